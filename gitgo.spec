@@ -6,7 +6,25 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[],
-    hiddenimports=[],
+    hiddenimports=[
+        'pygitgo.commands.push',
+        'pygitgo.commands.link',
+        'pygitgo.commands.jump',
+        'pygitgo.commands.state',
+        'pygitgo.commands.user',
+        'pygitgo.commands.resolve',
+        'pygitgo.commands.config',
+        'pygitgo.commands.undo',
+        'pygitgo.commands.pull',
+        'pygitgo.commands.repo',
+        'pygitgo.commands.new',
+        'pygitgo.commands.init',
+        'pygitgo.commands.log',
+        'pygitgo.commands.sync',
+        'pygitgo.commands.daemon',
+        'pygitgo.commands.shell_init',
+        'pygitgo.commands.worktree',
+    ],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
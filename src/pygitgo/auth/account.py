@@ -1,19 +1,12 @@
+from pygitgo.utils.config import get_git_config, set_git_config, unset_git_config
 from pygitgo.utils.cli_io import info, success, warning, error, write
-from pygitgo.utils.executor import run_command
 from pygitgo.exceptions import GitCommandError
 from pygitgo.utils.colors import BLUE, RESET
 
 
 def get_user():
-    try:
-        name = run_command(["git", "config", "--global", "user.name"])
-    except GitCommandError:
-        name = None
-    
-    try:
-        email = run_command(["git", "config", "--global", "user.email"])
-    except GitCommandError:
-        email = None
+    name = get_git_config("user.name", scopes=("global",))
+    email = get_git_config("user.email", scopes=("global",))
     
     if not name:
         name = None
@@ -23,8 +16,8 @@ def get_user():
     return name, email
 
 def set_user(name, email):
-    run_command(["git", "config", "--global", "user.name", name])
-    run_command(["git", "config", "--global", "user.email", email])
+    set_git_config("user.name", name)
+    set_git_config("user.email", email)
     success("\nGit user configured successfully.")
     write(f"{BLUE}Username{RESET} : {name}")
     write(f"{BLUE}Email    {RESET}: {email}")
@@ -71,18 +64,11 @@ def ensure_user_configure(default_email=None, default_username=None):
     return False
 
 def sanitize_signing_config():
-    try:
-        gpgsign = run_command(["git", "config", "--global", "commit.gpgsign"]).strip().lower()
-    except GitCommandError:
-        return
-
+    gpgsign = get_git_config("commit.gpgsign", scopes=("global",), default="").strip().lower()
     if gpgsign != "true":
         return
 
-    try:
-        fmt = run_command(["git", "config", "--global", "gpg.format"]).strip().lower()
-    except GitCommandError:
-        fmt = ""
+    fmt = get_git_config("gpg.format", scopes=("global",), default="").strip().lower()
 
     if fmt == "ssh":
         from pygitgo.auth.ssh_utils import get_ssh_key_path
@@ -95,11 +81,11 @@ def sanitize_signing_config():
         warning("Disabling global commit signing to prevent failures.")
 
     try:
-        run_command(["git", "config", "--global", "--unset", "gpg.program"])
+        unset_git_config("gpg.program")
     except GitCommandError:
         pass
 
     try:
-        run_command(["git", "config", "--global", "--unset", "commit.gpgsign"])
+        unset_git_config("commit.gpgsign")
     except GitCommandError:
         pass
@@ -0,0 +1,130 @@
+from pathlib import Path
+import hashlib
+import base64
+import hmac
+import os
+import re
+
+
+KNOWN_HOSTS_FILE = Path.home() / ".ssh" / "known_hosts"
+
+# `ssh-keygen -H` / `ssh-keyscan -H` entries: |1|base64(salt)|base64(HMAC-SHA1(salt, host))
+_HASH_MAGIC = "|1|"
+_WILDCARDS = ("*", "?", "!")
+
+# Parsed files, keyed on path and reused while mtime and size match.
+_INDEX_CACHE = {}
+
+
+def host_key_name(host, port=22):
+    """The name ssh looks up in known_hosts: "host", or "[host]:port" off the default port."""
+    host = host.lower()
+    return host if port == 22 else f"[{host}]:{port}"
+
+
+def _compile_pattern(pattern):
+    regex = re.escape(pattern.lower()).replace(r"\*", ".*").replace(r"\?", ".")
+    return re.compile(f"^{regex}$")
+
+
+def _parse_hash(pattern):
+    try:
+        _empty, _version, salt, digest = pattern.split("|")
+        return base64.b64decode(salt), base64.b64decode(digest)
+    except ValueError:
+        return None
+
+
+def _hash_matches(hashed, name):
+    salt, digest = hashed
+    return hmac.compare_digest(hmac.new(salt, name.encode("utf-8"), hashlib.sha1).digest(), digest)
+
+
+class KnownHosts:
+    """The host patterns from a known_hosts file, indexed for lookups.
+
+    Plain names go into a set. Hashed entries are kept as (salt, digest) and
+    checked with HMAC-SHA1. Lines with wildcards or `!` negations are matched
+    pattern by pattern, as ssh does. Marker lines (@revoked, @cert-authority)
+    never make a host known.
+    """
+
+    def __init__(self):
+        self.names = set()
+        self.hashed = []
+        self.pattern_lines = []
+        self._lookups = {}
+
+    @classmethod
+    def parse(cls, text):
+        index = cls()
+        for line in text.splitlines():
+            fields = line.split()
+            if not fields or fields[0].startswith(("#", "@")) or len(fields) < 3:
+                continue
+
+            patterns = fields[0].split(",")
+            if len(patterns) == 1 and patterns[0].startswith(_HASH_MAGIC):
+                hashed = _parse_hash(patterns[0])
+                if hashed:
+                    index.hashed.append(hashed)
+            elif any(p.startswith(_HASH_MAGIC) or any(c in p for c in _WILDCARDS) for p in patterns):
+                index.pattern_lines.append(patterns)
+            else:
+                index.names.update(p.lower() for p in patterns)
+        return index
+
+    def _line_matches(self, patterns, name):
+        matched = False
+        for pattern in patterns:
+            negated = pattern.startswith("!")
+            pattern = pattern[1:] if negated else pattern
+            if pattern.startswith(_HASH_MAGIC):
+                hashed = _parse_hash(pattern)
+                hit = bool(hashed) and _hash_matches(hashed, name)
+            else:
+                hit = bool(_compile_pattern(pattern).match(name))
+            if hit and negated:
+                return False
+            matched = matched or hit
+        return matched
+
+    def matches(self, host, port=22):
+        name = host_key_name(host, port)
+        if name in self.names:
+            return True
+        if name not in self._lookups:
+            self._lookups[name] = (
+                any(_hash_matches(hashed, name) for hashed in self.hashed)
+                or any(self._line_matches(patterns, name) for patterns in self.pattern_lines)
+            )
+        return self._lookups[name]
+
+
+def load_known_hosts(path=None):
+    """Parse `path` (default ~/.ssh/known_hosts), reusing the last parse while the file is unchanged."""
+    path = Path(path or KNOWN_HOSTS_FILE)
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return KnownHosts()
+
+    cached = _INDEX_CACHE.get(path)
+    if cached and cached[0] == (stat.st_mtime_ns, stat.st_size):
+        return cached[1]
+
+    try:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            index = KnownHosts.parse(f.read())
+    except OSError:
+        return KnownHosts()
+    _INDEX_CACHE[path] = ((stat.st_mtime_ns, stat.st_size), index)
+    return index
+
+
+def is_known_host(host, port=22, path=None):
+    return load_known_hosts(path).matches(host, port)
+
+
+def clear_known_hosts_cache():
+    _INDEX_CACHE.clear()
@@ -122,6 +122,7 @@ def logout():
         pub_key_path = str(key_path) + ".pub"
         if os.path.exists(pub_key_path):
             os.remove(pub_key_path)
+        ssh_utils.forget_ssh_probe()
 
         try:
             run_command(["git", "config", "--global", "--unset-all", "user.name"], loading_msg="Clearing Git username...", ok_text="Git username cleared.")
@@ -1,19 +1,38 @@
 from pygitgo.exceptions import GitCommandError, GitGoError
+from pygitgo.auth import known_hosts
 from pygitgo.utils.cli_io import info, success, warning
+from pygitgo.utils.reachability import check_tcp
 from pygitgo.utils.platform import get_platform
 from pygitgo.utils.executor import run_command
+from pygitgo.utils.ssh_mux import control_options
+from pygitgo.utils.trace import run_traced
+from pygitgo.utils import state_store
+from datetime import timedelta
 from pathlib import Path
 from typing import Optional
 import subprocess
+import hashlib
 import time
 import os
 import re
 
 
 SSH_TIMEOUT_SECONDS = 10
+SSH_CONFIG_TIMEOUT_SECONDS = 2
 
-_cached_ssh_response = None
-_cache_populated = False
+# GitHub also serves SSH on the HTTPS port, which most locked-down networks leave open.
+GITHUB_SSH_OVER_HTTPS = ("ssh.github.com", 443)
+_PORT_443_REACHABLE = "ssh.github.com port 443: reachable"
+
+# Successful `ssh -T` probes are remembered across runs, per host and key set,
+# so a push to an HTTPS remote does not pay for an SSH handshake every time.
+# Failures are never stored, and an auth failure drops the host's entries.
+PROBE_NAMESPACE = "ssh-probe"
+PROBE_TTL = timedelta(days=1)
+
+# This run's probe results, keyed by host: (raw_output, timed_out, os_error).
+_ssh_responses = {}
+_key_fingerprint_value = None
 
 
 def get_remote_host(url: str) -> Optional[str]:
@@ -30,30 +49,55 @@ def get_remote_host(url: str) -> Optional[str]:
     return None
 
 
-def ensure_known_host(host: str = "github.com"):
-    """Add a host to known_hosts if it is not already there."""
-    known_hosts = Path.home() / ".ssh" / "known_hosts"
-    known_hosts.parent.mkdir(parents=True, exist_ok=True)
-
+def _ends_with_newline(path):
     try:
-        if known_hosts.exists():
-            with open(known_hosts, "r") as f:
-                if host in f.read():
-                    return
-    except Exception:
-        pass
+        with open(path, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+    except OSError:
+        # Missing or empty file.
+        return True
+
+
+def ensure_known_hosts(hosts):
+    """Add any of `hosts` missing from known_hosts, with one `ssh-keyscan` that scans them in parallel.
 
-    info(f"Adding {host} to known_hosts...")
+    The check reads the local file only (hashed entries included), so a host
+    that is already known costs no network round trip.
+    """
+    path = known_hosts.KNOWN_HOSTS_FILE
+    missing = [host for host in dict.fromkeys(hosts) if not known_hosts.is_known_host(host, path=path)]
+    if not missing:
+        return
+
+    info(f"Adding {', '.join(missing)} to known_hosts...")
     try:
-        result = run_command(["ssh-keyscan", "-H", host], return_complete=True)
-        if result.stdout and host in result.stdout:
-            with open(known_hosts, "a") as f:
-                f.write(result.stdout)
-                if not result.stdout.endswith("\n"):
-                    f.write("\n")
-            success(f"{host} added to known_hosts.")
+        scan_output = run_command(["ssh-keyscan", "-H", *missing], return_complete=True).stdout or ""
     except GitCommandError:
-        warning(f"Could not automatically add {host} to known_hosts. You might be prompted.")
+        scan_output = ""
+
+    scanned = known_hosts.KnownHosts.parse(scan_output)
+    added = [host for host in missing if scanned.matches(host)]
+    if added:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            prefix = "" if _ends_with_newline(path) else "\n"
+            suffix = "" if scan_output.endswith("\n") else "\n"
+            with open(path, "a") as f:
+                f.write(prefix + scan_output + suffix)
+        except OSError:
+            added = []
+
+    for host in missing:
+        if host in added:
+            success(f"{host} added to known_hosts.")
+        else:
+            warning(f"Could not automatically add {host} to known_hosts. You might be prompted.")
+
+
+def ensure_known_host(host: str = "github.com"):
+    """Add a host to known_hosts if it is not already there."""
+    ensure_known_hosts([host])
 
 
 # Keep the old name so existing callers do not break.
@@ -61,11 +105,70 @@ def ensure_github_known_host():
     ensure_known_host("github.com")
 
 
+def _ssh_endpoint(host):
+    """The (hostname, port) ssh dials for git@host, per `ssh -G`. None when a proxy is configured or ssh cannot tell."""
+    try:
+        result = run_traced(
+            ["ssh", "-G", f"git@{host}"],
+            capture_output=True, text=True,
+            timeout=SSH_CONFIG_TIMEOUT_SECONDS, stdin=subprocess.DEVNULL,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    if result.returncode != 0:
+        return None
+
+    options = {}
+    for line in result.stdout.splitlines():
+        key, _sep, value = line.partition(" ")
+        options.setdefault(key.lower(), value.strip())
+    if options.get("proxycommand", "none") != "none" or options.get("proxyjump", "none") != "none":
+        return None
+    try:
+        return options.get("hostname", host), int(options.get("port", "22"))
+    except ValueError:
+        return None
+
+
+def _precheck(host):
+    """Fail fast when ssh cannot even open a socket. Returns a (raw_output, timed_out, os_error) failure, or None to go ahead.
+
+    The output mimics what ssh itself prints, so classify_connection_error
+    reads it the same way.
+    """
+    endpoint = _ssh_endpoint(host)
+    if endpoint is None:
+        return None
+
+    endpoints = [endpoint]
+    if host == "github.com" and endpoint != GITHUB_SSH_OVER_HTTPS:
+        endpoints.append(GITHUB_SSH_OVER_HTTPS)
+    reachability = check_tcp(endpoints, stop_on=endpoint)
+    # A slow resolver proves nothing; let ssh itself try.
+    if reachability.reached(endpoint) or reachability.layer == "unknown":
+        return None
+
+    hostname, port = endpoint
+    if reachability.layer == "dns":
+        return f"ssh: Could not resolve hostname {hostname}: Name or service not known", False, None
+    if reachability.refused:
+        return f"ssh: connect to host {hostname} port {port}: Connection refused", False, None
+
+    raw_output = f"ssh: connect to host {hostname} port {port}: Connection timed out"
+    if reachability.reached(GITHUB_SSH_OVER_HTTPS):
+        raw_output += f"\n{_PORT_443_REACHABLE}"
+    return raw_output, True, None
+
+
 def _get_ssh_response(host: str = "github.com"):
     """Test SSH connectivity to the given host."""
+    failure = _precheck(host)
+    if failure:
+        return failure
+
     try:
-        result = subprocess.run(
-            ["ssh", "-T", "-o", "BatchMode=yes", f"git@{host}"],
+        result = run_traced(
+            ["ssh", "-T", "-o", "BatchMode=yes", *control_options(), f"git@{host}"],
             capture_output=True, text=True,
             timeout=SSH_TIMEOUT_SECONDS, stdin=subprocess.DEVNULL,
         )
@@ -77,41 +180,105 @@ def _get_ssh_response(host: str = "github.com"):
         return "", False, str(e)
 
 
-# Keep module-level cache for GitHub only (used by login flow).
 def _get_github_ssh_response():
     return _get_ssh_response("github.com")
 
 
-def _get_cached_ssh_response():
-    global _cached_ssh_response, _cache_populated
-    if not _cache_populated:
-        _cached_ssh_response = _get_github_ssh_response()
-        _cache_populated = True
-    return _cached_ssh_response  # (raw_output, timed_out, os_error)
+def _key_fingerprint():
+    """A short hash of the public keys in ~/.ssh, so a new or removed key misses the cache."""
+    global _key_fingerprint_value
+    if _key_fingerprint_value is None:
+        digest = hashlib.sha256()
+        for path in sorted((Path.home() / ".ssh").glob("id_*.pub")):
+            try:
+                digest.update(path.read_bytes())
+            except OSError:
+                continue
+        _key_fingerprint_value = digest.hexdigest()[:16]
+    return _key_fingerprint_value
+
+
+def _probe_key(host):
+    return f"{host} {_key_fingerprint()}"
+
+
+def _parse_username(raw_output):
+    if raw_output and "Hi " in raw_output and "!" in raw_output:
+        try:
+            return raw_output.split("Hi ")[1].split("!")[0]
+        except (IndexError, ValueError):
+            pass
+    return None
+
+
+def _remember_probe(host, response):
+    raw_output, timed_out, os_error = response
+    if timed_out or os_error:
+        return
+    if "Permission denied" in raw_output:
+        forget_ssh_probe(host)
+        return
+    if "successfully authenticated" not in raw_output:
+        return
+
+    state_store.set(
+        PROBE_NAMESPACE, _probe_key(host),
+        {"username": _parse_username(raw_output), "output": raw_output},
+        ttl=PROBE_TTL,
+    )
+
+
+def forget_ssh_probe(host: str = "github.com"):
+    """Drop every remembered probe for `host`, e.g. after the server rejected our key."""
+    _ssh_responses.pop(host, None)
+    stale = [key for key in state_store.items(PROBE_NAMESPACE) if key.split(" ", 1)[0] == host]
+    if stale:
+        state_store.delete(PROBE_NAMESPACE, stale)
+
+
+def _get_cached_ssh_response(host: str = "github.com"):
+    """Probe `host` at most once per run, reusing a fresh successful probe from an earlier run."""
+    if host not in _ssh_responses:
+        entry = state_store.get(PROBE_NAMESPACE, _probe_key(host))
+        if entry and entry.get("output"):
+            _ssh_responses[host] = (entry["output"], False, None)
+        else:
+            response = _get_github_ssh_response() if host == "github.com" else _get_ssh_response(host)
+            _remember_probe(host, response)
+            _ssh_responses[host] = response
+    return _ssh_responses[host]  # (raw_output, timed_out, os_error)
 
 
 def clear_ssh_cache():
-    global _cached_ssh_response, _cache_populated
-    _cached_ssh_response = None
-    _cache_populated = False
+    """Forget this run's probe results. Remembered successes on disk are kept."""
+    global _key_fingerprint_value
+    _ssh_responses.clear()
+    _key_fingerprint_value = None
 
 
 def classify_connection_error(raw_output: str, timed_out: bool, os_error: Optional[str]) -> str:
-    """Return a short, plain-English reason for a connection failure."""
-    if timed_out:
-        return "Connection timed out. Port 22 may be blocked by your network or firewall."
+    """Return a short, plain-English reason for a connection failure, naming the layer that broke."""
     if os_error:
         return f"Could not start SSH: {os_error}"
+    if _PORT_443_REACHABLE in (raw_output or ""):
+        return (
+            "TCP: port 22 is blocked on this network, but GitHub's SSH over port 443 is reachable. "
+            "Point github.com at ssh.github.com port 443 in ~/.ssh/config (see 'Port 22 blocked' in the troubleshooting guide)."
+        )
+    if timed_out and raw_output and "Connection timed out" in raw_output:
+        return "TCP: no answer on port 22. It is likely blocked by your network or firewall."
+    if timed_out:
+        return "Connection timed out. Port 22 may be blocked by your network or firewall."
     if not raw_output:
         return "No response from the server. Check your internet connection."
-    if "Permission denied" in raw_output:
-        return "Permission denied. Your SSH key was not accepted by the server."
+    if "Could not resolve hostname" in raw_output:
+        return "DNS: lookup failed. You may be offline or behind a proxy."
     if "Connection refused" in raw_output:
-        return "Connection refused on port 22. Try a network without strict firewall rules."
+        return "TCP: connection refused on port 22. Try a network without strict firewall rules."
+    if "Permission denied" in raw_output:
+        return "SSH: permission denied. Your SSH key was not accepted by the server."
     if "Host key verification failed" in raw_output:
-        return "Host key check failed. Run: ssh-keyscan -H <host> >> ~/.ssh/known_hosts"
-    if "Could not resolve hostname" in raw_output:
-        return "DNS lookup failed. You may be offline or behind a proxy."
+        return "SSH: host key check failed. Run: ssh-keyscan -H <host> >> ~/.ssh/known_hosts"
     return raw_output.strip() or "Unknown SSH error."
 
 
@@ -129,10 +296,7 @@ def check_connection(ok_text=None, fail_text=None, host: str = "github.com"):
     spinner.start()
 
     try:
-        if host == "github.com":
-            raw_output, timed_out, os_error = _get_cached_ssh_response()
-        else:
-            raw_output, timed_out, os_error = _get_ssh_response(host)
+        raw_output, timed_out, os_error = _get_cached_ssh_response(host)
     except KeyboardInterrupt:
         spinner.stop()
         raise
@@ -155,12 +319,7 @@ def check_connection(ok_text=None, fail_text=None, host: str = "github.com"):
 
 def get_github_username():
     raw_output, _timed_out, _os_error = _get_cached_ssh_response()
-    if raw_output and "Hi " in raw_output and "!" in raw_output:
-        try:
-            return raw_output.split("Hi ")[1].split("!")[0]
-        except (IndexError, ValueError):
-            pass
-    return None
+    return _parse_username(raw_output)
 
 
 def get_ssh_key_path():
@@ -170,7 +329,7 @@ def get_ssh_key_path():
 def is_agent_loaded(key_path: Path) -> bool:
     """Return True if the given key is currently loaded in the SSH agent."""
     try:
-        result = subprocess.run(
+        result = run_traced(
             ["ssh-add", "-l"],
             capture_output=True, text=True, timeout=5,
         )
@@ -252,7 +411,7 @@ def ensure_ssh_agent(key_path, quiet=False):
 
     if get_platform() == "windows":
         try:
-            subprocess.run(
+            run_traced(
                 ["sc", "start", "ssh-agent"],
                 capture_output=True, timeout=5
             )
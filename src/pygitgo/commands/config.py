@@ -1,4 +1,4 @@
-from pygitgo.utils.config import get_config, set_config
+from pygitgo.utils.config import get_config, set_config, get_config_scope
 from pygitgo.utils.cli_io import warning, info
 from pygitgo.exceptions import GitGoError
 
@@ -8,19 +8,27 @@ def config_operation(args):
     key = args.key
     action = args.action
     value = getattr(args, 'value', None)
+    local = getattr(args, 'local', False)
 
-    VALID_KEYS = ["default-branch", "default-message"]
+    VALID_KEYS = ["default-branch", "default-message", "jump-mode", "worktree-root", "worktree-limit", "sync-window"]
     if key not in VALID_KEYS:
         raise GitGoError(f"Invalid configuration key: '{key}'. Valid keys are: {', '.join(VALID_KEYS)}")
 
     if action == 'set':
         if not value:
             raise GitGoError("You must provide a value to set!")
-        set_config(key, value)
+        if key == "jump-mode" and value not in ("checkout", "worktree"):
+            raise GitGoError(f"Invalid value '{value}' for jump-mode. Use 'checkout' or 'worktree'.")
+        if key == "worktree-limit" and not (value.isdigit() and int(value) > 0):
+            raise GitGoError(f"Invalid value '{value}' for worktree-limit. Use a whole number of 1 or more.")
+        if key == "sync-window" and not value.isdigit():
+            raise GitGoError(f"Invalid value '{value}' for sync-window. Use a number of minutes (0 to always sync).")
+        set_config(key, value, scope="local" if local else "global")
     elif action == 'get':
         current_value = get_config(key, None)
         if current_value:
-            info(f"\n{key} is currently set to: '{current_value}'\n", required=True)
+            where = " for this repository" if get_config_scope(key) in ("local", "worktree") else ""
+            info(f"\n{key} is currently set to: '{current_value}'{where}\n", required=True)
         else:
             warning(f"\n{key} is not currently set.\n", required=True)
 
@@ -0,0 +1,53 @@
+from pygitgo.utils.daemon import SOCKET_PATH, is_supported, connect, request_stop, serve
+from pygitgo.utils.cli_io import info, success, warning, write
+from pygitgo.exceptions import GitGoError
+
+
+def daemon_start():
+    sock = connect()
+    if sock is not None:
+        sock.close()
+        warning(f"GitGo daemon is already running at {SOCKET_PATH}.")
+        return
+
+    def on_ready():
+        success(f"GitGo daemon listening on {SOCKET_PATH}.")
+        info("Commands in other terminals now start instantly. Press Ctrl+C to stop.")
+
+    try:
+        serve(on_ready=on_ready)
+    except KeyboardInterrupt:
+        write()
+        info("GitGo daemon stopped.")
+
+
+def daemon_stop():
+    if request_stop():
+        success("GitGo daemon stopped.")
+    else:
+        info("GitGo daemon is not running.")
+
+
+def daemon_status():
+    sock = connect()
+    if sock is None:
+        info("GitGo daemon is not running. Start it with 'gitgo daemon start'.", required=True)
+        return
+    sock.close()
+    success(f"GitGo daemon is running at {SOCKET_PATH}.", required=True)
+
+
+def daemon_operation(args):
+    if not is_supported():
+        raise GitGoError("The GitGo daemon needs Unix domain sockets, which this platform does not support.")
+
+    action = getattr(args, "action", None) or "start"
+
+    if action == "start":
+        daemon_start()
+    elif action == "stop":
+        daemon_stop()
+    elif action == "status":
+        daemon_status()
+    else:
+        raise GitGoError(f"Unknown daemon action: {action}")
@@ -0,0 +1,478 @@
+import curses
+import os
+
+
+# Change sets up to this size open fully expanded; larger ones open with only
+# the top-level folders showing, so a 20k-file codegen run starts instantly.
+EXPAND_ALL_LIMIT = 300
+
+HEADER_LINES = 2
+HELP_TEXT = "SPACE toggle  <-/-> fold  / filter  a all  ENTER confirm  q cancel"
+
+_CURSES_KEYS = {
+    curses.KEY_UP: "up",
+    curses.KEY_DOWN: "down",
+    curses.KEY_PPAGE: "pageup",
+    curses.KEY_NPAGE: "pagedown",
+    curses.KEY_HOME: "home",
+    curses.KEY_END: "end",
+    curses.KEY_LEFT: "left",
+    curses.KEY_RIGHT: "right",
+    curses.KEY_ENTER: "enter",
+    curses.KEY_BACKSPACE: "backspace",
+    "\n": "enter",
+    "\r": "enter",
+    "\x1b": "escape",
+    "\x7f": "backspace",
+    "\b": "backspace",
+}
+
+# Vim-style movement, only outside the filter prompt where letters are typed.
+_NAVIGATION_KEYS = {"k": "up", "j": "down", "g": "home", "G": "end", "h": "left", "l": "right"}
+
+
+class _Dir:
+    __slots__ = ("name", "path", "depth", "dirs", "files", "file_count", "expanded")
+
+    def __init__(self, name, path, depth):
+        self.name = name
+        # "" for the root, otherwise "a/b/": the pathspec that stages the whole folder.
+        self.path = path
+        self.depth = depth
+        self.dirs = {}
+        self.files = []
+        self.file_count = 0
+        self.expanded = False
+
+
+class FileTree:
+    """Changed files grouped by folder. `files` are the records from get_changed_files()."""
+
+    def __init__(self, files):
+        self.root = _Dir("", "", -1)
+        self.files = files
+        for record in files:
+            node = self.root
+            node.file_count += 1
+            # An untracked folder ("assets/") stays a single entry, as git lists it.
+            for part in record["path"].rstrip("/").split("/")[:-1]:
+                child = node.dirs.get(part)
+                if child is None:
+                    child = node.dirs[part] = _Dir(part, f"{node.path}{part}/", node.depth + 1)
+                node = child
+                node.file_count += 1
+            node.files.append(record)
+
+        self.root.expanded = True
+        if len(files) <= EXPAND_ALL_LIMIT:
+            self._expand_all(self.root)
+
+    def _expand_all(self, node):
+        node.expanded = True
+        for child in node.dirs.values():
+            self._expand_all(child)
+
+    def rows(self, node=None):
+        """The (depth, item) rows under `node` that are visible with the current folding."""
+        rows = []
+        stack = self._children(node or self.root)[::-1]
+        while stack:
+            depth, item = stack.pop()
+            rows.append((depth, item))
+            if _is_dir(item) and item.expanded:
+                stack.extend(reversed(self._children(item)))
+        return rows
+
+    @staticmethod
+    def _children(node):
+        depth = node.depth + 1
+        return [(depth, child) for child in node.dirs.values()] + [(depth, record) for record in node.files]
+
+
+def _is_dir(item):
+    return isinstance(item, _Dir)
+
+
+def _item_path(item):
+    return item.path if _is_dir(item) else item["path"]
+
+
+def _ancestors(path):
+    """Folder paths above `path`, nearest first, ending with the root ""."""
+    end = len(path.rstrip("/"))
+    while True:
+        end = path.rfind("/", 0, end)
+        if end < 0:
+            yield ""
+            return
+        yield path[:end + 1]
+
+
+class Selection:
+    """What is selected, stored as marks on folders and files.
+
+    A mark applies to everything under it unless something closer says
+    otherwise, so selecting a folder of 20k files is one mark, not 20k.
+    """
+
+    def __init__(self):
+        self.marks = {}
+
+    def is_selected(self, path):
+        if path in self.marks:
+            return self.marks[path]
+        for ancestor in _ancestors(path):
+            if ancestor in self.marks:
+                return self.marks[ancestor]
+        return False
+
+    def is_partial(self, folder_path):
+        state = self.is_selected(folder_path)
+        return any(
+            key != folder_path and key.startswith(folder_path) and value != state
+            for key, value in self.marks.items()
+        )
+
+    def toggle(self, path):
+        value = not self.is_selected(path)
+        if path == "" or path.endswith("/"):
+            for key in [key for key in self.marks if key.startswith(path)]:
+                del self.marks[key]
+        self.marks.pop(path, None)
+        if self.is_selected(path) != value:
+            self.marks[path] = value
+
+    def _marked_folders(self):
+        """Folders with a mark somewhere strictly below them."""
+        folders = set()
+        for key in self.marks:
+            folders.update(_ancestors(key))
+        return folders
+
+    def pathspecs(self, tree):
+        """The fewest paths that stage exactly the selection: whole folders where possible."""
+        inner = self._marked_folders()
+        result = set()
+
+        def walk(node, inherited):
+            for child in node.dirs.values():
+                state = self.marks.get(child.path, inherited)
+                if child.path in inner:
+                    walk(child, state)
+                elif state:
+                    result.add(child.path)
+            for record in node.files:
+                if self.marks.get(record["path"], inherited):
+                    result.add(record["path"])
+
+        walk(tree.root, self.marks.get("", False))
+        return result
+
+    def count(self, tree):
+        """How many changed files the selection covers."""
+        inner = self._marked_folders()
+
+        def walk(node, inherited):
+            total = 0
+            for child in node.dirs.values():
+                state = self.marks.get(child.path, inherited)
+                if child.path in inner:
+                    total += walk(child, state)
+                elif state:
+                    total += child.file_count
+            for record in node.files:
+                total += bool(self.marks.get(record["path"], inherited))
+            return total
+
+        return walk(tree.root, self.marks.get("", False))
+
+
+class _Matches:
+    """Filter results, pulled from `source` only as far as the screen needs."""
+
+    def __init__(self, source):
+        self._source = source
+        self.items = []
+        self.done = False
+
+    def fill(self, count):
+        while not self.done and len(self.items) < count:
+            try:
+                self.items.append(next(self._source))
+            except StopIteration:
+                self.done = True
+
+    def __iter__(self):
+        index = 0
+        while True:
+            self.fill(index + 1)
+            if index >= len(self.items):
+                return
+            yield self.items[index]
+            index += 1
+
+
+class FilePicker:
+    """The picker's state and key handling, kept apart from curses so it can be tested.
+
+    Only the rows in the window are ever drawn, folding splices rows in and
+    out around the cursor, and each filter keystroke narrows the previous
+    matches lazily, so the work per keystroke does not grow with the change set.
+    """
+
+    def __init__(self, files, height=20):
+        self.tree = FileTree(files)
+        self.selection = Selection()
+        self.height = max(1, height)
+        self.cursor = 0
+        self.top = 0
+        self.typing = False
+        self._tree_rows = self.tree.rows()
+        # One entry per filter prefix, so backspace is instant.
+        self._filters = []
+        self._selected_count = 0
+
+    # Rows
+
+    @property
+    def query(self):
+        return self._filters[-1][0] if self._filters else ""
+
+    @property
+    def filtered(self):
+        return bool(self._filters)
+
+    def _ensure(self, count):
+        if self._filters:
+            self._filters[-1][1].fill(count)
+
+    def row_count(self):
+        """Rows known so far. While a filter is still scanning, more may follow."""
+        return len(self._filters[-1][1].items) if self._filters else len(self._tree_rows)
+
+    def row(self, index):
+        self._ensure(index + 1)
+        if self._filters:
+            matches = self._filters[-1][1].items
+            return (0, matches[index]) if index < len(matches) else None
+        return self._tree_rows[index] if index < len(self._tree_rows) else None
+
+    def visible_rows(self):
+        self._ensure(self.top + self.height)
+        rows = []
+        for index in range(self.top, self.top + self.height):
+            row = self.row(index)
+            if row is None:
+                break
+            rows.append((index, row))
+        return rows
+
+    def is_complete(self):
+        return not self._filters or self._filters[-1][1].done
+
+    # Movement
+
+    def move(self, delta):
+        target = max(0, self.cursor + delta)
+        self._ensure(target + 1)
+        self.cursor = max(0, min(target, self.row_count() - 1))
+        if self.cursor < self.top:
+            self.top = self.cursor
+        elif self.cursor >= self.top + self.height:
+            self.top = self.cursor - self.height + 1
+
+    def move_to_end(self):
+        if self._filters:
+            matches = self._filters[-1][1]
+            matches.fill(float("inf"))
+        self.move(self.row_count())
+
+    def resize(self, height):
+        self.height = max(1, height)
+        self.move(0)
+
+    # Folding
+
+    def expand(self):
+        row = self.row(self.cursor)
+        if self._filters or row is None or not _is_dir(row[1]) or row[1].expanded:
+            return
+        row[1].expanded = True
+        self._tree_rows[self.cursor + 1:self.cursor + 1] = self.tree.rows(row[1])
+
+    def collapse(self):
+        row = self.row(self.cursor)
+        if self._filters or row is None:
+            return
+        depth, item = row
+        if _is_dir(item) and item.expanded:
+            end = self.cursor + 1
+            while end < len(self._tree_rows) and self._tree_rows[end][0] > depth:
+                end += 1
+            del self._tree_rows[self.cursor + 1:end]
+            item.expanded = False
+            return
+        # On a file or a folded folder, jump to the parent folder.
+        for index in range(self.cursor - 1, -1, -1):
+            if self._tree_rows[index][0] < depth:
+                self.move(index - self.cursor)
+                return
+
+    # Selection
+
+    def toggle(self):
+        row = self.row(self.cursor)
+        if row is not None:
+            self.selection.toggle(_item_path(row[1]))
+            self._selected_count = None
+
+    def toggle_all(self):
+        self.selection.toggle("")
+        self._selected_count = None
+
+    def selected_count(self):
+        if self._selected_count is None:
+            self._selected_count = self.selection.count(self.tree)
+        return self._selected_count
+
+    def state(self, item):
+        """"x" selected, "-" partly selected folder, " " not selected."""
+        path = _item_path(item)
+        if _is_dir(item) and self.selection.is_partial(path):
+            return "-"
+        return "x" if self.selection.is_selected(path) else " "
+
+    def pathspecs(self):
+        return self.selection.pathspecs(self.tree)
+
+    # Filtering
+
+    def set_query(self, query):
+        while self._filters and not query.startswith(self._filters[-1][0]):
+            self._filters.pop()
+        if query and query != self.query:
+            needle = query.lower()
+            source = iter(self._filters[-1][1]) if self._filters else iter(self.tree.files)
+            self._filters.append((query, _Matches(r for r in source if needle in r["path"].lower())))
+        self.cursor = self.top = 0
+        self.move(0)
+
+    # Keys
+
+    def handle_key(self, key):
+        """Apply one key ("up", "enter", a typed character, ...). Returns "confirm", "cancel" or None."""
+        if self.typing:
+            if key == "enter":
+                self.typing = False
+            elif key == "escape":
+                self.typing = False
+                self.set_query("")
+            elif key == "backspace":
+                self.set_query(self.query[:-1])
+            elif isinstance(key, str) and len(key) == 1 and key.isprintable():
+                self.set_query(self.query + key)
+            else:
+                self._navigate(key)
+            return None
+
+        key = _NAVIGATION_KEYS.get(key, key)
+        if key == "enter":
+            return "confirm"
+        if key in ("escape", "q"):
+            if self._filters:
+                self.set_query("")
+                return None
+            return "cancel"
+        if key == " ":
+            self.toggle()
+        elif key == "a":
+            self.toggle_all()
+        elif key == "/":
+            self.typing = True
+        else:
+            self._navigate(key)
+        return None
+
+    def _navigate(self, key):
+        if key == "up":
+            self.move(-1)
+        elif key == "down":
+            self.move(1)
+        elif key == "pageup":
+            self.move(-self.height)
+        elif key == "pagedown":
+            self.move(self.height)
+        elif key == "home":
+            self.move(-self.cursor)
+        elif key == "end":
+            self.move_to_end()
+        elif key == "right":
+            self.expand()
+        elif key == "left":
+            self.collapse()
+
+    # Drawing
+
+    def render_row(self, row):
+        depth, item = row
+        box = f"[{self.state(item)}]"
+        if _is_dir(item):
+            fold = "v" if item.expanded else ">"
+            return f"{'  ' * depth}{box} {fold} {item.name}/ ({item.file_count})"
+        if self._filters:
+            return f"{box} ({item['label']}) {item['path']}"
+        name = item["path"].rstrip("/").rsplit("/", 1)[-1] + ("/" if item["path"].endswith("/") else "")
+        return f"{'  ' * depth}{box} ({item['label']}) {name}"
+
+    def status_line(self):
+        line = f"{self.selected_count()} of {len(self.tree.files)} file(s) selected"
+        if self._filters or self.typing:
+            self._ensure(self.top + self.height)
+            found = self.row_count()
+            more = "" if self.is_complete() else "+"
+            cursor = "_" if self.typing else ""
+            line += f"   filter: {self.query}{cursor} ({found}{more} match{'es' if found != 1 else ''})"
+        return line
+
+
+def _printable(text):
+    # Odd file names (control characters, non-UTF-8 bytes) must not garble the screen.
+    if text.isprintable():
+        return text
+    return "".join(char if char.isprintable() else "?" for char in text)
+
+
+def _draw(screen, picker):
+    height, width = screen.getmaxyx()
+    screen.erase()
+    screen.addnstr(0, 0, f"Select files to stage: {HELP_TEXT}", width - 1, curses.A_BOLD)
+    screen.addnstr(1, 0, picker.status_line(), width - 1)
+    for line, (index, row) in enumerate(picker.visible_rows(), start=HEADER_LINES):
+        attr = curses.A_REVERSE if index == picker.cursor else curses.A_NORMAL
+        screen.addnstr(line, 0, _printable(picker.render_row(row)), width - 1, attr)
+    screen.refresh()
+
+
+def _loop(screen, picker):
+    try:
+        curses.curs_set(0)
+    except curses.error:
+        pass
+    screen.keypad(True)
+
+    while True:
+        picker.resize(screen.getmaxyx()[0] - HEADER_LINES)
+        _draw(screen, picker)
+        key = screen.get_wch()
+        result = picker.handle_key(_CURSES_KEYS.get(key, key))
+        if result == "confirm":
+            return picker.pathspecs()
+        if result == "cancel":
+            return set()
+
+
+def pick_files(files):
+    """Run the picker full-screen. Returns the selected pathspecs, or an empty set when cancelled."""
+    # Let Esc register straight away instead of after curses' one-second wait.
+    os.environ.setdefault("ESCDELAY", "25")
+    return curses.wrapper(_loop, FilePicker(files))
@@ -1,12 +1,29 @@
+from pygitgo.utils.executor import run_command, run_exists, spawn_detached
 from pygitgo.utils.cli_io import warning, error, info, confirm
 from pygitgo.exceptions import GitCommandError, GitGoError
-from pygitgo.utils.executor import run_command
+from pygitgo.utils.repo_context import get_repo_context
 from pygitgo.utils.config import get_config
+from datetime import datetime, timedelta
+from pygitgo.utils import state_store
+from pygitgo.utils import refs
 from argparse import Namespace
 
 
+ORIGIN_HEAD = "refs/remotes/origin/HEAD"
+ORIGIN_HEAD_COMMAND = ["git", "symbolic-ref", "--quiet", ORIGIN_HEAD]
+SET_HEAD_COMMAND = ["git", "remote", "set-head", "origin", "--auto"]
+
+# How long a recorded `git remote set-head origin --auto` refresh counts as
+# current. Stored per repository, keyed by its common git dir.
+MAIN_BRANCH_TTL = timedelta(days=1)
+MAIN_BRANCH_NAMESPACE = "main-branch"
+
+
 def get_current_branch(safe=False):
-    branch = run_command(["git", "branch", "--show-current"]).strip()
+    try:
+        branch, _sha = refs.read_head()
+    except refs.RefsUnavailable:
+        branch = run_command(["git", "branch", "--show-current"]).strip()
     if not branch:
         # We are in a detached HEAD state.
         commit_hash = run_command(["git", "rev-parse", "--short", "HEAD"]).strip()
@@ -25,22 +42,55 @@ def get_current_branch(safe=False):
     return branch
 
 
+def _read_origin_head():
+    try:
+        target = refs.read_symbolic_ref(ORIGIN_HEAD)
+    except refs.RefsUnavailable:
+        try:
+            target = run_command(ORIGIN_HEAD_COMMAND)
+        except GitCommandError:
+            target = None
+
+    prefix = "refs/remotes/origin/"
+    if target and target.startswith(prefix):
+        return target[len(prefix):]
+    return None
+
+
+def _refresh_origin_head_in_background(repo_key):
+    # Record the attempt first so a slow or failing remote is asked at most
+    # once per TTL, not on every command.
+    if state_store.set(MAIN_BRANCH_NAMESPACE, repo_key, datetime.now().isoformat(), ttl=MAIN_BRANCH_TTL):
+        spawn_detached(SET_HEAD_COMMAND)
+
+
 def get_main_branch():
+    """Return origin's default branch as last recorded in refs/remotes/origin/HEAD.
+
+    Never waits on the network. When the record is older than MAIN_BRANCH_TTL,
+    `git remote set-head origin --auto` refreshes it in the background for the
+    next call. Falls back to the `default-branch` setting.
+    """
     default_main_branch = get_config("default-branch", "main")
 
-    try:
-        output = run_command(['git', 'remote', 'show', 'origin'])
-    except GitCommandError:
+    context = get_repo_context()
+    if context is None:
         return default_main_branch
 
-    if "HEAD branch:" not in output:
-        return default_main_branch
+    repo_key = str(context.common_dir)
+    if state_store.get(MAIN_BRANCH_NAMESPACE, repo_key) is None:
+        _refresh_origin_head_in_background(repo_key)
 
-    return output.split("HEAD branch:")[-1].strip().splitlines()[0].strip()
+    return _read_origin_head() or default_main_branch
 
 
 def is_branch_exist(branch):
-    return bool(run_command(["git", "branch", "-r", "--list", f"*/{branch}"])) or bool(run_command(["git", "branch", "--list", branch]))
+    if not any(char in branch for char in "*?[\\"):
+        try:
+            return refs.remote_branch_exists(branch) or refs.ref_exists(f"refs/heads/{branch}")
+        except refs.RefsUnavailable:
+            pass
+    return run_exists(["git", "branch", "-r", "--list", f"*/{branch}"]) or run_exists(["git", "branch", "--list", branch])
 
 
 def git_new_branch(branch, ok_text=None):
@@ -68,6 +118,14 @@ def git_new_branch(branch, ok_text=None):
 
 
 def get_head_sha(short=False):
+    if not short:
+        try:
+            _branch, sha = refs.read_head()
+            if sha:
+                return sha
+        except refs.RefsUnavailable:
+            pass
+
     args = ["git", "rev-parse"]
     if short:
         args.append("--short")
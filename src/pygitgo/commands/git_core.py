@@ -1,12 +1,18 @@
-from pygitgo.auth.ssh_utils import convert_https_to_ssh, get_ssh_key_path, is_ssh_url, check_connection, get_remote_host
+from pygitgo.auth.ssh_utils import convert_https_to_ssh, get_ssh_key_path, is_ssh_url, check_connection, get_remote_host, forget_ssh_probe
 from pygitgo.exceptions import GitGoError, GitCommandError
 from pygitgo.auth.account import sanitize_signing_config
 from pygitgo.commands.git_remote import handle_rebase
+from pygitgo.commands.git_status import get_status, has_changes
+from pygitgo.commands.staging import add_paths
+from pygitgo.utils.repo_context import get_repo_context
 from pygitgo.utils.config import get_default_branch
-from pygitgo.utils.executor import run_command
+from pygitgo.utils.executor import run_command, run_command_iter, run_exists
 from pygitgo.utils.cli_io import info, warning
+from pygitgo.utils import refs
 from pathlib import Path
-import os
+
+
+INSIDE_WORK_TREE_COMMAND = ["git", "rev-parse", "--is-inside-work-tree"]
 
 
 def ensure_inside_git_repository():
@@ -16,7 +22,7 @@ def ensure_inside_git_repository():
 
 def is_git_repository():
     try:
-        run_command(["git", "rev-parse", "--is-inside-work-tree"])
+        run_command(INSIDE_WORK_TREE_COMMAND)
         return True
     except GitCommandError:
         return False
@@ -24,17 +30,31 @@ def is_git_repository():
 
 def has_local_changes():
     try:
-        status_result = run_command(["git", "status", "--porcelain"])
-        return bool(status_result.strip())
+        return has_changes()
     except GitCommandError:
         return False
 
 
+def has_unpushed_commits(branch, on_remote=True, loading_msg=None):
+    """Whether HEAD has commits that origin/<branch> lacks (any commit at all when the branch is not on origin).
+
+    Stops at the first such commit. Raises GitCommandError when origin/<branch> is unknown.
+    """
+    revisions = f"origin/{branch}..HEAD" if on_remote else "HEAD"
+    return run_exists(["git", "rev-list", "-n1", revisions], loading_msg=loading_msg)
+
+
 def is_rebase_in_progress():
-    return Path(".git/rebase-merge").exists() or Path(".git/rebase-apply").exists()
+    context = get_repo_context()
+    return bool(context and context.rebase_in_progress)
 
 
 def has_any_commits():
+    try:
+        return refs.read_head()[1] is not None
+    except refs.RefsUnavailable:
+        pass
+
     try:
         run_command(["git", "rev-parse", "HEAD"])
         return True
@@ -42,7 +62,20 @@ def has_any_commits():
         return False
 
 
-def get_recent_commits(number=5, branch=None):
+def has_orig_head():
+    try:
+        return refs.ref_exists("ORIG_HEAD")
+    except refs.RefsUnavailable:
+        pass
+
+    try:
+        run_command(["git", "rev-parse", "ORIG_HEAD"])
+        return True
+    except GitCommandError:
+        return False
+
+
+def recent_commits_command(number=5, branch=None):
     command = [
         "git", "log", 
         f"-n{number}",
@@ -50,30 +83,32 @@ def get_recent_commits(number=5, branch=None):
     ]
     if branch:
         command.append(branch)
-        
+    return command
+
+
+def get_recent_commits(number=5, branch=None):
+    """Yield the most recent commits as dicts, as git prints them."""
     try:
-        output = run_command(command)
-        if not output:
-            return []
-            
-        commits = []
-        for line in output.splitlines():
+        for line in run_command_iter(recent_commits_command(number, branch)):
             try:
                 commit_hash, author, date, message = line.split("||", 3)
-                commits.append({
-                    "hash": commit_hash,
-                    "author": author,
-                    "date": date,
-                    "message": message
-                })
             except ValueError:
                 continue
-        return commits
+            yield {
+                "hash": commit_hash,
+                "author": author,
+                "date": date,
+                "message": message
+            }
     except GitCommandError as e:
         raise GitGoError(f"Failed to retrieve log: {getattr(e, 'stderr', str(e))}")
 
 
 
+# The signing check and flags, worked out once per process.
+_SIGNING_CACHE = {}
+
+
 def _get_signing_flags():
     key_path = get_ssh_key_path()
     if not key_path.exists():
@@ -84,35 +119,70 @@ def _get_signing_flags():
     ]
 
 
+def _prepare_signing():
+    if "flags" not in _SIGNING_CACHE:
+        sanitize_signing_config()
+        _SIGNING_CACHE["flags"] = _get_signing_flags()
+    return _SIGNING_CACHE["flags"]
+
+
+def clear_signing_cache():
+    _SIGNING_CACHE.clear()
+
+
+def _at_top_level():
+    context = get_repo_context()
+    return bool(context) and context.toplevel.resolve() == Path.cwd().resolve()
+
+
+def _stage_for_commit(status):
+    """Stage what `git add .` would and return the extra `git commit` flags.
+
+    At the top of the work tree, tracked changes are left to `git commit -a`
+    and only the untracked paths the status snapshot already listed are
+    added, so git does not walk the whole tree a second time. In a
+    subfolder, `git add .` keeps staging limited to that folder.
+    """
+    if not _at_top_level():
+        run_command(["git", "add", "."], loading_msg="Staging files...", ok_text="Files staged.")
+        return []
+
+    untracked = [entry.path for entry in status.untracked]
+    if untracked:
+        add_paths(untracked, loading_msg="Staging files...", ok_text="Files staged.")
+    return ["-a"]
+
+
 def git_commit(commit_message, loading_msg="Committing changes...", skip_staging=False, ok_text=None):
     if not ok_text:
         ok_text = "Changes committed."
     try:
-        status_result = run_command(["git", "status", "--porcelain"])
-        if not status_result.strip():
-            return False
+        status = get_status()
     except GitCommandError as e:
         stderr = getattr(e, "stderr", str(e))
         if "not a git repository" in stderr.lower():
             raise GitGoError("Not inside a git repository. Run 'gitgo init' or 'gitgo link' first.")
         raise GitGoError(f"Could not check repository status: {stderr}")
-    
-    sanitize_signing_config()
+    if status.is_clean:
+        return False
 
-    if not skip_staging:
-        run_command(["git", "add", "."], loading_msg="Staging files...", ok_text="Files staged.")
+    signing_flags = _prepare_signing()
+
+    staging_flags = [] if skip_staging else _stage_for_commit(status)
 
     clean_message = commit_message.strip('"\'')
 
-    signing_flags = _get_signing_flags()
-    commit_command = ["git"] + signing_flags + ["commit", "-S", "-m", clean_message]
+    commit_command = ["git"] + signing_flags + ["commit"] + staging_flags + ["-S", "-m", clean_message]
     run_command(commit_command, loading_msg=loading_msg, ok_text=ok_text)
 
     return True
 
 
 def git_init(ok_text=None):
-    if os.path.isdir(".git"):
+    # Only the top of a work tree counts: a subfolder of another repo still gets
+    # its own repository, and a linked worktree (where .git is a file) does not.
+    context = get_repo_context()
+    if context and context.toplevel.resolve() == Path.cwd().resolve():
         warning("Already a git repository! Skipping init...")
         return False
 
@@ -133,10 +203,8 @@ def git_init(ok_text=None):
 def git_push(branch, ok_text=None):
     if not ok_text:
         ok_text = f"Pushed to remote branch '{branch}'."
-    try:
-        remote_url = run_command(["git", "remote", "get-url", "origin"]).strip()
-    except GitCommandError:
-        remote_url = None
+    context = get_repo_context()
+    remote_url = context.remote_url if context else None
 
     if remote_url and not is_ssh_url(remote_url):
         # Only attempt SSH conversion if the remote host is github.com and
@@ -169,6 +237,8 @@ def git_push(branch, ok_text=None):
             info("Run:  git remote -v   to verify the remote URL.")
             raise GitGoError("Push failed: remote repository not found.")
         elif "permission denied" in stderr.lower():
+            if remote_url:
+                forget_ssh_probe(get_remote_host(remote_url) or "github.com")
             info("Check that your SSH key is added to GitHub.")
             info("Run:  gitgo user login   to re-authenticate.")
             raise GitGoError("Push failed: permission denied.")
@@ -178,15 +248,12 @@ def git_push(branch, ok_text=None):
 
 
 def abort_pull_conflict():
-    from pathlib import Path
     from pygitgo.utils.cli_io import warning, info, confirm
     from pygitgo.exceptions import GitCommandError, GitGoError
     from pygitgo.utils.executor import run_command
     from pygitgo.commands.git_branch import get_current_branch
     
-    rebase_in_progress = Path(".git/rebase-merge").exists() or Path(".git/rebase-apply").exists()
-    
-    if rebase_in_progress:
+    if is_rebase_in_progress():
         warning("A sync or jump hit a merge conflict and is paused.")
         if not confirm("Cancel the sync and discard any conflict fixes? (y/n): ", destructive=True):
             info("Canceled. The conflict is still active.")
@@ -198,9 +265,7 @@ def abort_pull_conflict():
         except GitCommandError as e:
             raise GitGoError(f"Abort failed: {getattr(e, 'stderr', str(e))}")
 
-    try:
-        run_command(["git", "rev-parse", "ORIG_HEAD"])
-    except GitCommandError:
+    if not has_orig_head():
         info("Nothing to undo. No recent pull was found (ORIG_HEAD does not exist).")
         return False
 
@@ -1,6 +1,60 @@
 from pygitgo.exceptions import GitCommandError, GitGoError
 from pygitgo.utils.cli_io import info, warning, error, write
+from pygitgo.utils.repo_context import get_repo_context
 from pygitgo.utils.executor import run_command
+from pygitgo.utils.config import get_config
+from pygitgo.utils import state_store
+from datetime import timedelta
+import time
+
+
+# When GitGo last fetched from a remote, per repository (keyed by its common
+# git dir). A key ends in "origin" after a full `git fetch origin`, or in
+# "origin/<branch>" after a pull of one branch, which also updates that
+# remote-tracking ref.
+FETCH_NAMESPACE = "fetch"
+FETCH_RECORD_TTL = timedelta(days=1)
+# How long, in minutes, a fetch counts as fresh enough for `gitgo jump` to sync
+# from the remote-tracking ref without going to the network.
+DEFAULT_SYNC_WINDOW = 10
+
+
+def _fetch_key(remote, branch=None):
+    context = get_repo_context()
+    if context is None:
+        return None
+    name = f"{remote}/{branch}" if branch else remote
+    return f"{context.common_dir}|{name}"
+
+
+def record_fetch(remote="origin", branch=None):
+    """Note that `remote` (or only its `branch`) was fetched successfully just now."""
+    key = _fetch_key(remote, branch)
+    if key is not None:
+        state_store.set(FETCH_NAMESPACE, key, time.time(), ttl=FETCH_RECORD_TTL)
+
+
+def get_sync_window():
+    """The `sync-window` setting in seconds. 0 turns the freshness check off."""
+    try:
+        return max(0, int(get_config("sync-window", DEFAULT_SYNC_WINDOW))) * 60
+    except ValueError:
+        return DEFAULT_SYNC_WINDOW * 60
+
+
+def fetched_recently(remote, branch):
+    """Whether `remote/branch` was fetched by GitGo within the sync window."""
+    window = get_sync_window()
+    if not window:
+        return False
+
+    fetched_at = [
+        state_store.get(FETCH_NAMESPACE, key)
+        for key in (_fetch_key(remote), _fetch_key(remote, branch))
+        if key is not None
+    ]
+    fetched_at = [value for value in fetched_at if isinstance(value, (int, float))]
+    return bool(fetched_at) and time.time() - max(fetched_at) < window
 
 
 def add_remote_origin(repo_url):
@@ -36,6 +90,7 @@ def confirm_remote_link(ok_text=None):
 def check_and_sync_branch(branch):
     try:
         run_command(["git", "fetch", "origin"], loading_msg="Checking if branch is up to date...", ok_text="Remote fetched.")
+        record_fetch("origin")
 
         try:
             local_commit = run_command(["git", "rev-parse", branch])
@@ -0,0 +1,242 @@
+from pygitgo.utils.executor import run_command, run_command_iter, run_exists, is_query_cached, get_generation
+from pygitgo.exceptions import GitCommandError
+import os
+
+
+STATUS_COMMAND = ["git", "status", "--porcelain=v2", "--branch", "-z", "--show-stash"]
+
+# The yes/no "anything to commit or stash?" check. `diff --quiet` stops at the
+# first changed file; untracked folders are listed once, not file by file.
+DIFF_QUIET_COMMAND = ["git", "diff", "--quiet", "HEAD", "--"]
+UNTRACKED_COMMAND = ["git", "ls-files", "--others", "--exclude-standard", "--directory", "--no-empty-directory"]
+INDEXED_FILES_COMMAND = ["git", "ls-files"]
+CHANGES_COMMANDS = [DIFF_QUIET_COMMAND, UNTRACKED_COMMAND]
+
+# Parsed snapshot for the current folder, reused until a git command that may
+# change the work tree runs.
+_CACHE = {"key": None, "snapshot": None}
+
+
+def _decode_path(raw):
+    # Git prints path bytes untouched. surrogateescape keeps a non-UTF-8 name
+    # exact, so it encodes back to the same bytes when passed to git again.
+    return raw.decode("utf-8", "surrogateescape")
+
+
+class StatusEntry:
+    """One changed path. `index` and `worktree` are the porcelain XY letters, '.' meaning unchanged.
+
+    `submodule` is None for ordinary files. For a submodule it holds the
+    porcelain "S<c><m><u>" field, e.g. "SC.." for new commits.
+    """
+
+    __slots__ = ("kind", "index", "worktree", "path", "orig_path", "submodule")
+
+    def __init__(self, kind, index, worktree, path, orig_path=None, submodule=None):
+        self.kind = kind
+        self.index = index
+        self.worktree = worktree
+        self.path = path
+        self.orig_path = orig_path
+        self.submodule = submodule
+
+    @property
+    def code(self):
+        """The short status code `git status --porcelain` (v1) prints, e.g. "M", "A", "??"."""
+        if self.kind == "untracked":
+            return "??"
+        if self.kind == "ignored":
+            return "!!"
+        return (self.index + self.worktree).replace(".", " ").strip()
+
+    @property
+    def is_staged(self):
+        return self.kind in ("changed", "renamed", "copied") and self.index != "."
+
+    @property
+    def is_unstaged(self):
+        return self.kind == "unmerged" or (self.kind in ("changed", "renamed", "copied") and self.worktree != ".")
+
+    @property
+    def is_submodule(self):
+        return self.submodule is not None
+
+    @property
+    def submodule_changes(self):
+        """What changed inside a submodule, in `git status` wording."""
+        if not self.submodule:
+            return []
+        flags = zip(self.submodule[1:], ("C", "M", "U"), ("new commits", "modified content", "untracked content"))
+        return [text for flag, expected, text in flags if flag == expected]
+
+    def __repr__(self):
+        return f"StatusEntry({self.kind!r}, {self.code!r}, {self.path!r})"
+
+
+def _split_records(data):
+    start = 0
+    while True:
+        end = data.find(b"\0", start)
+        if end == -1:
+            if start < len(data):
+                yield data[start:]
+            return
+        yield data[start:end]
+        start = end + 1
+
+
+def _as_bytes_records(output):
+    if isinstance(output, str):
+        output = output.encode("utf-8", "surrogateescape")
+    if isinstance(output, (bytes, bytearray)):
+        return _split_records(output)
+    return (record if isinstance(record, bytes) else record.encode("utf-8", "surrogateescape") for record in output)
+
+
+def _submodule_field(field):
+    return None if field[:1] == b"N" else field.decode("ascii")
+
+
+class StatusSnapshot:
+    """Branch, upstream and changed files from one `git status --porcelain=v2` call."""
+
+    def __init__(self, branch=None, oid=None, upstream=None, ahead=None, behind=None, stash_count=0, entries=None):
+        self.branch = branch
+        self.oid = oid
+        self.upstream = upstream
+        self.ahead = ahead
+        self.behind = behind
+        self.stash_count = stash_count
+        self.entries = entries or []
+
+    @classmethod
+    def parse(cls, output):
+        """Parse `--porcelain=v2 -z` output: bytes or str, whole or as an iterable of NUL-separated records.
+
+        Each record is read once, left to right, and only its path is decoded,
+        so parsing is linear in the size of the output.
+        """
+        snapshot = cls()
+        entries = snapshot.entries
+        records = _as_bytes_records(output)
+
+        for record in records:
+            tag = record[:2]
+            if tag == b"1 ":
+                fields = record.split(b" ", 8)
+                xy = fields[1].decode("ascii")
+                entries.append(StatusEntry("changed", xy[0], xy[1], _decode_path(fields[8]), submodule=_submodule_field(fields[2])))
+            elif tag == b"2 ":
+                fields = record.split(b" ", 9)
+                xy = fields[1].decode("ascii")
+                kind = "copied" if fields[8][:1] == b"C" else "renamed"
+                orig_path = next(records, None)
+                entries.append(StatusEntry(
+                    kind, xy[0], xy[1], _decode_path(fields[9]),
+                    None if orig_path is None else _decode_path(orig_path),
+                    submodule=_submodule_field(fields[2]),
+                ))
+            elif tag == b"u ":
+                fields = record.split(b" ", 10)
+                xy = fields[1].decode("ascii")
+                entries.append(StatusEntry("unmerged", xy[0], xy[1], _decode_path(fields[10]), submodule=_submodule_field(fields[2])))
+            elif tag == b"? ":
+                entries.append(StatusEntry("untracked", "?", "?", _decode_path(record[2:])))
+            elif tag == b"! ":
+                entries.append(StatusEntry("ignored", "!", "!", _decode_path(record[2:])))
+            elif tag == b"# ":
+                snapshot._parse_header(record[2:].decode("utf-8", "surrogateescape"))
+
+        return snapshot
+
+    def _parse_header(self, header):
+        key, _sep, value = header.partition(" ")
+        if key == "branch.oid":
+            self.oid = None if value == "(initial)" else value
+        elif key == "branch.head":
+            self.branch = None if value == "(detached)" else value
+        elif key == "branch.upstream":
+            self.upstream = value
+        elif key == "branch.ab":
+            ahead, behind = value.split()
+            self.ahead, self.behind = int(ahead), -int(behind)
+        elif key == "stash":
+            self.stash_count = int(value)
+
+    @property
+    def is_clean(self):
+        return not any(entry.kind != "ignored" for entry in self.entries)
+
+    @property
+    def staged(self):
+        return [entry for entry in self.entries if entry.is_staged]
+
+    @property
+    def unstaged(self):
+        return [entry for entry in self.entries if entry.is_unstaged]
+
+    @property
+    def untracked(self):
+        return [entry for entry in self.entries if entry.kind == "untracked"]
+
+    @property
+    def renamed(self):
+        return [entry for entry in self.entries if entry.kind == "renamed"]
+
+    @property
+    def copied(self):
+        return [entry for entry in self.entries if entry.kind == "copied"]
+
+    @property
+    def unmerged(self):
+        return [entry for entry in self.entries if entry.kind == "unmerged"]
+
+    @property
+    def has_staged(self):
+        return any(entry.is_staged for entry in self.entries)
+
+
+def _run_status(loading_msg=None):
+    try:
+        return StatusSnapshot.parse(run_command_iter(STATUS_COMMAND, separator=b"\0", decode=False, loading_msg=loading_msg))
+    except GitCommandError as e:
+        # --show-stash needs git 2.35+. Older versions get no stash count.
+        if "show-stash" not in getattr(e, "stderr", ""):
+            raise
+        return StatusSnapshot.parse(run_command_iter(STATUS_COMMAND[:-1], separator=b"\0", decode=False, loading_msg=loading_msg))
+
+
+def get_status(loading_msg=None):
+    """Return the StatusSnapshot for the current repository. Raises GitCommandError outside one."""
+    key = (os.getcwd(), get_generation())
+    if _CACHE["key"] != key:
+        _CACHE["snapshot"] = _run_status(loading_msg)
+        _CACHE["key"] = key
+    return _CACHE["snapshot"]
+
+
+def has_changes():
+    """Whether `git status` would list anything, without building a full snapshot.
+
+    A snapshot this command already has, or a prefetched status, answers
+    straight away. Raises GitCommandError outside a repository.
+    """
+    if _CACHE["key"] == (os.getcwd(), get_generation()) or is_query_cached(STATUS_COMMAND):
+        return not get_status().is_clean
+
+    try:
+        run_command(DIFF_QUIET_COMMAND)
+    except GitCommandError as e:
+        if e.returncode == 1:
+            return True
+        if "revision" not in getattr(e, "stderr", ""):
+            raise
+        # No commit yet, so there is no HEAD to compare with: any indexed file is a change.
+        if run_exists(INDEXED_FILES_COMMAND):
+            return True
+    return run_exists(UNTRACKED_COMMAND)
+
+
+def clear_status_cache():
+    _CACHE["key"] = None
+    _CACHE["snapshot"] = None
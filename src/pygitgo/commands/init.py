@@ -1,6 +1,7 @@
 from pygitgo.commands.git_core import git_init
 from pygitgo.exceptions import GitGoError
 from pygitgo.utils.cli_io import info, warning
+from pygitgo.utils import trace
 import urllib.request
 import urllib.error
 import zipfile
@@ -107,7 +108,7 @@ def _fetch_available_templates():
         },
     )
     try:
-        with urllib.request.urlopen(req, timeout=15) as resp:
+        with trace.urlopen(req, timeout=15) as resp:
             entries = json.loads(resp.read().decode("utf-8"))
     except urllib.error.HTTPError as e:
         raise GitGoError(f"Failed to fetch template list: HTTP {e.code}")
@@ -145,7 +146,7 @@ def _fetch_gitignore(resolved_lang):
     )
     req = urllib.request.Request(url, headers={"User-Agent": "GitGo-CLI"})
     try:
-        with urllib.request.urlopen(req, timeout=15) as response:
+        with trace.urlopen(req, timeout=15) as response:
             return response.read().decode("utf-8")
     except urllib.error.HTTPError as e:
         if e.code == 404:
@@ -186,7 +187,7 @@ def _download_and_extract_template(template_slug, target_dir):
     spinner = yaspin(**kwargs)
     spinner.start()
     try:
-        with urllib.request.urlopen(req, timeout=30) as response:
+        with trace.urlopen(req, timeout=30) as response:
             zip_data = response.read()
     except KeyboardInterrupt:
         spinner.stop()
@@ -2,11 +2,16 @@ from pygitgo.utils.cli_io import warning, info, success, error, confirm, banner,
 from pygitgo.commands.git_branch import (
     is_branch_exist, get_current_branch, git_new_branch, get_main_branch,
 )
+from pygitgo.commands.git_remote import fetched_recently, record_fetch
+from pygitgo.commands.git_status import has_changes, CHANGES_COMMANDS
 from pygitgo.commands.stash import (
     git_stash_pop, git_stash_push, git_stash_apply, git_stash_drop
 )
 from pygitgo.exceptions import GitCommandError, GitGoError
-from pygitgo.utils.executor import run_command
+from pygitgo.utils.repo_context import get_repo_context
+from pygitgo.utils.executor import run_command, gather_commands
+from pygitgo.utils.config import CONFIG_LIST_COMMAND, get_config
+from pygitgo.utils import refs
 import sys
 
 
@@ -57,8 +62,85 @@ def _jump_interrupt_cleanup(original_branch, stashed_code, created_branch):
         success("No git state was changed. Your files are safe.")
 
 
+def can_use_fetched_main(main_branch):
+    """Whether origin/<main> was fetched within the sync window and is still there to rebase onto."""
+    if not fetched_recently("origin", main_branch):
+        return False
+
+    ref = f"refs/remotes/origin/{main_branch}"
+    try:
+        return refs.ref_exists(ref)
+    except refs.RefsUnavailable:
+        pass
+
+    try:
+        run_command(["git", "rev-parse", "--verify", "--quiet", ref])
+        return True
+    except GitCommandError:
+        return False
+
+
+def sync_with_main(target_branch, main_branch, use_fetched=False):
+    """Rebase the branch onto main, pulled from origin or, with `use_fetched`, onto the already fetched origin/<main>."""
+    if use_fetched:
+        command = ["git", "rebase", "--autostash", f"origin/{main_branch}"]
+        loading_msg = f"Syncing '{target_branch}' with 'origin/{main_branch}' (fetched recently)..."
+    else:
+        command = ["git", "pull", "--rebase", "--autostash", "origin", main_branch]
+        loading_msg = f"Syncing '{target_branch}' with latest from '{main_branch}'..."
+
+    try:
+        pull_result = run_command(command, loading_msg=loading_msg, ok_text=f"Checked '{main_branch}'.", return_complete=True)
+    except GitCommandError as e:
+        stderr = getattr(e, "stderr", str(e))
+        if "conflict" in stderr.lower() or "rebase in progress" in stderr.lower():
+            if not use_fetched:
+                record_fetch("origin", main_branch)
+            warning(f"Sync from '{main_branch}' hit a conflict.")
+            info("Fix the conflict files, then run:  gitgo resolve")
+            info("Or cancel the jump with:  gitgo resolve --abort")
+        elif use_fetched:
+            warning(f"Could not rebase '{target_branch}' onto 'origin/{main_branch}': {stderr.strip()}")
+            info(f"On '{target_branch}', but not yet synced with '{main_branch}'.")
+        else:
+            warning(f"Could not sync from '{main_branch}': no remote or no internet.")
+            info(f"On '{target_branch}', but not yet synced with '{main_branch}'.")
+        return
+
+    if not use_fetched:
+        record_fetch("origin", main_branch)
+    pull_stdout = pull_result.stdout if hasattr(pull_result, "stdout") else str(pull_result)
+    if "up to date" in pull_stdout.lower():
+        info(f"'{target_branch}' was already up to date with '{main_branch}'.")
+    else:
+        info(f"'{target_branch}' synced with latest commits from '{main_branch}'.")
+
+
+def use_worktree_mode(args):
+    """`--worktree` and `--checkout` override the `jump-mode` setting.
+
+    Jumps made by another command (push, new branch) always check out in place,
+    because that command carries on in the current folder.
+    """
+    if getattr(args, "checkout", False):
+        return False
+    if getattr(args, "worktree", False):
+        return True
+    if getattr(args, "command", None) != "jump":
+        return False
+    return get_config("jump-mode", "checkout") == "worktree"
+
+
 def jump_operation(args):
     target_branch = args.branch
+
+    if use_worktree_mode(args):
+        if getattr(args, "sync", None) is not None:
+            raise GitGoError("--sync and --no-sync only apply to checkout jumps. Add --checkout to use them.")
+        from pygitgo.commands.worktree import worktree_jump
+        worktree_jump(target_branch)
+        return
+
     original_branch = get_current_branch(safe=True)
 
     if original_branch == target_branch:
@@ -66,26 +148,40 @@ def jump_operation(args):
         return
 
     try:
-        has_changes = run_command(["git", "status", "--porcelain"], loading_msg="Checking for local changes...")
+        target_exists = is_branch_exist(target_branch)
+    except GitCommandError:
+        target_exists = False
+
+    # The local-changes check and the main-branch lookup do not depend on each
+    # other, so run them side by side.
+    preflight = list(CHANGES_COMMANDS)
+    if target_exists:
+        preflight += [CONFIG_LIST_COMMAND]
+    gather_commands(preflight, loading_msg="Checking for local changes...")
+
+    try:
+        dirty = has_changes()
     except GitCommandError as e:
         stderr = getattr(e, "stderr", str(e))
         if "not a git repository" in stderr.lower():
             raise GitGoError("Not inside a git repository. Run 'gitgo init' or 'gitgo link' first.")
         raise GitGoError(f"Could not check repository status: {stderr}")
 
+    # Read now: stashing and switching branches below clear the query cache.
+    main_branch = get_main_branch() if target_exists else None
+
     stashed_code = False
     created_branch = None
 
     try:
-        if has_changes.strip():
+        if dirty:
             stash_result = git_stash_push(label="GitGo Jump Auto-Stash", loading_msg="Auto-saving local changes before switching...")
             if not stash_result:
-                from pathlib import Path
-                lock_file = Path(".git/index.lock")
-                if lock_file.exists():
+                context = get_repo_context()
+                if context and context.index_lock.exists():
                     warning("A stale lock file is blocking git.")
-                    info(f"Delete this file and try again: {lock_file.absolute()}")
-                elif Path(".git/rebase-merge").exists() or Path(".git/rebase-apply").exists():
+                    info(f"Delete this file and try again: {context.index_lock}")
+                elif context and context.rebase_in_progress:
                     warning("A rebase is in progress. Finish or abort it first.")
                     info("Abort with:  gitgo resolve --abort")
                 else:
@@ -94,7 +190,7 @@ def jump_operation(args):
                 raise GitGoError("Jump aborted: could not save local changes.")
             stashed_code = True
 
-        if not is_branch_exist(target_branch):
+        if not target_exists:
             write()
             warning(f"Branch '{target_branch}' does not exist.")
             if not confirm(f"Create '{target_branch}' and switch to it? (y/n): "):
@@ -114,28 +210,13 @@ def jump_operation(args):
                 loading_msg=f"Switching to '{target_branch}'...",
                 ok_text=f"Switched to '{target_branch}'."
             )
-            main_branch = get_main_branch()
-            try:
-                pull_result = run_command(
-                    ["git", "pull", "--rebase", "--autostash", "origin", main_branch],
-                    loading_msg=f"Syncing '{target_branch}' with latest from '{main_branch}'...",
-                    ok_text=f"Checked '{main_branch}'.",
-                    return_complete=True,
-                )
-                pull_stdout = pull_result.stdout if hasattr(pull_result, "stdout") else str(pull_result)
-                if "already up to date" in pull_stdout.lower():
-                    info(f"'{target_branch}' was already up to date with '{main_branch}'.")
-                else:
-                    info(f"'{target_branch}' synced with latest commits from '{main_branch}'.")
-            except GitCommandError as e:
-                stderr = getattr(e, "stderr", str(e))
-                if "conflict" in stderr.lower() or "rebase in progress" in stderr.lower():
-                    warning(f"Sync from '{main_branch}' hit a conflict.")
-                    info("Fix the conflict files, then run:  gitgo resolve")
-                    info("Or cancel the jump with:  gitgo resolve --abort")
-                else:
-                    warning(f"Could not sync from '{main_branch}': no remote or no internet.")
-                    info(f"On '{target_branch}', but not yet synced with '{main_branch}'.")
+            sync = getattr(args, "sync", None)
+            if sync is False:
+                info(f"On '{target_branch}'. Skipped syncing with '{main_branch}' (--no-sync).")
+            else:
+                # A jump back and forth within the sync window reuses the last
+                # fetch instead of asking origin again.
+                sync_with_main(target_branch, main_branch, use_fetched=sync is None and can_use_fetched_main(main_branch))
 
         if stashed_code:
             apply_result = git_stash_apply(loading_msg="Restoring your local changes...")
@@ -2,7 +2,8 @@ from pygitgo.commands.git_branch import is_branch_exist, get_current_branch
 from pygitgo.utils.colors import YELLOW, CYAN, GREEN, RESET
 from pygitgo.exceptions import GitCommandError, GitGoError
 from pygitgo.utils.cli_io import info, write, banner
-from pygitgo.utils.executor import run_command
+from pygitgo.utils.executor import run_command, run_command_iter
+from itertools import chain
 
 def log_operation(args):
     number = args.number
@@ -39,8 +40,9 @@ def log_operation(args):
         command.append(branch)
         
     try:
-        output = run_command(command)
-        if not output:
+        records = run_command_iter(command)
+        first = next(records, None)
+        if first is None:
             info("No commits found.")
             return
             
@@ -50,7 +52,7 @@ def log_operation(args):
             
         banner("Commit History", banner_subtitle, required=True)
         
-        for line in output.splitlines():
+        for line in chain([first], records):
             try:
                 commit_hash, author, date, message = line.split("||", 3)
                 write(f"[{YELLOW}{commit_hash}{RESET}] {message} ({CYAN}{date}{RESET}) [{GREEN}{author}{RESET}]", required=True)
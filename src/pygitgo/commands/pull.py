@@ -1,6 +1,7 @@
 from pygitgo.utils.cli_io import success, warning, error, info, write
 from pygitgo.commands.git_core import is_rebase_in_progress, ensure_inside_git_repository
 from pygitgo.commands.git_branch import get_current_branch
+from pygitgo.commands.git_remote import record_fetch
 from pygitgo.exceptions import GitCommandError, GitGoError
 from pygitgo.utils.executor import run_command
 import sys
@@ -53,6 +54,7 @@ def pull_operation(args):
             ok_text=f"Checked '{branch}'.",
             return_complete=True,
         )
+        record_fetch("origin", branch)
 
         pull_stdout = pull_result.stdout if hasattr(pull_result, "stdout") else str(pull_result)
         already_synced = "already up to date" in pull_stdout.lower()
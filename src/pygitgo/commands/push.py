@@ -1,11 +1,15 @@
 from pygitgo.commands.git_branch import git_new_branch, get_current_branch, is_branch_exist, get_head_sha
 from pygitgo.commands.staging import get_changed_files, display_file_picker, selective_stage
 from pygitgo.utils.cli_io import info, warning, success, confirm, banner, write
-from pygitgo.commands.git_core import git_commit, git_push, ensure_inside_git_repository
+from pygitgo.commands.git_core import (
+    git_commit, git_push, ensure_inside_git_repository, has_unpushed_commits, INSIDE_WORK_TREE_COMMAND,
+)
+from pygitgo.utils.executor import run_command, gather_commands
+from pygitgo.commands.git_status import get_status, STATUS_COMMAND
+from pygitgo.utils.config import get_config, CONFIG_LIST_COMMAND
 from pygitgo.exceptions import GitCommandError, GitGoError
+from pygitgo.utils.repo_context import RESOLVE_COMMAND
 from pygitgo.commands.jump import jump_operation
-from pygitgo.utils.executor import run_command
-from pygitgo.utils.config import get_config
 from argparse import Namespace
 import sys
 
@@ -30,11 +34,7 @@ def _push_interrupt_cleanup(original_branch, original_head, created_branch):
         return
 
     try:
-        status = run_command(["git", "status", "--porcelain"])
-        has_staged = any(
-            ln and ln[0] not in (' ', '?', '!')
-            for ln in status.splitlines()
-        )
+        has_staged = get_status().has_staged
     except GitCommandError:
         has_staged = False
 
@@ -59,6 +59,10 @@ def _push_interrupt_cleanup(original_branch, original_head, created_branch):
 
 
 def push_operation(args):
+    gather_commands([
+        INSIDE_WORK_TREE_COMMAND, RESOLVE_COMMAND,
+        CONFIG_LIST_COMMAND, STATUS_COMMAND,
+    ])
     ensure_inside_git_repository()
     branch = args.branch
     message = args.message
@@ -107,7 +111,7 @@ def push_operation(args):
                 info(f"No commit message given. Using: '{message}'\n")
 
         if select:
-            files = get_changed_files()
+            files = list(get_changed_files())
             if not files:
                 info("\nWorking tree is clean. Nothing to select.")
                 warning("Make some changes first before using GitGo to commit and push.")
@@ -131,11 +135,7 @@ def push_operation(args):
                 git_push(branch)
             else:
                 try:
-                    unpushed = run_command(
-                        ["git", "log", "--oneline", f"origin/{branch}..HEAD"],
-                        loading_msg="Checking for unpushed commits..."
-                    )
-                    if unpushed.strip():
+                    if has_unpushed_commits(branch, loading_msg="Checking for unpushed commits..."):
                         warning("\nNo changes to commit, but found unpushed commits. Pushing to remote...")
                         git_push(branch)
                     else:
@@ -1,7 +1,8 @@
-from pygitgo.utils.config import get_config, set_config
+from pygitgo.utils.config import get_config, set_config, unset_git_config
 from pygitgo.utils.cli_io import info, warning, banner
 from pygitgo.utils.platform import open_url
-from pygitgo.exceptions import GitGoError
+from pygitgo.utils import trace
+from pygitgo.exceptions import GitCommandError, GitGoError
 import subprocess
 import urllib
 import json
@@ -13,12 +14,10 @@ _TOKEN_URL = "https://github.com/settings/tokens/new?scopes=repo&description=Git
 
 
 def _clear_saved_token():
+    # Through the config cache, so later lookups in this process see it gone.
     try:
-        subprocess.run(
-            ["git", "config", "--global", "--unset", "gitgo.github-token"],
-            capture_output=True
-        )
-    except Exception:
+        unset_git_config("gitgo.github-token", scope="global")
+    except GitCommandError:
         pass
 
 
@@ -46,7 +45,7 @@ def _get_github_token():
         return token
 
     try:
-        result = subprocess.run(
+        result = trace.run_traced(
             ["gh", "auth", "token"],
             capture_output=True, text=True, timeout=5
         )
@@ -88,7 +87,7 @@ def create_github_repo(name, private=False, description="", token=None, retry_co
     )
 
     try:
-        with urllib.request.urlopen(req, timeout=15) as resp:
+        with trace.urlopen(req, timeout=15) as resp:
             return json.loads(resp.read().decode("utf-8"))
     except urllib.error.HTTPError as e:
         if e.code == 422:
@@ -182,7 +181,7 @@ def delete_github_repo(full_name, token=None):
         }, method="DELETE",
     )
     try:
-        with urllib.request.urlopen(req, timeout=15) as resp:
+        with trace.urlopen(req, timeout=15) as resp:
             return True
     except urllib.error.HTTPError as e:
         if e.code == 403:
@@ -1,8 +1,7 @@
 from pygitgo.utils.cli_io import info, warning, error, banner
 from pygitgo.exceptions import GitCommandError, GitGoError
 from pygitgo.utils.executor import run_command
-from pygitgo.commands.git_core import abort_pull_conflict, ensure_inside_git_repository
-from pathlib import Path
+from pygitgo.commands.git_core import abort_pull_conflict, ensure_inside_git_repository, is_rebase_in_progress
 
 def resolve_operation(args):
     ensure_inside_git_repository()
@@ -11,8 +10,7 @@ def resolve_operation(args):
         abort_pull_conflict()
         return
 
-    rebase_in_progress = Path(".git/rebase-merge").exists() or Path(".git/rebase-apply").exists()
-    if not rebase_in_progress:
+    if not is_rebase_in_progress():
         raise GitGoError("No conflict resolution is currently in progress. You are good to go!")
         
     # Stage the resolved files
@@ -0,0 +1,82 @@
+from pygitgo.exceptions import GitGoError
+import sys
+import os
+
+
+# A program cannot change its parent shell's folder, so the shell wraps gitgo
+# in a function: gitgo writes the folder to a temporary file named by
+# GITGO_CD_FILE, and the function changes into it once gitgo exits. Shells
+# run this at startup, so the module imports nothing heavy.
+CD_FILE_ENV = "GITGO_CD_FILE"
+
+POSIX_SCRIPT = f"""\
+gitgo() {{
+    local gitgo_cd_file gitgo_status gitgo_dir
+    gitgo_cd_file="$(mktemp "${{TMPDIR:-/tmp}}/gitgo-cd.XXXXXX")" || {{ command gitgo "$@"; return; }}
+    {CD_FILE_ENV}="$gitgo_cd_file" command gitgo "$@"
+    gitgo_status=$?
+    gitgo_dir="$(cat "$gitgo_cd_file" 2>/dev/null)"
+    rm -f "$gitgo_cd_file"
+    if [ -n "$gitgo_dir" ] && [ -d "$gitgo_dir" ]; then
+        cd "$gitgo_dir" || return
+    fi
+    return $gitgo_status
+}}
+"""
+
+FISH_SCRIPT = f"""\
+function gitgo
+    set -l gitgo_cd_file (mktemp)
+    env {CD_FILE_ENV}=$gitgo_cd_file gitgo $argv
+    set -l gitgo_status $status
+    set -l gitgo_dir (cat $gitgo_cd_file 2>/dev/null)
+    rm -f $gitgo_cd_file
+    if test -n "$gitgo_dir"; and test -d "$gitgo_dir"
+        cd $gitgo_dir
+    end
+    return $gitgo_status
+end
+"""
+
+POWERSHELL_SCRIPT = f"""\
+function gitgo {{
+    $gitgoCdFile = [System.IO.Path]::GetTempFileName()
+    $env:{CD_FILE_ENV} = $gitgoCdFile
+    try {{
+        & (Get-Command gitgo -CommandType Application | Select-Object -First 1) @args
+    }} finally {{
+        Remove-Item Env:{CD_FILE_ENV} -ErrorAction SilentlyContinue
+    }}
+    $gitgoDir = Get-Content $gitgoCdFile -ErrorAction SilentlyContinue
+    Remove-Item $gitgoCdFile -ErrorAction SilentlyContinue
+    if ($gitgoDir -and (Test-Path $gitgoDir -PathType Container)) {{
+        Set-Location $gitgoDir
+    }}
+}}
+"""
+
+SCRIPTS = {
+    "bash": POSIX_SCRIPT,
+    "zsh": POSIX_SCRIPT,
+    "fish": FISH_SCRIPT,
+    "powershell": POWERSHELL_SCRIPT,
+}
+
+
+def detect_shell():
+    """The shell to print the function for: the login shell's name, or PowerShell on Windows."""
+    name = os.path.basename(os.environ.get("SHELL", "")).lower()
+    if name in SCRIPTS:
+        return name
+    if os.name == "nt":
+        return "powershell"
+    return "bash"
+
+
+def shell_init_operation(args):
+    shell = getattr(args, "shell", None) or detect_shell()
+    if shell not in SCRIPTS:
+        raise GitGoError(f"Unsupported shell '{shell}'. Supported shells: {', '.join(SCRIPTS)}")
+
+    # Printed as-is (no colors, ignores --quiet): the output is meant for eval.
+    sys.stdout.write(SCRIPTS[shell])
@@ -1,7 +1,8 @@
+from pygitgo.exceptions import GitCommandError, GitGoError
+from pygitgo.utils.cli_io import success, warning
+from pygitgo.commands.git_status import get_status
 from pygitgo.utils.executor import run_command
-from pygitgo.exceptions import GitCommandError
-from pygitgo.utils.cli_io import success
-from pick import pick
+import re
 
 
 STATUS_LABELS = {
@@ -9,41 +10,95 @@ STATUS_LABELS = {
     "A": "added",
     "D": "deleted",
     "R": "renamed",
+    "C": "copied",
     "??": "new file",
 }
 
+# Selected paths are matched literally: a file named `*.py` stages only itself.
+ADD_COMMAND = ["git", "--literal-pathspecs", "add"]
+# Streams NUL-separated paths on stdin (git 2.25+): one process, one index write.
+ADD_FROM_STDIN_COMMAND = ADD_COMMAND + ["--pathspec-from-file=-", "--pathspec-file-nul"]
+# Older git takes the paths as arguments, in chunks that fit every platform's
+# command-line limit (Windows allows about 32K characters).
+MAX_ARGV_CHARS = 30000
+
+_UNMATCHED_PATHSPEC = re.compile(r"pathspec '(.+?)' did not match any files")
+
 
 def get_changed_files():
     try:
-        status = run_command(["git", "status", "--porcelain"])
+        status = get_status()
     except GitCommandError:
-        return []
-    
-    files = []
-    for line in status.strip().splitlines():
-        if len(line) < 3:
-            continue
-        status_code = line[:2].strip()
-        filepath = line[3:].strip()
-        label = STATUS_LABELS.get(status_code, "changed")
-        files.append({"status": status_code, "label": label, "path": filepath})
-
-    return files
+        return
+
+    for entry in status.entries:
+        label = STATUS_LABELS.get(entry.code, "changed")
+        if entry.is_submodule:
+            label = "submodule: " + (", ".join(entry.submodule_changes) or label)
+        yield {"status": entry.code, "label": label, "path": entry.path}
 
 def display_file_picker(files):
-    options = [f"({f['label']}) {f['path']}" for f in files]
+    """Let the user pick what to stage. Returns a set of pathspecs: files, and folders selected as a whole."""
+    # Imported here: the picker needs curses, which only `push --select` uses.
+    from pygitgo.commands.file_picker import pick_files
+    return pick_files(files)
 
-    selected = pick(
-        options,
-        "Select files to stage (SPACE to toggle, ENTER to confirm):",
-        multiselect=True,
-        min_selection_count=0
-    )
 
-    return [files[idx]["path"] for _, idx in selected]
+def _chunk_paths(paths):
+    chunk, size = [], 0
+    for path in paths:
+        if chunk and size + len(path) + 1 > MAX_ARGV_CHARS:
+            yield chunk
+            chunk, size = [], 0
+        chunk.append(path)
+        size += len(path) + 1
+    if chunk:
+        yield chunk
+
+
+def add_paths(paths, loading_msg, ok_text=None):
+    """`git add` exactly these paths, however many: streamed on stdin, or in argv-sized chunks on old git."""
+    try:
+        run_command(ADD_FROM_STDIN_COMMAND, loading_msg=loading_msg, ok_text=ok_text, input="\0".join(paths) + "\0")
+        return
+    except GitCommandError as e:
+        if "pathspec-from-file" not in getattr(e, "stderr", ""):
+            raise
+
+    for chunk in _chunk_paths(paths):
+        run_command(ADD_COMMAND + ["--"] + chunk, loading_msg=loading_msg, ok_text=ok_text)
+
+
+def _stage_all(paths):
+    """Stage `paths` in one `git add`. Paths git rejects are dropped and the rest retried.
+
+    Returns {path: reason} for the paths that could not be staged.
+    """
+    failed = {}
+    remaining = list(paths)
+    while remaining:
+        try:
+            add_paths(remaining, f"Staging {len(remaining)} file(s)...")
+            return failed
+        except GitCommandError as e:
+            stderr = getattr(e, "stderr", "") or str(e)
+            rejected = set(_UNMATCHED_PATHSPEC.findall(stderr)) & set(remaining)
+            if not rejected:
+                # Not a per-path problem (index.lock, not a repository, ...): nothing was staged.
+                raise
+            for path in rejected:
+                failed[path] = "no longer exists or has no changes"
+            remaining = [path for path in remaining if path not in rejected]
+    return failed
 
 
 def selective_stage(selected_files):
-    for filepath in selected_files:
-        run_command(["git", "add", "--", filepath])
-    success(f"\n{len(selected_files)} file(s) staged for commit.")
+    selected_files = sorted(selected_files)
+    failed = _stage_all(selected_files)
+    for path, reason in failed.items():
+        warning(f"Could not stage '{path}': {reason}.")
+
+    staged = len(selected_files) - len(failed)
+    if not staged:
+        raise GitGoError("None of the selected files could be staged.")
+    success(f"\n{staged} path(s) staged for commit.")
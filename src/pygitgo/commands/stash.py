@@ -1,4 +1,4 @@
-from pygitgo.utils.executor import run_command
+from pygitgo.utils.executor import run_command, run_command_iter
 from pygitgo.exceptions import GitCommandError
 
 def git_stash_push(label="GitGo Auto-Stash", loading_msg="Saving your changes...", ok_text=None):
@@ -62,16 +62,17 @@ def git_stash_drop(stash_id=None, loading_msg="Cleaning up stash...", ok_text=No
         return False
 
 def git_stash_list(loading_msg="Fetching stash list...", ok_text=None):
+    """Yield `stash-ref||date||subject` lines, newest first. Yields nothing on error."""
     if not ok_text:
         ok_text = "Stash list fetched."
     try:
-        return run_command([
+        yield from run_command_iter([
             "git", "stash", "list",
             "--date=format:%Y-%m-%d %H:%M:%S",
             "--pretty=%gd||%cd||%s"
         ], loading_msg=loading_msg, ok_text=ok_text)
     except GitCommandError:
-        return ""
+        return
 
 def git_stash_clear(loading_msg="Clearing all stashes...", ok_text=None):
     if not ok_text:
@@ -1,43 +1,60 @@
 from pygitgo.utils.cli_io import info, success, warning, error, confirm, banner, write
 from pygitgo.exceptions import GitCommandError, GitGoError
 from pygitgo.commands.git_core import ensure_inside_git_repository
+from pygitgo.commands.git_status import has_changes
 from pygitgo.commands.stash import (
     git_stash_apply, git_stash_clear, git_stash_drop,
     git_stash_list, git_stash_push
 )
+from pygitgo.utils.repo_context import get_repo_context
 from pygitgo.utils.executor import run_command
 import sys
 
 
 
-def all_save_state():
-    try:
-        output = git_stash_list()
-        if not output:
-            return []
-    except GitCommandError:
-        return []
+def worktree_branch():
+    """The branch whose states are shown, when other worktrees share the stash list; otherwise None."""
+    context = get_repo_context()
+    if context is None or not context.has_linked_worktrees:
+        return None
+    return context.branch or "(no branch)"
 
-    save_states = []
-    lines = output.splitlines()
-    total = len(lines)
 
-    for i, line in enumerate(reversed(lines)):
-        try:
-            stash_ref, date, message = line.split("||", 2)
-            stash_index = total - 1 - i
+def _made_on(message, branch):
+    # git prefixes every stash subject with the branch it was made on.
+    return message.startswith((f"On {branch}: ", f"WIP on {branch}: "))
+
+
+def all_save_state():
+    # Worktrees of one repository share a single stash list, so each one
+    # only sees the states saved on its own branch.
+    branch = worktree_branch()
+    try:
+        lines = git_stash_list()
+        save_states = []
+
+        # git lists the newest stash first; ids count up from the oldest.
+        for stash_index, line in enumerate(lines):
+            try:
+                _stash_ref, date, message = line.split("||", 2)
+            except ValueError:
+                warning(f"Skipping malformed line: {line}")
+                continue
+            if branch is not None and not _made_on(message, branch):
+                continue
 
             save_states.append({
-                "id": i + 1,
                 "ref": f"stash@{{{stash_index}}}",
                 "date": date,
                 "message": message,
                 "stash_index": stash_index
             })
+    except GitCommandError:
+        return []
 
-        except ValueError:
-            warning(f"Skipping malformed line: {line}")
-
+    save_states.reverse()
+    for state_id, save_state in enumerate(save_states, start=1):
+        save_state["id"] = state_id
     return save_states
 
 
@@ -155,12 +172,12 @@ def save_state(state_name=None):
         state_name = "Auto-Save"
 
     try:
-        has_changes = run_command(['git', 'status', '--porcelain'])
+        dirty = has_changes()
     except GitCommandError:
         warning("Could not check for local changes - make sure you're in a valid git repository.")
         return
 
-    if not has_changes.strip():
+    if not dirty:
         info("No local changes to save.")
         return
 
@@ -185,7 +202,14 @@ def delete_state(identifier=None):
     else:
         if identifier == '-a':
             if confirm("Delete all saved states? This cannot be undone. (y/n): ", destructive=True):
-                clear_result = git_stash_clear()
+                if worktree_branch() is None:
+                    clear_result = git_stash_clear()
+                else:
+                    # Oldest first, so the indexes of the ones still to drop do not shift.
+                    clear_result = all(
+                        git_stash_drop(stash_id=str(state["stash_index"]))
+                        for state in sorted(save_states, key=lambda state: state["stash_index"], reverse=True)
+                    )
                 if not clear_result:
                     error("Failed to delete all saved states.")
                 else:
@@ -1,14 +1,19 @@
-from pygitgo.commands.git_core import git_commit, git_push, ensure_inside_git_repository
+from pygitgo.commands.git_core import (
+    git_commit, git_push, ensure_inside_git_repository, has_unpushed_commits, INSIDE_WORK_TREE_COMMAND,
+)
 from pygitgo.utils.cli_io import info, error, warning, banner, write
 from pygitgo.commands.git_branch import get_current_branch
+from pygitgo.commands.git_remote import record_fetch
 from pygitgo.exceptions import GitCommandError, GitGoError
 from pygitgo.commands.pull import _pull_interrupt_cleanup
-from pygitgo.utils.executor import run_command
-from pygitgo.utils.config import get_config
+from pygitgo.utils.executor import run_command, gather_commands
+from pygitgo.utils.repo_context import RESOLVE_COMMAND
+from pygitgo.utils.config import get_config, CONFIG_LIST_COMMAND
 import sys
 
 
 def sync_operation(args):
+    gather_commands([INSIDE_WORK_TREE_COMMAND, RESOLVE_COMMAND, CONFIG_LIST_COMMAND])
     ensure_inside_git_repository()
 
     message = getattr(args, 'message', None)
@@ -34,6 +39,7 @@ def sync_operation(args):
                 ok_text="Checked remote.",
                 return_complete=True,
             )
+            record_fetch("origin", branch)
             pull_stdout = pull_result.stdout if hasattr(pull_result, "stdout") else str(pull_result)
             if "already up to date" not in pull_stdout.lower():
                 info("Latest changes pulled from remote.")
@@ -60,12 +66,7 @@ def sync_operation(args):
         git_push(branch)    
     else:
         try:
-            if remote_exists:
-                unpushed = run_command(["git", "log", "--oneline", f"origin/{branch}..HEAD"])
-            else:
-                unpushed = run_command(["git", "log", "--oneline", "HEAD"])
-
-            if unpushed.strip():
+            if has_unpushed_commits(branch, on_remote=remote_exists):
                 info("No new changes to commit, but found unpushed commits.")
                 git_push(branch)
             else:
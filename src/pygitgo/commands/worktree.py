@@ -0,0 +1,190 @@
+from pygitgo.utils.cli_io import warning, info, success, confirm, write
+from pygitgo.commands.git_branch import is_branch_exist
+from pygitgo.commands.shell_init import CD_FILE_ENV
+from pygitgo.utils.repo_context import get_repo_context
+from pygitgo.exceptions import GitCommandError, GitGoError
+from pygitgo.utils.executor import run_command
+from pygitgo.utils.config import get_config
+from pygitgo.utils import state_store
+from pathlib import Path
+import hashlib
+import time
+import os
+
+
+# In worktree mode each branch is checked out once, in its own folder under the
+# worktree root. A jump changes folders instead of rewriting the working tree,
+# so it costs the same on any repository size and edits stay where they are.
+WORKTREE_NAMESPACE = "worktrees"
+DEFAULT_WORKTREE_ROOT = Path.home() / ".gitgo" / "worktrees"
+DEFAULT_WORKTREE_LIMIT = 5
+LIST_COMMAND = ["git", "worktree", "list", "--porcelain"]
+
+
+def list_worktrees():
+    """Every worktree of this repository, the main checkout first, as dicts with path, branch, locked and prunable."""
+    worktrees = []
+    current = None
+    for line in run_command(LIST_COMMAND).splitlines():
+        if line.startswith("worktree "):
+            current = {"path": Path(line[len("worktree "):]), "branch": None, "locked": False, "prunable": False}
+            worktrees.append(current)
+        elif current is None:
+            continue
+        elif line.startswith("branch refs/heads/"):
+            current["branch"] = line[len("branch refs/heads/"):]
+        elif line.split(" ", 1)[0] in ("locked", "prunable"):
+            current[line.split(" ", 1)[0]] = True
+    return worktrees
+
+
+def get_worktree_root(context):
+    """The folder holding this repository's gitgo-managed worktrees, one subfolder per branch."""
+    root = Path(os.path.expanduser(get_config("worktree-root", str(DEFAULT_WORKTREE_ROOT))))
+    common_dir = context.common_dir
+    name = common_dir.parent.name if common_dir.name == ".git" else common_dir.name
+    # Two clones with the same folder name must not share worktrees.
+    digest = hashlib.sha1(str(common_dir).encode("utf-8")).hexdigest()[:8]
+    return root / f"{name}-{digest}"
+
+
+def get_worktree_limit():
+    try:
+        return max(1, int(get_config("worktree-limit", DEFAULT_WORKTREE_LIMIT)))
+    except ValueError:
+        return DEFAULT_WORKTREE_LIMIT
+
+
+def _key(path):
+    return str(Path(path).resolve())
+
+
+def _same_path(a, b):
+    return Path(a).resolve() == Path(b).resolve()
+
+
+def _is_inside(path, root):
+    try:
+        Path(path).resolve().relative_to(Path(root).resolve())
+        return True
+    except ValueError:
+        return False
+
+
+def _remove_empty_parents(path, root):
+    # A branch such as 'feature/login' leaves an empty 'feature' folder behind.
+    for parent in Path(path).parents:
+        if _same_path(parent, root):
+            return
+        try:
+            parent.rmdir()
+        except OSError:
+            return
+
+
+def evict_idle_worktrees(worktrees, root, keep):
+    """Remove the least recently used managed worktrees beyond the limit.
+
+    Only worktrees under `root` are considered; the main checkout and worktrees
+    you created yourself are never touched. git refuses to remove a worktree
+    with uncommitted or untracked files, and those are kept.
+    """
+    managed = [wt for wt in worktrees if _is_inside(wt["path"], root)]
+    excess = len(managed) - get_worktree_limit()
+    if excess <= 0:
+        return []
+
+    last_used = state_store.items(WORKTREE_NAMESPACE)
+    candidates = [
+        wt for wt in managed
+        if not wt["locked"] and not any(_same_path(wt["path"], path) for path in keep)
+    ]
+    candidates.sort(key=lambda wt: last_used.get(_key(wt["path"]), 0))
+
+    removed = []
+    for wt in candidates:
+        if len(removed) >= excess:
+            break
+        try:
+            run_command(["git", "worktree", "remove", str(wt["path"])])
+        except GitCommandError:
+            continue
+        _remove_empty_parents(wt["path"], root)
+        removed.append(wt)
+        info(f"Removed the idle worktree for '{wt['branch'] or wt['path'].name}'.")
+
+    if removed:
+        state_store.delete(WORKTREE_NAMESPACE, [_key(wt["path"]) for wt in removed])
+    return removed
+
+
+def _add_worktree(target_branch, path):
+    if is_branch_exist(target_branch):
+        # For a branch that exists only on a remote, git creates the local
+        # tracking branch itself.
+        command = ["git", "worktree", "add", str(path), target_branch]
+    else:
+        write()
+        warning(f"Branch '{target_branch}' does not exist.")
+        if not confirm(f"Create '{target_branch}' in a new worktree? (y/n): "):
+            info("Jump canceled.")
+            return False
+        command = ["git", "worktree", "add", "-b", target_branch, str(path)]
+
+    run_command(
+        command,
+        loading_msg=f"Checking out '{target_branch}' in its own worktree...",
+        ok_text=f"Worktree for '{target_branch}' ready.",
+    )
+    return True
+
+
+def change_directory(path):
+    """Ask the `gitgo shell-init` function to cd into `path`, or tell the user to."""
+    cd_file = os.environ.get(CD_FILE_ENV)
+    if cd_file:
+        try:
+            Path(cd_file).write_text(str(path), encoding="utf-8")
+            return True
+        except OSError:
+            pass
+
+    info(f'Your branch is in:  cd "{path}"', required=True)
+    info("To change folders automatically, add 'eval \"$(gitgo shell-init)\"' to your shell profile.")
+    return False
+
+
+def worktree_jump(target_branch):
+    """Switch to `target_branch` by moving to its worktree, creating it on first use."""
+    context = get_repo_context()
+    if context is None:
+        raise GitGoError("Not inside a git repository. Run 'gitgo init' or 'gitgo link' first.")
+
+    current = context.toplevel
+    root = get_worktree_root(context)
+    worktrees = list_worktrees()
+    if any(wt["prunable"] for wt in worktrees):
+        # A worktree folder deleted by hand still holds on to its branch.
+        run_command(["git", "worktree", "prune"])
+        worktrees = [wt for wt in worktrees if not wt["prunable"]]
+
+    existing = next((wt for wt in worktrees if wt["branch"] == target_branch), None)
+    if existing is not None:
+        target = existing["path"]
+        if _same_path(target, current):
+            warning(f"Already on branch '{target_branch}'.")
+            return
+    else:
+        target = root.joinpath(*target_branch.split("/"))
+        if target.exists() and any(target.iterdir()):
+            raise GitGoError(f"'{target}' already exists and is not a worktree of this repository.")
+        if not _add_worktree(target_branch, target):
+            return
+        worktrees.append({"path": target, "branch": target_branch, "locked": False, "prunable": False})
+
+    now = time.time()
+    state_store.set_many(WORKTREE_NAMESPACE, {_key(current): now, _key(target): now})
+    evict_idle_worktrees(worktrees, root, keep=[current, target])
+
+    success(f"On '{target_branch}'. Your changes in '{context.branch or current.name}' stay where they are.")
+    change_directory(target)
@@ -1,28 +1,69 @@
-from pygitgo.utils.update_checker import check_for_updates_background, check_for_updates
+from pygitgo.utils.update_checker import check_for_updates, refresh_cache, WORKER_FLAG
 from pygitgo.utils.cli_io import info, warning, error, write, _highlight_cmd
 from pygitgo.utils.bootstrap import ensure_first_run_setup
-from pygitgo.commands.resolve import resolve_operation
-from pygitgo.commands.config import config_operation
-from pygitgo.commands.state import state_operation
-from pygitgo.commands.undo import undo_operation
-from pygitgo.commands.pull import pull_operation
-from pygitgo.commands.jump import jump_operation
-from pygitgo.commands.link import link_operation
-from pygitgo.commands.push import push_operation
-from pygitgo.commands.user import user_operation
-from pygitgo.commands.repo import repo_operation
-from pygitgo.commands.init import init_operation
-from pygitgo.commands.sync import sync_operation
-from pygitgo.commands.log import log_operation
-from pygitgo.commands.new import new_operation
+from pygitgo.utils.trace import start_trace, write_trace, span
 from pygitgo.utils.cli_io import set_verbosity
-from pygitgo.utils.banner import show_banner
 from pygitgo.exceptions import GitGoError
+import importlib
 import argparse
 import sys
 
 
 
+# Handlers are imported only after parsing, so `gitgo log` never pays for the
+# auth stack, the file picker or the template downloader.
+COMMANDS = {
+    "push": ("pygitgo.commands.push", "push_operation"),
+    "link": ("pygitgo.commands.link", "link_operation"),
+    "jump": ("pygitgo.commands.jump", "jump_operation"),
+    "state": ("pygitgo.commands.state", "state_operation"),
+    "user": ("pygitgo.commands.user", "user_operation"),
+    "resolve": ("pygitgo.commands.resolve", "resolve_operation"),
+    "config": ("pygitgo.commands.config", "config_operation"),
+    "undo": ("pygitgo.commands.undo", "undo_operation"),
+    "pull": ("pygitgo.commands.pull", "pull_operation"),
+    "repo": ("pygitgo.commands.repo", "repo_operation"),
+    "new": ("pygitgo.commands.new", "new_operation"),
+    "init": ("pygitgo.commands.init", "init_operation"),
+    "log": ("pygitgo.commands.log", "log_operation"),
+    "sync": ("pygitgo.commands.sync", "sync_operation"),
+    "daemon": ("pygitgo.commands.daemon", "daemon_operation"),
+    "shell-init": ("pygitgo.commands.shell_init", "shell_init_operation"),
+}
+
+COMMAND_KWARGS = {
+    "init": {"standalone": True},
+}
+
+
+COMMAND_HELP = {
+    "jump": "Switch to another branch, saving your current work automatically if needed",
+    "link": "Connect a local project to a remote repository (initializes if needed)",
+    "push": "Commit and push changes to remote",
+    "state": "Temporarily save and restore your work-in-progress",
+    "user": "Manage Git user identity",
+    "config": "Manage GitGo default settings",
+    "undo": "Safely undo mistakes",
+    "pull": "Safely pull the latest code without losing your changes",
+    "resolve": "Finish a merge conflict after you have fixed the files",
+    "init": "Scaffold a new project structure",
+    "repo": "Create a remote GitHub repository",
+    "new": "Scaffold, create remote repo, and push in one command",
+    "log": "Show commit history",
+    "sync": "Pull the latest changes, commit your work, and push, all at once",
+    "daemon": "Keep GitGo loaded in the background so commands start instantly",
+    "shell-init": "Print the shell function that lets 'gitgo jump' change folders",
+}
+
+COMMAND_METAVAR = "{" + ",".join(COMMAND_HELP) + "}"
+
+
+def load_handler(command):
+    module_path, handler_name = COMMANDS[command]
+    module = importlib.import_module(module_path)
+    return getattr(module, handler_name)
+
+
 def get_version():
     try:
         from importlib.metadata import version
@@ -53,34 +94,33 @@ def _add_subcommand(subparsers, name, help, epilog=None, description=None):
     return subparsers.add_parser(name, **kwargs)
 
 
-def main():
-    parser = argparse.ArgumentParser(
-        prog='gitgo',
-        description="GitGo CLI - Your Fast Git Companion",
-        epilog="Use 'gitgo <command> -h' for help on a specific command."
-    )
-    
-    parser.add_argument("-v", "-V", "--version", action="store_true", help="show program's version number and exit")
-    parser.add_argument("-r", "--ready", action="store_true", help="Check tool readiness")
-
-    parser.add_argument("-q", "--quiet", action="store_true", help="Hide all non-error output")
-    parser.add_argument("--verbose", action="store_true", help="Enable verbose debug output")
-
-    subparsers = parser.add_subparsers(title="Commands", dest="command")
-    subparsers.required = False
-
+def _build_jump_parser(subparsers):
     jump_parser = _add_subcommand(
         subparsers,
         "jump",
-        help="Switch to another branch, saving your current work automatically if needed",
-        epilog="Examples:\n  gitgo jump feature/login          Switch to 'feature/login' branch"
+        help=COMMAND_HELP["jump"],
+        epilog=(
+            "Examples:\n"
+            "  gitgo jump feature/login          Switch to 'feature/login' branch\n"
+            "  gitgo jump --no-sync hotfix       Switch to 'hotfix' without syncing it with main\n"
+            "  gitgo jump --worktree feature/login\n"
+            "                                    Move to the branch's own worktree; nothing is stashed"
+        )
     )
     jump_parser.add_argument("branch", help="The name of the branch to jump to")
+    mode = jump_parser.add_mutually_exclusive_group()
+    mode.add_argument("--worktree", action="store_true", help="Keep each branch in its own worktree and move there (default when jump-mode is 'worktree')")
+    mode.add_argument("--checkout", action="store_true", help="Switch branches in this folder, even when jump-mode is 'worktree'")
+    sync = jump_parser.add_mutually_exclusive_group()
+    sync.add_argument("--sync", dest="sync", action="store_const", const=True, default=None, help="Always pull the main branch from origin, even if it was fetched recently (checkout mode only)")
+    sync.add_argument("--no-sync", dest="sync", action="store_const", const=False, help="Do not sync the branch with the main branch (checkout mode only)")
 
+
+def _build_link_parser(subparsers):
     link_parser = _add_subcommand(
         subparsers,
         "link",
-        help="Connect a local project to a remote repository (initializes if needed)",
+        help=COMMAND_HELP["link"],
         epilog=(
             "Examples:\n"
             "  gitgo link https://github.com/user/repo.git               Connect to a remote repo\n"
@@ -90,10 +130,12 @@ def main():
     link_parser.add_argument("url", help="The GitHub repository URL to link")
     link_parser.add_argument("message", nargs="?", default="Initial commit", help="Custom commit message")
 
+
+def _build_push_parser(subparsers):
     push_parser = _add_subcommand(
         subparsers,
         "push",
-        help="Commit and push changes to remote",
+        help=COMMAND_HELP["push"],
         epilog=(
             "Examples:\n"
             "  gitgo push                        Push current branch using defaults (shows which defaults are used)\n"
@@ -109,10 +151,12 @@ def main():
     push_parser.add_argument("branch", nargs="?", default=None, help="Branch to push to (default: current branch)")
     push_parser.add_argument("message", nargs="?", default=None, help="Commit message")
 
+
+def _build_state_parser(subparsers):
     state_parser = _add_subcommand(
         subparsers,
         "state",
-        help="Temporarily save and restore your work-in-progress",
+        help=COMMAND_HELP["state"],
         epilog=(
             "Examples:\n"
             "  gitgo state list                  Show all saved snapshots\n"
@@ -141,11 +185,13 @@ def main():
         action="store_true",
         help="Apply action to all snapshots (for example: delete all)"
     )
-    
+
+
+def _build_user_parser(subparsers):
     user_parser = _add_subcommand(
         subparsers,
         "user", 
-        help="Manage Git user identity",
+        help=COMMAND_HELP["user"],
         epilog=(
             "Examples:\n"
             "  gitgo user login                  Authenticate with Git provider\n"
@@ -154,25 +200,32 @@ def main():
     )
     user_parser.add_argument("action", nargs="?", choices=["login", "logout"], default=None, help="login or logout")
 
+
+def _build_config_parser(subparsers):
     config_parser = _add_subcommand(
         subparsers,
         "config",
-        help="Manage GitGo default settings",
+        help=COMMAND_HELP["config"],
         epilog=(
             "Examples:\n"
             "  gitgo config set default-branch master\n"
             "  gitgo config set default-message 'WIP'\n"
+            "  gitgo config set --local default-branch develop\n"
+            "  gitgo config set jump-mode worktree\n"
             "  gitgo config get default-branch"
         )
     )
     config_parser.add_argument("action", choices=["set", "get"], help="Action to perform")
-    config_parser.add_argument("key", choices=["default-branch", "default-message"], help="The setting to change")
+    config_parser.add_argument("key", choices=["default-branch", "default-message", "jump-mode", "worktree-root", "worktree-limit", "sync-window"], help="The setting to change")
     config_parser.add_argument("value", nargs="?", help="The new value (required for 'set')")
+    config_parser.add_argument("--local", action="store_true", help="Set the value for the current repository only")
+
 
+def _build_undo_parser(subparsers):
     undo_parser = _add_subcommand(
         subparsers,
         "undo",
-        help="Safely undo mistakes",
+        help=COMMAND_HELP["undo"],
         epilog=(
             "Examples:\n"
             "  gitgo undo commit       Undo your last commit (your files stay safe)\n"
@@ -189,10 +242,12 @@ def main():
         help="What to undo: 'commit', 'add', 'changes' (destructive), 'link', 'push' (destructive), or 'pull'"
     )
 
+
+def _build_pull_parser(subparsers):
     pull_parser = _add_subcommand(
         subparsers,
         "pull", 
-        help="Safely pull the latest code without losing your changes",
+        help=COMMAND_HELP["pull"],
         epilog=(
             "Examples:\n"
             "  gitgo pull                Safely pull updates for your current branch\n"
@@ -201,10 +256,12 @@ def main():
     )
     pull_parser.add_argument("branch", nargs="?", default=None, help="The branch to pull from (default is your current branch)")
 
+
+def _build_resolve_parser(subparsers):
     resolve_parser = _add_subcommand(
         subparsers,
         "resolve",
-        help="Finish a merge conflict after you have fixed the files",
+        help=COMMAND_HELP["resolve"],
         description="Run this after you fix the conflicting lines in your files. GitGo will stage the fixed files and complete the merge automatically.",
         epilog=(
             "Examples:\n"
@@ -214,10 +271,12 @@ def main():
     )
     resolve_parser.add_argument("--abort", action="store_true", help="Abort the current merge/rebase and revert to the pre-pull state")
 
+
+def _build_init_parser(subparsers):
     init_parser = _add_subcommand(
         subparsers,
         "init",
-        help="Scaffold a new project structure",
+        help=COMMAND_HELP["init"],
         epilog=(
             "Examples:\n"
             "  gitgo init my-app python          Scaffold a Python project locally\n"
@@ -243,10 +302,12 @@ def main():
         help="GitHub template repo to clone instead of a language scaffold."
     )
 
+
+def _build_repo_parser(subparsers):
     repo_parser = _add_subcommand(
         subparsers,
         "repo",
-        help="Create a remote GitHub repository",
+        help=COMMAND_HELP["repo"],
         epilog=(
             "Examples:\n"
             "  gitgo repo                         Use current directory name as repo name\n"
@@ -274,10 +335,12 @@ def main():
         help="Short repository description shown on GitHub."
     )
 
+
+def _build_new_parser(subparsers):
     new_parser = _add_subcommand(
         subparsers,
         "new",
-        help="Scaffold, create remote repo, and push in one command",
+        help=COMMAND_HELP["new"],
         epilog=(
             "Examples:\n"
             "  gitgo new my-app python            Scaffold a Python project and push it\n"
@@ -316,10 +379,12 @@ def main():
         help="Short repository description shown on GitHub."
     )
 
+
+def _build_log_parser(subparsers):
     log_parser = _add_subcommand(
         subparsers,
         "log",
-        help="Show commit history",
+        help=COMMAND_HELP["log"],
         epilog=(
             "Examples:\n"
             "  gitgo log                         Show last 5 commits for current branch\n"
@@ -343,10 +408,12 @@ def main():
         help="Branch to show commits for."
     )
 
+
+def _build_sync_parser(subparsers):
     sync_parser = _add_subcommand(
         subparsers,
         "sync",
-        help="Pull the latest changes, commit your work, and push, all at once",
+        help=COMMAND_HELP["sync"],
         epilog=(
             "Examples:\n"
             "  gitgo sync                        Sync with the default commit message\n"
@@ -355,50 +422,184 @@ def main():
     )
     sync_parser.add_argument("message", nargs="?", default=None, help="Commit message for your local changes")
 
-    args = parser.parse_args()
+
+
+def _build_daemon_parser(subparsers):
+    daemon_parser = _add_subcommand(
+        subparsers,
+        "daemon",
+        help=COMMAND_HELP["daemon"],
+        epilog=(
+            "Examples:\n"
+            "  gitgo daemon start                Keep GitGo loaded; other gitgo calls are forwarded to it\n"
+            "  gitgo daemon status               Check whether the daemon is running\n"
+            "  gitgo daemon stop                 Stop the daemon"
+        )
+    )
+    daemon_parser.add_argument(
+        "action",
+        nargs="?",
+        choices=["start", "stop", "status"],
+        default="start",
+        help="start (default), stop, status"
+    )
+
+
+def _build_shell_init_parser(subparsers):
+    shell_init_parser = _add_subcommand(
+        subparsers,
+        "shell-init",
+        help=COMMAND_HELP["shell-init"],
+        epilog=(
+            "Examples:\n"
+            "  eval \"$(gitgo shell-init)\"        Add to ~/.bashrc or ~/.zshrc\n"
+            "  gitgo shell-init fish | source    Add to ~/.config/fish/config.fish\n"
+            "  gitgo shell-init powershell | Invoke-Expression\n"
+            "                                    Add to your PowerShell $PROFILE"
+        )
+    )
+    shell_init_parser.add_argument(
+        "shell",
+        nargs="?",
+        choices=["bash", "zsh", "fish", "powershell"],
+        default=None,
+        help="The shell to print the function for (default: your login shell)"
+    )
+
+
+PARSER_BUILDERS = {
+    "jump": _build_jump_parser,
+    "link": _build_link_parser,
+    "push": _build_push_parser,
+    "state": _build_state_parser,
+    "user": _build_user_parser,
+    "config": _build_config_parser,
+    "undo": _build_undo_parser,
+    "pull": _build_pull_parser,
+    "resolve": _build_resolve_parser,
+    "init": _build_init_parser,
+    "repo": _build_repo_parser,
+    "new": _build_new_parser,
+    "log": _build_log_parser,
+    "sync": _build_sync_parser,
+    "daemon": _build_daemon_parser,
+    "shell-init": _build_shell_init_parser,
+}
+
+
+# Global options that take a value, so their value is not mistaken for a command.
+OPTIONS_WITH_VALUE = {"--trace"}
+
+
+def _pick_command(argv):
+    tokens = iter(argv)
+    for token in tokens:
+        if token in ("-h", "--help"):
+            return None
+        if token in OPTIONS_WITH_VALUE:
+            next(tokens, None)
+            continue
+        if not token.startswith("-"):
+            return token if token in PARSER_BUILDERS else None
+    return None
+
+
+def build_parser(command=None):
+    parser = argparse.ArgumentParser(
+        prog='gitgo',
+        description="GitGo CLI - Your Fast Git Companion",
+        epilog="Use 'gitgo <command> -h' for help on a specific command."
+    )
+    
+    parser.add_argument("-v", "-V", "--version", action="store_true", help="show program's version number and exit")
+    parser.add_argument("-r", "--ready", action="store_true", help="Check tool readiness")
+
+    parser.add_argument("-q", "--quiet", action="store_true", help="Hide all non-error output")
+    parser.add_argument("--verbose", action="store_true", help="Enable verbose debug output")
+    parser.add_argument("--trace", metavar="FILE", help="Write a Chrome trace of git calls and network requests to FILE")
+
+    if command in PARSER_BUILDERS:
+        # Only the chosen subparser is built. The metavar keeps the usage line
+        # listing every command, exactly as if all of them were registered.
+        subparsers = parser.add_subparsers(title="Commands", dest="command", metavar=COMMAND_METAVAR)
+        PARSER_BUILDERS[command](subparsers)
+    else:
+        subparsers = parser.add_subparsers(title="Commands", dest="command")
+        for name, help in COMMAND_HELP.items():
+            subparsers.add_parser(name, help=help)
+    subparsers.required = False
+
+    return parser
+
+
+def main():
+    argv = sys.argv[1:]
+    if argv == [WORKER_FLAG]:
+        # The background update check of a frozen build (see update_checker).
+        refresh_cache()
+        return
+
+    command = _pick_command(argv)
+
+    if command != "daemon":
+        from pygitgo.utils.daemon import forward
+        exit_code = forward(argv)
+        if exit_code is not None:
+            sys.exit(exit_code)
+
+    parser = build_parser(command)
+    if command is None:
+        # _pick_command can miss a command, e.g. after an abbreviated `--trac FILE`.
+        # The placeholder subparsers know none of its options, so find it first.
+        known, _rest = parser.parse_known_args(argv)
+        if known.command in PARSER_BUILDERS:
+            parser = build_parser(known.command)
+    args = parser.parse_args(argv)
 
     set_verbosity(quiet=args.quiet, verbose=getattr(args, 'verbose', False))
 
+    if args.trace:
+        start_trace(args.trace)
+
     if getattr(args, 'version', False):
-        current_v = get_version()
-        print(f"GitGo {current_v}")
-        print(f"Support GitGo: https://ko-fi.com/huerte")
-        check_for_updates(current_v)
+        try:
+            with span("gitgo --version", "command"):
+                current_v = get_version()
+                print(f"GitGo {current_v}")
+                print(f"Support GitGo: https://ko-fi.com/huerte")
+                check_for_updates(current_v)
+        finally:
+            write_trace()
         return
 
     if args.ready:
-        info("ALL UNITS ONLINE. GitGo STANDING BY. AWAITING COMMANDS...")
-        check_for_updates(get_version())
+        try:
+            with span("gitgo --ready", "command"):
+                info("ALL UNITS ONLINE. GitGo STANDING BY. AWAITING COMMANDS...")
+                check_for_updates(get_version())
+        finally:
+            write_trace()
         return
 
     if not args.command:
-        show_banner()
+        from pygitgo.utils.banner import show_banner
+        try:
+            with span("gitgo", "command"):
+                show_banner()
+        finally:
+            write_trace()
         return
 
     ensure_first_run_setup()
-    check_for_updates_background(get_version())
-
-    COMMANDS = {
-        "push": push_operation,
-        "link": link_operation,
-        "jump": jump_operation,
-        "state": state_operation,
-        "user": user_operation,
-        "resolve": resolve_operation,
-        "config": config_operation,
-        "undo": undo_operation,
-        "pull": pull_operation,
-        "repo": repo_operation,
-        "new": new_operation,
-        "init": lambda a: init_operation(a, standalone=True),
-        "log": log_operation,
-        "sync": sync_operation,
-    }
+    # The shell evaluates everything `shell-init` prints, so it gets no notices.
+    if args.command != "shell-init":
+        check_for_updates(get_version())
 
     try:
-        handler = COMMANDS.get(args.command)
-        if handler:
-            handler(args)
+        if args.command in COMMANDS:
+            handler = load_handler(args.command)
+            with span(f"gitgo {args.command}", "command"):
+                handler(args, **COMMAND_KWARGS.get(args.command, {}))
     except GitGoError as e:
         error(f"{e}")
         sys.exit(1)
@@ -410,6 +611,10 @@ def main():
         error(f"Unexpected error ({type(e).__name__}): {e}")
         info("If this keeps happening, report it: https://github.com/Huerte/GitGo/issues")
         sys.exit(1)
+    finally:
+        from pygitgo.utils.executor import report_query_cache_stats
+        report_query_cache_stats()
+        write_trace()
 
 if __name__ == "__main__":
     main()
@@ -1,9 +1,14 @@
-from pygitgo.commands.git_core import is_git_repository, get_recent_commits
+from pygitgo.commands.git_core import (
+    is_git_repository, get_recent_commits, recent_commits_command, INSIDE_WORK_TREE_COMMAND,
+)
+from pygitgo.utils.repo_context import RESOLVE_COMMAND, REMOTE_URL_COMMAND
+from pygitgo.auth.account import get_user
+from pygitgo.commands.git_status import get_status, STATUS_COMMAND
+from pygitgo.utils.executor import run_command, gather_commands
 from pygitgo.utils.colors import GREEN, YELLOW, CYAN, RESET
-from pygitgo.utils.update_checker import check_for_updates
+from pygitgo.utils.update_checker import get_update_notice
+from pygitgo.utils.config import CONFIG_LIST_COMMAND
 from pygitgo.commands.git_branch import get_current_branch
-from pygitgo.utils.executor import run_command
-from pygitgo.auth.account import get_user
 import shutil
 import sys
 
@@ -15,16 +20,10 @@ def _safe(fn, default=None):
         return default
 
 
-def _format_sync():
-    try:
-        raw = run_command(["git", "rev-list", "--left-right", "--count", "HEAD...@{u}"])
-    except Exception:
+def _format_sync(status):
+    if status is None or status.ahead is None:
         return None
-
-    parts = raw.split()
-    if len(parts) != 2:
-        return None
-    ahead, behind = int(parts[0]), int(parts[1])
+    ahead, behind = status.ahead, status.behind
 
     if ahead == 0 and behind == 0:
         return f"{GREEN}up to date{RESET}"
@@ -38,6 +37,13 @@ def _format_sync():
 def show_banner():
     from pygitgo.main import get_version
 
+    # None of these depend on each other. Running them side by side fills the
+    # query cache, so the lookups below cost about as much as the slowest one.
+    gather_commands([
+        CONFIG_LIST_COMMAND, INSIDE_WORK_TREE_COMMAND, RESOLVE_COMMAND,
+        REMOTE_URL_COMMAND, STATUS_COMMAND, recent_commits_command(number=1),
+    ])
+
     username, email = get_user()
     username = username or "Not set"
     email = email or "Not set"
@@ -45,14 +51,14 @@ def show_banner():
     in_git = is_git_repository()
 
     if in_git:
-        remote_url = _safe(lambda: run_command("git config --get remote.origin.url".split())) or "not set"
+        remote_url = _safe(lambda: run_command(REMOTE_URL_COMMAND)) or "not set"
         current_branch = _safe(get_current_branch) or "unknown"
-        sync_msg = _format_sync() or f"{YELLOW}no upstream{RESET}"
+        status = _safe(get_status)
+        sync_msg = _format_sync(status) or f"{YELLOW}no upstream{RESET}"
 
-        porcelain = _safe(lambda: run_command(["git", "status", "--porcelain"])) or ""
-        lines = [line for line in porcelain.splitlines() if line.strip()]
-        untracked = sum(1 for line in lines if line.startswith("??"))
-        modified = len(lines) - untracked
+        entries = status.entries if status else []
+        untracked = sum(1 for entry in entries if entry.kind == "untracked")
+        modified = len(entries) - untracked
 
         if modified == 0 and untracked == 0:
             status_msg = f"{GREEN}clean{RESET}"
@@ -64,9 +70,8 @@ def show_banner():
                 parts.append(f"{untracked} untracked")
             status_msg = f"{YELLOW}{', '.join(parts)}{RESET}"
 
-        commits = _safe(lambda: get_recent_commits(number=1))
-        if commits:
-            c = commits[0]
+        c = _safe(lambda: next(get_recent_commits(number=1), None))
+        if c:
             latest = f"[{YELLOW}{c['hash']}{RESET}] {c['message']} ({CYAN}{c['date']}{RESET}) by {GREEN}{c['author']}{RESET}"
         else:
             latest = "no commits yet"
@@ -78,7 +83,7 @@ def show_banner():
         latest = "Run 'gitgo init' or 'gitgo link' to start"
 
     version = get_version()
-    cached = check_for_updates(version)
+    notice = get_update_notice(version)
 
     width = max(46, min(shutil.get_terminal_size((80, 20)).columns - 2, 70))
     top = f"{GREEN}╭{'─' * (width - 2)}╮{RESET}"
@@ -106,8 +111,8 @@ def show_banner():
         "  GitHub    github.com/Huerte/GitGo",
         "  Sponsor   github.com/sponsors/Huerte",
     ]
-    if cached:
-        out += ["", str(cached)]
+    if notice:
+        out += ["", f"  {YELLOW}{notice}{RESET}", "  Run: pip install --upgrade pygitgo"]
     out += ["", f"  Run {GREEN}`gitgo help`{RESET} to see available commands.", ""]
 
     content = "\n".join(out)
@@ -27,9 +27,18 @@ def _supports_color():
 
 _use_color = _supports_color()
 
-RED = "\033[31m" if _use_color else ""
-GREEN = "\033[32m" if _use_color else ""
-YELLOW = "\033[33m" if _use_color else ""
-BLUE = "\033[34m" if _use_color else ""
-CYAN = "\033[36m" if _use_color else ""
-RESET = "\033[0m" if _use_color else ""
+ANSI_CODES = {
+    "RED": "\033[31m",
+    "GREEN": "\033[32m",
+    "YELLOW": "\033[33m",
+    "BLUE": "\033[34m",
+    "CYAN": "\033[36m",
+    "RESET": "\033[0m",
+}
+
+RED = ANSI_CODES["RED"] if _use_color else ""
+GREEN = ANSI_CODES["GREEN"] if _use_color else ""
+YELLOW = ANSI_CODES["YELLOW"] if _use_color else ""
+BLUE = ANSI_CODES["BLUE"] if _use_color else ""
+CYAN = ANSI_CODES["CYAN"] if _use_color else ""
+RESET = ANSI_CODES["RESET"] if _use_color else ""
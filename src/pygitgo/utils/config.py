@@ -1,27 +1,149 @@
+from pygitgo.utils.executor import run_command, get_generation
 from pygitgo.utils.cli_io import error, success
-from pygitgo.utils.executor import run_command
 from pygitgo.exceptions import GitCommandError
+import os
 
 
-def get_config(key, fallback_value):
+CONFIG_LIST_COMMAND = ["git", "config", "--list", "-z", "--show-scope"]
+
+# Lowest precedence first; a later scope overrides an earlier one.
+SCOPES = ("system", "global", "local", "worktree", "command")
+_REPO_SCOPES = ("local", "worktree")
+
+# Parsed configuration for the current folder, reused until a git command
+# that may change it runs. Writes made through this module update it in place.
+_CACHE = {"key": None, "config": None}
+
+
+def _normalize_key(key):
+    # Section and variable names are case-insensitive, subsections are not.
+    section, _dot, rest = key.partition(".")
+    subsection, _dot, name = rest.rpartition(".")
+    if not subsection:
+        return f"{section.lower()}.{name.lower()}"
+    return f"{section.lower()}.{subsection}.{name.lower()}"
+
+
+def _scope_rank(scope):
+    return SCOPES.index(scope) if scope in SCOPES else len(SCOPES)
+
+
+class GitConfig:
+    """Every `git config` entry visible from here, with the scope it came from."""
 
-    config_key = f"gitgo.{key}"
+    def __init__(self, entries=None):
+        # (scope, key, value) in git's precedence order, lowest first.
+        self.entries = list(entries or [])
 
+    @classmethod
+    def parse(cls, output, scope=None):
+        """Parse `git config --list -z` output. Without `scope`, each record starts with its --show-scope field."""
+        fields = output.split("\0")
+        if fields and fields[-1] == "":
+            fields.pop()
+
+        config = cls()
+        step = 1 if scope else 2
+        for i in range(0, len(fields) - step + 1, step):
+            record_scope = scope or fields[i]
+            key, newline, value = fields[i + step - 1].partition("\n")
+            # A bare `key` line with no `=` is a boolean true; git prints it with no value.
+            config.entries.append((record_scope, key, value if newline else ""))
+        return config
+
+    def get(self, key, scopes=None, default=None):
+        value, scope = self.get_with_scope(key, scopes)
+        return default if scope is None else value
+
+    def get_with_scope(self, key, scopes=None):
+        """The winning (value, scope) for `key`, or (None, None) when it is not set."""
+        key = _normalize_key(key)
+        for entry_scope, entry_key, value in reversed(self.entries):
+            if entry_key == key and (scopes is None or entry_scope in scopes):
+                return value, entry_scope
+        return None, None
+
+    def set(self, scope, key, value):
+        self.unset(scope, key)
+        self.entries.append((scope, _normalize_key(key), value))
+        self.entries.sort(key=lambda entry: _scope_rank(entry[0]))
+
+    def unset(self, scope, key):
+        key = _normalize_key(key)
+        self.entries = [entry for entry in self.entries if not (entry[0] == scope and entry[1] == key)]
+
+
+def _read_config():
     try:
-        result = run_command(['git', 'config', '--global', config_key])                                                                                                                     
-        return result.strip()
-    except GitCommandError:
-        return fallback_value
+        return GitConfig.parse(run_command(CONFIG_LIST_COMMAND, return_complete=True).stdout or "")
+    except GitCommandError as e:
+        if "show-scope" not in getattr(e, "stderr", ""):
+            return GitConfig()
+
+    # git older than 2.26 has no --show-scope: read each scope on its own.
+    config = GitConfig()
+    for scope in ("system", "global", "local"):
+        try:
+            output = run_command(["git", "config", f"--{scope}", "--list", "-z"], return_complete=True).stdout or ""
+        except GitCommandError:
+            continue
+        config.entries += GitConfig.parse(output, scope=scope).entries
+    return config
 
 
-def set_config(key, value, silent=False):
+def load_config():
+    """Every config entry, from one `git config --list` per invocation (per folder and repository state)."""
+    key = (os.getcwd(), get_generation())
+    if _CACHE["key"] != key:
+        _CACHE["config"] = _read_config()
+        _CACHE["key"] = key
+    return _CACHE["config"]
 
-    config_key = f"gitgo.{key}"
+
+def _write_through(scope, key, value, command):
+    """Run a `git config` write and apply it to the loaded config instead of re-reading everything."""
+    key_before = (os.getcwd(), get_generation())
+    run_command(command)
+
+    config = _CACHE["config"]
+    if config is not None and _CACHE["key"] == key_before:
+        if value is None:
+            config.unset(scope, key)
+        else:
+            config.set(scope, key, value)
+        _CACHE["key"] = (os.getcwd(), get_generation())
+
+
+def get_git_config(key, scopes=None, default=None):
+    return load_config().get(key, scopes=scopes, default=default)
+
+
+def set_git_config(key, value, scope="global"):
+    _write_through(scope, key, value, ["git", "config", f"--{scope}", key, value])
+
+
+def unset_git_config(key, scope="global"):
+    _write_through(scope, key, None, ["git", "config", f"--{scope}", "--unset", key])
+
+
+def get_config(key, fallback_value):
+    """A gitgo setting. A value set for this repository overrides the global one."""
+    value = get_git_config(f"gitgo.{key}")
+    return fallback_value if value is None else value.strip()
+
+
+def get_config_scope(key):
+    """Where the gitgo setting `key` comes from ("global", "local", ...), or None when unset."""
+    return load_config().get_with_scope(f"gitgo.{key}")[1]
+
+
+def set_config(key, value, silent=False, scope="global"):
 
     try:
-        run_command(['git', 'config', '--global', config_key, value])
+        set_git_config(f"gitgo.{key}", value, scope=scope)
         if not silent:
-            success(f"\nConfiguration saved: {key} = '{value}'")
+            where = " for this repository" if scope in _REPO_SCOPES else ""
+            success(f"\nConfiguration saved{where}: {key} = '{value}'")
         return True
     except GitCommandError:
         if not silent:
@@ -30,12 +152,13 @@ def set_config(key, value, silent=False):
 
 
 def get_default_branch() -> str:
-    try:
-        branch = run_command(["git", "config", "--get", "init.defaultBranch"])
-        if branch:
-            return branch
-    except GitCommandError:
-        pass
+    branch = get_git_config("init.defaultBranch")
+    if branch:
+        return branch
 
     return get_config("default-branch", "main")
 
+
+def clear_config_cache():
+    _CACHE["key"] = None
+    _CACHE["config"] = None
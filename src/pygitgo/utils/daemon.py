@@ -0,0 +1,234 @@
+from pathlib import Path
+import socket
+import signal
+import array
+import json
+import sys
+import os
+
+
+SOCKET_PATH = Path.home() / ".gitgo" / "daemon.sock"
+MAX_FDS = 3
+
+_serving = False
+
+
+def is_supported():
+    return hasattr(socket, "AF_UNIX") and hasattr(os, "fork") and hasattr(socket.socket, "sendmsg")
+
+
+def send_message(sock, message, fds=None):
+    payload = json.dumps(message).encode("utf-8") + b"\n"
+    if fds:
+        ancillary = [(socket.SOL_SOCKET, socket.SCM_RIGHTS, array.array("i", fds))]
+        sent = sock.sendmsg([payload], ancillary)
+        payload = payload[sent:]
+    if payload:
+        sock.sendall(payload)
+
+
+class MessageReader:
+    def __init__(self, sock):
+        self.sock = sock
+        self.buffer = b""
+        self.fds = []
+
+    def read(self):
+        while b"\n" not in self.buffer:
+            fd_size = array.array("i").itemsize * MAX_FDS
+            data, ancdata, _flags, _addr = self.sock.recvmsg(65536, socket.CMSG_SPACE(fd_size))
+            for level, kind, cmsg_data in ancdata:
+                if level == socket.SOL_SOCKET and kind == socket.SCM_RIGHTS:
+                    fds = array.array("i")
+                    fds.frombytes(cmsg_data[:len(cmsg_data) - (len(cmsg_data) % fds.itemsize)])
+                    self.fds.extend(fds)
+            if not data:
+                return None
+            self.buffer += data
+
+        line, self.buffer = self.buffer.split(b"\n", 1)
+        return json.loads(line.decode("utf-8"))
+
+
+def connect():
+    if _serving or os.environ.get("GITGO_NO_DAEMON") or not is_supported() or not SOCKET_PATH.exists():
+        return None
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(SOCKET_PATH))
+    except OSError:
+        sock.close()
+        return None
+    return sock
+
+
+def forward(argv):
+    """Run argv on a running daemon and return its exit code, or None if there is no daemon."""
+    sock = connect()
+    if sock is None:
+        return None
+
+    request = {"argv": list(argv), "cwd": os.getcwd(), "env": dict(os.environ)}
+    try:
+        send_message(sock, request, fds=[0, 1, 2])
+    except OSError:
+        sock.close()
+        return None
+
+    reader = MessageReader(sock)
+    child_pid = None
+    try:
+        while True:
+            try:
+                message = reader.read()
+            except KeyboardInterrupt:
+                # The daemon child is not in our process group, so pass Ctrl+C on.
+                if child_pid:
+                    os.kill(child_pid, signal.SIGINT)
+                continue
+
+            if message is None:
+                sys.stderr.write("GitGo daemon closed the connection unexpectedly.\n")
+                return 1
+            if "pid" in message:
+                child_pid = message["pid"]
+            elif "exit" in message:
+                return message["exit"]
+    finally:
+        sock.close()
+
+
+def request_stop():
+    sock = connect()
+    if sock is None:
+        return False
+    try:
+        send_message(sock, {"action": "stop"})
+        return MessageReader(sock).read() is not None
+    except OSError:
+        return False
+    finally:
+        sock.close()
+
+
+def _warm_imports():
+    from pygitgo.main import COMMANDS, load_handler
+    for command in COMMANDS:
+        load_handler(command)
+    import pygitgo.commands.worktree  # noqa: F401
+    import pygitgo.utils.banner  # noqa: F401
+    import yaspin  # noqa: F401
+    import curses  # noqa: F401
+
+
+def _refresh_colors():
+    # Color constants are computed once at import from the daemon's own stdout.
+    # Recompute them for the client's terminal and patch every module that
+    # imported them by name.
+    from pygitgo.utils import colors
+
+    enabled = colors._supports_color()
+    for module_name, module in list(sys.modules.items()):
+        if not module_name.startswith("pygitgo") or module is None:
+            continue
+        for name, code in colors.ANSI_CODES.items():
+            if hasattr(module, name):
+                setattr(module, name, code if enabled else "")
+
+
+def _run_request(conn, request, fds):
+    from pygitgo.main import main
+
+    for target, fd in enumerate(fds[:3]):
+        os.dup2(fd, target)
+    for fd in fds:
+        os.close(fd)
+
+    sys.stdin = open(0, "r", closefd=False)
+    sys.stdout = open(1, "w", buffering=1, closefd=False)
+    sys.stderr = open(2, "w", buffering=1, closefd=False)
+
+    os.chdir(request["cwd"])
+    os.environ.clear()
+    os.environ.update(request["env"])
+    _refresh_colors()
+
+    signal.signal(signal.SIGINT, signal.default_int_handler)
+    signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+    send_message(conn, {"pid": os.getpid()})
+
+    sys.argv = ["gitgo"] + request["argv"]
+    code = 0
+    try:
+        main()
+    except SystemExit as e:
+        if isinstance(e.code, int):
+            code = e.code
+        elif e.code is not None:
+            sys.stderr.write(f"{e.code}\n")
+            code = 1
+    except BaseException:
+        import traceback
+        traceback.print_exc()
+        code = 1
+
+    sys.stdout.flush()
+    sys.stderr.flush()
+    send_message(conn, {"exit": code})
+
+
+def serve(on_ready=None):
+    global _serving
+    _serving = True
+
+    SOCKET_PATH.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    if SOCKET_PATH.exists():
+        SOCKET_PATH.unlink()
+
+    _warm_imports()
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(str(SOCKET_PATH))
+    os.chmod(SOCKET_PATH, 0o600)
+    server.listen(16)
+
+    # Children report their exit code over the socket; let the kernel reap them.
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+
+    if on_ready:
+        on_ready()
+
+    try:
+        while True:
+            conn, _addr = server.accept()
+            reader = MessageReader(conn)
+            try:
+                request = reader.read()
+            except (OSError, ValueError):
+                request = None
+
+            if request is None:
+                conn.close()
+                continue
+
+            if request.get("action") == "stop":
+                send_message(conn, {"stopped": True})
+                conn.close()
+                break
+
+            pid = os.fork()
+            if pid == 0:
+                server.close()
+                try:
+                    _run_request(conn, request, reader.fds)
+                finally:
+                    os._exit(0)
+
+            for fd in reader.fds:
+                os.close(fd)
+            conn.close()
+    finally:
+        server.close()
+        if SOCKET_PATH.exists():
+            SOCKET_PATH.unlink()
@@ -1,42 +1,456 @@
-from pygitgo.utils.cli_io import error, info, success, warning, confirm, danger, _QUIET, _VERBOSE
+from pygitgo.utils.cli_io import error, info, success, warning, confirm, danger
 from pygitgo.exceptions import GitCommandError
-from yaspin import yaspin
+from pygitgo.utils.trace import run_traced, command_span, record_output
+from pygitgo.utils.ssh_mux import ssh_command
+from pygitgo.utils import cli_io
 import subprocess
+import threading
+import tempfile
+import locale
 import os
 import re
 
 
-def run_command(command, return_complete=False, loading_msg=None, ok_text=None, err_text=None, extra_env=None):
+# Results of read-only git queries, keyed on (argv, cwd). Lives for a single
+# gitgo invocation and is dropped as soon as any other git command runs.
+_QUERY_CACHE = {}
+_CACHE_STATS = {"hits": 0, "misses": 0}
 
+# Bumped every time a git command that may change the repository runs, so
+# state derived from git (see repo_context) knows when to re-resolve.
+_GENERATION = 0
+
+# Upper bound on git processes started at once by gather_commands.
+MAX_CONCURRENT_QUERIES = 4
+
+_READ_ONLY_SUBCOMMANDS = {"rev-parse", "status", "log", "rev-list", "show-ref", "ls-files", "ls-remote", "diff"}
+# Only these reach a remote, so only they get the shared SSH connection.
+_REMOTE_SUBCOMMANDS = {"push", "pull", "fetch", "ls-remote", "clone"}
+_CONFIG_WRITE_FLAGS = {
+    "--unset", "--unset-all", "--add", "--replace-all",
+    "--rename-section", "--remove-section", "-e", "--edit",
+}
+
+
+def is_read_only_git_command(command):
+    if not isinstance(command, list) or len(command) < 2 or command[0] != "git":
+        return False
+
+    args = command[1:]
+    while len(args) >= 2 and args[0] == "-c":
+        args = args[2:]
+    if not args:
+        return False
+
+    subcommand, rest = args[0], args[1:]
+
+    if subcommand in _READ_ONLY_SUBCOMMANDS:
+        return True
+    if subcommand == "branch":
+        return "--show-current" in rest or "--list" in rest
+    if subcommand == "config":
+        if any(flag in _CONFIG_WRITE_FLAGS for flag in rest):
+            return False
+        if "--get" in rest or "--list" in rest or "-l" in rest:
+            return True
+        return len([arg for arg in rest if not arg.startswith("-")]) <= 1
+    if subcommand == "remote":
+        return rest[:1] in (["get-url"], ["show"], ["-v"], [])
+    if subcommand == "stash":
+        return rest[:1] == ["list"]
+    if subcommand == "symbolic-ref":
+        positional = [arg for arg in rest if not arg.startswith("-")]
+        return len(positional) == 1 and not {"-d", "--delete"} & set(rest)
+    return False
+
+
+def _query_cache_key(command, extra_env):
+    if extra_env or not is_read_only_git_command(command):
+        return None
+    return (tuple(command), os.getcwd())
+
+
+def invalidate_query_cache():
+    global _GENERATION
+    _QUERY_CACHE.clear()
+    _GENERATION += 1
+
+
+def get_generation():
+    return _GENERATION
+
+
+def clear_query_cache():
+    invalidate_query_cache()
+    _CACHE_STATS["hits"] = 0
+    _CACHE_STATS["misses"] = 0
+
+
+def is_query_cached(command):
+    """Whether `command` has already been answered (by run_command or gather_commands)."""
+    cache_key = _query_cache_key(command, None)
+    return cache_key is not None and cache_key in _QUERY_CACHE
+
+
+def get_query_cache_stats():
+    return dict(_CACHE_STATS)
+
+
+def report_query_cache_stats():
+    if cli_io._VERBOSE:
+        print(f"[DEBUG] Query cache: {_CACHE_STATS['hits']} hit(s), {_CACHE_STATS['misses']} miss(es)")
+
+
+def _make_spinner(text):
+    from yaspin import yaspin
     import sys
-    kwargs = {"text": loading_msg}
+    kwargs = {"text": text}
     if sys.stdout.isatty():
         kwargs["color"] = "cyan"
-    spinner = yaspin(**kwargs) if (loading_msg and not _QUIET) else None
+    return yaspin(**kwargs)
+
+
+def _talks_to_remote(command):
+    if not isinstance(command, list) or not command or command[0] != "git":
+        return False
+    args = command[1:]
+    while len(args) >= 2 and args[0] in ("-c", "-C"):
+        args = args[2:]
+    return bool(args) and args[0] in _REMOTE_SUBCOMMANDS
+
+
+def _command_env(extra_env=None, command=None):
+    env = os.environ.copy()
+    env["GIT_TERMINAL_PROMPT"] = "0"
+    env["GIT_SSH_COMMAND"] = ssh_command(env.get("GIT_SSH_COMMAND", "ssh"), multiplex=_talks_to_remote(command))
 
+    if extra_env:
+        env.update(extra_env)
+    return env
+
+
+def _launch_error(command, e):
+    cmd_name = command[0] if isinstance(command, list) else str(command).split()[0]
+    if "cannot find the file" in str(e) or "No such file or directory" in str(e):
+        return (
+            f"'{cmd_name}' is not installed or not on your PATH. "
+            "Install it and make sure it is accessible from your terminal."
+        )
+    return f"Failed to run '{cmd_name}': {e}"
+
+
+def run_command_iter(command, separator=b"\n", decode=True, loading_msg=None, ok_text=None, err_text=None, extra_env=None):
+    """Run a command and yield its stdout one record at a time.
+
+    Records are split on `separator` as they arrive, so memory stays flat and
+    the first record is available before the command exits. A non-zero exit
+    raises GitCommandError once the output is exhausted. Closing the generator
+    early stops the command.
+    """
+    cache_key = _query_cache_key(command, extra_env)
+    if cache_key is not None and cache_key in _QUERY_CACHE:
+        # Already answered, usually by gather_commands; replay it.
+        _CACHE_STATS["hits"] += 1
+        if cli_io._VERBOSE:
+            print(f"[DEBUG] Cache hit: {' '.join(command)}")
+        cached = _QUERY_CACHE[cache_key]
+        if isinstance(cached, GitCommandError):
+            raise cached
+        raw = getattr(cached, "stdout_bytes", None)
+        if not decode and raw is not None:
+            records = raw.split(separator)
+        else:
+            records = cached.stdout.split(separator.decode("utf-8"))
+        if records and not records[-1]:
+            records.pop()
+        for record in records:
+            yield record if decode or isinstance(record, bytes) else record.encode("utf-8")
+        return
+
+    if cache_key is None and isinstance(command, list) and command[:1] == ["git"]:
+        invalidate_query_cache()
+
+    if cli_io._VERBOSE:
+        print(f"[DEBUG] Streaming command: {' '.join(command)}")
+
+    spinner = _make_spinner(loading_msg) if (loading_msg and not cli_io._QUIET) else None
     if spinner:
         spinner.start()
 
+    # stderr goes to a file so a chatty command can never block on a full pipe
+    # while we are still reading stdout.
+    with command_span(command) as span_args, tempfile.TemporaryFile() as stderr_file:
+        try:
+            process = subprocess.Popen(
+                command,
+                stdout=subprocess.PIPE,
+                stderr=stderr_file,
+                stdin=subprocess.DEVNULL,
+                env=_command_env(extra_env, command),
+            )
+        except OSError as e:
+            if spinner:
+                if err_text:
+                    spinner.text = err_text
+                spinner.fail("✖")
+            stderr = _launch_error(command, e)
+            record_output(span_args, 1, b"", stderr)
+            raise GitCommandError(command, stderr=stderr, returncode=1)
+
+        buffer = bytearray()
+        stdout_bytes = 0
+        try:
+            while True:
+                chunk = process.stdout.read1(65536)
+                if not chunk:
+                    break
+                buffer += chunk
+                stdout_bytes += len(chunk)
+
+                start = 0
+                while True:
+                    end = buffer.find(separator, start)
+                    if end == -1:
+                        break
+                    record = bytes(buffer[start:end])
+                    start = end + len(separator)
+                    yield record.decode("utf-8", "replace") if decode else record
+                del buffer[:start]
+
+            if buffer:
+                record = bytes(buffer)
+                buffer.clear()
+                yield record.decode("utf-8", "replace") if decode else record
+
+            returncode = process.wait()
+        except BaseException as e:
+            if span_args is not None and isinstance(e, GeneratorExit):
+                span_args["closed_early"] = True
+            if spinner:
+                spinner.stop()
+            process.kill()
+            process.wait()
+            raise
+        finally:
+            process.stdout.close()
+
+        stderr_file.seek(0)
+        stderr = stderr_file.read()
+        if span_args is not None:
+            span_args.update(exit_code=returncode, stdout_bytes=stdout_bytes, stderr_bytes=len(stderr))
+
+        if returncode != 0:
+            stderr = stderr.decode("utf-8", "replace").strip()
+            if cli_io._VERBOSE:
+                print(f"[DEBUG] Command failed with exit code: {returncode}")
+                if stderr:
+                    print(f"[DEBUG] stderr:\n{stderr}")
+            if spinner:
+                if err_text:
+                    spinner.text = err_text
+                spinner.fail("✖")
+            raise GitCommandError(command, stderr=stderr, returncode=returncode)
+
+    if spinner:
+        if ok_text:
+            spinner.text = ok_text
+        spinner.ok("✔")
+
+
+def run_exists(command, extra_env=None, loading_msg=None):
+    """Whether `command` prints anything. The command is stopped at its first non-blank line.
+
+    For yes/no checks such as "is there an unpushed commit": git does not
+    finish the walk once the answer is known. A failing command raises
+    GitCommandError as usual.
+    """
+    records = run_command_iter(command, extra_env=extra_env, loading_msg=loading_msg)
+    try:
+        return any(record.strip() for record in records)
+    finally:
+        records.close()
+
+
+def spawn_detached(command):
+    """Start a command that outlives gitgo, without waiting for it or reading its output.
+
+    Returns False if the command could not be started.
+    """
+    if cli_io._VERBOSE:
+        print(f"[DEBUG] Starting in background: {' '.join(command)}")
+
+    if os.name == "nt":
+        kwargs = {"creationflags": subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP}
+    else:
+        kwargs = {"start_new_session": True}
+
+    try:
+        subprocess.Popen(
+            command,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            env=_command_env(command=command),
+            **kwargs,
+        )
+    except OSError:
+        return False
+    return True
+
+
+def _decode_output(data):
+    # Match subprocess.run(text=True): locale encoding, universal newlines.
+    text = data.decode(locale.getpreferredencoding(False), "replace")
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _run_query(command, extra_env=None, track=None):
+    """run_command for queries that run side by side in gather_commands.
+
+    Shares the query cache with run_command and returns the CompletedProcess.
+    It never shows a spinner or prompts, so a dubious-ownership failure is
+    left out of the cache and the next run_command call can still offer the fix.
+    """
+    cache_key = _query_cache_key(command, extra_env)
+    if cache_key is not None and cache_key in _QUERY_CACHE:
+        _CACHE_STATS["hits"] += 1
+        cached = _QUERY_CACHE[cache_key]
+        if isinstance(cached, GitCommandError):
+            raise cached
+        return cached
+
+    if cache_key is not None:
+        _CACHE_STATS["misses"] += 1
+    elif isinstance(command, list) and command[:1] == ["git"]:
+        invalidate_query_cache()
+
+    if cli_io._VERBOSE:
+        print(f"[DEBUG] Running command concurrently: {' '.join(command)}")
+
+    with command_span(command, track=track) as span_args:
+        try:
+            process = subprocess.Popen(
+                command,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                stdin=subprocess.DEVNULL,
+                env=_command_env(extra_env, command),
+            )
+        except OSError as e:
+            record_output(span_args, 1, b"", b"")
+            raise GitCommandError(command, stderr=_launch_error(command, e), returncode=1)
+
+        try:
+            stdout, stderr = process.communicate()
+        except BaseException:
+            process.kill()
+            process.wait()
+            raise
+        record_output(span_args, process.returncode, stdout, stderr)
+
+    result = subprocess.CompletedProcess(command, process.returncode, _decode_output(stdout), _decode_output(stderr))
+    # Kept for run_command_iter(decode=False): byte-exact paths survive the cache.
+    result.stdout_bytes = stdout
+
+    if result.returncode != 0:
+        stderr = result.stderr.strip()
+        if cli_io._VERBOSE:
+            print(f"[DEBUG] Command failed with exit code: {result.returncode}")
+            if stderr:
+                print(f"[DEBUG] stderr:\n{stderr}")
+        command_error = GitCommandError(command, stderr=stderr, returncode=result.returncode)
+        if cache_key is not None and "detected dubious ownership" not in stderr:
+            _QUERY_CACHE[cache_key] = command_error
+        raise command_error
+
+    if cache_key is not None:
+        _QUERY_CACHE[cache_key] = result
+    return result
+
+
+def gather_commands(commands, limit=MAX_CONCURRENT_QUERIES, loading_msg=None):
+    """Run independent commands concurrently, at most `limit` at a time.
+
+    Returns one CompletedProcess or GitCommandError per command, in order.
+    Read-only git queries land in the query cache, so the run_command calls
+    that follow are answered without starting git again. Each worker is a
+    plain thread (subprocess already loads threading); asyncio would cost
+    more to import than these queries take to run.
+    """
+    commands = [list(command) for command in commands]
+    if not commands:
+        return []
+
+    results = [None] * len(commands)
+    pending = iter(range(len(commands)))
+    lock = threading.Lock()
+
+    def worker(track):
+        while True:
+            with lock:
+                index = next(pending, None)
+            if index is None:
+                return
+            try:
+                results[index] = _run_query(commands[index], track=track)
+            except GitCommandError as e:
+                results[index] = e
+
+    spinner = _make_spinner(loading_msg) if (loading_msg and not cli_io._QUIET) else None
+    if spinner:
+        spinner.start()
     try:
-        env = os.environ.copy()
-        env["GIT_TERMINAL_PROMPT"] = "0"
-        base_ssh_cmd = env.get("GIT_SSH_COMMAND", "ssh")
-        env["GIT_SSH_COMMAND"] = f"{base_ssh_cmd} -o BatchMode=yes"
+        workers = [
+            threading.Thread(target=worker, args=(track,), daemon=True)
+            for track in range(1, min(limit, len(commands)) + 1)
+        ]
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+    finally:
+        if spinner:
+            spinner.stop()
+    return results
+
+
+def run_command(command, return_complete=False, loading_msg=None, ok_text=None, err_text=None, extra_env=None, input=None):
+
+    cache_key = _query_cache_key(command, extra_env) if input is None else None
+    if cache_key is not None and cache_key in _QUERY_CACHE:
+        _CACHE_STATS["hits"] += 1
+        if cli_io._VERBOSE:
+            print(f"[DEBUG] Cache hit: {' '.join(command)}")
+        cached = _QUERY_CACHE[cache_key]
+        if isinstance(cached, GitCommandError):
+            raise cached
+        return cached if return_complete else cached.stdout.strip()
 
-        if extra_env:
-            env.update(extra_env)
+    if cache_key is not None:
+        _CACHE_STATS["misses"] += 1
+    elif isinstance(command, list) and command[:1] == ["git"]:
+        invalidate_query_cache()
 
-        if _VERBOSE:
+    spinner = _make_spinner(loading_msg) if (loading_msg and not cli_io._QUIET) else None
+
+    if spinner:
+        spinner.start()
+
+    try:
+        env = _command_env(extra_env, command)
+
+        if cli_io._VERBOSE:
             cmd_str = " ".join(command) if isinstance(command, list) else command
             print(f"[DEBUG] Running command: {cmd_str}")
 
         try:
-            result = subprocess.run(
+            result = run_traced(
                 command,
                 check=True,
                 capture_output=True,
                 text=True,
-                stdin=subprocess.DEVNULL,
+                # Input is git pathspecs and such: UTF-8, with surrogateescape for non-UTF-8 paths.
+                **({"stdin": subprocess.DEVNULL} if input is None else {"input": input, "encoding": "utf-8", "errors": "surrogateescape"}),
                 env=env,
             )
         except KeyboardInterrupt:
@@ -44,7 +458,7 @@ def run_command(command, return_complete=False, loading_msg=None, ok_text=None,
                 spinner.stop()
             raise
 
-        if _VERBOSE:
+        if cli_io._VERBOSE:
             if result.stdout.strip():
                 print(f"[DEBUG] stdout:\n{result.stdout.strip()}")
             if result.stderr.strip():
@@ -55,6 +469,9 @@ def run_command(command, return_complete=False, loading_msg=None, ok_text=None,
                 spinner.text = ok_text
             spinner.ok("✔")
 
+        if cache_key is not None:
+            _QUERY_CACHE[cache_key] = result
+
         return result if return_complete else result.stdout.strip()
     except (subprocess.CalledProcessError, OSError) as e:
         if spinner:
@@ -69,16 +486,9 @@ def run_command(command, return_complete=False, loading_msg=None, ok_text=None,
             stderr = e.stderr.strip() if e.stderr else ""
             returncode = e.returncode
         else:
-            cmd_name = command[0] if isinstance(command, list) else str(command).split()[0]
-            if "cannot find the file" in str(e) or "No such file or directory" in str(e):
-                stderr = (
-                    f"'{cmd_name}' is not installed or not on your PATH. "
-                    "Install it and make sure it is accessible from your terminal."
-                )
-            else:
-                stderr = f"Failed to run '{cmd_name}': {e}"
+            stderr = _launch_error(command, e)
 
-        if _VERBOSE:
+        if cli_io._VERBOSE:
             print(f"[DEBUG] Command failed with exit code: {returncode}")
             if stderr:
                 print(f"[DEBUG] stderr:\n{stderr}")
@@ -98,11 +508,16 @@ def run_command(command, return_complete=False, loading_msg=None, ok_text=None,
                 fix_command = ["git", "config", "--global", "--add", "safe.directory", repo_path]
                 try:
                     subprocess.run(fix_command, check=True)
+                    # Cached queries and the loaded config predate the new entry.
+                    invalidate_query_cache()
                     success("Directory trusted. Retrying command...")
-                    return run_command(command, return_complete, loading_msg=loading_msg)
+                    return run_command(command, return_complete, loading_msg=loading_msg, input=input)
                 except OSError as fix_err:
                     error(f"Failed to apply fix: {fix_err}")
             else:
                 warning("Fix declined. Operations in this directory will continue to fail.")
 
-        raise GitCommandError(command, stderr=stderr, returncode=returncode)
+        command_error = GitCommandError(command, stderr=stderr, returncode=returncode)
+        if cache_key is not None:
+            _QUERY_CACHE[cache_key] = command_error
+        raise command_error
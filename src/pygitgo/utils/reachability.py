@@ -0,0 +1,133 @@
+import selectors
+import threading
+import socket
+import errno
+import time
+
+
+# How long the TCP connects may take before we call the network blocked. A
+# reachable host answers well inside this on any network where an interactive
+# `git push` is bearable.
+PRECHECK_BUDGET = 0.5
+# DNS gets its own, longer allowance: a cold resolver cache can be slow while
+# working fine. A lookup still running after it is reported as "unknown", not
+# as a failure, and the caller goes ahead with the real connection.
+DNS_BUDGET = 2.0
+
+_IN_PROGRESS = {errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EAGAIN, getattr(errno, "WSAEWOULDBLOCK", errno.EWOULDBLOCK)}
+
+
+class Reachability:
+    """What a TCP pre-check found for a set of (host, port) endpoints.
+
+    `connected` holds the endpoints a socket reached. When none did, `layer`
+    says where it broke: "dns" if no name resolved, "tcp" otherwise, with
+    `refused` telling an actively refused port from a silently dropped one.
+    `layer` is "unknown" when the names had not resolved within DNS_BUDGET
+    (`resolved` is None), so nothing can be concluded.
+    """
+
+    def __init__(self, connected=(), resolved=True, refused=False):
+        self.connected = set(connected)
+        self.resolved = resolved
+        self.refused = refused
+
+    @property
+    def layer(self):
+        if self.connected:
+            return None
+        if self.resolved is None:
+            return "unknown"
+        return "tcp" if self.resolved else "dns"
+
+    def reached(self, endpoint):
+        return endpoint in self.connected
+
+    def __repr__(self):
+        return f"Reachability(connected={sorted(self.connected)!r}, layer={self.layer!r}, refused={self.refused!r})"
+
+
+def _resolve_all(endpoints, deadline):
+    """getaddrinfo every endpoint in parallel. Lookups still running at the deadline are dropped.
+
+    Returns the addresses and whether every lookup finished in time.
+    """
+    results = {}
+
+    def lookup(endpoint):
+        try:
+            results[endpoint] = socket.getaddrinfo(endpoint[0], endpoint[1], type=socket.SOCK_STREAM)
+        except (OSError, UnicodeError):
+            results[endpoint] = []
+
+    # Daemon threads: a resolver that hangs past the budget must not keep gitgo alive.
+    threads = [threading.Thread(target=lookup, args=(endpoint,), daemon=True) for endpoint in endpoints]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(max(0.0, deadline - time.monotonic()))
+    finished = all(endpoint in results for endpoint in endpoints)
+    return [(endpoint, info) for endpoint in endpoints for info in results.get(endpoint, [])], finished
+
+
+def _open(family, sock_type, proto, sockaddr):
+    sock = socket.socket(family, sock_type, proto)
+    sock.setblocking(False)
+    return sock, sock.connect_ex(sockaddr)
+
+
+def check_tcp(endpoints, stop_on=None, budget=PRECHECK_BUDGET, dns_budget=DNS_BUDGET):
+    """Race non-blocking connects to every address of every endpoint, IPv4 and IPv6 alike.
+
+    Names are resolved first, within `dns_budget`. The connects then get
+    `budget`, and return as soon as `stop_on` connects or every attempt has
+    settled. Nothing is sent over the sockets.
+    """
+    addresses, finished = _resolve_all(list(endpoints), time.monotonic() + dns_budget)
+    if not addresses:
+        return Reachability(resolved=False if finished else None)
+
+    deadline = time.monotonic() + budget
+
+    connected = set()
+    failures = 0
+    selector = selectors.DefaultSelector()
+    try:
+        for endpoint, (family, sock_type, proto, _name, sockaddr) in addresses:
+            if endpoint in connected:
+                continue
+            try:
+                sock, result = _open(family, sock_type, proto, sockaddr)
+            except OSError:
+                failures += 1
+                continue
+            if result == 0:
+                sock.close()
+                connected.add(endpoint)
+            elif result in _IN_PROGRESS:
+                selector.register(sock, selectors.EVENT_WRITE, endpoint)
+            else:
+                sock.close()
+                failures += 1
+
+        while selector.get_map() and stop_on not in connected:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            for key, _events in selector.select(remaining):
+                sock = key.fileobj
+                result = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+                selector.unregister(sock)
+                sock.close()
+                if result == 0:
+                    connected.add(key.data)
+                else:
+                    failures += 1
+        # Every attempt failed outright rather than hanging: the port is closed, not filtered.
+        refused = not connected and not selector.get_map() and failures > 0
+    finally:
+        for key in list(selector.get_map().values()):
+            key.fileobj.close()
+        selector.close()
+
+    return Reachability(connected=connected, refused=refused)
@@ -0,0 +1,218 @@
+from pygitgo.utils.repo_context import get_repo_context
+from pathlib import Path
+import re
+import os
+
+
+# Refs that live in the per-worktree git dir rather than the shared one.
+_PER_WORKTREE_PREFIXES = ("refs/bisect/", "refs/worktree/", "refs/rewritten/")
+_OBJECT_ID = re.compile(r"^[0-9a-f]{40}([0-9a-f]{24})?$")
+_MAX_SYMREF_DEPTH = 5
+
+# packed-refs contents, keyed on path and reused while mtime and size match.
+_PACKED_CACHE = {}
+
+
+class RefsUnavailable(Exception):
+    """The refs cannot be read from disk here; ask git instead."""
+
+
+def _ref_store():
+    context = get_repo_context()
+    if context is None:
+        raise RefsUnavailable("not inside a git repository")
+    if not (context.git_dir / "HEAD").is_file():
+        raise RefsUnavailable(f"no HEAD in {context.git_dir}")
+    if (context.common_dir / "reftable").is_dir():
+        raise RefsUnavailable("reftable repositories are read through git")
+    return context
+
+
+def _ref_dir(context, name):
+    if not name.startswith("refs/") or name.startswith(_PER_WORKTREE_PREFIXES):
+        return context.git_dir
+    return context.common_dir
+
+
+def _read_loose(context, name):
+    """Return the raw contents of a loose ref, or None when there is no such file."""
+    try:
+        with open(_ref_dir(context, name) / name, "r", encoding="utf-8") as f:
+            return f.readline().strip()
+    except (FileNotFoundError, NotADirectoryError, IsADirectoryError):
+        return None
+    except OSError as e:
+        raise RefsUnavailable(str(e))
+
+
+def _load_packed(common_dir):
+    path = Path(common_dir) / "packed-refs"
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+
+    cached = _PACKED_CACHE.get(path)
+    if cached and cached[0] == (stat.st_mtime_ns, stat.st_size):
+        return cached[1]
+
+    with open(path, "rb") as f:
+        data = f.read()
+
+    body_start = 0
+    sorted_refs = False
+    if data.startswith(b"# pack-refs with:"):
+        header_end = data.find(b"\n")
+        header_end = len(data) if header_end == -1 else header_end
+        sorted_refs = b" sorted" in data[:header_end]
+        body_start = header_end + 1
+
+    packed = (data, body_start, sorted_refs)
+    _PACKED_CACHE[path] = ((stat.st_mtime_ns, stat.st_size), packed)
+    return packed
+
+
+def _line_at(data, start):
+    end = data.find(b"\n", start)
+    end = len(data) if end == -1 else end
+    return data[start:end], end + 1
+
+
+def _parse_packed_line(line):
+    sha, _sep, name = line.partition(b" ")
+    return sha, name.rstrip(b"\r")
+
+
+def _search_packed(data, start, target):
+    """Binary search a sorted packed-refs body. `start` must be a record start."""
+    lo, hi = start, len(data)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        newline = data.rfind(b"\n", lo, mid)
+        line_start = lo if newline == -1 else newline + 1
+
+        line, next_start = _line_at(data, line_start)
+        if line.startswith(b"^") and line_start > lo:
+            # A peeled tag line belongs to the record right above it.
+            newline = data.rfind(b"\n", lo, line_start - 1)
+            line_start = lo if newline == -1 else newline + 1
+            line, next_start = _line_at(data, line_start)
+
+        sha, name = _parse_packed_line(line)
+        if name == target:
+            return sha.decode("ascii")
+        if name < target:
+            lo = next_start
+            if data.startswith(b"^", lo):
+                _line, lo = _line_at(data, lo)
+        else:
+            hi = line_start
+    return None
+
+
+def _read_packed(context, name):
+    packed = _load_packed(context.common_dir)
+    if packed is None:
+        return None
+
+    data, start, sorted_refs = packed
+    target = name.encode("utf-8")
+    if sorted_refs:
+        return _search_packed(data, start, target)
+
+    for line in data[start:].splitlines():
+        if line.startswith((b"#", b"^")):
+            continue
+        sha, ref_name = _parse_packed_line(line)
+        if ref_name == target:
+            return sha.decode("ascii")
+    return None
+
+
+def _packed_names(context):
+    packed = _load_packed(context.common_dir)
+    if packed is None:
+        return []
+    data, start, _sorted = packed
+    return [
+        _parse_packed_line(line)[1].decode("utf-8")
+        for line in data[start:].splitlines()
+        if line and not line.startswith((b"#", b"^"))
+    ]
+
+
+def _resolve(context, name):
+    """Follow `name` to an object id. Returns (final ref name, sha or None)."""
+    for _depth in range(_MAX_SYMREF_DEPTH):
+        raw = _read_loose(context, name)
+        if raw is None:
+            if not name.startswith("refs/"):
+                return name, None
+            return name, _read_packed(context, name)
+
+        if raw.startswith("ref:"):
+            name = raw[len("ref:"):].strip()
+            continue
+        if _OBJECT_ID.match(raw):
+            return name, raw
+        raise RefsUnavailable(f"cannot parse ref '{name}'")
+
+    raise RefsUnavailable(f"symbolic ref '{name}' nests too deeply")
+
+
+def read_head():
+    """Return (branch, sha) for HEAD. branch is "" when detached; sha is None on an unborn branch."""
+    context = _ref_store()
+    raw = _read_loose(context, "HEAD")
+    if raw is None:
+        raise RefsUnavailable("HEAD is missing")
+
+    if raw.startswith("ref:"):
+        target = raw[len("ref:"):].strip()
+        _name, sha = _resolve(context, target)
+        branch = target[len("refs/heads/"):] if target.startswith("refs/heads/") else ""
+        return branch, sha
+    if _OBJECT_ID.match(raw):
+        return "", raw
+    raise RefsUnavailable("cannot parse HEAD")
+
+
+def read_ref(name):
+    """Return the object id `name` points to, or None if the ref does not exist."""
+    return _resolve(_ref_store(), name)[1]
+
+
+def read_symbolic_ref(name):
+    """Return the ref `name` points to (e.g. "refs/remotes/origin/main"), or None if it is not a symbolic ref."""
+    raw = _read_loose(_ref_store(), name)
+    if raw and raw.startswith("ref:"):
+        return raw[len("ref:"):].strip()
+    return None
+
+
+def ref_exists(name):
+    return read_ref(name) is not None
+
+
+def remote_branch_exists(branch):
+    """Whether some remote has exactly `refs/remotes/<remote>/<branch>`, loose or packed."""
+    context = _ref_store()
+
+    remotes_dir = context.common_dir / "refs" / "remotes"
+    if remotes_dir.is_dir():
+        for remote in os.listdir(remotes_dir):
+            if (remotes_dir / remote / branch).is_file():
+                return True
+
+    # The same test for packed refs: the part after the remote's name must be the
+    # whole branch, so 'x' does not match 'origin/feature/x'.
+    for name in _packed_names(context):
+        if name.startswith("refs/remotes/"):
+            parts = name[len("refs/remotes/"):].split("/", 1)
+            if len(parts) == 2 and parts[1] == branch:
+                return True
+    return False
+
+
+def clear_packed_cache():
+    _PACKED_CACHE.clear()
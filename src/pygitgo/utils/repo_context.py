@@ -0,0 +1,110 @@
+from pygitgo.utils.executor import run_command, get_generation
+from pygitgo.exceptions import GitCommandError
+from pathlib import Path
+import os
+
+
+_UNSET = object()
+
+_REV_PARSE_BASE = ["git", "rev-parse", "--absolute-git-dir", "--git-common-dir", "--show-toplevel"]
+RESOLVE_COMMAND = _REV_PARSE_BASE + ["--abbrev-ref", "HEAD"]
+REMOTE_URL_COMMAND = ["git", "config", "--get", "remote.origin.url"]
+
+# The context for the current folder, re-resolved when the folder changes or
+# after any git command that may have moved HEAD, switched branches or edited
+# the remote.
+_CACHE = {"key": None, "context": None}
+
+
+class RepoContext:
+    """Where the current repository lives and what HEAD points at.
+
+    Paths are absolute, so checks such as "is a rebase in progress" work from
+    any subdirectory and inside linked worktrees, where `.git` is a file.
+    """
+
+    def __init__(self, git_dir, common_dir, toplevel, head=None):
+        self.git_dir = Path(git_dir)
+        self.common_dir = Path(common_dir)
+        self.toplevel = Path(toplevel)
+        self.head = head
+        self._remote_url = _UNSET
+
+    @classmethod
+    def from_git(cls):
+        """Resolve the repository with a single `git rev-parse` call. Returns None outside a work tree."""
+        try:
+            lines = run_command(RESOLVE_COMMAND).splitlines()
+        except GitCommandError:
+            # HEAD does not resolve yet on a branch with no commits.
+            try:
+                lines = run_command(_REV_PARSE_BASE).splitlines() + [None]
+            except GitCommandError:
+                return None
+
+        if len(lines) != 4:
+            return None
+
+        git_dir, common_dir, toplevel, head = lines
+        # Older git prints the common dir relative to the current folder.
+        common_dir = Path(os.getcwd(), common_dir).resolve()
+        return cls(git_dir, common_dir, toplevel, head)
+
+    def git_path(self, *parts):
+        return self.git_dir.joinpath(*parts)
+
+    @property
+    def is_linked_worktree(self):
+        return self.git_dir.resolve() != self.common_dir.resolve()
+
+    @property
+    def has_linked_worktrees(self):
+        """Whether other checkouts share this repository's branches and stashes."""
+        return self.is_linked_worktree or (self.common_dir / "worktrees").is_dir()
+
+    @property
+    def is_detached(self):
+        return self.head == "HEAD"
+
+    @property
+    def branch(self):
+        """Current branch name, or an empty string when HEAD is detached."""
+        if self.head is None:
+            self.head = run_command(["git", "branch", "--show-current"]).strip()
+        return "" if self.is_detached else self.head
+
+    @property
+    def index_lock(self):
+        return self.git_path("index.lock")
+
+    @property
+    def rebase_in_progress(self):
+        return self.git_path("rebase-merge").exists() or self.git_path("rebase-apply").exists()
+
+    @property
+    def remote_url(self):
+        """URL of 'origin', or None when no origin is configured."""
+        if self._remote_url is _UNSET:
+            try:
+                self._remote_url = run_command(REMOTE_URL_COMMAND).strip() or None
+            except GitCommandError:
+                self._remote_url = None
+        return self._remote_url
+
+
+def _resolve():
+    return RepoContext.from_git()
+
+
+def get_repo_context():
+    """Return the RepoContext for the current folder, or None outside a git work tree."""
+    key = (os.getcwd(), get_generation())
+    if _CACHE["key"] != key:
+        _CACHE["context"] = _resolve()
+        _CACHE["key"] = key
+    return _CACHE["context"]
+
+
+def clear_repo_context():
+    _CACHE["key"] = None
+    _CACHE["context"] = None
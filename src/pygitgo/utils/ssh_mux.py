@@ -0,0 +1,118 @@
+from pygitgo.utils import state_store
+from datetime import timedelta
+from pathlib import Path
+import subprocess
+import shutil
+import shlex
+import os
+import re
+
+
+# One control socket per user, host and port (ssh's %C hash), shared by git
+# and the ssh probes. The master closes itself after CONTROL_PERSIST idle.
+CONTROL_DIR = Path.home() / ".gitgo" / "ssh"
+CONTROL_PERSIST = "60s"
+
+# Unix socket paths are capped at about 104 bytes and %C expands to 40 hex
+# digits, so a very long home folder cannot hold the socket.
+_MAX_SOCKET_PATH = 100
+_HASH_LENGTH = 40
+
+# Before OpenSSH 8.4 the master started by ControlMaster=auto keeps the stderr
+# of the ssh that spawned it open, so anything reading that pipe (git with
+# captured output, the `ssh -T` probe) waits for ControlPersist to run out.
+MIN_OPENSSH_VERSION = (8, 4)
+
+# `ssh -V` results, keyed on the binary's path and mtime so an upgrade is
+# noticed. Unreadable banners are stored as (0, 0).
+VERSION_NAMESPACE = "ssh-version"
+VERSION_TTL = timedelta(days=30)
+
+_dir_ready = False
+_versions = {}
+
+
+def _openssh_program(base_command):
+    try:
+        program = shlex.split(base_command)[0]
+    except (ValueError, IndexError):
+        return None
+    return program if os.path.basename(program).lower() in ("ssh", "ssh.exe") else None
+
+
+def _read_openssh_version(program):
+    path = shutil.which(program)
+    if path is None:
+        return None
+    try:
+        key = f"{path}:{os.stat(path).st_mtime_ns}"
+    except OSError:
+        return None
+
+    cached = state_store.get(VERSION_NAMESPACE, key)
+    if isinstance(cached, list) and len(cached) == 2:
+        return tuple(cached)
+
+    try:
+        result = subprocess.run(
+            [path, "-V"], stdin=subprocess.DEVNULL, capture_output=True, text=True, timeout=5,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    match = re.search(r"OpenSSH_(?:for_Windows_)?(\d+)\.(\d+)", result.stderr + result.stdout)
+    version = (int(match.group(1)), int(match.group(2))) if match else (0, 0)
+    state_store.set(VERSION_NAMESPACE, key, list(version), ttl=VERSION_TTL)
+    return version
+
+
+def _openssh_version(program):
+    """(major, minor) as reported by `ssh -V`, or None if it cannot be run. Stored between runs."""
+    if program not in _versions:
+        _versions[program] = _read_openssh_version(program)
+    return _versions[program]
+
+
+def _ensure_control_dir():
+    global _dir_ready
+    if not _dir_ready:
+        try:
+            CONTROL_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+        except OSError:
+            return False
+        _dir_ready = True
+    return True
+
+
+def control_options(base_command="ssh"):
+    """ssh `-o` options that reuse one connection per host, or [] where that does not apply.
+
+    Multiplexing is skipped on Windows (its OpenSSH has no control sockets),
+    for ssh replacements such as plink, on OpenSSH older than 8.4, when the
+    user already configures ControlMaster/ControlPath themselves, and when
+    GITGO_NO_SSH_MUX is set.
+    """
+    if os.name == "nt" or os.environ.get("GITGO_NO_SSH_MUX"):
+        return []
+    program = _openssh_program(base_command)
+    if "control" in base_command.lower() or program is None:
+        return []
+    if len(str(CONTROL_DIR)) + 1 + _HASH_LENGTH > _MAX_SOCKET_PATH:
+        return []
+    if (_openssh_version(program) or (0, 0)) < MIN_OPENSSH_VERSION:
+        return []
+    if not _ensure_control_dir():
+        return []
+
+    return [
+        "-o", "ControlMaster=auto",
+        "-o", f"ControlPath={CONTROL_DIR / '%C'}",
+        "-o", f"ControlPersist={CONTROL_PERSIST}",
+    ]
+
+
+def ssh_command(base_command="ssh", multiplex=True):
+    """The GIT_SSH_COMMAND value gitgo runs git with: never prompt, and multiplex when asked and possible."""
+    options = ["-o", "BatchMode=yes"]
+    if multiplex:
+        options += control_options(base_command)
+    return " ".join([base_command] + [shlex.quote(option) for option in options])
@@ -0,0 +1,164 @@
+from contextlib import contextmanager
+from pathlib import Path
+import json
+import time
+import os
+
+
+# Every cache gitgo keeps between runs lives in this one file, split into
+# namespaces ("update-check", "ssh-probe", ...). Each entry records when it
+# expires, so callers ask for a key and get it back only while it is fresh.
+STATE_DIR = Path.home() / ".gitgo"
+STATE_FILE_NAME = "state.json"
+LOCK_FILE_NAME = "state.lock"
+
+# The parsed file, reused while the same file (every write is a new inode) is unchanged.
+_CACHE = {"path": None, "stamp": None, "data": {}}
+
+
+def _state_file():
+    return STATE_DIR / STATE_FILE_NAME
+
+
+def _is_live(entry, now):
+    if not isinstance(entry, dict) or "value" not in entry:
+        return False
+    expires_at = entry.get("expires_at")
+    return expires_at is None or expires_at > now
+
+
+def _load():
+    """Read the store without locking. Writers replace the file atomically, so a read never sees half a write."""
+    path = _state_file()
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return {}
+
+    stamp = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+    if _CACHE["path"] == path and _CACHE["stamp"] == stamp:
+        return _CACHE["data"]
+
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        data = {}
+    if not isinstance(data, dict):
+        data = {}
+
+    _CACHE.update(path=path, stamp=stamp, data=data)
+    return data
+
+
+def _lock(lock_file):
+    try:
+        import fcntl
+    except ImportError:
+        import msvcrt
+        lock_file.seek(0)
+        msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+        return
+    fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+
+
+def _unlock(lock_file):
+    try:
+        import fcntl
+    except ImportError:
+        import msvcrt
+        lock_file.seek(0)
+        msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+        return
+    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def _write(data):
+    import tempfile
+
+    path = _state_file()
+    fd, temp_path = tempfile.mkstemp(prefix=".state-", suffix=".tmp", dir=STATE_DIR)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+@contextmanager
+def _transaction():
+    """Hold the store's lock across read-modify-write. Yields the data to edit in place."""
+    STATE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+    with open(STATE_DIR / LOCK_FILE_NAME, "a+") as lock_file:
+        _lock(lock_file)
+        try:
+            # Bypass the in-process copy: another gitgo may have written since.
+            _CACHE["stamp"] = None
+            data = {namespace: dict(entries) for namespace, entries in _load().items() if isinstance(entries, dict)}
+            yield data
+
+            now = time.time()
+            for namespace in list(data):
+                data[namespace] = {key: entry for key, entry in data[namespace].items() if _is_live(entry, now)}
+                if not data[namespace]:
+                    del data[namespace]
+            _write(data)
+        finally:
+            _unlock(lock_file)
+
+
+def get(namespace, key, default=None):
+    """Return the stored value, or `default` when it is missing or expired."""
+    entry = _load().get(namespace, {}).get(key)
+    return entry["value"] if _is_live(entry, time.time()) else default
+
+
+def items(namespace):
+    """All unexpired values in `namespace`, as a dict."""
+    now = time.time()
+    entries = _load().get(namespace, {})
+    return {key: entry["value"] for key, entry in entries.items() if _is_live(entry, now)}
+
+
+def set_many(namespace, values, ttl=None):
+    """Store several values at once. `ttl` is a timedelta; None keeps them until overwritten.
+
+    The store is a cache: returns False instead of raising when ~/.gitgo cannot be written.
+    """
+    expires_at = time.time() + ttl.total_seconds() if ttl is not None else None
+    try:
+        with _transaction() as data:
+            entries = data.setdefault(namespace, {})
+            for key, value in values.items():
+                entries[key] = {"value": value, "expires_at": expires_at}
+    except OSError:
+        return False
+    return True
+
+
+def set(namespace, key, value, ttl=None):
+    return set_many(namespace, {key: value}, ttl=ttl)
+
+
+def delete(namespace, keys=None):
+    """Drop `keys` from `namespace`, or the whole namespace when keys is None."""
+    try:
+        with _transaction() as data:
+            if keys is None:
+                data.pop(namespace, None)
+                return True
+            entries = data.get(namespace, {})
+            for key in keys:
+                entries.pop(key, None)
+    except OSError:
+        return False
+    return True
+
+
+def clear_state_cache():
+    _CACHE.update(path=None, stamp=None, data={})
@@ -0,0 +1,175 @@
+from contextlib import contextmanager
+import subprocess
+import threading
+import time
+import os
+
+
+# Spans collected for `gitgo --trace FILE`. Nothing is recorded unless a trace
+# file was requested, so the helpers below cost one dict lookup otherwise.
+_TRACE = {"path": None, "events": [], "origin": 0}
+
+
+def start_trace(path):
+    _TRACE["path"] = path
+    _TRACE["events"] = []
+    _TRACE["origin"] = time.perf_counter_ns()
+
+
+def is_tracing():
+    return _TRACE["path"] is not None
+
+
+def _now_us():
+    return (time.perf_counter_ns() - _TRACE["origin"]) / 1000
+
+
+@contextmanager
+def span(name, category, track=None, **args):
+    """Record the enclosed block as one trace event.
+
+    Yields the event's args dict so the caller can add results (exit code,
+    byte counts, status), or None when tracing is off. Spans that overlap on
+    one thread (concurrent queries) pass their own `track` so the viewer draws
+    them side by side instead of nesting them.
+    """
+    if _TRACE["path"] is None:
+        yield None
+        return
+
+    start = _now_us()
+    try:
+        yield args
+    except GeneratorExit:
+        # A streaming caller stopped reading early; that is not a failure.
+        raise
+    except BaseException as e:
+        args.setdefault("error", type(e).__name__)
+        raise
+    finally:
+        _TRACE["events"].append({
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": start,
+            "dur": _now_us() - start,
+            "pid": os.getpid(),
+            "tid": threading.get_native_id() if track is None else track,
+            "args": args,
+        })
+
+
+# Options placed before the subcommand whose value is a separate argument:
+# `git -c key=value`, `git -C path`, `ssh -o Option=value`.
+_OPTIONS_WITH_VALUE = {"-c", "-C", "-o"}
+
+
+def _command_name(command):
+    if not isinstance(command, list):
+        return str(command)
+    # "git status", "git commit" and so on group nicely in the trace viewer.
+    name = os.path.basename(command[0])
+    args = iter(command[1:])
+    for arg in args:
+        if arg in _OPTIONS_WITH_VALUE:
+            next(args, None)
+            continue
+        if not arg.startswith("-"):
+            return f"{name} {arg}"
+    return name
+
+
+def _byte_count(output):
+    if output is None:
+        return 0
+    return len(output.encode("utf-8", "replace")) if isinstance(output, str) else len(output)
+
+
+def record_output(span_args, returncode, stdout, stderr):
+    if span_args is None:
+        return
+    span_args["exit_code"] = returncode
+    span_args["stdout_bytes"] = _byte_count(stdout)
+    span_args["stderr_bytes"] = _byte_count(stderr)
+
+
+def command_span(command, track=None):
+    argv = list(command) if isinstance(command, list) else [str(command)]
+    return span(_command_name(command), "subprocess", track=track, argv=argv)
+
+
+def run_traced(command, **kwargs):
+    """subprocess.run, recorded as a span when tracing."""
+    if _TRACE["path"] is None:
+        return subprocess.run(command, **kwargs)
+
+    with command_span(command) as span_args:
+        try:
+            result = subprocess.run(command, **kwargs)
+        except subprocess.CalledProcessError as e:
+            record_output(span_args, e.returncode, e.stdout, e.stderr)
+            raise
+        except subprocess.TimeoutExpired:
+            span_args["timed_out"] = True
+            raise
+        record_output(span_args, result.returncode, result.stdout, result.stderr)
+        return result
+
+
+class _CountingResponse:
+    def __init__(self, response, span_args):
+        self._response = response
+        self._span_args = span_args
+
+    def read(self, *args):
+        data = self._response.read(*args)
+        self._span_args["response_bytes"] += len(data)
+        return data
+
+    def __getattr__(self, name):
+        return getattr(self._response, name)
+
+
+@contextmanager
+def urlopen(request, timeout):
+    """urllib.request.urlopen as a context manager, recorded as a span when tracing."""
+    import urllib.request
+    import urllib.error
+    import urllib.parse
+
+    if _TRACE["path"] is None:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            yield response
+        return
+
+    url = request.full_url if isinstance(request, urllib.request.Request) else request
+    method = request.get_method() if isinstance(request, urllib.request.Request) else "GET"
+    host = urllib.parse.urlsplit(url).netloc
+    with span(f"{method} {host}", "http", method=method, url=url, response_bytes=0) as span_args:
+        try:
+            with urllib.request.urlopen(request, timeout=timeout) as response:
+                span_args["status"] = getattr(response, "status", None)
+                yield _CountingResponse(response, span_args)
+        except urllib.error.HTTPError as e:
+            span_args["status"] = e.code
+            raise
+
+
+def write_trace():
+    """Write the collected spans as a Chrome trace-event file and stop tracing."""
+    path = _TRACE["path"]
+    if path is None:
+        return
+
+    import json
+    from pygitgo.utils.cli_io import warning
+
+    events = _TRACE["events"]
+    _TRACE["path"] = None
+    _TRACE["events"] = []
+
+    try:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f, default=str)
+    except OSError as e:
+        warning(f"Could not write trace file '{path}': {e}")
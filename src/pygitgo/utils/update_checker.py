@@ -1,62 +1,85 @@
 from pygitgo.utils.cli_io import info, warning, write
 from datetime import datetime, timedelta
-from pathlib import Path
-import urllib.request
-import urllib.error
-import threading
+from pygitgo.utils import state_store
 import json
+import sys
 
 
-
-CACHE_DIR = Path.home() / ".gitgo"
-CACHE_FILE = CACHE_DIR / "update_check.json"
+STATE_NAMESPACE = "update-check"
 PYPI_URL = "https://pypi.org/pypi/pygitgo/json"
 CHECK_INTERVAL = timedelta(days=7)
-REQUEST_TIMEOUT = 2
-
+# The request runs in a detached worker, so a slow network never holds up a command.
+REQUEST_TIMEOUT = 10
 
-def read_cache():
-    if not CACHE_FILE.exists():
-        return {}
-    try:
-        with open(CACHE_FILE, "r") as f:
-            return json.load(f)
-    except (json.JSONDecodeError, IOError):
-        return {}
+# `python -m pygitgo.utils.update_checker` refreshes the cache and exits. A
+# frozen (PyInstaller) build has no `-m`: sys.executable is gitgo itself, so it
+# runs itself with this hidden argument instead, which main() hands to refresh_cache.
+WORKER_FLAG = "--refresh-update-check"
 
 
-def write_cache(data):
-    try:
-        CACHE_DIR.mkdir(exist_ok=True)
-        with open(CACHE_FILE, "w") as f:
-            json.dump(data, f)
-    except IOError:
-        pass
+def get_worker_command():
+    if getattr(sys, "frozen", False):
+        return [sys.executable, WORKER_FLAG]
+    return [sys.executable, "-m", "pygitgo.utils.update_checker"]
 
 
 def should_check():
-    cache = read_cache()
-    last_check = cache.get("last_check")
+    """Whether the last check (successful or not) is older than CHECK_INTERVAL."""
+    return state_store.get(STATE_NAMESPACE, "checked_at") is None
 
-    if not last_check:
-        return True
 
-    try:
-        last_check_time = datetime.fromisoformat(last_check)
-        return (datetime.now() - last_check_time) > CHECK_INTERVAL
-    except ValueError:
-        return True
+def get_latest_version(cache=None):
+    """Ask PyPI for the latest release, or None on any failure.
+
+    With a cache dict, the request is revalidated with its ETag and
+    Last-Modified. A 304 answer returns the cached version, and new
+    validators are stored back into the dict.
+    """
+    import urllib.request
+    import urllib.error
 
+    headers = {}
+    if cache and cache.get("etag"):
+        headers["If-None-Match"] = cache["etag"]
+    if cache and cache.get("last_modified"):
+        headers["If-Modified-Since"] = cache["last_modified"]
 
-def get_latest_version():
     try:
-        with urllib.request.urlopen(PYPI_URL, timeout=REQUEST_TIMEOUT) as response:
+        request = urllib.request.Request(PYPI_URL, headers=headers)
+        with urllib.request.urlopen(request, timeout=REQUEST_TIMEOUT) as response:
             data = json.loads(response.read().decode("utf-8"))
+            if cache is not None:
+                cache["etag"] = response.headers.get("ETag")
+                cache["last_modified"] = response.headers.get("Last-Modified")
             return data["info"]["version"]
+    except urllib.error.HTTPError as e:
+        if e.code == 304 and cache:
+            return cache.get("latest_version")
+        return None
     except Exception:
         return None
 
 
+def refresh_cache():
+    """Fetch the latest version into the state store. Runs in the detached worker."""
+    cache = state_store.items(STATE_NAMESPACE)
+    latest_version = get_latest_version(cache)
+
+    values = {"etag": cache.get("etag"), "last_modified": cache.get("last_modified")}
+    if latest_version:
+        values["latest_version"] = latest_version
+    state_store.set_many(STATE_NAMESPACE, values)
+    state_store.set(STATE_NAMESPACE, "checked_at", datetime.now().isoformat(), ttl=CHECK_INTERVAL)
+
+
+def _schedule_refresh():
+    from pygitgo.utils.executor import spawn_detached
+
+    # Record the attempt first so concurrent commands do not each start a worker.
+    state_store.set(STATE_NAMESPACE, "checked_at", datetime.now().isoformat(), ttl=CHECK_INTERVAL)
+    spawn_detached(get_worker_command())
+
+
 def parse_version(version_string):
     parts = [int(x) for x in version_string.split(".")]
     while len(parts) < 3:
@@ -64,34 +87,40 @@ def parse_version(version_string):
     return parts
 
 
-def check_for_updates(current_version):
-    if not should_check():
-        return
+def get_update_notice(current_version):
+    """Return an "update available" line from the cached check, or None.
 
-    cache = read_cache()
-    cache["last_check"] = datetime.now().isoformat()
-    write_cache(cache)
+    Never touches the network. A stale cache starts a background refresh
+    whose answer shows up on a later run. Each newer version is announced
+    once per CHECK_INTERVAL.
+    """
+    if should_check():
+        _schedule_refresh()
 
-    latest_version = get_latest_version()
+    latest_version = state_store.get(STATE_NAMESPACE, "latest_version")
     if not latest_version or latest_version == current_version:
-        return
+        return None
+    if state_store.get(STATE_NAMESPACE, "notified_version") == latest_version:
+        return None
 
     try:
-        current_parts = parse_version(current_version)
-        latest_parts = parse_version(latest_version)
+        if parse_version(latest_version) <= parse_version(current_version):
+            return None
+    except (ValueError, AttributeError):
+        return None
 
-        if latest_parts > current_parts:
-            write()
-            warning(f"GitGo update available: {current_version} -> {latest_version}")
-            info("Run: pip install --upgrade pygitgo")
-            write()
+    state_store.set(STATE_NAMESPACE, "notified_version", latest_version, ttl=CHECK_INTERVAL)
+    return f"GitGo update available: {current_version} -> {latest_version}"
 
-            cache["notified_version"] = latest_version
-            write_cache(cache)
-    except (ValueError, AttributeError):
-        pass
+
+def check_for_updates(current_version):
+    notice = get_update_notice(current_version)
+    if notice:
+        write()
+        warning(notice)
+        info("Run: pip install --upgrade pygitgo")
+        write()
 
 
-def check_for_updates_background(current_version):
-    thread = threading.Thread(target=check_for_updates, args=(current_version,), daemon=True)
-    thread.start()
+if __name__ == "__main__":
+    refresh_cache()
@@ -1,5 +1,7 @@
-import sys
 from pathlib import Path
+import subprocess
+import sys
+import os
 
 src_dir = Path(__file__).parent.parent / "src"
 sys.path.insert(0, str(src_dir))
@@ -18,10 +20,116 @@ def capture_system_exit_code(function):
         return 1
 
 
+def make_status(*lines, **fields):
+    """Build a StatusSnapshot from `git status --porcelain` style lines, e.g. "M file.py" or "?? new.txt"."""
+    from pygitgo.commands.git_status import StatusSnapshot, StatusEntry
+
+    entries = []
+    for line in lines:
+        if line.startswith("?? "):
+            entries.append(StatusEntry("untracked", "?", "?", line[3:]))
+            continue
+        if len(line) > 2 and line[2] == " ":
+            xy, path = line[:2], line[3:]
+        else:
+            xy, path = line[0] + " ", line[2:]
+        index, worktree = (letter if letter != " " else "." for letter in xy)
+        kind = "renamed" if "R" in xy else "changed"
+        entries.append(StatusEntry(kind, index, worktree, path))
+    return StatusSnapshot(entries=entries, **fields)
+
+
+def make_config(**scopes):
+    """`git config --list -z --show-scope` output, e.g. make_config(global_={"user.name": "Ann"}, local={...})."""
+    records = []
+    for scope, values in scopes.items():
+        for key, value in values.items():
+            records.append(f"{scope.rstrip('_')}\0{key}\n{value}\0")
+    return "".join(records)
+
+
+def config_result(**scopes):
+    """A CompletedProcess for a mocked `run_command(CONFIG_LIST_COMMAND, return_complete=True)`."""
+    return subprocess.CompletedProcess(["git", "config", "--list"], 0, make_config(**scopes), "")
+
+
 @pytest.fixture(autouse=True)
 def _clear_ssh_cache():
     """Reset the SSH response cache before every test."""
     from pygitgo.auth.ssh_utils import clear_ssh_cache
     clear_ssh_cache()
     yield
-    clear_ssh_cache()
\ No newline at end of file
+    clear_ssh_cache()
+
+@pytest.fixture(scope="session")
+def _scratch_repo(tmp_path_factory):
+    repo = tmp_path_factory.mktemp("scratch-repo")
+    env = {**os.environ, "GIT_AUTHOR_NAME": "Test", "GIT_AUTHOR_EMAIL": "test@example.com",
+           "GIT_COMMITTER_NAME": "Test", "GIT_COMMITTER_EMAIL": "test@example.com"}
+    subprocess.run(["git", "init", "-b", "main"], cwd=repo, check=True, capture_output=True, env=env)
+    subprocess.run(["git", "-c", "commit.gpgsign=false", "commit", "--allow-empty", "-m", "init"],
+                   cwd=repo, check=True, capture_output=True, env=env)
+    return repo
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cwd(monkeypatch, _scratch_repo):
+    """Run every test inside a throwaway repository so an unmocked git call cannot touch this checkout."""
+    monkeypatch.chdir(_scratch_repo)
+
+
+@pytest.fixture(autouse=True)
+def _no_daemon(monkeypatch):
+    """Never forward test runs to a GitGo daemon running on this machine."""
+    monkeypatch.setenv("GITGO_NO_DAEMON", "1")
+
+
+@pytest.fixture(autouse=True)
+def _no_ssh_mux(monkeypatch):
+    """Keep `ssh -V` and the control socket folder out of tests that do not ask for them."""
+    monkeypatch.setenv("GITGO_NO_SSH_MUX", "1")
+
+
+@pytest.fixture(autouse=True)
+def _isolated_state_store(monkeypatch, tmp_path_factory):
+    """Give every test its own empty ~/.gitgo state store, with the update check just done so no test starts the PyPI worker."""
+    from pygitgo.utils import state_store, update_checker
+    from datetime import datetime
+    monkeypatch.setattr(state_store, "STATE_DIR", tmp_path_factory.mktemp("gitgo-state"))
+    state_store.clear_state_cache()
+    state_store.set(update_checker.STATE_NAMESPACE, "checked_at", datetime.now().isoformat(), ttl=update_checker.CHECK_INTERVAL)
+    yield
+    state_store.clear_state_cache()
+
+
+@pytest.fixture(autouse=True)
+def _clear_query_cache():
+    """Start every test with an empty git query cache."""
+    from pygitgo.utils.executor import clear_query_cache
+    from pygitgo.utils.config import clear_config_cache
+    from pygitgo.commands.git_core import clear_signing_cache
+    clear_query_cache()
+    clear_config_cache()
+    clear_signing_cache()
+    yield
+    clear_query_cache()
+    clear_config_cache()
+    clear_signing_cache()
+
+
+@pytest.fixture(autouse=True)
+def _fake_repo_context(monkeypatch, tmp_path):
+    """Treat the test's working folder as the top of a repository on 'main'.
+
+    The git dir does not exist, so ref lookups fall back to the (mocked) git calls.
+    """
+    from pygitgo.utils import repo_context, refs
+    git_dir = tmp_path / "missing" / ".git"
+    repo_context.clear_repo_context()
+    refs.clear_packed_cache()
+    monkeypatch.setattr(
+        repo_context, "_resolve",
+        lambda: repo_context.RepoContext(git_dir, git_dir, Path.cwd(), "main"),
+    )
+    yield
+    repo_context.clear_repo_context()
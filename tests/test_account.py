@@ -1,26 +1,35 @@
 from pygitgo.auth.account import get_user, set_user, ensure_user_configure, sanitize_signing_config
 from pygitgo.exceptions import GitCommandError
+from conftest import config_result
 
 
 
+def _config(mocker, **scopes):
+    return mocker.patch("pygitgo.utils.config.run_command", return_value=config_result(**scopes))
+
+
 def test_get_user_both_exist(mocker):
-    fake_run = mocker.patch("pygitgo.auth.account.run_command", side_effect=["John Doe", "john@example.com"])
+    fake_run = _config(mocker, global_={"user.name": "John Doe", "user.email": "john@example.com"})
     name, email = get_user()
     assert name == "John Doe"
     assert email == "john@example.com"
-    assert fake_run.call_count == 2
+    fake_run.assert_called_once()
 
 
 def test_get_user_none_exist(mocker):
-    fake_run = mocker.patch("pygitgo.auth.account.run_command", side_effect=GitCommandError(["git", "config"]))
+    _config(mocker)
     name, email = get_user()
     assert name is None
     assert email is None
-    assert fake_run.call_count == 2
+
+
+def test_get_user_reads_global_identity_only(mocker):
+    _config(mocker, global_={"user.name": "John Doe"}, local={"user.name": "Repo Bot", "user.email": "bot@example.com"})
+    assert get_user() == ("John Doe", None)
 
 
 def test_set_user(mocker):
-    fake_run = mocker.patch("pygitgo.auth.account.run_command")
+    fake_run = mocker.patch("pygitgo.utils.config.run_command")
     fake_success = mocker.patch("pygitgo.auth.account.success")
 
     set_user("Alice", "alice@example.com")
@@ -75,34 +84,32 @@ def test_ensure_user_configure_prompt_failure(mocker):
 
 
 def test_sanitize_signing_config_disabled(mocker):
-    fake_run = mocker.patch("pygitgo.auth.account.run_command", return_value="false")
+    fake_run = _config(mocker, global_={"commit.gpgsign": "false"})
     sanitize_signing_config()
-    fake_run.assert_called_once_with(["git", "config", "--global", "commit.gpgsign"])
+    fake_run.assert_called_once()
 
 
 def test_sanitize_signing_config_not_configured(mocker):
-    fake_run = mocker.patch("pygitgo.auth.account.run_command", side_effect=GitCommandError(["git", "config"]))
+    fake_run = _config(mocker)
     sanitize_signing_config()
-    fake_run.assert_called_once_with(["git", "config", "--global", "commit.gpgsign"])
+    fake_run.assert_called_once()
 
 
 def test_sanitize_signing_config_ssh_format_key_exists(mocker):
     """When gpg.format=ssh and the key file exists, signing is left on."""
-    fake_run = mocker.patch("pygitgo.auth.account.run_command", side_effect=["true", "ssh"])
+    fake_run = _config(mocker, global_={"commit.gpgsign": "true", "gpg.format": "ssh"})
     mock_key = mocker.MagicMock()
     mock_key.exists.return_value = True
     mocker.patch("pygitgo.auth.ssh_utils.get_ssh_key_path", return_value=mock_key)
     sanitize_signing_config()
-    assert fake_run.call_count == 2
-    fake_run.assert_any_call(["git", "config", "--global", "commit.gpgsign"])
-    fake_run.assert_any_call(["git", "config", "--global", "gpg.format"])
+    fake_run.assert_called_once()
 
 
 def test_sanitize_signing_config_ssh_format_key_missing(mocker):
     """When gpg.format=ssh but the key file is missing, signing is disabled."""
     fake_run = mocker.patch(
-        "pygitgo.auth.account.run_command",
-        side_effect=["true", "ssh", None, None]
+        "pygitgo.utils.config.run_command",
+        side_effect=[config_result(global_={"commit.gpgsign": "true", "gpg.format": "ssh"}), None, None]
     )
     mock_key = mocker.MagicMock()
     mock_key.exists.return_value = False
@@ -110,30 +117,42 @@ def test_sanitize_signing_config_ssh_format_key_missing(mocker):
     fake_warning = mocker.patch("pygitgo.auth.account.warning")
     sanitize_signing_config()
     assert fake_warning.call_count >= 1
+    fake_run.assert_any_call(["git", "config", "--global", "--unset", "commit.gpgsign"])
 
 
 def test_sanitize_signing_config_unset_gpg_program(mocker):
-    fake_run = mocker.patch("pygitgo.auth.account.run_command", side_effect=["true", "openpgp", None, None])
+    fake_run = mocker.patch(
+        "pygitgo.utils.config.run_command",
+        side_effect=[config_result(global_={"commit.gpgsign": "true", "gpg.format": "openpgp"}), None, None]
+    )
     fake_warning = mocker.patch("pygitgo.auth.account.warning")
 
     sanitize_signing_config()
 
-    assert fake_run.call_count == 4
-    fake_run.assert_any_call(["git", "config", "--global", "commit.gpgsign"])
-    fake_run.assert_any_call(["git", "config", "--global", "gpg.format"])
+    assert fake_run.call_count == 3
     fake_run.assert_any_call(["git", "config", "--global", "--unset", "gpg.program"])
     fake_run.assert_any_call(["git", "config", "--global", "--unset", "commit.gpgsign"])
     assert fake_warning.call_count == 2
 
 
+def test_sanitize_signing_config_ignores_repo_local_signing(mocker):
+    fake_warning = mocker.patch("pygitgo.auth.account.warning")
+    _config(mocker, local={"commit.gpgsign": "true"})
+    sanitize_signing_config()
+    fake_warning.assert_not_called()
+
+
 def test_sanitize_signing_config_unset_gpg_program_error(mocker):
     fake_run = mocker.patch(
-        "pygitgo.auth.account.run_command",
-        side_effect=["true", "openpgp", GitCommandError(["git", "config"]), GitCommandError(["git", "config"])]
+        "pygitgo.utils.config.run_command",
+        side_effect=[
+            config_result(global_={"commit.gpgsign": "true", "gpg.format": "openpgp"}),
+            GitCommandError(["git", "config"]), GitCommandError(["git", "config"]),
+        ]
     )
     fake_warning = mocker.patch("pygitgo.auth.account.warning")
 
     sanitize_signing_config()
 
-    assert fake_run.call_count == 4
+    assert fake_run.call_count == 3
     assert fake_warning.call_count == 2
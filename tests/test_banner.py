@@ -1,4 +1,5 @@
 from pygitgo.utils.banner import _safe, _format_sync, show_banner
+from conftest import make_status
 import pytest
 
 
@@ -12,16 +13,11 @@ def test_safe_exception():
         raise ValueError("error")
     assert _safe(mock_fn, default="default") == "default"
 
-def test_format_sync_exception(mocker):
-    mocker.patch("pygitgo.utils.banner.run_command", side_effect=Exception("error"))
-    assert _format_sync() is None
+def test_format_sync_no_status():
+    assert _format_sync(None) is None
 
-def test_format_sync_invalid_output(mocker):
-    mocker.patch("pygitgo.utils.banner.run_command", return_value="only_one_part")
-    assert _format_sync() is None
-    
-    mocker.patch("pygitgo.utils.banner.run_command", return_value="three parts here")
-    assert _format_sync() is None
+def test_format_sync_no_upstream():
+    assert _format_sync(make_status()) is None
 
 @pytest.mark.parametrize("ahead,behind,expected", [
     (0, 0, "up to date"),
@@ -29,9 +25,8 @@ def test_format_sync_invalid_output(mocker):
     (0, 3, "3 behind"),
     (2, 3, "2 ahead, 3 behind (diverged)"),
 ])
-def test_format_sync_valid_cases(mocker, ahead, behind, expected):
-    mocker.patch("pygitgo.utils.banner.run_command", return_value=f"{ahead}\t{behind}")
-    res = _format_sync()
+def test_format_sync_valid_cases(ahead, behind, expected):
+    res = _format_sync(make_status(upstream="origin/main", ahead=ahead, behind=behind))
     assert expected in res
 
 def test_show_banner_clean_status(mocker, capsys):
@@ -39,22 +34,19 @@ def test_show_banner_clean_status(mocker, capsys):
     mocker.patch("pygitgo.utils.banner.is_git_repository", return_value=True)
     mocker.patch("pygitgo.utils.banner.get_user", return_value=("Huerte", "huerte@example.com"))
     mocker.patch("pygitgo.utils.banner.get_current_branch", return_value="main")
-    mocker.patch("pygitgo.utils.banner.check_for_updates", return_value=None)
+    mocker.patch("pygitgo.utils.banner.get_update_notice", return_value=None)
     
     def mock_run(args, *a, **k):
         cmd_str = " ".join(args) if isinstance(args, list) else str(args)
         if "remote.origin.url" in cmd_str:
             return "https://github.com/Huerte/GitGo.git"
-        elif "status" in cmd_str:
-            return ""
-        elif "rev-list" in cmd_str:
-            return "0\t0"
         return ""
     
     mocker.patch("pygitgo.utils.banner.run_command", side_effect=mock_run)
+    mocker.patch("pygitgo.utils.banner.get_status", return_value=make_status(ahead=0, behind=0))
     
     mock_commits = [{"hash": "abcdef0", "message": "Initial commit", "date": "2026-07-17", "author": "Huerte"}]
-    mocker.patch("pygitgo.utils.banner.get_recent_commits", return_value=mock_commits)
+    mocker.patch("pygitgo.utils.banner.get_recent_commits", return_value=iter(mock_commits))
     
     import os
     mocker.patch("shutil.get_terminal_size", return_value=os.terminal_size((80, 20)))
@@ -82,20 +74,17 @@ def test_show_banner_dirty_status(mocker, capsys):
     mocker.patch("pygitgo.utils.banner.is_git_repository", return_value=True)
     mocker.patch("pygitgo.utils.banner.get_user", return_value=(None, None))
     mocker.patch("pygitgo.utils.banner.get_current_branch", side_effect=Exception("no branch"))
-    mocker.patch("pygitgo.utils.banner.check_for_updates", return_value="Update available: 1.10.2")
+    mocker.patch("pygitgo.utils.banner.get_update_notice", return_value="Update available: 1.10.2")
     
     def mock_run(args, *a, **k):
         cmd_str = " ".join(args) if isinstance(args, list) else str(args)
         if "remote.origin.url" in cmd_str:
             raise Exception("no remote")
-        elif "status" in cmd_str:
-            return "M  src/main.py\n?? test.py\n"
-        elif "rev-list" in cmd_str:
-            return "2\t3"
         return ""
     
     mocker.patch("pygitgo.utils.banner.run_command", side_effect=mock_run)
-    mocker.patch("pygitgo.utils.banner.get_recent_commits", return_value=[])
+    mocker.patch("pygitgo.utils.banner.get_status", return_value=make_status("M  src/main.py", "?? test.py", ahead=2, behind=3))
+    mocker.patch("pygitgo.utils.banner.get_recent_commits", return_value=iter([]))
     import os
     mocker.patch("shutil.get_terminal_size", return_value=os.terminal_size((40, 20)))
     
@@ -121,20 +110,17 @@ def test_show_banner_dirty_only_modified(mocker, capsys):
     mocker.patch("pygitgo.utils.banner.is_git_repository", return_value=True)
     mocker.patch("pygitgo.utils.banner.get_user", return_value=("user", "email"))
     mocker.patch("pygitgo.utils.banner.get_current_branch", return_value="main")
-    mocker.patch("pygitgo.utils.banner.check_for_updates", return_value=None)
+    mocker.patch("pygitgo.utils.banner.get_update_notice", return_value=None)
     
     def mock_run(args, *a, **k):
         cmd_str = " ".join(args) if isinstance(args, list) else str(args)
         if "remote.origin.url" in cmd_str:
             return "https://github.com/Huerte/GitGo.git"
-        elif "status" in cmd_str:
-            return "M  src/main.py\n"
-        elif "rev-list" in cmd_str:
-            return "0\t0"
         return ""
     
     mocker.patch("pygitgo.utils.banner.run_command", side_effect=mock_run)
-    mocker.patch("pygitgo.utils.banner.get_recent_commits", return_value=[])
+    mocker.patch("pygitgo.utils.banner.get_status", return_value=make_status("M  src/main.py", ahead=0, behind=0))
+    mocker.patch("pygitgo.utils.banner.get_recent_commits", return_value=iter([]))
     
     show_banner()
     
@@ -147,20 +133,17 @@ def test_show_banner_dirty_only_untracked(mocker, capsys):
     mocker.patch("pygitgo.utils.banner.is_git_repository", return_value=True)
     mocker.patch("pygitgo.utils.banner.get_user", return_value=("user", "email"))
     mocker.patch("pygitgo.utils.banner.get_current_branch", return_value="main")
-    mocker.patch("pygitgo.utils.banner.check_for_updates", return_value=None)
+    mocker.patch("pygitgo.utils.banner.get_update_notice", return_value=None)
     
     def mock_run(args, *a, **k):
         cmd_str = " ".join(args) if isinstance(args, list) else str(args)
         if "remote.origin.url" in cmd_str:
             return "https://github.com/Huerte/GitGo.git"
-        elif "status" in cmd_str:
-            return "?? untracked.py\n"
-        elif "rev-list" in cmd_str:
-            return "0\t0"
         return ""
     
     mocker.patch("pygitgo.utils.banner.run_command", side_effect=mock_run)
-    mocker.patch("pygitgo.utils.banner.get_recent_commits", return_value=[])
+    mocker.patch("pygitgo.utils.banner.get_status", return_value=make_status("?? untracked.py", ahead=0, behind=0))
+    mocker.patch("pygitgo.utils.banner.get_recent_commits", return_value=iter([]))
     
     show_banner()
     
@@ -172,7 +155,7 @@ def test_show_banner_non_git_repository(mocker, capsys):
     mocker.patch("pygitgo.main.get_version", return_value="1.10.1")
     mocker.patch("pygitgo.utils.banner.is_git_repository", return_value=False)
     mocker.patch("pygitgo.utils.banner.get_user", return_value=("Huerte", "huerte@example.com"))
-    mocker.patch("pygitgo.utils.banner.check_for_updates", return_value=None)
+    mocker.patch("pygitgo.utils.banner.get_update_notice", return_value=None)
     
     show_banner()
     
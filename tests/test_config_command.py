@@ -25,7 +25,33 @@ def test_config_operation_set_ok(mocker):
     fake_set = mocker.patch('pygitgo.commands.config.set_config')
     args = Namespace(key="default-branch", action="set", value="main")
     config_operation(args)
-    fake_set.assert_called_with("default-branch", "main")
+    fake_set.assert_called_with("default-branch", "main", scope="global")
+
+@pytest.mark.parametrize("key, value", [("jump-mode", "teleport"), ("worktree-limit", "0"), ("worktree-limit", "many"), ("sync-window", "-5")])
+def test_config_operation_set_rejects_bad_values(mocker, key, value):
+    fake_set = mocker.patch('pygitgo.commands.config.set_config')
+    with pytest.raises(GitGoError, match=f"Invalid value '{value}' for {key}"):
+        config_operation(Namespace(key=key, action="set", value=value))
+    fake_set.assert_not_called()
+
+def test_config_operation_set_jump_mode(mocker):
+    fake_set = mocker.patch('pygitgo.commands.config.set_config')
+    config_operation(Namespace(key="jump-mode", action="set", value="worktree"))
+    fake_set.assert_called_with("jump-mode", "worktree", scope="global")
+
+def test_config_operation_set_local(mocker):
+    fake_set = mocker.patch('pygitgo.commands.config.set_config')
+    args = Namespace(key="default-branch", action="set", value="dev", local=True)
+    config_operation(args)
+    fake_set.assert_called_with("default-branch", "dev", scope="local")
+
+def test_config_operation_get_local_override(mocker):
+    mocker.patch('pygitgo.commands.config.get_config', return_value="dev")
+    mocker.patch('pygitgo.commands.config.get_config_scope', return_value="local")
+    fake_info = mocker.patch('pygitgo.commands.config.info')
+    args = Namespace(key="default-branch", action="get")
+    config_operation(args)
+    fake_info.assert_called_with("\ndefault-branch is currently set to: 'dev' for this repository\n", required=True)
 
 def test_config_operation_get_ok(mocker):
     mocker.patch('pygitgo.commands.config.get_config', return_value="main")
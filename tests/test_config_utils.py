@@ -1,4 +1,6 @@
-from pygitgo.utils.config import get_config, set_config, get_default_branch
+from pygitgo.utils.config import get_config, set_config, get_default_branch, get_config_scope
+from pygitgo.utils.config import GitConfig, CONFIG_LIST_COMMAND, load_config
+from conftest import config_result, make_config
 
 
 def test_get_config_fallback(mocker):
@@ -11,7 +13,7 @@ def test_get_config_fallback(mocker):
     assert result == fallback_value
 
 def test_get_config_ok(mocker):
-    fake_run = mocker.patch('pygitgo.utils.config.run_command', return_value="true")
+    fake_run = mocker.patch('pygitgo.utils.config.run_command', return_value=config_result(global_={"gitgo.default-key": "true"}))
 
     fallback_value = "false"
 
@@ -45,7 +47,7 @@ def test_set_config_ok(mocker):
     fake_success.assert_called_with(f"\nConfiguration saved: {key} = '{value}'")
 
 def test_get_config_strip(mocker):
-    fake_run = mocker.patch('pygitgo.utils.config.run_command', return_value="  true  \n")
+    fake_run = mocker.patch('pygitgo.utils.config.run_command', return_value=config_result(global_={"gitgo.default-key": "  true  "}))
     result = get_config("default-key", "false")
     assert result == "true"
 
@@ -60,17 +62,16 @@ def test_get_config_error_handling(mocker):
 def test_get_default_branch_uses_git_init_default_branch(mocker):
     mocker.patch(
         "pygitgo.utils.config.run_command",
-        return_value="develop",
+        return_value=config_result(global_={"init.defaultbranch": "develop", "gitgo.default-branch": "trunk"}),
     )
     result = get_default_branch()
     assert result == "develop"
 
 
 def test_get_default_branch_falls_back_to_gitgo_config(mocker):
-    from pygitgo.exceptions import GitCommandError
     mocker.patch(
         "pygitgo.utils.config.run_command",
-        side_effect=[GitCommandError(["git"]), "trunk"],
+        return_value=config_result(global_={"gitgo.default-branch": "trunk"}),
     )
     result = get_default_branch()
     assert result == "trunk"
@@ -89,3 +90,78 @@ def test_get_default_branch_handles_git_not_found(mocker):
     mocker.patch("pygitgo.utils.config.run_command", side_effect=GitCommandError(["git"]))
     result = get_default_branch()
     assert result == "main"
+
+
+def test_default_branch_local_override(mocker):
+    mocker.patch(
+        "pygitgo.utils.config.run_command",
+        return_value=config_result(global_={"gitgo.default-branch": "main"}, local={"gitgo.default-branch": "dev"}),
+    )
+    assert get_default_branch() == "dev"
+    assert get_config_scope("default-branch") == "local"
+
+
+def test_git_config_parse_scopes_and_values():
+    output = make_config(system={"core.editor": "vi"}, global_={"user.name": "Ann"}) + "local\0core.bare\0"
+    config = GitConfig.parse(output)
+
+    assert config.get("core.editor") == "vi"
+    assert config.get_with_scope("user.name") == ("Ann", "global")
+    # A bare key is a boolean true with no value.
+    assert config.get_with_scope("core.bare") == ("", "local")
+    assert config.get("User.Name", scopes=("local",), default="none") == "none"
+
+
+def test_git_config_value_with_newline():
+    config = GitConfig.parse("global\0gitgo.default-message\nline one\nline two\0")
+    assert config.get("gitgo.default-message") == "line one\nline two"
+
+
+def test_config_read_once_per_invocation(mocker):
+    fake_run = mocker.patch(
+        "pygitgo.utils.config.run_command",
+        return_value=config_result(global_={"gitgo.default-branch": "main"}),
+    )
+    get_config("default-branch", "x")
+    get_config("default-message", "x")
+    get_default_branch()
+    fake_run.assert_called_once_with(CONFIG_LIST_COMMAND, return_complete=True)
+
+
+def test_set_config_writes_through_without_rereading(mocker):
+    fake_run = mocker.patch(
+        "pygitgo.utils.config.run_command",
+        side_effect=[config_result(global_={"gitgo.default-branch": "main"}), None],
+    )
+    mocker.patch("pygitgo.utils.config.success")
+
+    assert get_config("default-branch", "x") == "main"
+    assert set_config("default-branch", "dev", scope="local")
+    assert get_config("default-branch", "x") == "dev"
+    assert get_config_scope("default-branch") == "local"
+
+    assert fake_run.call_count == 2
+    fake_run.assert_called_with(["git", "config", "--local", "gitgo.default-branch", "dev"])
+
+
+def test_set_config_local_message(mocker):
+    mocker.patch("pygitgo.utils.config.run_command")
+    fake_success = mocker.patch("pygitgo.utils.config.success")
+    set_config("default-branch", "dev", scope="local")
+    fake_success.assert_called_with("\nConfiguration saved for this repository: default-branch = 'dev'")
+
+
+def test_config_falls_back_without_show_scope(mocker):
+    import subprocess
+    from pygitgo.exceptions import GitCommandError
+
+    def fake_run(command, return_complete=False):
+        if "--show-scope" in command:
+            raise GitCommandError(command, stderr="error: unknown option `show-scope'")
+        scope = command[2].lstrip("-")
+        output = {"global": "gitgo.default-branch\nmain\0", "local": "gitgo.default-branch\ndev\0"}.get(scope, "")
+        return subprocess.CompletedProcess(command, 0, output, "")
+
+    mocker.patch("pygitgo.utils.config.run_command", side_effect=fake_run)
+    config = load_config()
+    assert config.get_with_scope("gitgo.default-branch") == ("dev", "local")
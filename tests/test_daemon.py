@@ -0,0 +1,115 @@
+from pygitgo.utils.daemon import send_message, MessageReader, forward, connect, is_supported, _refresh_colors
+from pygitgo.commands.daemon import daemon_operation
+from pygitgo.exceptions import GitGoError
+from argparse import Namespace
+import socket
+import pytest
+import os
+
+
+needs_unix_sockets = pytest.mark.skipif(not is_supported(), reason="Unix domain sockets not available")
+
+
+def test_forward_without_daemon_returns_none(mocker, tmp_path, monkeypatch):
+    monkeypatch.delenv("GITGO_NO_DAEMON")
+    mocker.patch("pygitgo.utils.daemon.SOCKET_PATH", tmp_path / "missing.sock")
+    assert forward(["log"]) is None
+
+
+def test_connect_respects_opt_out(mocker, tmp_path):
+    sock_path = tmp_path / "daemon.sock"
+    sock_path.touch()
+    mocker.patch("pygitgo.utils.daemon.SOCKET_PATH", sock_path)
+    assert connect() is None
+
+
+@needs_unix_sockets
+def test_connect_stale_socket_file_returns_none(mocker, tmp_path, monkeypatch):
+    monkeypatch.delenv("GITGO_NO_DAEMON")
+    sock_path = tmp_path / "daemon.sock"
+    sock_path.touch()
+    mocker.patch("pygitgo.utils.daemon.SOCKET_PATH", sock_path)
+    assert connect() is None
+
+
+@needs_unix_sockets
+def test_message_round_trip_with_fds():
+    left, right = socket.socketpair(socket.AF_UNIX, socket.SOCK_STREAM)
+    read_fd, write_fd = os.pipe()
+    try:
+        send_message(left, {"argv": ["log"], "env": {"A": "x" * 200000}}, fds=[write_fd])
+        send_message(left, {"exit": 3})
+
+        reader = MessageReader(right)
+        request = reader.read()
+        assert request["argv"] == ["log"]
+        assert len(request["env"]["A"]) == 200000
+        assert reader.read() == {"exit": 3}
+        assert len(reader.fds) == 1
+
+        os.write(reader.fds[0], b"hi")
+        assert os.read(read_fd, 2) == b"hi"
+        os.close(reader.fds[0])
+    finally:
+        left.close()
+        right.close()
+        os.close(read_fd)
+        os.close(write_fd)
+
+
+@needs_unix_sockets
+def test_message_reader_closed_connection():
+    left, right = socket.socketpair(socket.AF_UNIX, socket.SOCK_STREAM)
+    left.close()
+    assert MessageReader(right).read() is None
+    right.close()
+
+
+def test_refresh_colors_patches_imported_constants(mocker):
+    import pygitgo.utils.cli_io as cli_io
+    mocker.patch("pygitgo.utils.colors._supports_color", return_value=True)
+    mocker.patch.object(cli_io, "RED", "")
+
+    _refresh_colors()
+
+    assert cli_io.RED == "\033[31m"
+
+
+def test_daemon_operation_unsupported(mocker):
+    mocker.patch("pygitgo.commands.daemon.is_supported", return_value=False)
+    with pytest.raises(GitGoError):
+        daemon_operation(Namespace(action="start"))
+
+
+def test_daemon_status_not_running(mocker):
+    mocker.patch("pygitgo.commands.daemon.is_supported", return_value=True)
+    mocker.patch("pygitgo.commands.daemon.connect", return_value=None)
+    fake_info = mocker.patch("pygitgo.commands.daemon.info")
+
+    daemon_operation(Namespace(action="status"))
+
+    fake_info.assert_called_once()
+
+
+def test_daemon_stop_sends_request(mocker):
+    mocker.patch("pygitgo.commands.daemon.is_supported", return_value=True)
+    mocker.patch("pygitgo.commands.daemon.request_stop", return_value=True)
+    fake_success = mocker.patch("pygitgo.commands.daemon.success")
+
+    daemon_operation(Namespace(action="stop"))
+
+    fake_success.assert_called_once_with("GitGo daemon stopped.")
+
+
+def test_daemon_start_already_running(mocker):
+    fake_sock = mocker.MagicMock()
+    mocker.patch("pygitgo.commands.daemon.is_supported", return_value=True)
+    mocker.patch("pygitgo.commands.daemon.connect", return_value=fake_sock)
+    fake_serve = mocker.patch("pygitgo.commands.daemon.serve")
+    fake_warning = mocker.patch("pygitgo.commands.daemon.warning")
+
+    daemon_operation(Namespace(action="start"))
+
+    fake_serve.assert_not_called()
+    fake_warning.assert_called_once()
+    fake_sock.close.assert_called_once()
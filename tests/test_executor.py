@@ -1,6 +1,8 @@
-from pygitgo.utils.executor import run_command
+from pygitgo.utils.executor import run_command, run_command_iter, gather_commands, is_read_only_git_command, get_query_cache_stats
+from pygitgo.utils.executor import run_exists
 from pygitgo.exceptions import GitCommandError
 import subprocess
+import sys
 import pytest
 
 def test_run_command_success(mocker):
@@ -13,6 +15,17 @@ def test_run_command_success(mocker):
     assert res == "hello world"
     mock_run.assert_called_once_with(["echo", "hello"], check=True, capture_output=True, text=True, stdin=subprocess.DEVNULL, env=mocker.ANY)
 
+def test_run_command_input_is_sent_on_stdin():
+    assert run_command([sys.executable, "-c", "import sys; print(sys.stdin.read()[::-1])"], input="abc") == "cba"
+
+def test_run_command_with_input_is_not_cached(mocker):
+    mock_run = mocker.patch("subprocess.run")
+    mock_run.return_value = mocker.MagicMock(stdout="")
+    run_command(["git", "status"], input="x")
+    run_command(["git", "status"], input="x")
+    assert mock_run.call_count == 2
+    assert mock_run.call_args.kwargs["input"] == "x"
+
 def test_run_command_success_complete(mocker):
     mock_run = mocker.patch("subprocess.run")
     mock_result = mocker.MagicMock()
@@ -28,7 +41,7 @@ def test_run_command_spinner_success(mocker):
     mock_run.return_value = mock_result
 
     # Mock yaspin spinner
-    mock_yaspin = mocker.patch("pygitgo.utils.executor.yaspin")
+    mock_yaspin = mocker.patch("yaspin.yaspin")
     mock_spinner = mocker.MagicMock()
     mock_yaspin.return_value = mock_spinner
 
@@ -76,6 +89,26 @@ def test_run_command_dubious_ownership_confirm(mocker):
     mock_confirm.assert_called_once()
     mock_success.assert_called_once_with("Directory trusted. Retrying command...")
 
+def test_run_command_dubious_ownership_fix_refreshes_config(mocker):
+    from pygitgo.utils.config import load_config, get_git_config
+    from conftest import config_result
+    mocker.patch("pygitgo.utils.executor.danger")
+    mocker.patch("pygitgo.utils.executor.info")
+    mocker.patch("pygitgo.utils.executor.success")
+    mocker.patch("pygitgo.utils.executor.confirm", return_value=True)
+    mock_run = mocker.patch("subprocess.run", return_value=config_result())
+    load_config()
+
+    mock_run.side_effect = [
+        subprocess.CalledProcessError(1, ["git", "status"], stderr="fatal: detected dubious ownership in repository at '/repo'"),
+        mocker.MagicMock(stdout=""),
+        mocker.MagicMock(stdout=""),
+        config_result(global_={"safe.directory": "/repo"}),
+    ]
+    run_command(["git", "status"])
+
+    assert get_git_config("safe.directory") == "/repo"
+
 def test_run_command_dubious_ownership_decline(mocker):
     mock_run = mocker.patch("subprocess.run")
     mock_run.side_effect = subprocess.CalledProcessError(1, ["git", "status"], stderr="fatal: detected dubious ownership in repository at 'C:/path'")
@@ -92,7 +125,7 @@ def test_run_command_dubious_ownership_decline(mocker):
     mock_warning.assert_called_with("Fix declined. Operations in this directory will continue to fail.")
 
 def test_run_command_verbose(mocker):
-    mocker.patch("pygitgo.utils.executor._VERBOSE", True)
+    mocker.patch("pygitgo.utils.cli_io._VERBOSE", True)
     mock_print = mocker.patch("builtins.print")
     
     mock_run = mocker.patch("subprocess.run")
@@ -109,3 +142,234 @@ def test_run_command_verbose(mocker):
     mock_print.assert_any_call("[DEBUG] stdout:\nhello stdout")
     mock_print.assert_any_call("[DEBUG] stderr:\nhello stderr")
 
+
+
+@pytest.mark.parametrize("command,expected", [
+    (["git", "rev-parse", "HEAD"], True),
+    (["git", "status", "--porcelain"], True),
+    (["git", "branch", "--show-current"], True),
+    (["git", "branch", "-r", "--list", "*/main"], True),
+    (["git", "branch", "-m", "main"], False),
+    (["git", "config", "--global", "user.name"], True),
+    (["git", "config", "--global", "user.name", "Huerte"], False),
+    (["git", "config", "--global", "--unset", "commit.gpgsign"], False),
+    (["git", "remote", "get-url", "origin"], True),
+    (["git", "remote", "set-url", "origin", "x"], False),
+    (["git", "stash", "list"], True),
+    (["git", "stash", "push", "-u"], False),
+    (["git", "symbolic-ref", "--quiet", "refs/remotes/origin/HEAD"], True),
+    (["git", "symbolic-ref", "HEAD", "refs/heads/main"], False),
+    (["git", "symbolic-ref", "--delete", "refs/remotes/origin/HEAD"], False),
+    (["git", "-c", "gpg.format=ssh", "commit", "-m", "x"], False),
+    (["git", "checkout", "main"], False),
+    (["git", "diff", "--quiet", "HEAD", "--"], True),
+    (["ssh-add", "-l"], False),
+])
+def test_is_read_only_git_command(command, expected):
+    assert is_read_only_git_command(command) is expected
+
+
+def test_run_command_caches_read_only_queries(mocker):
+    mock_run = mocker.patch("subprocess.run", return_value=mocker.MagicMock(stdout="main\n"))
+
+    assert run_command(["git", "branch", "--show-current"]) == "main"
+    assert run_command(["git", "branch", "--show-current"]) == "main"
+
+    assert mock_run.call_count == 1
+    assert get_query_cache_stats() == {"hits": 1, "misses": 1}
+
+
+def test_run_command_mutation_invalidates_cache(mocker):
+    mock_run = mocker.patch("subprocess.run", return_value=mocker.MagicMock(stdout="abc\n"))
+
+    run_command(["git", "rev-parse", "HEAD"])
+    run_command(["git", "commit", "-m", "msg"])
+    run_command(["git", "rev-parse", "HEAD"])
+
+    assert mock_run.call_count == 3
+
+
+def test_run_command_cache_keyed_on_cwd(mocker, tmp_path, monkeypatch):
+    mock_run = mocker.patch("subprocess.run", return_value=mocker.MagicMock(stdout="abc\n"))
+
+    run_command(["git", "rev-parse", "HEAD"])
+    monkeypatch.chdir(tmp_path)
+    run_command(["git", "rev-parse", "HEAD"])
+
+    assert mock_run.call_count == 2
+
+
+def test_run_command_caches_failures(mocker):
+    mock_run = mocker.patch("subprocess.run", side_effect=subprocess.CalledProcessError(128, ["git"], stderr="unknown revision"))
+
+    for _ in range(2):
+        with pytest.raises(GitCommandError):
+            run_command(["git", "rev-parse", "HEAD"])
+
+    assert mock_run.call_count == 1
+
+
+def test_run_command_extra_env_bypasses_cache(mocker):
+    mock_run = mocker.patch("subprocess.run", return_value=mocker.MagicMock(stdout="x"))
+
+    run_command(["git", "status"], extra_env={"A": "1"})
+    run_command(["git", "status"], extra_env={"A": "1"})
+
+    assert mock_run.call_count == 2
+
+
+def _python(code):
+    return [sys.executable, "-c", code]
+
+
+def test_run_command_iter_splits_records():
+    records = run_command_iter(_python("import sys; sys.stdout.write('a\\nb b\\n\\nc')"))
+    assert list(records) == ["a", "b b", "", "c"]
+
+
+def test_run_command_iter_custom_separator_and_bytes():
+    records = run_command_iter(_python("import sys; sys.stdout.write('x y\\0z\\0')"), separator=b"\0", decode=False)
+    assert list(records) == [b"x y", b"z"]
+
+
+def test_run_command_iter_yields_before_exit():
+    code = "import sys, time; print('first', flush=True); time.sleep(30); print('never')"
+    records = run_command_iter(_python(code))
+
+    assert next(records) == "first"
+    records.close()
+
+
+def test_run_command_iter_raises_after_output():
+    records = run_command_iter(_python("import sys; print('partial'); sys.stderr.write('boom'); sys.exit(3)"))
+
+    assert next(records) == "partial"
+    with pytest.raises(GitCommandError) as exc_info:
+        next(records)
+    assert exc_info.value.returncode == 3
+    assert exc_info.value.stderr == "boom"
+
+
+def test_run_command_iter_missing_program():
+    with pytest.raises(GitCommandError) as exc_info:
+        list(run_command_iter(["gitgo-definitely-missing-binary"]))
+    assert "not installed" in exc_info.value.stderr
+
+
+def test_gather_commands_runs_concurrently_in_order():
+    import time
+    sleep = "import time, sys; time.sleep(0.4); sys.stdout.write('{}')"
+
+    start = time.monotonic()
+    results = gather_commands([_python(sleep.format(i)) for i in range(3)])
+
+    assert [result.stdout for result in results] == ["0", "1", "2"]
+    assert time.monotonic() - start < 1.0
+
+
+def test_gather_commands_respects_limit():
+    import time
+    sleep = "import time; time.sleep(0.3)"
+
+    start = time.monotonic()
+    gather_commands([_python(sleep)] * 4, limit=2)
+
+    assert time.monotonic() - start >= 0.6
+
+
+def test_gather_commands_returns_errors():
+    results = gather_commands([
+        _python("import sys; sys.stderr.write('bad'); sys.exit(2)"),
+        ["gitgo-definitely-missing-binary"],
+    ])
+
+    assert isinstance(results[0], GitCommandError)
+    assert results[0].returncode == 2
+    assert results[0].stderr == "bad"
+    assert "not installed" in results[1].stderr
+
+
+def test_gather_commands_fills_query_cache(mocker):
+    gather_commands([["git", "rev-parse", "--is-inside-work-tree"], ["git", "status", "--porcelain=v2", "-z"]])
+    mock_run = mocker.patch("subprocess.run")
+    mock_popen = mocker.patch("subprocess.Popen")
+
+    assert run_command(["git", "rev-parse", "--is-inside-work-tree"]) == "true"
+    assert list(run_command_iter(["git", "status", "--porcelain=v2", "-z"], separator=b"\0")) == []
+
+    mock_run.assert_not_called()
+    mock_popen.assert_not_called()
+    assert get_query_cache_stats() == {"hits": 2, "misses": 2}
+
+
+def test_run_command_iter_replays_cached_records(mocker):
+    mocker.patch("subprocess.run", return_value=subprocess.CompletedProcess([], 0, stdout="a\0b c\0"))
+    run_command(["git", "ls-files", "-z"])
+
+    assert list(run_command_iter(["git", "ls-files", "-z"], separator=b"\0")) == ["a", "b c"]
+    assert list(run_command_iter(["git", "ls-files", "-z"], separator=b"\0", decode=False)) == [b"a", b"b c"]
+
+
+def test_gather_commands_leaves_dubious_ownership_uncached(mocker):
+    dubious = "import sys; sys.stderr.write('fatal: detected dubious ownership'); sys.exit(128)"
+    mocker.patch("pygitgo.utils.executor._query_cache_key", return_value=("dubious",))
+
+    (result,) = gather_commands([_python(dubious)])
+
+    assert "dubious ownership" in result.stderr
+    from pygitgo.utils.executor import _QUERY_CACHE
+    assert ("dubious",) not in _QUERY_CACHE
+
+
+def test_spawn_detached_does_not_wait(tmp_path):
+    import time
+    from pygitgo.utils.executor import spawn_detached
+    marker = tmp_path / "done"
+
+    start = time.monotonic()
+    assert spawn_detached(_python(f"import time; time.sleep(0.3); open({str(marker)!r}, 'w').close()"))
+    assert time.monotonic() - start < 0.3
+
+    deadline = time.monotonic() + 5
+    while not marker.exists() and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert marker.exists()
+
+
+def test_spawn_detached_missing_program():
+    from pygitgo.utils.executor import spawn_detached
+    assert spawn_detached(["gitgo-definitely-missing-binary"]) is False
+
+
+def test_run_exists_stops_at_first_line():
+    import time
+    start = time.monotonic()
+    assert run_exists([sys.executable, "-c", "import time; print('x', flush=True); time.sleep(30)"]) is True
+    assert time.monotonic() - start < 10
+
+
+def test_run_exists_blank_output_is_empty():
+    assert run_exists([sys.executable, "-c", "print(); print('   ')"]) is False
+
+
+def test_run_exists_failure_raises():
+    with pytest.raises(GitCommandError):
+        run_exists([sys.executable, "-c", "import sys; sys.exit(3)"])
+
+
+@pytest.mark.parametrize("command, multiplex", [
+    (["git", "status"], False),
+    (["git", "rev-parse", "HEAD"], False),
+    (["git", "push", "origin", "main"], True),
+    (["git", "-c", "gpg.format=ssh", "fetch", "origin"], True),
+    (["gh", "auth", "status"], False),
+])
+def test_only_remote_commands_share_ssh_connections(mocker, command, multiplex):
+    fake_ssh_command = mocker.patch("pygitgo.utils.executor.ssh_command", return_value="ssh -o BatchMode=yes")
+    mock_run = mocker.patch("subprocess.run")
+    mock_run.return_value.stdout = ""
+
+    run_command(command)
+
+    assert fake_ssh_command.call_args[1] == {"multiplex": multiplex}
+    assert mock_run.call_args[1]["env"]["GIT_SSH_COMMAND"] == "ssh -o BatchMode=yes"
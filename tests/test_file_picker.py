@@ -0,0 +1,184 @@
+from pygitgo.commands.file_picker import FilePicker, Selection, FileTree
+import pytest
+
+
+def _files(*paths):
+    return [{"status": "M", "label": "modified", "path": path} for path in paths]
+
+
+def _rendered(picker):
+    return [picker.render_row(row) for _index, row in picker.visible_rows()]
+
+
+def _press(picker, *keys):
+    result = None
+    for key in keys:
+        result = picker.handle_key(key)
+    return result
+
+
+def test_small_change_set_opens_expanded():
+    picker = FilePicker(_files("src/app/main.py", "src/util.py", "README.md"))
+
+    assert _rendered(picker) == [
+        "[ ] v src/ (2)",
+        "  [ ] v app/ (1)",
+        "    [ ] (modified) main.py",
+        "  [ ] (modified) util.py",
+        "[ ] (modified) README.md",
+    ]
+
+
+def test_large_change_set_opens_folded(mocker):
+    mocker.patch("pygitgo.commands.file_picker.EXPAND_ALL_LIMIT", 2)
+    picker = FilePicker(_files("gen/a.py", "gen/b.py", "README.md"))
+
+    assert _rendered(picker) == ["[ ] > gen/ (2)", "[ ] (modified) README.md"]
+
+
+def test_only_the_window_is_rendered():
+    picker = FilePicker(_files(*(f"f{i:03}.py" for i in range(500))), height=10)
+    picker.handle_key("end")
+
+    rows = picker.visible_rows()
+    assert len(rows) == 10
+    assert rows[-1][0] == picker.cursor == 499
+    assert picker.top == 490
+
+
+def test_fold_and_unfold_folder():
+    picker = FilePicker(_files("src/a.py", "src/b.py", "README.md"))
+
+    _press(picker, "left")
+    assert _rendered(picker) == ["[ ] > src/ (2)", "[ ] (modified) README.md"]
+
+    _press(picker, "right")
+    assert len(_rendered(picker)) == 4
+
+
+def test_left_on_file_jumps_to_folder():
+    picker = FilePicker(_files("src/a.py", "src/b.py"))
+    _press(picker, "down", "down", "left")
+    assert picker.cursor == 0
+
+
+def test_select_folder_returns_one_pathspec():
+    picker = FilePicker(_files("src/a.py", "src/b.py", "README.md"))
+
+    _press(picker, " ")
+
+    assert picker.pathspecs() == {"src/"}
+    assert picker.selected_count() == 2
+    assert picker.render_row(picker.row(1)) == "  [x] (modified) a.py"
+
+
+def test_deselect_file_inside_selected_folder():
+    picker = FilePicker(_files("src/a.py", "src/b.py", "src/lib/c.py", "README.md"))
+
+    _press(picker, " ")             # src/
+    _press(picker, "down", "down", " ")   # src/lib/c.py off
+
+    assert picker.pathspecs() == {"src/a.py", "src/b.py"}
+    assert picker.state(picker.row(0)[1]) == "-"
+    assert picker.selected_count() == 2
+
+
+def test_select_all_then_exclude_folder():
+    picker = FilePicker(_files("docs/x.md", "src/a.py", "README.md"))
+
+    _press(picker, "a")
+    assert picker.pathspecs() == {"docs/", "src/", "README.md"}
+
+    _press(picker, " ")
+    assert picker.pathspecs() == {"src/", "README.md"}
+
+
+def test_toggle_folder_twice_clears_marks():
+    picker = FilePicker(_files("src/a.py", "src/b.py"))
+    _press(picker, "down", " ", "up", " ", " ")
+    assert picker.pathspecs() == set()
+    assert picker.selection.marks == {}
+
+
+def test_untracked_folder_is_a_single_entry():
+    files = [{"status": "??", "label": "new file", "path": "assets/"}] + _files("src/a.py")
+    picker = FilePicker(files)
+
+    assert "[ ] (new file) assets/" in _rendered(picker)
+    _press(picker, "end", " ")
+    assert picker.pathspecs() == {"assets/"}
+
+
+def test_filter_narrows_and_backspace_restores():
+    picker = FilePicker(_files("src/app.py", "src/api.py", "docs/apple.md", "README.md"))
+
+    _press(picker, "/", "a", "p")
+    assert [row[1]["path"] for _i, row in picker.visible_rows()] == ["src/app.py", "src/api.py", "docs/apple.md"]
+
+    _press(picker, "p")
+    assert [row[1]["path"] for _i, row in picker.visible_rows()] == ["src/app.py", "docs/apple.md"]
+
+    _press(picker, "backspace")
+    assert picker.query == "ap"
+    assert picker.row_count() == 3
+
+
+def test_filter_is_case_insensitive_and_selects_files():
+    picker = FilePicker(_files("README.md", "src/readme.txt", "src/main.py"))
+
+    _press(picker, "/", "R", "E", "A", "D", "enter", "down", " ")
+
+    assert not picker.typing
+    assert picker.pathspecs() == {"src/readme.txt"}
+    assert "filter: READ (2 matches)" in picker.status_line()
+
+
+def test_filter_scans_lazily(mocker):
+    picker = FilePicker(_files(*(f"pkg/file{i}.py" for i in range(10000))), height=5)
+
+    _press(picker, "/", "f")
+    picker.visible_rows()
+
+    matches = picker._filters[-1][1]
+    assert len(matches.items) == 5
+    assert not picker.is_complete()
+    assert "5+ matches" in picker.status_line()
+
+
+def test_escape_clears_filter_then_cancels():
+    picker = FilePicker(_files("a.py", "b.py"))
+
+    _press(picker, "/", "a")
+    assert _press(picker, "escape") is None
+    assert picker.query == "" and not picker.typing
+
+    _press(picker, "/", "b", "enter")
+    assert _press(picker, "q") is None
+    assert picker.query == ""
+    assert _press(picker, "q") == "cancel"
+
+
+def test_enter_confirms():
+    picker = FilePicker(_files("a.py"))
+    assert _press(picker, " ", "enter") == "confirm"
+    assert picker.pathspecs() == {"a.py"}
+
+
+def test_typed_letters_do_not_navigate():
+    picker = FilePicker(_files("a.py", "b.py", "j.py"))
+    _press(picker, "/", "j")
+    assert picker.query == "j"
+    assert picker.cursor == 0
+
+
+@pytest.mark.parametrize("marks, expected", [
+    ({}, 0),
+    ({"": True}, 4),
+    ({"src/": True, "src/lib/": False}, 2),
+    ({"": True, "src/lib/c.py": False, "README.md": False}, 2),
+])
+def test_selection_count(marks, expected):
+    tree = FileTree(_files("src/a.py", "src/b.py", "src/lib/c.py", "README.md"))
+    selection = Selection()
+    selection.marks = dict(marks)
+    assert selection.count(tree) == expected
@@ -62,6 +62,33 @@ def test_get_current_branch(mocker):
     assert result == 'main'
     fake_run.assert_called_once_with(['git', 'branch', '--show-current'])
 
+def test_get_current_branch_reads_refs_without_git(mocker):
+    mocker.patch("pygitgo.commands.git_branch.refs.read_head", return_value=("dev", "a" * 40))
+    fake_run = mocker.patch("pygitgo.commands.git_branch.run_command")
+    assert get_current_branch() == "dev"
+    fake_run.assert_not_called()
+
+def test_is_branch_exist_reads_refs_without_git(mocker):
+    mocker.patch("pygitgo.commands.git_branch.refs.remote_branch_exists", return_value=False)
+    fake_exists = mocker.patch("pygitgo.commands.git_branch.refs.ref_exists", return_value=True)
+    fake_run = mocker.patch("pygitgo.commands.git_branch.run_command")
+    assert is_branch_exist("feature") is True
+    fake_exists.assert_called_once_with("refs/heads/feature")
+    fake_run.assert_not_called()
+
+def test_is_branch_exist_pattern_uses_git(mocker):
+    fake_exists = mocker.patch("pygitgo.commands.git_branch.refs.ref_exists")
+    mocker.patch("pygitgo.commands.git_branch.run_command", return_value="")
+    assert is_branch_exist("feat*") is False
+    fake_exists.assert_not_called()
+
+def test_get_head_sha_reads_refs_without_git(mocker):
+    mocker.patch("pygitgo.commands.git_branch.refs.read_head", return_value=("main", "b" * 40))
+    fake_run = mocker.patch("pygitgo.commands.git_branch.run_command", return_value="bbbbbbb")
+    assert get_head_sha() == "b" * 40
+    fake_run.assert_not_called()
+    assert get_head_sha(short=True) == "bbbbbbb"
+
 def test_is_branch_exist_true(mocker):
     fake_run = mocker.patch('pygitgo.commands.git_branch.run_command', return_value="origin/main")
     result = is_branch_exist('main')
@@ -88,20 +115,77 @@ def test_get_current_branch_detached_head_safe_confirm_no(mocker):
     with pytest.raises(GitGoError):
         get_current_branch(safe=True)
 
-def test_get_main_branch_default(mocker):
+@pytest.fixture
+def origin_repo(tmp_path, monkeypatch):
+    from pygitgo.utils.repo_context import RepoContext
+    from pygitgo.utils import repo_context
+
+    git_dir = tmp_path / ".git"
+    (git_dir / "refs" / "remotes" / "origin").mkdir(parents=True)
+    (git_dir / "HEAD").write_text("ref: refs/heads/main\n", encoding="utf-8")
+    context = RepoContext(git_dir, git_dir, tmp_path, head="main")
+    monkeypatch.setattr(repo_context, "_resolve", lambda: context)
+    repo_context.clear_repo_context()
+    return git_dir
+
+def _set_origin_head(git_dir, branch):
+    (git_dir / "refs" / "remotes" / "origin" / "HEAD").write_text(f"ref: refs/remotes/origin/{branch}\n", encoding="utf-8")
+
+def _mark_refreshed(git_dir, ttl):
+    from pygitgo.commands.git_branch import MAIN_BRANCH_NAMESPACE
+    from pygitgo.utils import state_store
+    state_store.set(MAIN_BRANCH_NAMESPACE, str(git_dir), "2026-01-01T00:00:00", ttl=ttl)
+
+def test_get_main_branch_default(mocker, origin_repo):
     mocker.patch("pygitgo.commands.git_branch.get_config", return_value="main")
-    mocker.patch("pygitgo.commands.git_branch.run_command", side_effect=GitCommandError(["cmd"]))
+    mocker.patch("pygitgo.commands.git_branch.spawn_detached")
     assert get_main_branch() == "main"
 
-def test_get_main_branch_remote_invalid(mocker):
+def test_get_main_branch_reads_origin_head(mocker, origin_repo):
     mocker.patch("pygitgo.commands.git_branch.get_config", return_value="main")
-    mocker.patch("pygitgo.commands.git_branch.run_command", return_value="some other output")
-    assert get_main_branch() == "main"
+    mocker.patch("pygitgo.commands.git_branch.spawn_detached")
+    fake_run = mocker.patch("pygitgo.commands.git_branch.run_command")
+    _set_origin_head(origin_repo, "dev")
+
+    assert get_main_branch() == "dev"
+    fake_run.assert_not_called()
 
-def test_get_main_branch_remote_valid(mocker):
+def test_get_main_branch_fresh_cache_skips_refresh(mocker, origin_repo):
+    from pygitgo.commands.git_branch import MAIN_BRANCH_TTL
     mocker.patch("pygitgo.commands.git_branch.get_config", return_value="main")
-    mocker.patch("pygitgo.commands.git_branch.run_command", return_value="* remote origin\n  HEAD branch: dev\n")
+    fake_spawn = mocker.patch("pygitgo.commands.git_branch.spawn_detached")
+    _set_origin_head(origin_repo, "dev")
+    _mark_refreshed(origin_repo, MAIN_BRANCH_TTL)
+
     assert get_main_branch() == "dev"
+    fake_spawn.assert_not_called()
+
+def test_get_main_branch_stale_cache_refreshes_in_background(mocker, origin_repo):
+    from pygitgo.commands.git_branch import SET_HEAD_COMMAND
+    from datetime import timedelta
+    mocker.patch("pygitgo.commands.git_branch.get_config", return_value="main")
+    fake_spawn = mocker.patch("pygitgo.commands.git_branch.spawn_detached")
+    _mark_refreshed(origin_repo, timedelta(seconds=-1))
+
+    assert get_main_branch() == "main"
+    fake_spawn.assert_called_once_with(SET_HEAD_COMMAND)
+
+    # The attempt itself is recorded, so the next call does not refresh again.
+    assert get_main_branch() == "main"
+    fake_spawn.assert_called_once()
+
+def test_get_main_branch_falls_back_to_git(mocker):
+    mocker.patch("pygitgo.commands.git_branch.get_config", return_value="main")
+    mocker.patch("pygitgo.commands.git_branch.spawn_detached")
+    mocker.patch("pygitgo.commands.git_branch.run_command", return_value="refs/remotes/origin/trunk")
+    assert get_main_branch() == "trunk"
+
+def test_get_main_branch_outside_repository(mocker):
+    mocker.patch("pygitgo.commands.git_branch.get_config", return_value="main")
+    mocker.patch("pygitgo.commands.git_branch.get_repo_context", return_value=None)
+    fake_spawn = mocker.patch("pygitgo.commands.git_branch.spawn_detached")
+    assert get_main_branch() == "main"
+    fake_spawn.assert_not_called()
 
 def test_get_head_sha(mocker):
     mocker.patch("pygitgo.commands.git_branch.run_command", return_value="abcdef0123456789")
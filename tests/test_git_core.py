@@ -1,4 +1,5 @@
 from pygitgo.exceptions import GitGoError, GitCommandError
+from pygitgo.commands.staging import ADD_FROM_STDIN_COMMAND
 from pygitgo.commands.git_core import (
     git_commit,
     git_init,
@@ -8,31 +9,38 @@ from pygitgo.commands.git_core import (
     has_local_changes,
     is_rebase_in_progress,
     has_any_commits,
+    has_orig_head,
     get_recent_commits,
     _get_signing_flags,
     abort_pull_conflict
 )
+from conftest import make_status
 from pathlib import Path
 import pytest
 
 def test_git_commit(mocker):
     mocker.patch("pygitgo.commands.git_core._get_signing_flags", return_value=[])
     fake_sanitize = mocker.patch("pygitgo.commands.git_core.sanitize_signing_config")
+    mocker.patch("pygitgo.commands.git_core.get_status", return_value=make_status("M file.py"))
     fake_run = mocker.patch("pygitgo.commands.git_core.run_command")
-    fake_run.side_effect = ["M file.py", None, None]
+    fake_run.side_effect = [None, None]
     
     result = git_commit("Testing the commit feature")
     assert result == True
     fake_sanitize.assert_called_once()
 
     fake_run.assert_any_call(
-        ['git', 'commit', '-S', '-m', 'Testing the commit feature'],
+        ['git', 'commit', '-a', '-S', '-m', 'Testing the commit feature'],
         loading_msg="Committing changes...",
         ok_text="Changes committed."
     )
 
+def _patch_remote_url(mocker, url):
+    context = mocker.MagicMock(remote_url=url)
+    mocker.patch("pygitgo.commands.git_core.get_repo_context", return_value=context)
+
+
 def test_git_init_already_initialized(mocker):
-    mocker.patch('os.path.isdir', return_value=True)
     fake_warning = mocker.patch('pygitgo.commands.git_core.warning')
     fake_run = mocker.patch('pygitgo.commands.git_core.run_command')
 
@@ -43,7 +51,7 @@ def test_git_init_already_initialized(mocker):
     fake_run.assert_not_called()
 
 def test_git_init_success(mocker):
-    mocker.patch('os.path.isdir', return_value=False)
+    mocker.patch('pygitgo.commands.git_core.get_repo_context', return_value=None)
     mocker.patch('pygitgo.commands.git_core.get_default_branch', return_value='main')
     fake_run = mocker.patch('pygitgo.commands.git_core.run_command', return_value='ok')
 
@@ -57,7 +65,7 @@ def test_git_init_success(mocker):
     )
 
 def test_git_init_fallback(mocker):
-    mocker.patch('os.path.isdir', return_value=False)
+    mocker.patch('pygitgo.commands.git_core.get_repo_context', return_value=None)
     mocker.patch('pygitgo.commands.git_core.get_default_branch', return_value='main')
     
     fake_run = mocker.patch(
@@ -77,10 +85,9 @@ def test_git_init_fallback(mocker):
 def test_git_push_already_ssh(mocker):
     fake_run = mocker.patch(
         'pygitgo.commands.git_core.run_command',
-        side_effect=[
-            'git@github.com:user/repo.git\n', None
-        ]
+        side_effect=[None]
     )
+    _patch_remote_url(mocker, 'git@github.com:user/repo.git')
     mocker.patch('pygitgo.commands.git_core.is_ssh_url', return_value=True)
 
     branch = 'main'
@@ -96,11 +103,9 @@ def test_git_push_already_ssh(mocker):
 def test_git_push_no_remote(mocker):
     fake_run = mocker.patch(
         'pygitgo.commands.git_core.run_command', 
-        side_effect=[
-            GitCommandError(["git", "remote", "get-url"]),
-            "pushed"
-        ]
+        side_effect=["pushed"]
     )
+    _patch_remote_url(mocker, None)
 
     branch = 'main'
     git_push(branch)
@@ -115,11 +120,9 @@ def test_git_push_no_remote(mocker):
 def test_git_push_https_no_connection(mocker):
     fake_run = mocker.patch(
         'pygitgo.commands.git_core.run_command',
-        side_effect=[
-            'https://github.com/user/repo.git\n',
-            None
-        ]
+        side_effect=[None]
     )
+    _patch_remote_url(mocker, 'https://github.com/user/repo.git')
 
     mocker.patch('pygitgo.commands.git_core.is_ssh_url', return_value=False)
     mocker.patch('pygitgo.commands.git_core.check_connection', return_value=False)
@@ -138,11 +141,9 @@ def test_git_push_convert_https_to_ssh(mocker):
     url = 'https://github.com/user/repo.git\n'
     fake_run = mocker.patch(
         'pygitgo.commands.git_core.run_command',
-        side_effect=[
-            url,
-            None, None
-        ]
+        side_effect=[None, None]
     )
+    _patch_remote_url(mocker, url.strip())
 
     mocker.patch('pygitgo.commands.git_core.is_ssh_url', return_value=False)
     mocker.patch('pygitgo.commands.git_core.get_remote_host', return_value='github.com')
@@ -171,8 +172,9 @@ def test_git_push_non_github_host_skips_conversion(mocker):
     url = 'https://git.mycompany.com/user/repo.git'
     fake_run = mocker.patch(
         'pygitgo.commands.git_core.run_command',
-        side_effect=[url, None]
+        side_effect=[None]
     )
+    _patch_remote_url(mocker, url)
 
     mocker.patch('pygitgo.commands.git_core.is_ssh_url', return_value=False)
     mocker.patch('pygitgo.commands.git_core.get_remote_host', return_value='git.mycompany.com')
@@ -190,21 +192,64 @@ def test_git_commit_skip_staging_does_not_run_git_add(mocker):
     mocker.patch("pygitgo.commands.git_core.sanitize_signing_config")
     fake_run = mocker.patch("pygitgo.commands.git_core.run_command")
     
-    fake_run.side_effect = ["M file.py", None]
+    mocker.patch("pygitgo.commands.git_core.get_status", return_value=make_status("M file.py"))
+    fake_run.side_effect = [None]
     git_commit("my message", skip_staging=True)
 
     for call in fake_run.call_args_list:
         args = call[0][0]
         assert args[:2] != ["git", "add"]
 
-def test_git_commit_default_runs_git_add(mocker):
+def test_git_commit_tracked_changes_only_skip_git_add(mocker):
+    mocker.patch("pygitgo.commands.git_core._get_signing_flags", return_value=[])
+    mocker.patch("pygitgo.commands.git_core.sanitize_signing_config")
+    mocker.patch("pygitgo.commands.git_core.get_status", return_value=make_status("M file.py", "D gone.py"))
+    fake_run = mocker.patch("pygitgo.commands.git_core.run_command")
+    git_commit("my message")
+    assert fake_run.call_count == 1
+    assert fake_run.call_args[0][0] == ["git", "commit", "-a", "-S", "-m", "my message"]
+
+def test_git_commit_adds_only_untracked_paths(mocker):
+    mocker.patch("pygitgo.commands.git_core._get_signing_flags", return_value=[])
+    mocker.patch("pygitgo.commands.git_core.sanitize_signing_config")
+    mocker.patch("pygitgo.commands.git_core.get_status", return_value=make_status("M file.py", "?? new.py", "?? assets/"))
+    fake_add = mocker.patch("pygitgo.commands.staging.run_command")
+    fake_run = mocker.patch("pygitgo.commands.git_core.run_command")
+    git_commit("my message")
+    assert fake_add.call_args[0][0] == ADD_FROM_STDIN_COMMAND
+    assert fake_add.call_args[1]["input"] == "new.py\0assets/\0"
+    assert [call[0][0] for call in fake_run.call_args_list] == [["git", "commit", "-a", "-S", "-m", "my message"]]
+
+def test_git_commit_in_subfolder_runs_git_add(mocker):
+    mocker.patch("pygitgo.commands.git_core._get_signing_flags", return_value=[])
+    mocker.patch("pygitgo.commands.git_core.sanitize_signing_config")
+    mocker.patch("pygitgo.commands.git_core.get_status", return_value=make_status("M src/file.py"))
+    mocker.patch("pygitgo.commands.git_core._at_top_level", return_value=False)
+    fake_run = mocker.patch("pygitgo.commands.git_core.run_command")
+    git_commit("my message")
+    commands = [call[0][0] for call in fake_run.call_args_list]
+    assert commands == [["git", "add", "."], ["git", "commit", "-S", "-m", "my message"]]
+
+def test_git_commit_without_untracked_runs_no_add(mocker):
     mocker.patch("pygitgo.commands.git_core._get_signing_flags", return_value=[])
     mocker.patch("pygitgo.commands.git_core.sanitize_signing_config")
+    mocker.patch("pygitgo.commands.git_core.get_status", return_value=make_status("M file.py"))
+    fake_add = mocker.patch("pygitgo.commands.staging.run_command")
     fake_run = mocker.patch("pygitgo.commands.git_core.run_command")
-    fake_run.side_effect = ["M file.py", None, None]
     git_commit("my message")
-    add_call = fake_run.call_args_list[1][0][0]
-    assert add_call == ["git", "add", "."]
+    fake_add.assert_not_called()
+    assert fake_run.call_args[0][0] == ["git", "commit", "-a", "-S", "-m", "my message"]
+
+def test_git_commit_checks_signing_once_per_process(mocker):
+    fake_flags = mocker.patch("pygitgo.commands.git_core._get_signing_flags", return_value=["-c", "gpg.format=ssh"])
+    fake_sanitize = mocker.patch("pygitgo.commands.git_core.sanitize_signing_config")
+    mocker.patch("pygitgo.commands.git_core.get_status", return_value=make_status("M file.py"))
+    fake_run = mocker.patch("pygitgo.commands.git_core.run_command")
+    git_commit("one")
+    git_commit("two")
+    fake_sanitize.assert_called_once()
+    fake_flags.assert_called_once()
+    assert fake_run.call_args[0][0][:3] == ["git", "-c", "gpg.format=ssh"]
 
 def test_abort_pull_conflict_active_rebase(mocker):
     mocker.patch("pathlib.Path.exists", return_value=True)
@@ -220,7 +265,8 @@ def test_abort_pull_conflict_no_rebase(mocker):
     mocker.patch("pathlib.Path.exists", return_value=False)
     mocker.patch("pygitgo.utils.cli_io.confirm", return_value=True)
     mocker.patch("pygitgo.commands.git_branch.get_current_branch", return_value="main")
-    fake_run = mocker.patch("pygitgo.utils.executor.run_command", side_effect=["", "", "0"])
+    mocker.patch("pygitgo.commands.git_core.has_orig_head", return_value=True)
+    fake_run = mocker.patch("pygitgo.utils.executor.run_command", side_effect=["", "0"])
     
     result = abort_pull_conflict()
     
@@ -243,21 +289,39 @@ def test_is_git_repository(mocker):
     assert is_git_repository() is False
 
 def test_has_local_changes(mocker):
-    mocker.patch("pygitgo.commands.git_core.run_command", return_value="M test.py")
+    mocker.patch("pygitgo.commands.git_core.has_changes", return_value=True)
     assert has_local_changes() is True
 
-    mocker.patch("pygitgo.commands.git_core.run_command", return_value="")
+    mocker.patch("pygitgo.commands.git_core.has_changes", return_value=False)
     assert has_local_changes() is False
 
-    mocker.patch("pygitgo.commands.git_core.run_command", side_effect=GitCommandError(["cmd"]))
+    mocker.patch("pygitgo.commands.git_core.has_changes", side_effect=GitCommandError(["cmd"]))
     assert has_local_changes() is False
 
+def test_has_unpushed_commits(mocker):
+    from pygitgo.commands.git_core import has_unpushed_commits
+    fake_exists = mocker.patch("pygitgo.commands.git_core.run_exists", return_value=True)
+
+    assert has_unpushed_commits("main") is True
+    fake_exists.assert_called_with(["git", "rev-list", "-n1", "origin/main..HEAD"], loading_msg=None)
+
+    has_unpushed_commits("main", on_remote=False, loading_msg="Checking for unpushed commits...")
+    fake_exists.assert_called_with(["git", "rev-list", "-n1", "HEAD"], loading_msg="Checking for unpushed commits...")
+
 def test_is_rebase_in_progress(mocker):
     def mock_exists(self):
         return "rebase-merge" in str(self)
     mocker.patch.object(Path, "exists", mock_exists)
     assert is_rebase_in_progress() is True
 
+def test_has_orig_head_falls_back_to_git(mocker):
+    fake_run = mocker.patch("pygitgo.commands.git_core.run_command", return_value="abc")
+    assert has_orig_head() is True
+    fake_run.assert_called_once_with(["git", "rev-parse", "ORIG_HEAD"])
+
+    fake_run.side_effect = GitCommandError(["git", "rev-parse", "ORIG_HEAD"])
+    assert has_orig_head() is False
+
 def test_has_any_commits(mocker):
     mocker.patch("pygitgo.commands.git_core.run_command", return_value="abcdef")
     assert has_any_commits() is True
@@ -266,18 +330,18 @@ def test_has_any_commits(mocker):
     assert has_any_commits() is False
 
 def test_get_recent_commits(mocker):
-    mocker.patch("pygitgo.commands.git_core.run_command", return_value="abc||author||date||msg\ninvalidline\ndef||author2||date2||msg2")
-    commits = get_recent_commits(number=2, branch="main")
+    mocker.patch("pygitgo.commands.git_core.run_command_iter", return_value=iter(["abc||author||date||msg", "invalidline", "def||author2||date2||msg2"]))
+    commits = list(get_recent_commits(number=2, branch="main"))
     assert len(commits) == 2
     assert commits[0]["hash"] == "abc"
     assert commits[1]["hash"] == "def"
 
-    mocker.patch("pygitgo.commands.git_core.run_command", return_value="")
-    assert get_recent_commits() == []
+    mocker.patch("pygitgo.commands.git_core.run_command_iter", return_value=iter([]))
+    assert list(get_recent_commits()) == []
 
-    mocker.patch("pygitgo.commands.git_core.run_command", side_effect=GitCommandError(["cmd"], stderr="err"))
+    mocker.patch("pygitgo.commands.git_core.run_command_iter", side_effect=GitCommandError(["cmd"], stderr="err"))
     with pytest.raises(GitGoError):
-        get_recent_commits()
+        list(get_recent_commits())
 
 def test_get_signing_flags(mocker):
     mock_path = mocker.MagicMock()
@@ -291,23 +355,25 @@ def test_get_signing_flags(mocker):
     assert _get_signing_flags() == []
 
 def test_git_commit_no_changes(mocker):
-    mocker.patch("pygitgo.commands.git_core.run_command", return_value="")
+    mocker.patch("pygitgo.commands.git_core.get_status", return_value=make_status())
+    fake_run = mocker.patch("pygitgo.commands.git_core.run_command")
     assert git_commit("msg") is False
+    fake_run.assert_not_called()
 
 def test_git_commit_status_error(mocker):
-    mocker.patch("pygitgo.commands.git_core.run_command", side_effect=GitCommandError(["cmd"], stderr="not a git repository"))
+    mocker.patch("pygitgo.commands.git_core.get_status", side_effect=GitCommandError(["cmd"], stderr="not a git repository"))
     with pytest.raises(GitGoError) as ex:
         git_commit("msg")
     assert "Not inside a git repository" in str(ex.value)
 
-    mocker.patch("pygitgo.commands.git_core.run_command", side_effect=GitCommandError(["cmd"], stderr="other error"))
+    mocker.patch("pygitgo.commands.git_core.get_status", side_effect=GitCommandError(["cmd"], stderr="other error"))
     with pytest.raises(GitGoError) as ex:
         git_commit("msg")
     assert "Could not check repository status" in str(ex.value)
 
 def test_git_push_non_fast_forward(mocker):
+    _patch_remote_url(mocker, "git@github.com:user/repo.git")
     mocker.patch("pygitgo.commands.git_core.run_command", side_effect=[
-        "git@github.com:user/repo.git",
         GitCommandError(["push"], stderr="rejected (non-fast-forward)")
     ])
     mocker.patch("pygitgo.commands.git_core.is_ssh_url", return_value=True)
@@ -316,8 +382,8 @@ def test_git_push_non_fast_forward(mocker):
     assert "Push rejected" in str(ex.value)
 
 def test_git_push_repository_not_found(mocker):
+    _patch_remote_url(mocker, "git@github.com:user/repo.git")
     mocker.patch("pygitgo.commands.git_core.run_command", side_effect=[
-        "git@github.com:user/repo.git",
         GitCommandError(["push"], stderr="repository not found")
     ])
     mocker.patch("pygitgo.commands.git_core.is_ssh_url", return_value=True)
@@ -326,8 +392,8 @@ def test_git_push_repository_not_found(mocker):
     assert "remote repository not found" in str(ex.value)
 
 def test_git_push_permission_denied(mocker):
+    _patch_remote_url(mocker, "git@github.com:user/repo.git")
     mocker.patch("pygitgo.commands.git_core.run_command", side_effect=[
-        "git@github.com:user/repo.git",
         GitCommandError(["push"], stderr="permission denied")
     ])
     mocker.patch("pygitgo.commands.git_core.is_ssh_url", return_value=True)
@@ -336,8 +402,8 @@ def test_git_push_permission_denied(mocker):
     assert "permission denied" in str(ex.value)
 
 def test_git_push_other_error(mocker):
+    _patch_remote_url(mocker, "git@github.com:user/repo.git")
     mocker.patch("pygitgo.commands.git_core.run_command", side_effect=[
-        "git@github.com:user/repo.git",
         GitCommandError(["push"], stderr="unknown failure")
     ])
     mocker.patch("pygitgo.commands.git_core.is_ssh_url", return_value=True)
@@ -359,7 +425,7 @@ def test_abort_pull_conflict_active_rebase_error(mocker):
 
 def test_abort_pull_conflict_no_orig_head(mocker):
     mocker.patch("pathlib.Path.exists", return_value=False)
-    mocker.patch("pygitgo.utils.executor.run_command", side_effect=GitCommandError(["cmd"]))
+    mocker.patch("pygitgo.commands.git_core.has_orig_head", return_value=False)
     mock_info = mocker.patch("pygitgo.utils.cli_io.info")
     result = abort_pull_conflict()
     assert result is False
@@ -367,7 +433,7 @@ def test_abort_pull_conflict_no_orig_head(mocker):
 
 def test_abort_pull_conflict_branch_error(mocker):
     mocker.patch("pathlib.Path.exists", return_value=False)
-    mocker.patch("pygitgo.utils.executor.run_command", return_value="")
+    mocker.patch("pygitgo.commands.git_core.has_orig_head", return_value=True)
     mocker.patch("pygitgo.commands.git_branch.get_current_branch", side_effect=GitCommandError(["cmd"]))
     with pytest.raises(GitGoError):
         abort_pull_conflict()
@@ -376,9 +442,24 @@ def test_abort_pull_conflict_reset_error(mocker):
     mocker.patch("pathlib.Path.exists", return_value=False)
     mocker.patch("pygitgo.commands.git_branch.get_current_branch", return_value="main")
     mocker.patch("pygitgo.utils.cli_io.confirm", return_value=True)
+    mocker.patch("pygitgo.commands.git_core.has_orig_head", return_value=True)
     mocker.patch("pygitgo.utils.executor.run_command", side_effect=[
-        "",
         GitCommandError(["cmd"], stderr="reset error")
     ])
     with pytest.raises(GitGoError):
         abort_pull_conflict()
+
+
+def test_git_push_permission_denied_forgets_ssh_probe(mocker):
+    _patch_remote_url(mocker, 'git@github.com:user/repo.git')
+    mocker.patch(
+        'pygitgo.commands.git_core.run_command',
+        side_effect=GitCommandError("push", stderr="git@github.com: Permission denied (publickey).")
+    )
+    mocker.patch('pygitgo.commands.git_core.info')
+    forget = mocker.patch('pygitgo.commands.git_core.forget_ssh_probe')
+
+    with pytest.raises(GitGoError):
+        git_push('main')
+
+    forget.assert_called_once_with('github.com')
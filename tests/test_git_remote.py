@@ -1,7 +1,9 @@
 from pygitgo.commands.git_remote import (
     confirm_remote_link, handle_rebase,
-    add_remote_origin, check_and_sync_branch
+    add_remote_origin, check_and_sync_branch,
+    record_fetch, fetched_recently, FETCH_NAMESPACE,
 )
+from pygitgo.utils import state_store
 from unittest.mock import call
 import pytest
 
@@ -192,3 +194,38 @@ def test_check_and_sync_branch_remote_not_exist(mocker):
     fake_run.assert_any_call(
         ["git", "rev-parse", branch]
     )
+
+
+def test_fetched_recently_after_branch_or_full_fetch(mocker):
+    assert not fetched_recently("origin", "main")
+
+    record_fetch("origin", "develop")
+    assert not fetched_recently("origin", "main")
+
+    record_fetch("origin")
+    assert fetched_recently("origin", "main")
+
+
+def test_fetched_recently_expires_after_window(mocker):
+    mocker.patch("pygitgo.commands.git_remote.get_config", return_value="10")
+    record_fetch("origin", "main")
+    key = next(iter(state_store.items(FETCH_NAMESPACE)))
+    state_store.set(FETCH_NAMESPACE, key, state_store.get(FETCH_NAMESPACE, key) - 11 * 60)
+
+    assert not fetched_recently("origin", "main")
+
+
+def test_fetched_recently_window_zero_always_syncs(mocker):
+    mocker.patch("pygitgo.commands.git_remote.get_config", return_value="0")
+    record_fetch("origin", "main")
+
+    assert not fetched_recently("origin", "main")
+
+
+def test_check_and_sync_branch_records_fetch(mocker):
+    mocker.patch("pygitgo.commands.git_remote.run_command", return_value="abc")
+    mocker.patch("pygitgo.commands.git_remote.info")
+
+    check_and_sync_branch("main")
+
+    assert fetched_recently("origin", "main")
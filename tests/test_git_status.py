@@ -0,0 +1,212 @@
+from pygitgo.commands.git_status import StatusSnapshot, get_status, STATUS_COMMAND
+from pygitgo.exceptions import GitCommandError
+import subprocess
+import os
+
+
+SAMPLE = "\0".join([
+    "# branch.oid 1234567890abcdef1234567890abcdef12345678",
+    "# branch.head feature/login",
+    "# branch.upstream origin/feature/login",
+    "# branch.ab +2 -3",
+    "# stash 4",
+    "1 M. N... 100644 100644 100644 aaaa bbbb src/app.py",
+    "1 .M N... 100644 100644 100644 aaaa aaaa docs/read me.md",
+    "1 MM N... 100644 100644 100644 aaaa bbbb both.py",
+    "2 R. N... 100644 100644 100644 aaaa aaaa R100 new name.py",
+    "old name.py",
+    "u UU N... 100644 100644 100644 100644 aaaa bbbb cccc conflict.py",
+    "? notes.txt",
+    "",
+])
+
+
+def test_parse_headers():
+    status = StatusSnapshot.parse(SAMPLE)
+
+    assert status.oid == "1234567890abcdef1234567890abcdef12345678"
+    assert status.branch == "feature/login"
+    assert status.upstream == "origin/feature/login"
+    assert (status.ahead, status.behind) == (2, 3)
+    assert status.stash_count == 4
+
+
+def test_parse_entries():
+    status = StatusSnapshot.parse(SAMPLE)
+
+    assert [entry.path for entry in status.entries] == [
+        "src/app.py", "docs/read me.md", "both.py", "new name.py", "conflict.py", "notes.txt",
+    ]
+    assert [entry.code for entry in status.entries] == ["M", "M", "MM", "R", "UU", "??"]
+    assert status.renamed[0].orig_path == "old name.py"
+    assert [entry.path for entry in status.staged] == ["src/app.py", "both.py", "new name.py"]
+    assert [entry.path for entry in status.unstaged] == ["docs/read me.md", "both.py", "conflict.py"]
+    assert [entry.path for entry in status.untracked] == ["notes.txt"]
+    assert [entry.path for entry in status.unmerged] == ["conflict.py"]
+    assert status.has_staged
+    assert not status.is_clean
+
+
+def test_parse_bytes_matches_str():
+    from_bytes = StatusSnapshot.parse(SAMPLE.encode("utf-8"))
+    from_records = StatusSnapshot.parse(iter(SAMPLE.encode("utf-8").split(b"\0")))
+
+    expected = [(e.kind, e.code, e.path, e.orig_path) for e in StatusSnapshot.parse(SAMPLE).entries]
+    assert [(e.kind, e.code, e.path, e.orig_path) for e in from_bytes.entries] == expected
+    assert [(e.kind, e.code, e.path, e.orig_path) for e in from_records.entries] == expected
+    assert from_bytes.branch == "feature/login"
+
+
+def test_parse_copies_submodules_and_odd_paths():
+    output = b"\0".join([
+        b"2 C. N... 100644 100644 100644 aaaa aaaa C75 copy.py",
+        b"orig.py",
+        b"1 .M SCMU 160000 160000 160000 aaaa aaaa vendor/lib",
+        b"1 A. N... 000000 100644 100644 0000 bbbb caf\xc3\xa9 \\ \"x\"\n.txt",
+        b"? raw\xff.bin",
+        b"",
+    ])
+    status = StatusSnapshot.parse(output)
+
+    copy, submodule, odd, raw = status.entries
+    assert (copy.kind, copy.code, copy.path, copy.orig_path) == ("copied", "C", "copy.py", "orig.py")
+    assert copy.is_staged and status.copied == [copy]
+    assert submodule.is_submodule and submodule.submodule == "SCMU"
+    assert submodule.submodule_changes == ["new commits", "modified content", "untracked content"]
+    assert not odd.is_submodule
+    assert odd.path == 'caf\u00e9 \\ "x"\n.txt'
+    # Non-UTF-8 names round-trip to the original bytes.
+    assert raw.path.encode("utf-8", "surrogateescape") == b"raw\xff.bin"
+
+
+def test_parse_clean_initial_detached():
+    status = StatusSnapshot.parse("# branch.oid (initial)\0# branch.head (detached)\0")
+
+    assert status.oid is None
+    assert status.branch is None
+    assert status.upstream is None
+    assert status.ahead is None
+    assert status.stash_count == 0
+    assert status.is_clean
+    assert not status.has_staged
+
+
+def test_get_status_runs_git_once_per_generation(mocker):
+    fake_run = mocker.patch(
+        "pygitgo.commands.git_status.run_command_iter",
+        side_effect=lambda *args, **kwargs: iter(["? a.txt"]),
+    )
+
+    first = get_status()
+    assert get_status() is first
+    fake_run.assert_called_once_with(STATUS_COMMAND, separator=b"\0", decode=False, loading_msg=None)
+
+    from pygitgo.utils.executor import invalidate_query_cache
+    invalidate_query_cache()
+    assert get_status() is not first
+
+
+def test_get_status_without_show_stash(mocker):
+    fake_run = mocker.patch("pygitgo.commands.git_status.run_command_iter", side_effect=[
+        GitCommandError(STATUS_COMMAND, stderr="error: unknown option `show-stash'"),
+        iter(["# branch.head main"]),
+    ])
+
+    assert get_status().branch == "main"
+    assert fake_run.call_args_list[1][0][0] == STATUS_COMMAND[:-1]
+
+
+def test_get_status_real_repository(tmp_path, monkeypatch):
+    env = {**os.environ, "GIT_AUTHOR_NAME": "T", "GIT_AUTHOR_EMAIL": "t@e", "GIT_COMMITTER_NAME": "T", "GIT_COMMITTER_EMAIL": "t@e"}
+
+    def git(*args):
+        subprocess.run(["git", *args], cwd=tmp_path, check=True, capture_output=True, env=env)
+
+    git("init", "-b", "main")
+    (tmp_path / "a.txt").write_text("a\n", encoding="utf-8")
+    git("add", "a.txt")
+    git("-c", "commit.gpgsign=false", "commit", "-m", "first")
+    git("mv", "a.txt", "b c.txt")
+    (tmp_path / "new.txt").write_text("n\n", encoding="utf-8")
+    (tmp_path / "ü -> \"q\".txt").write_text("n\n", encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+
+    status = get_status()
+
+    assert status.branch == "main"
+    assert [(entry.code, entry.path, entry.orig_path) for entry in status.entries] == [
+        ("R", "b c.txt", "a.txt"), ("??", "new.txt", None), ("??", "ü -> \"q\".txt", None),
+    ]
+
+
+def test_get_status_uses_prefetched_bytes(tmp_path, monkeypatch):
+    from pygitgo.utils.executor import gather_commands
+    subprocess.run(["git", "init", "-q", "-b", "main"], cwd=tmp_path, check=True)
+    name = os.fsdecode(b"bad\xff name.txt")
+    try:
+        (tmp_path / name).write_text("x", encoding="utf-8")
+    except (OSError, UnicodeEncodeError):
+        import pytest
+        pytest.skip("file system rejects non-UTF-8 names")
+    monkeypatch.chdir(tmp_path)
+
+    gather_commands([STATUS_COMMAND])
+    status = get_status()
+
+    assert [entry.path for entry in status.untracked] == [name]
+
+
+def test_has_changes_real_repository(tmp_path, monkeypatch):
+    from pygitgo.commands.git_status import has_changes
+    from pygitgo.utils.executor import invalidate_query_cache
+    env = {**os.environ, "GIT_AUTHOR_NAME": "T", "GIT_AUTHOR_EMAIL": "t@e", "GIT_COMMITTER_NAME": "T", "GIT_COMMITTER_EMAIL": "t@e"}
+
+    def git(*args):
+        subprocess.run(["git", *args], cwd=tmp_path, check=True, capture_output=True, env=env)
+        invalidate_query_cache()
+
+    monkeypatch.chdir(tmp_path)
+    git("init", "-b", "main")
+    assert has_changes() is False
+
+    (tmp_path / "a.txt").write_text("a\n", encoding="utf-8")
+    invalidate_query_cache()
+    assert has_changes() is True          # untracked, no commit yet
+
+    git("add", "a.txt")
+    assert has_changes() is True          # staged, no commit yet
+
+    (tmp_path / ".gitignore").write_text("*.log\n", encoding="utf-8")
+    git("add", ".gitignore")
+    git("-c", "commit.gpgsign=false", "commit", "-m", "first")
+    (tmp_path / "debug.log").write_text("x\n", encoding="utf-8")
+    invalidate_query_cache()
+    assert has_changes() is False         # ignored files do not count
+
+    (tmp_path / "a.txt").write_text("changed\n", encoding="utf-8")
+    invalidate_query_cache()
+    assert has_changes() is True
+
+
+def test_has_changes_reuses_status_snapshot(mocker):
+    from pygitgo.commands.git_status import has_changes
+    mocker.patch(
+        "pygitgo.commands.git_status.run_command_iter",
+        side_effect=lambda *args, **kwargs: iter([b"? a.txt"]),
+    )
+    fake_run = mocker.patch("pygitgo.commands.git_status.run_command")
+
+    get_status()
+    assert has_changes() is True
+    fake_run.assert_not_called()
+
+
+def test_has_changes_outside_repository(mocker):
+    from pygitgo.commands.git_status import has_changes
+    import pytest
+    mocker.patch(
+        "pygitgo.commands.git_status.run_command",
+        side_effect=GitCommandError(["git", "diff"], stderr="fatal: not a git repository", returncode=128),
+    )
+    with pytest.raises(GitCommandError):
+        has_changes()
@@ -8,6 +8,9 @@ import pytest
 def make_args(branch, nested=False):
     return Namespace(branch=branch, nested=nested)
 
+def patch_status(mocker, *lines):
+    return mocker.patch('pygitgo.commands.jump.has_changes', return_value=bool(lines))
+
 def test_undo_jump_operation_no_stash(mocker):
     fake_run = mocker.patch('pygitgo.commands.jump.run_command', return_value='')
     fake_pop = mocker.patch('pygitgo.commands.jump.git_stash_pop', return_value=True)
@@ -72,7 +75,7 @@ def test_jump_operation_not_valid_repo(mocker):
     mocker.patch('pygitgo.commands.jump.get_current_branch', return_value='master')
     mocker.patch('pygitgo.commands.jump.warning')
     mocker.patch(
-        'pygitgo.commands.jump.run_command',
+        'pygitgo.commands.jump.has_changes',
         side_effect=GitCommandError(['git', 'status'], stderr='not a repo', returncode=128)
     )
 
@@ -80,7 +83,8 @@ def test_jump_operation_not_valid_repo(mocker):
 
 def test_jump_operation_has_changes_exit(mocker):
     mocker.patch('pygitgo.commands.jump.get_current_branch', return_value='master')
-    mocker.patch('pygitgo.commands.jump.run_command', return_value='M file.txt')
+    mocker.patch('pygitgo.commands.jump.run_command', return_value='ok')
+    patch_status(mocker, 'M file.txt')
     mocker.patch('pygitgo.commands.jump.git_stash_push', return_value=False)
     mocker.patch('pathlib.Path.exists', return_value=False)
     
@@ -94,7 +98,8 @@ def test_jump_operation_has_changes_moves_to_branch(mocker):
     fake_stash = mocker.patch('pygitgo.commands.jump.git_stash_push', return_value=True)
     mocker.patch('pygitgo.commands.jump.git_stash_apply', return_value=True)
     fake_drop = mocker.patch('pygitgo.commands.jump.git_stash_drop', return_value=True)
-    mocker.patch('pygitgo.commands.jump.run_command', side_effect=lambda *a, **kw: 'M file.txt' if a[0] == ['git', 'status', '--porcelain'] else 'ok')
+    mocker.patch('pygitgo.commands.jump.run_command', return_value='ok')
+    patch_status(mocker, 'M file.txt')
 
     assert capture_system_exit_code(lambda: jump_operation(make_args('feature'))) == 0
     fake_stash.assert_called_once()
@@ -104,13 +109,15 @@ def test_jump_operation_no_changes(mocker):
     mocker.patch('pygitgo.commands.jump.get_current_branch', return_value='master')
     mocker.patch('pygitgo.commands.jump.get_main_branch', return_value='main')
     mocker.patch('pygitgo.commands.jump.is_branch_exist', return_value=True)
-    mocker.patch('pygitgo.commands.jump.run_command', side_effect=['', 'ok', 'ok'])
+    mocker.patch('pygitgo.commands.jump.run_command', side_effect=['ok', 'ok'])
+    patch_status(mocker)
 
     assert capture_system_exit_code(lambda: jump_operation(make_args('feature'))) == 0
 
 def test_jump_operation_save_changes_error(mocker):
     mocker.patch('pygitgo.commands.jump.get_current_branch', return_value='master')
-    mocker.patch('pygitgo.commands.jump.run_command', return_value='M file.txt')
+    mocker.patch('pygitgo.commands.jump.run_command', return_value='ok')
+    patch_status(mocker, 'M file.txt')
     mocker.patch('pygitgo.commands.jump.git_stash_push', return_value=False)
     mocker.patch('pathlib.Path.exists', return_value=True) 
     fake_warning = mocker.patch('pygitgo.commands.jump.warning')
@@ -126,7 +133,8 @@ def test_jump_operation_branch_not_exist_cancel_operation(mocker):
     mocker.patch('pygitgo.commands.jump.confirm', return_value=False)
 
     fake_info = mocker.patch('pygitgo.commands.jump.info')
-    mocker.patch('pygitgo.commands.jump.run_command', return_value='M file.txt')
+    mocker.patch('pygitgo.commands.jump.run_command', return_value='ok')
+    patch_status(mocker, 'M file.txt')
     mocker.patch('pygitgo.commands.jump.git_stash_push', return_value=True)
     fake_pop = mocker.patch('pygitgo.commands.jump.git_stash_pop', return_value=True)
 
@@ -142,10 +150,8 @@ def test_jump_operation_branch_not_exist_create_branch(mocker):
     fake_new_branch = mocker.patch('pygitgo.commands.jump.git_new_branch', return_value=None)
     mocker.patch('pygitgo.commands.jump.confirm', return_value=True)
 
-    mocker.patch(
-        'pygitgo.commands.jump.run_command',
-        side_effect=lambda *a, **kw: 'M file.txt' if a[0] == ['git', 'status', '--porcelain'] else 'ok'
-    )
+    mocker.patch('pygitgo.commands.jump.run_command', return_value='ok')
+    patch_status(mocker, 'M file.txt')
     mocker.patch('pygitgo.commands.jump.git_stash_push', return_value=True)
     fake_apply = mocker.patch('pygitgo.commands.jump.git_stash_apply', return_value=True)
     fake_drop = mocker.patch('pygitgo.commands.jump.git_stash_drop', return_value=True)
@@ -164,13 +170,12 @@ def test_jump_operation_sync_fail_stay(mocker):
 
     def _run(*args, **kwargs):
         cmd = args[0]
-        if cmd == ['git', 'status', '--porcelain']:
-            return ''
         if cmd[1] == 'pull':
             raise GitCommandError(cmd, stderr='no internet', returncode=1)
         return 'ok'
 
     mocker.patch('pygitgo.commands.jump.run_command', side_effect=_run)
+    patch_status(mocker)
 
     assert capture_system_exit_code(lambda: jump_operation(make_args('feature'))) == 0
     fake_info.assert_any_call("On 'feature', but not yet synced with 'main'.")
@@ -184,10 +189,8 @@ def test_jump_operation_merge_conflict_cancel(mocker):
 
     fake_error = mocker.patch('pygitgo.commands.jump.error')
 
-    mocker.patch(
-        'pygitgo.commands.jump.run_command',
-        side_effect=lambda *a, **kw: 'M file.txt' if a[0] == ['git', 'status', '--porcelain'] else 'ok'
-    )
+    mocker.patch('pygitgo.commands.jump.run_command', return_value='ok')
+    patch_status(mocker, 'M file.txt')
     mocker.patch('pygitgo.commands.jump.git_stash_push', return_value=True)
     mocker.patch('pygitgo.commands.jump.git_stash_apply', return_value=False)
 
@@ -203,10 +206,8 @@ def test_jump_operation_merge_conflict_stay(mocker):
     fake_success = mocker.patch('pygitgo.commands.jump.success')
     fake_warning = mocker.patch('pygitgo.commands.jump.warning')
 
-    mocker.patch(
-        'pygitgo.commands.jump.run_command',
-        side_effect=lambda *a, **kw: 'M file.txt' if a[0] == ['git', 'status', '--porcelain'] else 'ok'
-    )
+    mocker.patch('pygitgo.commands.jump.run_command', return_value='ok')
+    patch_status(mocker, 'M file.txt')
     mocker.patch('pygitgo.commands.jump.git_stash_push', return_value=True)
     mocker.patch('pygitgo.commands.jump.git_stash_apply', return_value=False)
 
@@ -222,13 +223,12 @@ def test_jump_keyboard_interrupt_during_checkout(mocker):
     mock_cleanup = mocker.patch('pygitgo.commands.jump._jump_interrupt_cleanup')
 
     def side_effect(cmd, *args, **kwargs):
-        if cmd == ['git', 'status', '--porcelain']:
-            return ''
         if cmd == ['git', 'checkout', 'feature']:
             raise KeyboardInterrupt()
         return 'ok'
 
     mocker.patch('pygitgo.commands.jump.run_command', side_effect=side_effect)
+    patch_status(mocker)
 
     with pytest.raises(SystemExit) as exc_info:
         jump_operation(make_args('feature'))
@@ -246,13 +246,12 @@ def test_jump_keyboard_interrupt_after_stash(mocker):
     mock_cleanup = mocker.patch('pygitgo.commands.jump._jump_interrupt_cleanup')
 
     def side_effect(cmd, *args, **kwargs):
-        if cmd == ['git', 'status', '--porcelain']:
-            return 'M file.txt'
         if cmd[0] == 'git' and cmd[1] == 'checkout':
             raise KeyboardInterrupt()
         return 'ok'
 
     mocker.patch('pygitgo.commands.jump.run_command', side_effect=side_effect)
+    patch_status(mocker, 'M file.txt')
 
     with pytest.raises(SystemExit) as exc_info:
         jump_operation(make_args('feature'))
@@ -295,14 +294,15 @@ def test_jump_interrupt_cleanup_pop_fails(mocker):
 
 def test_jump_operation_status_error(mocker):
     mocker.patch("pygitgo.commands.jump.get_current_branch", return_value="main")
-    mocker.patch("pygitgo.commands.jump.run_command", side_effect=GitCommandError(["status"], stderr="some other error"))
+    mocker.patch("pygitgo.commands.jump.has_changes", side_effect=GitCommandError(["status"], stderr="some other error"))
     with pytest.raises(GitGoError) as ex:
         jump_operation(make_args("feat"))
     assert "Could not check repository status" in str(ex.value)
 
 def test_jump_operation_stash_fails_rebase_in_progress(mocker):
     mocker.patch("pygitgo.commands.jump.get_current_branch", return_value="main")
-    mocker.patch("pygitgo.commands.jump.run_command", side_effect=["M file.py", ""])
+    mocker.patch("pygitgo.commands.jump.run_command", side_effect=[""])
+    patch_status(mocker, "M file.py")
     mocker.patch("pygitgo.commands.jump.git_stash_push", return_value=False)
     def mock_exists(self):
         return "rebase-merge" in str(self)
@@ -314,7 +314,8 @@ def test_jump_operation_stash_fails_rebase_in_progress(mocker):
 
 def test_jump_operation_stash_fails_generic(mocker):
     mocker.patch("pygitgo.commands.jump.get_current_branch", return_value="main")
-    mocker.patch("pygitgo.commands.jump.run_command", side_effect=["M file.py", ""])
+    mocker.patch("pygitgo.commands.jump.run_command", side_effect=[""])
+    patch_status(mocker, "M file.py")
     mocker.patch("pygitgo.commands.jump.git_stash_push", return_value=False)
     mocker.patch("pathlib.Path.exists", return_value=False)
     fake_warning = mocker.patch("pygitgo.commands.jump.warning")
@@ -326,7 +327,8 @@ def test_jump_operation_new_branch_not_exist_cancel_pop_fails(mocker):
     mocker.patch("pygitgo.commands.jump.get_current_branch", return_value="main")
     mocker.patch("pygitgo.commands.jump.is_branch_exist", return_value=False)
     mocker.patch("pygitgo.commands.jump.confirm", return_value=False)
-    mocker.patch("pygitgo.commands.jump.run_command", return_value="M file.py")
+    mocker.patch("pygitgo.commands.jump.run_command", return_value="ok")
+    patch_status(mocker, "M file.py")
     mocker.patch("pygitgo.commands.jump.git_stash_push", return_value=True)
     mocker.patch("pygitgo.commands.jump.git_stash_pop", return_value=False)
     fake_warning = mocker.patch("pygitgo.commands.jump.warning")
@@ -338,10 +340,10 @@ def test_jump_operation_sync_fails_generic(mocker):
     mocker.patch("pygitgo.commands.jump.is_branch_exist", return_value=True)
     mocker.patch("pygitgo.commands.jump.get_main_branch", return_value="main")
     mocker.patch("pygitgo.commands.jump.run_command", side_effect=[
-        "",
         "",
         GitCommandError(["pull"], stderr="network error")
     ])
+    patch_status(mocker)
     fake_warning = mocker.patch("pygitgo.commands.jump.warning")
     assert capture_system_exit_code(lambda: jump_operation(make_args("feat"))) == 0
     fake_warning.assert_any_call("Could not sync from 'main': no remote or no internet.")
@@ -353,7 +355,170 @@ def test_jump_operation_stash_apply_fails_drop_fails(mocker):
     mocker.patch("pygitgo.commands.jump.git_stash_push", return_value=True)
     mocker.patch("pygitgo.commands.jump.git_stash_apply", return_value=True)
     mocker.patch("pygitgo.commands.jump.git_stash_drop", return_value=False)
-    mocker.patch("pygitgo.commands.jump.run_command", side_effect=lambda *a, **kw: "M file.py" if a[0] == ["git", "status", "--porcelain"] else "ok")
+    mocker.patch("pygitgo.commands.jump.run_command", return_value="ok")
+    patch_status(mocker, "M file.py")
     fake_warning = mocker.patch("pygitgo.commands.jump.warning")
     assert capture_system_exit_code(lambda: jump_operation(make_args("feat"))) == 0
     fake_warning.assert_any_call("Could not clean up the temporary stash. Run 'gitgo state list' to remove it manually.")
+
+
+def test_jump_preflight_runs_status_and_config_together(mocker):
+    from pygitgo.commands.git_status import CHANGES_COMMANDS
+    from pygitgo.utils.config import CONFIG_LIST_COMMAND
+    mocker.patch("pygitgo.commands.jump.get_current_branch", return_value="master")
+    mocker.patch("pygitgo.commands.jump.is_branch_exist", return_value=True)
+    mocker.patch("pygitgo.commands.jump.get_main_branch", return_value="main")
+    mocker.patch("pygitgo.commands.jump.run_command", return_value="ok")
+    fake_gather = mocker.patch("pygitgo.commands.jump.gather_commands")
+    patch_status(mocker)
+
+    jump_operation(make_args("feature"))
+
+    assert fake_gather.call_args[0][0] == CHANGES_COMMANDS + [CONFIG_LIST_COMMAND]
+
+
+def test_jump_new_branch_skips_main_branch_lookup(mocker):
+    from pygitgo.commands.git_status import CHANGES_COMMANDS
+    mocker.patch("pygitgo.commands.jump.get_current_branch", return_value="master")
+    mocker.patch("pygitgo.commands.jump.is_branch_exist", return_value=False)
+    mocker.patch("pygitgo.commands.jump.confirm", return_value=False)
+    fake_main = mocker.patch("pygitgo.commands.jump.get_main_branch")
+    fake_gather = mocker.patch("pygitgo.commands.jump.gather_commands")
+    patch_status(mocker)
+
+    jump_operation(make_args("feature"))
+
+    assert fake_gather.call_args[0][0] == CHANGES_COMMANDS
+    fake_main.assert_not_called()
+
+
+@pytest.mark.parametrize("flags, setting, expected", [
+    ({}, "checkout", False),
+    ({}, "worktree", True),
+    ({"checkout": True}, "worktree", False),
+    ({"worktree": True}, "checkout", True),
+])
+def test_jump_mode_from_flags_and_setting(mocker, flags, setting, expected):
+    from pygitgo.commands.jump import use_worktree_mode
+    mocker.patch("pygitgo.commands.jump.get_config", return_value=setting)
+
+    assert use_worktree_mode(Namespace(branch="feature", command="jump", **flags)) is expected
+
+
+def test_jump_mode_setting_ignored_for_nested_jumps(mocker):
+    from pygitgo.commands.jump import use_worktree_mode
+    mocker.patch("pygitgo.commands.jump.get_config", return_value="worktree")
+
+    assert not use_worktree_mode(Namespace(branch="feature", nested=True))
+
+
+def test_jump_worktree_mode_skips_stash_and_checkout(mocker):
+    fake_worktree_jump = mocker.patch("pygitgo.commands.worktree.worktree_jump")
+    fake_run = mocker.patch("pygitgo.commands.jump.run_command")
+    fake_stash = mocker.patch("pygitgo.commands.jump.git_stash_push")
+
+    jump_operation(Namespace(branch="feature", command="jump", worktree=True))
+
+    fake_worktree_jump.assert_called_once_with("feature")
+    fake_run.assert_not_called()
+    fake_stash.assert_not_called()
+
+
+def _jump_to_existing_branch(mocker, sync=None):
+    mocker.patch("pygitgo.commands.jump.get_current_branch", return_value="master")
+    mocker.patch("pygitgo.commands.jump.get_main_branch", return_value="main")
+    mocker.patch("pygitgo.commands.jump.is_branch_exist", return_value=True)
+    mocker.patch("pygitgo.commands.jump.gather_commands")
+    patch_status(mocker)
+    jump_operation(Namespace(branch="feature", sync=sync))
+
+
+def _git_calls(fake_run):
+    return [call.args[0][:2] for call in fake_run.call_args_list]
+
+
+def test_jump_pulls_and_records_fetch(mocker):
+    from pygitgo.commands.git_remote import fetched_recently
+    fake_run = mocker.patch("pygitgo.commands.jump.run_command", return_value="ok")
+
+    _jump_to_existing_branch(mocker)
+
+    assert _git_calls(fake_run) == [["git", "checkout"], ["git", "pull"]]
+    assert fetched_recently("origin", "main")
+
+
+def test_jump_within_sync_window_rebases_locally(mocker):
+    from pygitgo.commands.git_remote import record_fetch
+    record_fetch("origin", "main")
+    fake_run = mocker.patch("pygitgo.commands.jump.run_command", return_value="Current branch feature is up to date.")
+    fake_info = mocker.patch("pygitgo.commands.jump.info")
+
+    _jump_to_existing_branch(mocker)
+
+    fake_run.assert_any_call(
+        ["git", "rebase", "--autostash", "origin/main"],
+        loading_msg="Syncing 'feature' with 'origin/main' (fetched recently)...",
+        ok_text="Checked 'main'.",
+        return_complete=True,
+    )
+    assert ["git", "pull"] not in _git_calls(fake_run)
+    fake_info.assert_any_call("'feature' was already up to date with 'main'.")
+
+
+def test_jump_sync_flag_ignores_recent_fetch(mocker):
+    from pygitgo.commands.git_remote import record_fetch
+    record_fetch("origin")
+    fake_run = mocker.patch("pygitgo.commands.jump.run_command", return_value="ok")
+
+    _jump_to_existing_branch(mocker, sync=True)
+
+    assert _git_calls(fake_run) == [["git", "checkout"], ["git", "pull"]]
+
+
+def test_jump_no_sync_flag_skips_sync(mocker):
+    fake_run = mocker.patch("pygitgo.commands.jump.run_command", return_value="ok")
+    fake_info = mocker.patch("pygitgo.commands.jump.info")
+
+    _jump_to_existing_branch(mocker, sync=False)
+
+    assert _git_calls(fake_run) == [["git", "checkout"]]
+    fake_info.assert_any_call("On 'feature'. Skipped syncing with 'main' (--no-sync).")
+
+
+def test_jump_local_rebase_failure_does_not_pull(mocker):
+    from pygitgo.commands.git_remote import record_fetch
+    record_fetch("origin", "main")
+    mocker.patch("pygitgo.commands.jump.refs.ref_exists", return_value=True)
+
+    def _run(command, **kwargs):
+        if command[1] == "rebase":
+            raise GitCommandError(command, stderr="error: cannot rebase: You have unstaged changes.", returncode=1)
+        return "ok"
+    fake_run = mocker.patch("pygitgo.commands.jump.run_command", side_effect=_run)
+    fake_warning = mocker.patch("pygitgo.commands.jump.warning")
+
+    _jump_to_existing_branch(mocker)
+
+    assert _git_calls(fake_run) == [["git", "checkout"], ["git", "rebase"]]
+    fake_warning.assert_any_call("Could not rebase 'feature' onto 'origin/main': error: cannot rebase: You have unstaged changes.")
+
+
+def test_jump_pulls_when_fetched_ref_is_missing(mocker):
+    from pygitgo.commands.git_remote import record_fetch
+    record_fetch("origin", "main")
+    mocker.patch("pygitgo.commands.jump.refs.ref_exists", return_value=False)
+    fake_run = mocker.patch("pygitgo.commands.jump.run_command", return_value="ok")
+
+    _jump_to_existing_branch(mocker)
+
+    assert _git_calls(fake_run) == [["git", "checkout"], ["git", "pull"]]
+
+
+@pytest.mark.parametrize("sync", [True, False])
+def test_jump_sync_flags_rejected_in_worktree_mode(mocker, sync):
+    fake_worktree_jump = mocker.patch("pygitgo.commands.worktree.worktree_jump")
+
+    with pytest.raises(GitGoError, match="only apply to checkout jumps"):
+        jump_operation(Namespace(branch="feature", command="jump", worktree=True, sync=sync))
+
+    fake_worktree_jump.assert_not_called()
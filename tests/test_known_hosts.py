@@ -0,0 +1,86 @@
+from pygitgo.auth.known_hosts import KnownHosts, load_known_hosts, host_key_name, clear_known_hosts_cache
+import hashlib
+import base64
+import hmac
+import os
+import pytest
+
+
+def _hashed(name, salt=b"saltsaltsaltsaltsalt"):
+    digest = hmac.new(salt, name.encode(), hashlib.sha1).digest()
+    return f"|1|{base64.b64encode(salt).decode()}|{base64.b64encode(digest).decode()}"
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    clear_known_hosts_cache()
+    yield
+    clear_known_hosts_cache()
+
+
+def test_host_key_name():
+    assert host_key_name("GitHub.com") == "github.com"
+    assert host_key_name("ssh.github.com", 443) == "[ssh.github.com]:443"
+
+
+def test_plain_names_and_lists():
+    index = KnownHosts.parse("github.com,140.82.112.3 ssh-ed25519 AAAA\n# comment\n\n")
+
+    assert index.matches("github.com")
+    assert index.matches("140.82.112.3")
+    assert not index.matches("gitlab.com")
+
+
+def test_hashed_entries():
+    index = KnownHosts.parse(f"{_hashed('github.com')} ssh-ed25519 AAAA\n")
+
+    assert index.matches("github.com")
+    assert index.matches("GITHUB.COM")
+    assert not index.matches("gitlab.com")
+
+
+def test_non_default_port():
+    index = KnownHosts.parse(
+        f"[git.example.com]:2222 ssh-ed25519 AAAA\n{_hashed('[ssh.github.com]:443')} ssh-rsa AAAA\n"
+    )
+
+    assert index.matches("git.example.com", 2222)
+    assert not index.matches("git.example.com")
+    assert index.matches("ssh.github.com", 443)
+    assert not index.matches("ssh.github.com")
+
+
+def test_wildcards_and_negation():
+    index = KnownHosts.parse("*.corp.example,!bad.corp.example,git?.example ssh-ed25519 AAAA\n")
+
+    assert index.matches("git.corp.example")
+    assert not index.matches("bad.corp.example")
+    assert index.matches("git1.example")
+    assert not index.matches("git12.example")
+
+
+def test_markers_and_short_lines_are_ignored():
+    index = KnownHosts.parse("@revoked github.com ssh-rsa AAAA\n@cert-authority *.example ssh-rsa AAAA\ngitlab.com\n")
+
+    assert not index.matches("github.com")
+    assert not index.matches("git.example")
+    assert not index.matches("gitlab.com")
+
+
+def test_index_is_reused_until_file_changes(tmp_path, mocker):
+    path = tmp_path / "known_hosts"
+    path.write_text("github.com ssh-ed25519 AAAA\n")
+    parse = mocker.spy(KnownHosts, "parse")
+
+    assert load_known_hosts(path).matches("github.com")
+    assert load_known_hosts(path).matches("github.com")
+    assert parse.call_count == 1
+
+    path.write_text("github.com ssh-ed25519 AAAA\ngitlab.com ssh-ed25519 AAAA\n")
+    os.utime(path, ns=(1, 1))
+    assert load_known_hosts(path).matches("gitlab.com")
+    assert parse.call_count == 2
+
+
+def test_missing_file_knows_nothing(tmp_path):
+    assert not load_known_hosts(tmp_path / "nope").matches("github.com")
@@ -12,12 +12,12 @@ def test_log_operation_success(mocker, base_args):
     
     # Mock rev-parse (is-inside-work-tree)
     # Mock rev-parse HEAD (commits exist)
-    # Mock log command output
     mock_run.side_effect = [
         "true",  # rev-parse --is-inside-work-tree
         "abc1234",  # rev-parse HEAD
-        "abc1234||User Name||2 hours ago||Initial commit"  # git log
     ]
+    # Mock log command output
+    mocker.patch("pygitgo.commands.log.run_command_iter", return_value=iter(["abc1234||User Name||2 hours ago||Initial commit"]))
     
     mock_branch = mocker.patch("pygitgo.commands.log.get_current_branch", return_value="main")
     mock_write = mocker.patch("pygitgo.commands.log.write")
@@ -70,8 +70,8 @@ def test_log_with_branch_success(mocker, base_args):
     mock_run.side_effect = [
         "true",  # rev-parse --is-inside-work-tree
         "abc1234",  # rev-parse HEAD
-        "def5678||Bob||1 day ago||Feature added"  # git log
     ]
+    mocker.patch("pygitgo.commands.log.run_command_iter", return_value=iter(["def5678||Bob||1 day ago||Feature added"]))
     
     mocker.patch("pygitgo.commands.log.is_branch_exist", return_value=True)
     mock_banner = mocker.patch("pygitgo.commands.log.banner")
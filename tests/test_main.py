@@ -7,7 +7,7 @@ import sys
 @pytest.fixture
 def _patch_startup(mocker):
     mocker.patch("pygitgo.main.ensure_first_run_setup")
-    mocker.patch("pygitgo.main.check_for_updates_background")
+    mocker.patch("pygitgo.main.check_for_updates")
 
 
 def test_main_version_flag(mocker, capsys):
@@ -36,7 +36,7 @@ def test_main_ready_flag(mocker, capsys):
 
 def test_main_no_command_prints_help(mocker, capsys, _patch_startup):
     mocker.patch.object(sys, "argv", ["gitgo"])
-    mock_banner = mocker.patch("pygitgo.main.show_banner")
+    mock_banner = mocker.patch("pygitgo.utils.banner.show_banner")
 
     main()
 
@@ -45,22 +45,22 @@ def test_main_no_command_prints_help(mocker, capsys, _patch_startup):
 
 
 @pytest.mark.parametrize("command,handler", [
-    ("jump", "jump_operation"),
-    ("link", "link_operation"),
-    ("push", "push_operation"),
-    ("state", "state_operation"),
-    ("user", "user_operation"),
-    ("config", "config_operation"),
-    ("undo", "undo_operation"),
-    ("pull", "pull_operation"),
-    ("repo", "repo_operation"),
-    ("new", "new_operation"),
-    ("init", "init_operation"),
-    ("log", "log_operation"),
+    ("jump", "pygitgo.commands.jump.jump_operation"),
+    ("link", "pygitgo.commands.link.link_operation"),
+    ("push", "pygitgo.commands.push.push_operation"),
+    ("state", "pygitgo.commands.state.state_operation"),
+    ("user", "pygitgo.commands.user.user_operation"),
+    ("config", "pygitgo.commands.config.config_operation"),
+    ("undo", "pygitgo.commands.undo.undo_operation"),
+    ("pull", "pygitgo.commands.pull.pull_operation"),
+    ("repo", "pygitgo.commands.repo.repo_operation"),
+    ("new", "pygitgo.commands.new.new_operation"),
+    ("init", "pygitgo.commands.init.init_operation"),
+    ("log", "pygitgo.commands.log.log_operation"),
 ])
 def test_main_dispatches_command(mocker, _patch_startup, command, handler):
     mocker.patch.object(sys, "argv", ["gitgo", command] + _argv_tail(command))
-    mock_handler = mocker.patch(f"pygitgo.main.{handler}")
+    mock_handler = mocker.patch(handler)
 
     main()
 
@@ -85,9 +85,44 @@ def _argv_tail(command):
     return tails[command]
 
 
+def test_main_trace_writes_command_span(mocker, _patch_startup, tmp_path):
+    import json
+    trace_file = tmp_path / "trace.json"
+    mocker.patch.object(sys, "argv", ["gitgo", "--trace", str(trace_file), "log"])
+    mocker.patch("pygitgo.commands.log.log_operation")
+
+    main()
+
+    events = json.loads(trace_file.read_text(encoding="utf-8"))["traceEvents"]
+    assert [event["name"] for event in events] == ["gitgo log"]
+
+
+def test_main_abbreviated_global_option_before_command(mocker, _patch_startup, tmp_path):
+    trace_file = tmp_path / "trace.json"
+    mocker.patch.object(sys, "argv", ["gitgo", "--trac", str(trace_file), "log", "-n", "3"])
+    mock_handler = mocker.patch("pygitgo.commands.log.log_operation")
+
+    main()
+
+    assert mock_handler.call_args[0][0].number == 3
+    assert trace_file.exists()
+
+
+@pytest.mark.parametrize("flag, name", [("-v", "gitgo --version"), ("--ready", "gitgo --ready")])
+def test_main_trace_written_for_version_and_ready(mocker, _patch_startup, tmp_path, flag, name):
+    import json
+    trace_file = tmp_path / "trace.json"
+    mocker.patch.object(sys, "argv", ["gitgo", "--trace", str(trace_file), flag])
+
+    main()
+
+    events = json.loads(trace_file.read_text(encoding="utf-8"))["traceEvents"]
+    assert [event["name"] for event in events] == [name]
+
+
 def test_main_init_passes_standalone(mocker, _patch_startup):
     mocker.patch.object(sys, "argv", ["gitgo", "init", "my-app"])
-    mock_init = mocker.patch("pygitgo.main.init_operation")
+    mock_init = mocker.patch("pygitgo.commands.init.init_operation")
 
     main()
 
@@ -97,7 +132,7 @@ def test_main_init_passes_standalone(mocker, _patch_startup):
 
 def test_main_gitgo_error_exits_one(mocker, _patch_startup):
     mocker.patch.object(sys, "argv", ["gitgo", "push"])
-    mocker.patch("pygitgo.main.push_operation", side_effect=GitGoError("push failed"))
+    mocker.patch("pygitgo.commands.push.push_operation", side_effect=GitGoError("push failed"))
     mock_error = mocker.patch("pygitgo.main.error")
 
     with pytest.raises(SystemExit) as exc_info:
@@ -109,7 +144,7 @@ def test_main_gitgo_error_exits_one(mocker, _patch_startup):
 
 def test_main_keyboard_interrupt_exits_130(mocker, _patch_startup):
     mocker.patch.object(sys, "argv", ["gitgo", "push"])
-    mocker.patch("pygitgo.main.push_operation", side_effect=KeyboardInterrupt())
+    mocker.patch("pygitgo.commands.push.push_operation", side_effect=KeyboardInterrupt())
     mock_warning = mocker.patch("pygitgo.main.warning")
 
     with pytest.raises(SystemExit) as exc_info:
@@ -117,3 +152,85 @@ def test_main_keyboard_interrupt_exits_130(mocker, _patch_startup):
 
     assert exc_info.value.code == 130
     mock_warning.assert_called_once_with("Operation canceled.")
+
+
+def test_main_registry_covers_every_command():
+    from pygitgo.main import COMMANDS, load_handler
+
+    for command in COMMANDS:
+        assert callable(load_handler(command))
+
+
+@pytest.mark.parametrize("argv,expected", [
+    (["log", "-n", "3"], "log"),
+    (["-q", "push", "main"], "push"),
+    (["--verbose", "state", "list"], "state"),
+    (["--trace", "push.json", "push"], "push"),
+    (["--trace=push.json", "push"], "push"),
+    (["-h", "push"], None),
+    (["-v"], None),
+    (["bogus"], None),
+    ([], None),
+])
+def test_pick_command(argv, expected):
+    from pygitgo.main import _pick_command
+
+    assert _pick_command(argv) == expected
+
+
+def test_build_parser_only_builds_chosen_subparser():
+    from pygitgo.main import build_parser
+
+    parser = build_parser("log")
+    subparsers = next(a for a in parser._actions if a.dest == "command")
+
+    assert list(subparsers.choices) == ["log"]
+    assert "{jump,link,push" in parser.format_usage()
+
+
+def test_main_help_lists_every_command(mocker, capsys):
+    from pygitgo.main import COMMAND_HELP
+
+    mocker.patch.object(sys, "argv", ["gitgo", "-h"])
+    mocker.patch.dict("os.environ", {"COLUMNS": "200"})
+
+    with pytest.raises(SystemExit):
+        main()
+
+    out = capsys.readouterr().out
+    for name, help in COMMAND_HELP.items():
+        assert name in out
+        assert help in out
+
+
+def test_main_invalid_command_lists_choices(mocker, capsys):
+    mocker.patch.object(sys, "argv", ["gitgo", "bogus"])
+
+    with pytest.raises(SystemExit) as exc_info:
+        main()
+
+    assert exc_info.value.code == 2
+    assert "invalid choice: 'bogus'" in capsys.readouterr().err
+
+
+def test_main_forwards_to_daemon(mocker):
+    mocker.patch.object(sys, "argv", ["gitgo", "log"])
+    mocker.patch("pygitgo.utils.daemon.forward", return_value=0)
+    mock_handler = mocker.patch("pygitgo.commands.log.log_operation")
+
+    with pytest.raises(SystemExit) as exc_info:
+        main()
+
+    assert exc_info.value.code == 0
+    mock_handler.assert_not_called()
+
+
+def test_main_never_forwards_daemon_command(mocker, _patch_startup):
+    mocker.patch.object(sys, "argv", ["gitgo", "daemon", "status"])
+    mock_forward = mocker.patch("pygitgo.utils.daemon.forward")
+    mock_handler = mocker.patch("pygitgo.commands.daemon.daemon_operation")
+
+    main()
+
+    mock_forward.assert_not_called()
+    mock_handler.assert_called_once()
@@ -58,6 +58,9 @@ def test_pull_operation_success_with_branch(mock_success, mock_run_command):
     )
     mock_success.assert_not_called()
 
+    from pygitgo.commands.git_remote import fetched_recently
+    assert fetched_recently("origin", "feature/test")
+
 @patch("pygitgo.commands.pull.run_command")
 def test_pull_operation_branch_not_found(mock_run_command):
     mock_run_command.side_effect = GitCommandError(["git", "ls-remote"])
@@ -1,5 +1,6 @@
 from pygitgo.commands.push import push_operation, _push_interrupt_cleanup
 from pygitgo.exceptions import GitCommandError, GitGoError
+from conftest import make_status
 from argparse import Namespace
 import pytest
 import sys
@@ -114,7 +115,7 @@ def test_push_select_success(mocker):
 def test_push_clean_but_unpushed_commits(mocker):
     mocker.patch("pygitgo.commands.push.get_current_branch", return_value="main")
     mocker.patch("pygitgo.commands.push.git_commit", return_value=False) 
-    fake_run = mocker.patch("pygitgo.commands.push.run_command", return_value="abc1234 Unpushed commit message\n")
+    fake_unpushed = mocker.patch("pygitgo.commands.push.has_unpushed_commits", return_value=True)
     fake_warning = mocker.patch("pygitgo.commands.push.warning")
     fake_push = mocker.patch("pygitgo.commands.push.git_push")
     mocker.patch("pygitgo.commands.push.banner")
@@ -122,14 +123,14 @@ def test_push_clean_but_unpushed_commits(mocker):
     args = Namespace(branch=None, message="Commit message", new=False, select=False)
     push_operation(args)
 
-    fake_run.assert_any_call(["git", "log", "--oneline", "origin/main..HEAD"], loading_msg="Checking for unpushed commits...")
+    fake_unpushed.assert_called_once_with("main", loading_msg="Checking for unpushed commits...")
     fake_warning.assert_called_once_with("\nNo changes to commit, but found unpushed commits. Pushing to remote...")
     fake_push.assert_called_once_with("main")
 
 def test_push_clean_and_up_to_date(mocker):
     mocker.patch("pygitgo.commands.push.get_current_branch", return_value="main")
     mocker.patch("pygitgo.commands.push.git_commit", return_value=False) 
-    fake_run = mocker.patch("pygitgo.commands.push.run_command", return_value="") 
+    fake_unpushed = mocker.patch("pygitgo.commands.push.has_unpushed_commits", return_value=False)
     fake_info = mocker.patch("pygitgo.commands.push.info")
     fake_warning = mocker.patch("pygitgo.commands.push.warning")
     fake_push = mocker.patch("pygitgo.commands.push.git_push")
@@ -137,7 +138,7 @@ def test_push_clean_and_up_to_date(mocker):
     args = Namespace(branch=None, message="Commit message", new=False, select=False)
     push_operation(args)
 
-    fake_run.assert_any_call(["git", "log", "--oneline", "origin/main..HEAD"], loading_msg="Checking for unpushed commits...")
+    fake_unpushed.assert_called_once_with("main", loading_msg="Checking for unpushed commits...")
     fake_info.assert_called_once_with("\nWorking tree is clean and everything is up to date.")
     fake_warning.assert_called_once_with("Make some changes first before using GitGo to commit and push.")
     fake_push.assert_not_called()
@@ -150,7 +151,7 @@ def test_push_keyboard_interrupt_no_changes_made(mocker):
     fake_warning = mocker.patch("pygitgo.commands.push.warning")
     mocker.patch("pygitgo.commands.push.info")
 
-    fake_run.side_effect = lambda cmd, *a, **kw: "" if cmd == ["git", "status", "--porcelain"] else "initial_hash"
+    mocker.patch("pygitgo.commands.push.get_status", return_value=make_status())
 
     args = Namespace(branch=None, message="Commit message", new=False, select=False)
     with pytest.raises(SystemExit) as sys_exit:
@@ -180,11 +181,25 @@ def test_push_interrupt_cleanup_exceptions(mocker):
     mocker.patch("pygitgo.commands.push.get_current_branch", side_effect=Exception("error"))
     mocker.patch("pygitgo.commands.push.get_head_sha", side_effect=GitCommandError(["cmd"]))
     fake_run = mocker.patch("pygitgo.commands.push.run_command", side_effect=GitCommandError(["cmd"]))
+    mocker.patch("pygitgo.commands.push.get_status", side_effect=GitCommandError(["cmd"]))
     fake_warning = mocker.patch("pygitgo.commands.push.warning")
 
     _push_interrupt_cleanup("main", "head", "new-branch")
     fake_warning.assert_any_call("Could not auto-remove 'new-branch'.")
 
+
+def test_push_interrupt_cleanup_unstages_staged_files(mocker):
+    mocker.patch("pygitgo.commands.push.get_current_branch", return_value="main")
+    mocker.patch("pygitgo.commands.push.get_head_sha", return_value="head")
+    mocker.patch("pygitgo.commands.push.get_status", return_value=make_status("M  staged.py", "?? new.py"))
+    fake_run = mocker.patch("pygitgo.commands.push.run_command")
+    fake_success = mocker.patch("pygitgo.commands.push.success")
+
+    _push_interrupt_cleanup("main", "head", None)
+
+    fake_run.assert_called_once_with(["git", "reset", "HEAD"])
+    fake_success.assert_called_once_with("Staged files have been unstaged. Your edits are safe.")
+
 def test_push_operation_no_msg_branch_does_not_exist(mocker):
     mocker.patch("pygitgo.commands.push.get_current_branch", return_value="main")
     mocker.patch("pygitgo.commands.push.is_branch_exist", return_value=False)
@@ -197,7 +212,7 @@ def test_push_operation_no_msg_branch_does_not_exist(mocker):
 def test_push_unpushed_check_unknown_revision_error(mocker):
     mocker.patch("pygitgo.commands.push.get_current_branch", return_value="main")
     mocker.patch("pygitgo.commands.push.git_commit", return_value=False)
-    mocker.patch("pygitgo.commands.push.run_command", side_effect=GitCommandError(["log"], stderr="fatal: unknown revision or path not in the working tree"))
+    mocker.patch("pygitgo.commands.push.has_unpushed_commits", side_effect=GitCommandError(["rev-list"], stderr="fatal: ambiguous argument 'origin/main..HEAD': unknown revision or path not in the working tree."))
     fake_warning = mocker.patch("pygitgo.commands.push.warning")
     args = Namespace(branch=None, message="message", new=False, select=False)
     push_operation(args)
@@ -206,7 +221,7 @@ def test_push_unpushed_check_unknown_revision_error(mocker):
 def test_push_unpushed_check_other_error(mocker):
     mocker.patch("pygitgo.commands.push.get_current_branch", return_value="main")
     mocker.patch("pygitgo.commands.push.git_commit", return_value=False)
-    mocker.patch("pygitgo.commands.push.run_command", side_effect=GitCommandError(["log"], stderr="some other error"))
+    mocker.patch("pygitgo.commands.push.has_unpushed_commits", side_effect=GitCommandError(["rev-list"], stderr="some other error"))
     fake_warning = mocker.patch("pygitgo.commands.push.warning")
     args = Namespace(branch=None, message="message", new=False, select=False)
     push_operation(args)
@@ -0,0 +1,90 @@
+from pygitgo.utils.reachability import check_tcp, Reachability
+import socket
+import time
+import pytest
+
+
+@pytest.fixture
+def listener():
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.bind(("127.0.0.1", 0))
+    server.listen(1)
+    yield ("127.0.0.1", server.getsockname()[1])
+    server.close()
+
+
+@pytest.fixture
+def closed_port():
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.bind(("127.0.0.1", 0))
+    port = sock.getsockname()[1]
+    sock.close()
+    return ("127.0.0.1", port)
+
+
+def test_open_port_connects(listener):
+    result = check_tcp([listener], stop_on=listener)
+
+    assert result.reached(listener)
+    assert result.layer is None
+
+
+def test_closed_port_is_refused(closed_port):
+    result = check_tcp([closed_port])
+
+    assert result.layer == "tcp"
+    assert result.refused is True
+
+
+def test_reports_every_endpoint_that_connects(listener, closed_port):
+    result = check_tcp([closed_port, listener], stop_on=closed_port)
+
+    assert result.connected == {listener}
+    assert result.refused is False
+
+
+def test_unresolvable_host_fails_at_dns(mocker):
+    mocker.patch("socket.getaddrinfo", side_effect=socket.gaierror("no such host"))
+
+    result = check_tcp([("nowhere.invalid", 22)])
+
+    assert result.layer == "dns"
+
+
+def test_slow_resolver_is_cut_off_as_unknown(mocker):
+    mocker.patch("socket.getaddrinfo", side_effect=lambda *args, **kwargs: time.sleep(2))
+
+    start = time.monotonic()
+    result = check_tcp([("github.com", 22)], dns_budget=0.1)
+
+    assert time.monotonic() - start < 1
+    assert result.layer == "unknown"
+
+
+def test_slow_resolver_does_not_use_up_connect_budget(mocker, listener):
+    real_getaddrinfo = socket.getaddrinfo
+
+    def slow_lookup(*args, **kwargs):
+        time.sleep(0.3)
+        return real_getaddrinfo(*args, **kwargs)
+    mocker.patch("socket.getaddrinfo", side_effect=slow_lookup)
+
+    result = check_tcp([listener], budget=0.2)
+
+    assert result.reached(listener)
+
+
+def test_unanswered_connect_is_cut_off_at_budget(mocker, listener):
+    never_ready = mocker.patch("selectors.DefaultSelector.select", return_value=[])
+
+    start = time.monotonic()
+    result = check_tcp([listener], budget=0.1)
+
+    assert never_ready.called
+    assert time.monotonic() - start < 1
+    assert result.layer == "tcp"
+    assert result.refused is False
+
+
+def test_reachability_repr():
+    assert "layer='dns'" in repr(Reachability(resolved=False))
@@ -0,0 +1,157 @@
+from pygitgo.utils.repo_context import RepoContext
+from pygitgo.utils.executor import clear_query_cache
+from pygitgo.utils import repo_context, refs
+import subprocess
+import pytest
+import os
+
+
+def _git(cwd, *args):
+    env = {
+        **os.environ,
+        "GIT_AUTHOR_NAME": "Test",
+        "GIT_AUTHOR_EMAIL": "test@example.com",
+        "GIT_COMMITTER_NAME": "Test",
+        "GIT_COMMITTER_EMAIL": "test@example.com",
+    }
+    return subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True, text=True, env=env).stdout.strip()
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    path = tmp_path / "project"
+    path.mkdir()
+    _git(path, "init", "-b", "main")
+    (path / "README.md").write_text("hello\n", encoding="utf-8")
+    _git(path, "add", "README.md")
+    _git(path, "-c", "commit.gpgsign=false", "commit", "-m", "first")
+
+    monkeypatch.chdir(path)
+    monkeypatch.setattr(repo_context, "_resolve", RepoContext.from_git)
+    return path
+
+
+def _refresh():
+    clear_query_cache()
+    repo_context.clear_repo_context()
+
+
+def test_read_head_on_branch(repo):
+    assert refs.read_head() == ("main", _git(repo, "rev-parse", "HEAD"))
+
+
+def test_read_head_detached(repo):
+    _git(repo, "checkout", "--detach")
+    assert refs.read_head() == ("", _git(repo, "rev-parse", "HEAD"))
+
+
+def test_read_head_unborn(tmp_path, monkeypatch):
+    _git(tmp_path, "init", "-b", "trunk")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(repo_context, "_resolve", RepoContext.from_git)
+
+    assert refs.read_head() == ("trunk", None)
+
+
+def test_packed_refs_binary_search(repo):
+    head = _git(repo, "rev-parse", "HEAD")
+    names = [f"feature/{i:03d}" for i in range(0, 200, 3)]
+    for name in names:
+        _git(repo, "branch", name)
+    _git(repo, "tag", "-a", "v1", "-m", "release")
+    _git(repo, "pack-refs", "--all")
+    refs.clear_packed_cache()
+
+    assert not (repo / ".git" / "refs" / "heads" / "feature").exists()
+    for name in names:
+        assert refs.read_ref(f"refs/heads/{name}") == head
+    assert refs.read_ref("refs/tags/v1") == _git(repo, "rev-parse", "refs/tags/v1")
+    assert refs.read_ref("refs/heads/main") == head
+    for missing in ["feature/001", "feature/999", "aaa", "zzz", "feature"]:
+        assert refs.read_ref(f"refs/heads/{missing}") is None
+
+
+def test_loose_ref_overrides_packed(repo):
+    _git(repo, "pack-refs", "--all")
+    (repo / "second.txt").write_text("x\n", encoding="utf-8")
+    _git(repo, "add", "second.txt")
+    _git(repo, "-c", "commit.gpgsign=false", "commit", "-m", "second")
+
+    assert refs.read_head()[1] == _git(repo, "rev-parse", "HEAD")
+
+
+def test_unsorted_packed_refs(repo):
+    head = _git(repo, "rev-parse", "HEAD")
+    (repo / ".git" / "packed-refs").write_text(
+        f"{head} refs/heads/zeta\n{head} refs/heads/alpha\n", encoding="utf-8"
+    )
+    refs.clear_packed_cache()
+
+    assert refs.read_ref("refs/heads/alpha") == head
+    assert refs.read_ref("refs/heads/beta") is None
+
+
+def test_orig_head(repo):
+    assert refs.read_ref("ORIG_HEAD") is None
+    _git(repo, "reset", "--soft", "HEAD")
+    assert refs.read_ref("ORIG_HEAD") == _git(repo, "rev-parse", "ORIG_HEAD")
+
+
+def test_remote_branch_exists(repo):
+    head = _git(repo, "rev-parse", "HEAD")
+    _git(repo, "update-ref", "refs/remotes/origin/loose", head)
+    _git(repo, "update-ref", "refs/remotes/upstream/packed", head)
+    _git(repo, "pack-refs", "--all")
+    _git(repo, "update-ref", "refs/remotes/origin/loose", head)
+    refs.clear_packed_cache()
+
+    assert refs.remote_branch_exists("loose")
+    assert refs.remote_branch_exists("packed")
+    assert not refs.remote_branch_exists("main")
+
+
+def test_remote_branch_exists_matches_packed_nested_names_exactly(repo):
+    head = _git(repo, "rev-parse", "HEAD")
+    _git(repo, "update-ref", "refs/remotes/origin/feature/login", head)
+    _git(repo, "pack-refs", "--all")
+    refs.clear_packed_cache()
+
+    assert refs.remote_branch_exists("feature/login")
+    assert not refs.remote_branch_exists("login")
+
+
+def test_read_symbolic_ref(repo):
+    _git(repo, "update-ref", "refs/remotes/origin/main", _git(repo, "rev-parse", "HEAD"))
+    _git(repo, "symbolic-ref", "refs/remotes/origin/HEAD", "refs/remotes/origin/main")
+
+    assert refs.read_symbolic_ref("refs/remotes/origin/HEAD") == "refs/remotes/origin/main"
+    assert refs.read_symbolic_ref("refs/remotes/origin/main") is None
+    assert refs.read_symbolic_ref("refs/remotes/upstream/HEAD") is None
+
+
+def test_linked_worktree_has_its_own_head(repo, tmp_path, monkeypatch):
+    worktree = tmp_path / "feature"
+    _git(repo, "worktree", "add", "-b", "feature", str(worktree))
+    monkeypatch.chdir(worktree)
+    _refresh()
+
+    assert refs.read_head() == ("feature", _git(worktree, "rev-parse", "HEAD"))
+    assert refs.read_ref("refs/heads/main") == _git(repo, "rev-parse", "main")
+
+
+def test_reftable_falls_back(repo):
+    (repo / ".git" / "reftable").mkdir()
+    with pytest.raises(refs.RefsUnavailable):
+        refs.read_head()
+
+
+def test_unparseable_ref_falls_back(repo):
+    (repo / ".git" / "refs" / "heads" / "broken").write_text("garbage\n", encoding="utf-8")
+    with pytest.raises(refs.RefsUnavailable):
+        refs.read_ref("refs/heads/broken")
+
+
+def test_outside_repository_falls_back(mocker):
+    mocker.patch.object(repo_context, "_resolve", return_value=None)
+    with pytest.raises(refs.RefsUnavailable):
+        refs.read_head()
@@ -1,5 +1,5 @@
 from unittest.mock import patch, MagicMock
-from pygitgo.exceptions import GitGoError
+from pygitgo.exceptions import GitCommandError, GitGoError
 from pygitgo.commands.repo import (
     _get_github_token,
     create_github_repo,
@@ -118,16 +118,24 @@ def test_repo_operation_silent(mock_create, mock_token, capsys):
     assert "gitgo link" not in captured.out
 
 def test_clear_saved_token(mocker):
-    mock_run = mocker.patch("subprocess.run")
+    mock_unset = mocker.patch("pygitgo.commands.repo.unset_git_config")
     _clear_saved_token()
-    mock_run.assert_called_once_with(
-        ["git", "config", "--global", "--unset", "gitgo.github-token"],
-        capture_output=True
-    )
+    mock_unset.assert_called_once_with("gitgo.github-token", scope="global")
 
-    mock_run.side_effect = Exception("failed")
+    mock_unset.side_effect = GitCommandError(["git", "config"], stderr="", returncode=5)
     _clear_saved_token()
 
+def test_clear_saved_token_drops_loaded_value(mocker):
+    from pygitgo.utils.config import load_config, get_config
+    from conftest import config_result
+    mock_run = mocker.patch("pygitgo.utils.executor.subprocess.run", return_value=config_result(global_={"gitgo.github-token": "old"}))
+    load_config()
+
+    _clear_saved_token()
+
+    assert get_config("github-token", "") == ""
+    assert mock_run.call_args[0][0] == ["git", "config", "--global", "--unset", "gitgo.github-token"]
+
 @patch.dict("os.environ", {}, clear=True)
 def test_get_github_token_gh_cli_timeout(mocker):
     mocker.patch("subprocess.run", side_effect=subprocess.TimeoutExpired(["gh"], 5))
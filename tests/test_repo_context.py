@@ -0,0 +1,122 @@
+from pygitgo.utils.repo_context import RepoContext, get_repo_context
+from pygitgo.utils.executor import clear_query_cache, run_command
+from pygitgo.utils import repo_context
+import subprocess
+import os
+
+
+def _git(cwd, *args):
+    env = {
+        **os.environ,
+        "GIT_AUTHOR_NAME": "Test",
+        "GIT_AUTHOR_EMAIL": "test@example.com",
+        "GIT_COMMITTER_NAME": "Test",
+        "GIT_COMMITTER_EMAIL": "test@example.com",
+    }
+    return subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True, text=True, env=env)
+
+
+def _make_repo(path):
+    path.mkdir()
+    _git(path, "init", "-b", "main")
+    (path / "README.md").write_text("hello\n", encoding="utf-8")
+    _git(path, "add", "README.md")
+    _git(path, "-c", "commit.gpgsign=false", "commit", "-m", "first")
+    return path
+
+
+def test_from_git_outside_repository(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("GIT_CEILING_DIRECTORIES", str(tmp_path.parent))
+    assert RepoContext.from_git() is None
+
+
+def test_from_git_in_subdirectory(tmp_path, monkeypatch):
+    repo = _make_repo(tmp_path / "project")
+    sub = repo / "src" / "pkg"
+    sub.mkdir(parents=True)
+    monkeypatch.chdir(sub)
+
+    context = RepoContext.from_git()
+
+    assert context.toplevel.resolve() == repo.resolve()
+    assert context.git_dir.resolve() == (repo / ".git").resolve()
+    assert context.branch == "main"
+    assert not context.is_linked_worktree
+    assert not context.rebase_in_progress
+
+    (repo / ".git" / "rebase-merge").mkdir()
+    assert context.rebase_in_progress
+
+
+def test_from_git_in_linked_worktree(tmp_path, monkeypatch):
+    repo = _make_repo(tmp_path / "project")
+    worktree = tmp_path / "feature"
+    _git(repo, "worktree", "add", "-b", "feature", str(worktree))
+    monkeypatch.chdir(worktree)
+
+    context = RepoContext.from_git()
+
+    assert (worktree / ".git").is_file()
+    assert context.is_linked_worktree
+    assert context.branch == "feature"
+    assert context.common_dir.resolve() == (repo / ".git").resolve()
+    assert context.index_lock.parent == context.git_dir
+    assert context.git_dir.resolve() != (repo / ".git").resolve()
+
+
+def test_from_git_unborn_branch(tmp_path, monkeypatch):
+    repo = tmp_path / "empty"
+    repo.mkdir()
+    _git(repo, "init", "-b", "trunk")
+    monkeypatch.chdir(repo)
+
+    context = RepoContext.from_git()
+
+    assert context.head is None
+    assert context.branch == "trunk"
+
+
+def test_from_git_detached_head(tmp_path, monkeypatch):
+    repo = _make_repo(tmp_path / "project")
+    _git(repo, "checkout", "--detach")
+    monkeypatch.chdir(repo)
+
+    context = RepoContext.from_git()
+
+    assert context.is_detached
+    assert context.branch == ""
+
+
+def test_remote_url(tmp_path, monkeypatch):
+    repo = _make_repo(tmp_path / "project")
+    monkeypatch.chdir(repo)
+    assert RepoContext.from_git().remote_url is None
+
+    _git(repo, "remote", "add", "origin", "git@github.com:user/repo.git")
+    clear_query_cache()
+    assert RepoContext.from_git().remote_url == "git@github.com:user/repo.git"
+
+
+def test_get_repo_context_resolves_once_until_mutation(mocker):
+    resolve = mocker.patch.object(repo_context, "_resolve", side_effect=lambda: object())
+
+    first = get_repo_context()
+    assert get_repo_context() is first
+    assert resolve.call_count == 1
+
+    mocker.patch("subprocess.run")
+    run_command(["git", "checkout", "dev"])
+
+    assert get_repo_context() is not first
+    assert resolve.call_count == 2
+
+
+def test_get_repo_context_keyed_on_folder(mocker, tmp_path, monkeypatch):
+    resolve = mocker.patch.object(repo_context, "_resolve", side_effect=lambda: object())
+
+    get_repo_context()
+    monkeypatch.chdir(tmp_path)
+    get_repo_context()
+
+    assert resolve.call_count == 2
@@ -1,6 +1,6 @@
 from pygitgo.commands.resolve import resolve_operation
 from pygitgo.exceptions import GitCommandError, GitGoError
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 from argparse import Namespace
 import pytest
 
@@ -10,11 +10,9 @@ def test_resolve_abort_flag(mock_abort):
     resolve_operation(args)
     mock_abort.assert_called_once()
 
-@patch("pygitgo.commands.resolve.Path")
-def test_resolve_no_conflict(mock_path):
-    mock_path_instance = MagicMock()
-    mock_path_instance.exists.return_value = False
-    mock_path.return_value = mock_path_instance
+@patch("pygitgo.commands.resolve.is_rebase_in_progress")
+def test_resolve_no_conflict(mock_rebase):
+    mock_rebase.return_value = False
     
     args = Namespace(abort=False)
     with pytest.raises(GitGoError, match="No conflict resolution is currently in progress"):
@@ -22,12 +20,10 @@ def test_resolve_no_conflict(mock_path):
 
 @patch("pygitgo.commands.resolve.ensure_inside_git_repository")
 @patch("pygitgo.commands.resolve.run_command")
-@patch("pygitgo.commands.resolve.Path")
+@patch("pygitgo.commands.resolve.is_rebase_in_progress")
 @patch("pygitgo.commands.resolve.banner")
-def test_resolve_success(mock_banner, mock_path, mock_run, mock_ensure_git):
-    mock_path_instance = MagicMock()
-    mock_path_instance.exists.return_value = True
-    mock_path.return_value = mock_path_instance
+def test_resolve_success(mock_banner, mock_rebase, mock_run, mock_ensure_git):
+    mock_rebase.return_value = True
     
     mock_run.side_effect = ["", ""]
     
@@ -42,8 +38,8 @@ def test_resolve_success(mock_banner, mock_path, mock_run, mock_ensure_git):
     mock_banner.assert_called_once()
 
 @patch("pygitgo.commands.resolve.ensure_inside_git_repository")
-@patch("pygitgo.commands.resolve.Path")
-def test_resolve_status_error(mock_path, mock_ensure_git):
+@patch("pygitgo.commands.resolve.is_rebase_in_progress")
+def test_resolve_status_error(mock_rebase, mock_ensure_git):
     mock_ensure_git.side_effect = GitGoError("Not inside a git repository. Run 'gitgo init' or 'gitgo link' first.")
     
     args = Namespace(abort=False)
@@ -52,11 +48,9 @@ def test_resolve_status_error(mock_path, mock_ensure_git):
 
 @patch("pygitgo.commands.resolve.ensure_inside_git_repository")
 @patch("pygitgo.commands.resolve.run_command")
-@patch("pygitgo.commands.resolve.Path")
-def test_resolve_still_conflicted(mock_path, mock_run, mock_ensure_git):
-    mock_path_instance = MagicMock()
-    mock_path_instance.exists.return_value = True
-    mock_path.return_value = mock_path_instance
+@patch("pygitgo.commands.resolve.is_rebase_in_progress")
+def test_resolve_still_conflicted(mock_rebase, mock_run, mock_ensure_git):
+    mock_rebase.return_value = True
     
     mock_run.side_effect = [
         "",
@@ -69,11 +63,9 @@ def test_resolve_still_conflicted(mock_path, mock_run, mock_ensure_git):
 
 @patch("pygitgo.commands.resolve.ensure_inside_git_repository")
 @patch("pygitgo.commands.resolve.run_command")
-@patch("pygitgo.commands.resolve.Path")
-def test_resolve_other_error(mock_path, mock_run, mock_ensure_git):
-    mock_path_instance = MagicMock()
-    mock_path_instance.exists.return_value = True
-    mock_path.return_value = mock_path_instance
+@patch("pygitgo.commands.resolve.is_rebase_in_progress")
+def test_resolve_other_error(mock_rebase, mock_run, mock_ensure_git):
+    mock_rebase.return_value = True
     
     mock_run.side_effect = [
         "",
@@ -0,0 +1,43 @@
+from pygitgo.commands.shell_init import shell_init_operation, detect_shell, SCRIPTS
+from pygitgo.exceptions import GitGoError
+from argparse import Namespace
+import subprocess
+import shutil
+import pytest
+
+
+@pytest.mark.parametrize("shell, expected", [
+    ("/bin/zsh", "zsh"),
+    ("/usr/bin/fish", "fish"),
+    ("/bin/bash", "bash"),
+    ("", "bash"),
+])
+def test_detect_shell(monkeypatch, shell, expected):
+    monkeypatch.setenv("SHELL", shell)
+    monkeypatch.setattr("os.name", "posix")
+    assert detect_shell() == expected
+
+
+def test_shell_init_prints_script(capsys):
+    shell_init_operation(Namespace(shell="fish"))
+    assert capsys.readouterr().out == SCRIPTS["fish"]
+
+
+def test_shell_init_unknown_shell():
+    with pytest.raises(GitGoError):
+        shell_init_operation(Namespace(shell="tcsh"))
+
+
+@pytest.mark.skipif(shutil.which("bash") is None, reason="bash is not installed")
+def test_posix_function_changes_folder(tmp_path):
+    target = tmp_path / "target dir"
+    target.mkdir()
+    fake_gitgo = tmp_path / "bin" / "gitgo"
+    fake_gitgo.parent.mkdir()
+    fake_gitgo.write_text(f'#!/bin/sh\nprintf %s "{target}" > "$GITGO_CD_FILE"\nexit 3\n', encoding="utf-8")
+    fake_gitgo.chmod(0o755)
+
+    script = f'PATH="{fake_gitgo.parent}:$PATH"\n{SCRIPTS["bash"]}\ngitgo jump feat\necho "$?"\npwd\n'
+    result = subprocess.run(["bash", "-c", script], cwd=tmp_path, capture_output=True, text=True)
+
+    assert result.stdout.splitlines() == ["3", str(target)]
@@ -0,0 +1,129 @@
+from pygitgo.utils import ssh_mux
+from pathlib import Path
+import subprocess
+import sys
+import tempfile
+import shutil
+import pytest
+
+
+@pytest.fixture
+def control_dir(monkeypatch):
+    # pytest's tmp_path is too long to hold a Unix socket path.
+    base = tempfile.mkdtemp(prefix="gg")
+    path = Path(base) / "ssh"
+    monkeypatch.setattr(ssh_mux, "CONTROL_DIR", path)
+    monkeypatch.setattr(ssh_mux, "_dir_ready", False)
+    monkeypatch.setattr(ssh_mux, "_versions", {"ssh": (9, 6)})
+    monkeypatch.setattr(ssh_mux.os, "name", "posix")
+    monkeypatch.delenv("GITGO_NO_SSH_MUX", raising=False)
+    yield path
+    shutil.rmtree(base, ignore_errors=True)
+
+
+@pytest.fixture
+def ssh_binary(monkeypatch):
+    # Any existing file stands in for ssh; `ssh -V` itself is mocked.
+    monkeypatch.setattr(ssh_mux, "_versions", {})
+    monkeypatch.setattr(ssh_mux.shutil, "which", lambda program: sys.executable)
+
+
+def test_control_options_share_socket_per_host(control_dir):
+    options = ssh_mux.control_options()
+
+    assert options == [
+        "-o", "ControlMaster=auto",
+        "-o", f"ControlPath={control_dir / '%C'}",
+        "-o", f"ControlPersist={ssh_mux.CONTROL_PERSIST}",
+    ]
+    assert control_dir.is_dir()
+
+
+def test_ssh_command_keeps_user_command_and_batch_mode(control_dir):
+    command = ssh_mux.ssh_command('ssh -i "/keys/my key"')
+
+    assert command.startswith('ssh -i "/keys/my key" -o BatchMode=yes -o ControlMaster=auto')
+
+
+@pytest.mark.parametrize("base_command", [
+    "plink",
+    "/usr/bin/tortoiseplink -batch",
+    "ssh -o ControlMaster=no",
+])
+def test_control_options_skip_unsupported_or_user_managed(control_dir, base_command):
+    assert ssh_mux.control_options(base_command) == []
+    assert ssh_mux.ssh_command(base_command) == f"{base_command} -o BatchMode=yes"
+
+
+def test_control_options_disabled_on_windows(control_dir, monkeypatch):
+    monkeypatch.setattr(ssh_mux.os, "name", "nt")
+    assert ssh_mux.control_options() == []
+
+
+def test_control_options_opt_out(control_dir, monkeypatch):
+    monkeypatch.setenv("GITGO_NO_SSH_MUX", "1")
+    assert ssh_mux.control_options() == []
+
+
+def test_control_options_skip_long_socket_path(control_dir, monkeypatch):
+    monkeypatch.setattr(ssh_mux, "CONTROL_DIR", control_dir / ("x" * 100))
+    assert ssh_mux.control_options() == []
+
+
+def test_control_options_unwritable_dir(control_dir, mocker):
+    mocker.patch.object(type(control_dir), "mkdir", side_effect=PermissionError("denied"))
+    assert ssh_mux.control_options() == []
+
+
+@pytest.mark.parametrize("banner, enabled", [
+    ("OpenSSH_8.2p1 Ubuntu-4ubuntu0.5, OpenSSL 1.1.1f  31 Mar 2020", False),
+    ("OpenSSH_8.4p1, LibreSSL 3.3.6", True),
+    ("OpenSSH_for_Windows_9.5p1, LibreSSL 3.8.2", True),
+    ("", False),
+])
+def test_control_options_need_openssh_8_4(control_dir, ssh_binary, mocker, banner, enabled):
+    # Older masters keep the spawning ssh's stderr open, and captured git output hangs on it.
+    fake_run = mocker.patch(
+        "pygitgo.utils.ssh_mux.subprocess.run",
+        return_value=subprocess.CompletedProcess(["ssh", "-V"], 0, "", banner),
+    )
+
+    assert bool(ssh_mux.control_options()) is enabled
+    ssh_mux.control_options()
+    fake_run.assert_called_once()
+
+
+def test_openssh_version_is_stored_between_runs(control_dir, ssh_binary, monkeypatch, mocker):
+    fake_run = mocker.patch(
+        "pygitgo.utils.ssh_mux.subprocess.run",
+        return_value=subprocess.CompletedProcess(["ssh", "-V"], 0, "", "OpenSSH_9.6p1"),
+    )
+    assert ssh_mux.control_options()
+
+    # A new process starts with an empty in-memory cache.
+    monkeypatch.setattr(ssh_mux, "_versions", {})
+    assert ssh_mux.control_options()
+    fake_run.assert_called_once()
+
+
+def test_ssh_command_without_multiplexing(control_dir, mocker):
+    fake_run = mocker.patch("pygitgo.utils.ssh_mux.subprocess.run")
+    assert ssh_mux.ssh_command("ssh", multiplex=False) == "ssh -o BatchMode=yes"
+    fake_run.assert_not_called()
+    assert not control_dir.exists()
+
+
+def test_control_options_skip_when_ssh_cannot_run(control_dir, ssh_binary, mocker):
+    mocker.patch("pygitgo.utils.ssh_mux.subprocess.run", side_effect=OSError("not found"))
+    assert ssh_mux.control_options() == []
+
+
+@pytest.mark.skipif(shutil.which("ssh") is None, reason="ssh is not installed")
+def test_openssh_accepts_control_options(control_dir):
+    result = subprocess.run(
+        ["ssh", "-G", *ssh_mux.control_options(), "git@github.com"],
+        capture_output=True, text=True, check=True,
+    )
+
+    assert "controlmaster auto" in result.stdout
+    assert f"controlpath {control_dir}" in result.stdout
@@ -4,13 +4,30 @@ from pygitgo.auth.ssh_utils import (
     _try_ssh_add, ensure_ssh_agent
 )
 from pygitgo.exceptions import GitGoError
+from pygitgo.utils import state_store
 from pathlib import Path
 import pytest
 
 
-def test_ensure_github_known_host_already_exists(mocker):
-    mocker.patch("pathlib.Path.exists", return_value=True)
-    mocker.patch("builtins.open", mocker.mock_open(read_data="github.com ssh-rsa AAA..."))
+@pytest.fixture
+def known_hosts_file(mocker, tmp_path):
+    from pygitgo.auth import known_hosts
+    path = tmp_path / ".ssh" / "known_hosts"
+    mocker.patch.object(known_hosts, "KNOWN_HOSTS_FILE", path)
+    known_hosts.clear_known_hosts_cache()
+    yield path
+    known_hosts.clear_known_hosts_cache()
+
+
+def _hashed_entry(host, salt=b"0123456789abcdefghij"):
+    import base64, hashlib, hmac
+    digest = hmac.new(salt, host.encode(), hashlib.sha1).digest()
+    return f"|1|{base64.b64encode(salt).decode()}|{base64.b64encode(digest).decode()} ssh-ed25519 AAAAC3Nza\n"
+
+
+def test_ensure_github_known_host_already_exists(mocker, known_hosts_file):
+    known_hosts_file.parent.mkdir()
+    known_hosts_file.write_text("github.com ssh-rsa AAA...\n")
     fake_run = mocker.patch("pygitgo.auth.ssh_utils.run_command")
 
     ensure_github_known_host()
@@ -18,25 +35,50 @@ def test_ensure_github_known_host_already_exists(mocker):
     fake_run.assert_not_called()
 
 
-def test_ensure_github_known_host_not_exists(mocker):
-    mocker.patch("pathlib.Path.exists", return_value=False)
-    mocker.patch("pathlib.Path.mkdir")
-    mock_file = mocker.patch("builtins.open", mocker.mock_open())
-    
+def test_ensure_known_host_recognises_hashed_entries(mocker, known_hosts_file):
+    known_hosts_file.parent.mkdir()
+    known_hosts_file.write_text(_hashed_entry("github.com"))
+    fake_run = mocker.patch("pygitgo.auth.ssh_utils.run_command")
+
+    ensure_github_known_host()
+
+    fake_run.assert_not_called()
+
+
+def test_ensure_github_known_host_not_exists(mocker, known_hosts_file):
     mock_process = mocker.MagicMock()
-    mock_process.stdout = "github.com ssh-rsa AAA...\n"
+    mock_process.stdout = _hashed_entry("github.com")
     fake_run = mocker.patch("pygitgo.auth.ssh_utils.run_command", return_value=mock_process)
     mocker.patch("pygitgo.auth.ssh_utils.info")
     mocker.patch("pygitgo.auth.ssh_utils.success")
 
+    ensure_github_known_host()
     ensure_github_known_host()
 
     fake_run.assert_called_once_with(["ssh-keyscan", "-H", "github.com"], return_complete=True)
-    mock_file().write.assert_any_call("github.com ssh-rsa AAA...\n")
+    assert known_hosts_file.read_text() == _hashed_entry("github.com")
+
+
+def test_ensure_known_hosts_scans_missing_hosts_together(mocker, known_hosts_file):
+    from pygitgo.auth.ssh_utils import ensure_known_hosts
+    known_hosts_file.parent.mkdir()
+    known_hosts_file.write_text("github.com ssh-rsa AAA")
+    mock_process = mocker.MagicMock(stdout=_hashed_entry("gitlab.com"))
+    fake_run = mocker.patch("pygitgo.auth.ssh_utils.run_command", return_value=mock_process)
+    mocker.patch("pygitgo.auth.ssh_utils.info")
+    mocker.patch("pygitgo.auth.ssh_utils.success")
+    fake_warning = mocker.patch("pygitgo.auth.ssh_utils.warning")
+
+    ensure_known_hosts(["github.com", "gitlab.com", "bitbucket.org"])
+
+    fake_run.assert_called_once_with(["ssh-keyscan", "-H", "gitlab.com", "bitbucket.org"], return_complete=True)
+    fake_warning.assert_called_once()
+    assert "bitbucket.org" in fake_warning.call_args[0][0]
+    assert known_hosts_file.read_text() == "github.com ssh-rsa AAA\n" + _hashed_entry("gitlab.com")
 
 
 def test_check_connection_success(mocker):
-    mocker.patch("pygitgo.auth.ssh_utils.ensure_github_known_host")
+    mocker.patch("pygitgo.auth.ssh_utils.ensure_known_host")
     mocker.patch("pygitgo.auth.ssh_utils._get_github_ssh_response", return_value=("Hi user! You've successfully authenticated.", False, None))
 
     mock_spinner = mocker.MagicMock()
@@ -49,7 +91,7 @@ def test_check_connection_success(mocker):
 
 
 def test_check_connection_failure(mocker):
-    mocker.patch("pygitgo.auth.ssh_utils.ensure_github_known_host")
+    mocker.patch("pygitgo.auth.ssh_utils.ensure_known_host")
     mocker.patch("pygitgo.auth.ssh_utils._get_github_ssh_response", return_value=("Permission denied.", False, None))
 
     mock_spinner = mocker.MagicMock()
@@ -218,3 +260,167 @@ def test_generate_ssh_key_exists_and_accepted(mocker):
 
 
 
+
+
+def test_ssh_probe_reuses_control_socket(mocker):
+    from pygitgo.auth.ssh_utils import _get_ssh_response
+    mocker.patch("pygitgo.auth.ssh_utils._precheck", return_value=None)
+    mocker.patch("pygitgo.auth.ssh_utils.control_options", return_value=["-o", "ControlPath=/s/%C"])
+    fake_run = mocker.patch("pygitgo.auth.ssh_utils.run_traced", return_value=mocker.MagicMock(stdout="", stderr="Hi user!"))
+
+    assert _get_ssh_response("github.com") == ("Hi user!", False, None)
+    assert fake_run.call_args[0][0] == ["ssh", "-T", "-o", "BatchMode=yes", "-o", "ControlPath=/s/%C", "git@github.com"]
+
+
+GREETING = "Hi Alice! You've successfully authenticated, but GitHub does not provide shell access."
+
+
+def test_successful_probe_is_reused_by_the_next_run(mocker):
+    from pygitgo.auth.ssh_utils import _get_cached_ssh_response, clear_ssh_cache
+    probe = mocker.patch("pygitgo.auth.ssh_utils._get_github_ssh_response", return_value=(GREETING, False, None))
+
+    assert _get_cached_ssh_response() == (GREETING, False, None)
+    clear_ssh_cache()
+
+    assert get_github_username() == "Alice"
+    probe.assert_called_once()
+
+
+def test_expired_probe_is_run_again(mocker):
+    from pygitgo.auth import ssh_utils
+    from datetime import timedelta
+    probe = mocker.patch("pygitgo.auth.ssh_utils._get_github_ssh_response", return_value=(GREETING, False, None))
+    mocker.patch.object(ssh_utils, "PROBE_TTL", timedelta(seconds=-1))
+
+    ssh_utils._get_cached_ssh_response()
+    ssh_utils.clear_ssh_cache()
+    ssh_utils._get_cached_ssh_response()
+
+    assert probe.call_count == 2
+
+
+def test_failed_probes_are_not_remembered(mocker):
+    from pygitgo.auth import ssh_utils
+    probe = mocker.patch("pygitgo.auth.ssh_utils._get_github_ssh_response", return_value=("", True, None))
+
+    ssh_utils._get_cached_ssh_response()
+    ssh_utils.clear_ssh_cache()
+    ssh_utils._get_cached_ssh_response()
+
+    assert probe.call_count == 2
+    assert state_store.items(ssh_utils.PROBE_NAMESPACE) == {}
+
+
+def test_permission_denied_forgets_the_host(mocker):
+    from pygitgo.auth import ssh_utils
+    mocker.patch("pygitgo.auth.ssh_utils._get_github_ssh_response", side_effect=[
+        (GREETING, False, None),
+        ("git@github.com: Permission denied (publickey).", False, None),
+    ])
+    ssh_utils._get_cached_ssh_response()
+    assert state_store.items(ssh_utils.PROBE_NAMESPACE)
+
+    # Same host, different key set: the rejection still drops the old entry.
+    ssh_utils.clear_ssh_cache()
+    mocker.patch("pygitgo.auth.ssh_utils._key_fingerprint", return_value="other-key")
+    ssh_utils._get_cached_ssh_response()
+
+    assert state_store.items(ssh_utils.PROBE_NAMESPACE) == {}
+
+
+def test_probe_cache_is_keyed_by_key_fingerprint(mocker):
+    from pygitgo.auth import ssh_utils
+    probe = mocker.patch("pygitgo.auth.ssh_utils._get_github_ssh_response", return_value=(GREETING, False, None))
+    fingerprint = mocker.patch("pygitgo.auth.ssh_utils._key_fingerprint", return_value="first-key")
+    ssh_utils._get_cached_ssh_response()
+
+    ssh_utils.clear_ssh_cache()
+    fingerprint.return_value = "second-key"
+    ssh_utils._get_cached_ssh_response()
+
+    assert probe.call_count == 2
+
+
+def test_non_github_hosts_are_probed_once_per_run(mocker):
+    from pygitgo.auth import ssh_utils
+    probe = mocker.patch("pygitgo.auth.ssh_utils._get_ssh_response", return_value=("Welcome to GitLab, @alice!", False, None))
+    mocker.patch("pygitgo.auth.ssh_utils.ensure_known_host")
+    mocker.patch("yaspin.yaspin")
+
+    assert check_connection(host="gitlab.com") is False
+    assert check_connection(host="gitlab.com") is False
+    probe.assert_called_once_with("gitlab.com")
+
+
+def _ssh_config(mocker, stdout, returncode=0):
+    return mocker.patch("pygitgo.auth.ssh_utils.run_traced", return_value=mocker.MagicMock(stdout=stdout, returncode=returncode))
+
+
+def test_ssh_endpoint_follows_ssh_config(mocker):
+    from pygitgo.auth.ssh_utils import _ssh_endpoint
+    _ssh_config(mocker, "user git\nhostname ssh.github.com\nport 443\nproxycommand none\n")
+    assert _ssh_endpoint("github.com") == ("ssh.github.com", 443)
+
+
+def test_ssh_endpoint_skips_proxied_hosts(mocker):
+    from pygitgo.auth.ssh_utils import _ssh_endpoint
+    _ssh_config(mocker, "hostname github.com\nport 22\nproxyjump bastion\n")
+    assert _ssh_endpoint("github.com") is None
+
+
+def test_blocked_port_fails_without_running_ssh(mocker):
+    from pygitgo.auth.ssh_utils import _get_ssh_response, classify_connection_error
+    from pygitgo.utils.reachability import Reachability
+    mocker.patch("pygitgo.auth.ssh_utils._ssh_endpoint", return_value=("github.com", 22))
+    check = mocker.patch("pygitgo.auth.ssh_utils.check_tcp", return_value=Reachability())
+    fake_run = mocker.patch("pygitgo.auth.ssh_utils.run_traced")
+
+    raw_output, timed_out, os_error = _get_ssh_response("github.com")
+
+    fake_run.assert_not_called()
+    check.assert_called_once_with([("github.com", 22), ("ssh.github.com", 443)], stop_on=("github.com", 22))
+    assert timed_out is True
+    assert classify_connection_error(raw_output, timed_out, os_error).startswith("TCP: no answer on port 22")
+
+
+def test_blocked_port_22_suggests_port_443(mocker):
+    from pygitgo.auth.ssh_utils import _precheck, classify_connection_error
+    from pygitgo.utils.reachability import Reachability
+    mocker.patch("pygitgo.auth.ssh_utils._ssh_endpoint", return_value=("github.com", 22))
+    mocker.patch("pygitgo.auth.ssh_utils.check_tcp", return_value=Reachability(connected=[("ssh.github.com", 443)]))
+
+    cause = classify_connection_error(*_precheck("github.com"))
+
+    assert "port 443 is reachable" in cause
+
+
+@pytest.mark.parametrize("reachability, expected", [
+    ({"resolved": False}, "DNS:"),
+    ({"refused": True}, "TCP: connection refused"),
+])
+def test_precheck_reports_failed_layer(mocker, reachability, expected):
+    from pygitgo.auth.ssh_utils import _precheck, classify_connection_error
+    from pygitgo.utils.reachability import Reachability
+    mocker.patch("pygitgo.auth.ssh_utils._ssh_endpoint", return_value=("gitlab.com", 22))
+    mocker.patch("pygitgo.auth.ssh_utils.check_tcp", return_value=Reachability(**reachability))
+
+    assert classify_connection_error(*_precheck("gitlab.com")).startswith(expected)
+
+
+def test_reachable_host_runs_ssh(mocker):
+    from pygitgo.auth.ssh_utils import _precheck
+    from pygitgo.utils.reachability import Reachability
+    mocker.patch("pygitgo.auth.ssh_utils._ssh_endpoint", return_value=("github.com", 22))
+    mocker.patch("pygitgo.auth.ssh_utils.check_tcp", return_value=Reachability(connected=[("github.com", 22)]))
+
+    assert _precheck("github.com") is None
+
+
+def test_precheck_goes_ahead_when_dns_is_slow(mocker):
+    from pygitgo.auth.ssh_utils import _precheck
+    from pygitgo.utils.reachability import Reachability
+
+    mocker.patch("pygitgo.auth.ssh_utils._ssh_endpoint", return_value=("github.com", 22))
+    mocker.patch("pygitgo.auth.ssh_utils.check_tcp", return_value=Reachability(resolved=None))
+
+    assert _precheck("github.com") is None
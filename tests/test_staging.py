@@ -1,12 +1,16 @@
 from pygitgo.commands.staging import get_changed_files, display_file_picker, selective_stage
+from pygitgo.commands.staging import ADD_COMMAND, ADD_FROM_STDIN_COMMAND
+from pygitgo.commands.git_status import StatusEntry, StatusSnapshot
+from conftest import make_status
 from unittest.mock import patch
+import pytest
 
 
-@patch("pygitgo.commands.staging.run_command")
-def test_get_changed_files_with_changes(mock_run_command):
-    mock_run_command.return_value = "M  src/main.py\n?? new_file.txt\nM  README.md"
+@patch("pygitgo.commands.staging.get_status")
+def test_get_changed_files_with_changes(mock_get_status):
+    mock_get_status.return_value = make_status("M  src/main.py", "?? new_file.txt", "M  README.md")
 
-    files = get_changed_files()
+    files = list(get_changed_files())
 
     assert len(files) == 3
     assert files[0]["path"] == "src/main.py"
@@ -17,110 +21,166 @@ def test_get_changed_files_with_changes(mock_run_command):
     assert files[2]["label"] == "modified"
 
 
-@patch("pygitgo.commands.staging.run_command")
-def test_get_changed_files_no_changes(mock_run_command):
+@patch("pygitgo.commands.staging.get_status")
+def test_get_changed_files_no_changes(mock_get_status):
     from pygitgo.exceptions import GitCommandError
-    mock_run_command.side_effect = GitCommandError(["git", "status"])
+    mock_get_status.side_effect = GitCommandError(["git", "status"])
 
-    files = get_changed_files()
+    files = list(get_changed_files())
 
     assert files == []
 
 
-@patch("pygitgo.commands.staging.run_command")
-def test_get_changed_files_empty_status(mock_run_command):
-    mock_run_command.return_value = ""
+@patch("pygitgo.commands.staging.get_status")
+def test_get_changed_files_empty_status(mock_get_status):
+    mock_get_status.return_value = make_status()
 
-    files = get_changed_files()
+    files = list(get_changed_files())
 
     assert files == []
 
 
-@patch("pygitgo.commands.staging.run_command")
-def test_get_changed_files_deleted_file(mock_run_command):
-    mock_run_command.return_value = "D  old_file.py"
+@patch("pygitgo.commands.staging.get_status")
+def test_get_changed_files_deleted_file(mock_get_status):
+    mock_get_status.return_value = make_status("D  old_file.py")
 
-    files = get_changed_files()
+    files = list(get_changed_files())
 
     assert len(files) == 1
     assert files[0]["path"] == "old_file.py"
     assert files[0]["label"] == "deleted"
 
 
-@patch("pygitgo.commands.staging.pick")
-def test_display_file_picker_select_specific(mock_pick):
-    mock_pick.return_value = [("(modified) src/main.py", 0), ("(modified) README.md", 2)]
+@patch("pygitgo.commands.staging.get_status")
+def test_get_changed_files_rename_uses_new_path(mock_get_status):
+    mock_get_status.return_value = StatusSnapshot(entries=[StatusEntry("renamed", "R", ".", "new.py", "old.py")])
 
-    files = [
-        {"status": "M", "label": "modified", "path": "src/main.py"},
-        {"status": "??", "label": "new file", "path": "new_file.txt"},
-        {"status": "M", "label": "modified", "path": "README.md"},
-    ]
+    files = list(get_changed_files())
 
-    selected = display_file_picker(files)
+    assert files == [{"status": "R", "label": "renamed", "path": "new.py"}]
 
-    assert selected == ["src/main.py", "README.md"]
-    mock_pick.assert_called_once()
 
+@patch("pygitgo.commands.file_picker.pick_files")
+def test_display_file_picker_returns_pathspecs(mock_pick_files):
+    mock_pick_files.return_value = {"src/", "README.md"}
+    files = [{"status": "M", "label": "modified", "path": "src/main.py"}]
 
-@patch("pygitgo.commands.staging.pick")
-def test_display_file_picker_select_all(mock_pick):
-    mock_pick.return_value = [("(modified) src/main.py", 0), ("(new file) new_file.txt", 1)]
+    assert display_file_picker(files) == {"src/", "README.md"}
+    mock_pick_files.assert_called_once_with(files)
 
-    files = [
-        {"status": "M", "label": "modified", "path": "src/main.py"},
-        {"status": "??", "label": "new file", "path": "new_file.txt"},
-    ]
 
-    selected = display_file_picker(files)
+@patch("pygitgo.commands.staging.run_command")
+@patch("pygitgo.commands.staging.success")
+def test_selective_stage(mock_success, mock_run_command):
+    selected_files = ["src/main.py", "README.md"]
 
-    assert selected == ["src/main.py", "new_file.txt"]
+    selective_stage(selected_files)
 
+    mock_run_command.assert_called_once_with(
+        ADD_FROM_STDIN_COMMAND, loading_msg="Staging 2 file(s)...", ok_text=None, input="README.md\0src/main.py\0"
+    )
+    mock_success.assert_called_once_with("\n2 path(s) staged for commit.")
 
-@patch("pygitgo.commands.staging.pick")
-def test_display_file_picker_cancel(mock_pick):
-    mock_pick.return_value = []
 
-    files = [
-        {"status": "M", "label": "modified", "path": "src/main.py"},
-    ]
+@patch("pygitgo.commands.staging.run_command")
+@patch("pygitgo.commands.staging.success")
+def test_selective_stage_single_file(mock_success, mock_run_command):
+    selective_stage(["README.md"])
 
-    selected = display_file_picker(files)
+    mock_run_command.assert_called_once()
+    assert mock_run_command.call_args.kwargs["input"] == "README.md\0"
+    mock_success.assert_called_once()
 
-    assert selected == []
 
+@patch("pygitgo.commands.staging.warning")
+@patch("pygitgo.commands.staging.success")
+def test_selective_stage_reports_rejected_paths(mock_success, mock_warning, mocker):
+    from pygitgo.exceptions import GitCommandError
+    fake_run = mocker.patch("pygitgo.commands.staging.run_command", side_effect=[
+        GitCommandError(ADD_FROM_STDIN_COMMAND, stderr="fatal: pathspec 'gone.py' did not match any files"),
+        None,
+    ])
 
-@patch("pygitgo.commands.staging.pick")
-def test_display_file_picker_select_single(mock_pick):
-    mock_pick.return_value = [("(new file) new_file.txt", 1)]
+    selective_stage(["a.py", "gone.py", "b.py"])
 
-    files = [
-        {"status": "M", "label": "modified", "path": "src/main.py"},
-        {"status": "??", "label": "new file", "path": "new_file.txt"},
-    ]
+    assert fake_run.call_count == 2
+    assert fake_run.call_args.kwargs["input"] == "a.py\0b.py\0"
+    mock_warning.assert_called_once_with("Could not stage 'gone.py': no longer exists or has no changes.")
+    mock_success.assert_called_once_with("\n2 path(s) staged for commit.")
 
-    selected = display_file_picker(files)
 
-    assert selected == ["new_file.txt"]
+@patch("pygitgo.commands.staging.warning")
+def test_selective_stage_nothing_staged(mock_warning, mocker):
+    from pygitgo.exceptions import GitCommandError, GitGoError
+    mocker.patch("pygitgo.commands.staging.run_command", side_effect=GitCommandError(
+        ADD_FROM_STDIN_COMMAND, stderr="fatal: pathspec 'gone.py' did not match any files"
+    ))
 
+    with pytest.raises(GitGoError):
+        selective_stage(["gone.py"])
 
-@patch("pygitgo.commands.staging.run_command")
-@patch("pygitgo.commands.staging.success")
-def test_selective_stage(mock_success, mock_run_command):
-    selected_files = ["src/main.py", "README.md"]
 
-    selective_stage(selected_files)
+def test_selective_stage_other_errors_propagate(mocker):
+    from pygitgo.exceptions import GitCommandError
+    mocker.patch("pygitgo.commands.staging.run_command", side_effect=GitCommandError(
+        ADD_FROM_STDIN_COMMAND, stderr="fatal: Unable to create '.git/index.lock': File exists."
+    ))
 
-    assert mock_run_command.call_count == 2
-    mock_run_command.assert_any_call(["git", "add", "--", "src/main.py"])
-    mock_run_command.assert_any_call(["git", "add", "--", "README.md"])
-    mock_success.assert_called_once()
+    with pytest.raises(GitCommandError):
+        selective_stage(["a.py"])
 
 
-@patch("pygitgo.commands.staging.run_command")
 @patch("pygitgo.commands.staging.success")
-def test_selective_stage_single_file(mock_success, mock_run_command):
-    selective_stage(["README.md"])
+def test_selective_stage_chunks_arguments_on_old_git(mock_success, mocker):
+    from pygitgo.exceptions import GitCommandError
+    mocker.patch("pygitgo.commands.staging.MAX_ARGV_CHARS", 14)
+    fake_run = mocker.patch("pygitgo.commands.staging.run_command", side_effect=[
+        GitCommandError(ADD_FROM_STDIN_COMMAND, stderr="error: unknown option `pathspec-from-file=-'"),
+        None, None,
+    ])
 
-    mock_run_command.assert_called_once_with(["git", "add", "--", "README.md"])
-    mock_success.assert_called_once()
+    selective_stage(["one.py", "six.py", "two.py"])
+
+    commands = [call.args[0] for call in fake_run.call_args_list[1:]]
+    assert commands == [ADD_COMMAND + ["--", "one.py", "six.py"], ADD_COMMAND + ["--", "two.py"]]
+
+
+def test_selective_stage_real_repository(tmp_path, monkeypatch):
+    import subprocess
+    monkeypatch.chdir(tmp_path)
+    subprocess.run(["git", "init", "-q", "-b", "main"], check=True)
+    for name in ["keep.py", "*.py", "skip.py"]:
+        (tmp_path / name).write_text("x\n", encoding="utf-8")
+
+    selective_stage(["keep.py", "*.py"])
+
+    staged = subprocess.run(["git", "diff", "--cached", "--name-only", "-z"], capture_output=True, text=True).stdout
+    assert sorted(staged.split("\0")[:-1]) == ["*.py", "keep.py"]
+
+
+def test_selective_stage_odd_paths_real_repository(tmp_path, monkeypatch):
+    import subprocess
+    import os
+    from pygitgo.commands.staging import get_changed_files
+    monkeypatch.chdir(tmp_path)
+    subprocess.run(["git", "init", "-q", "-b", "main"], check=True)
+    names = ["with space.txt", "café.txt", 'quote"d.txt', os.fsdecode(b"raw\xff.txt")]
+    try:
+        for name in names:
+            (tmp_path / name).write_text("x\n", encoding="utf-8")
+    except (OSError, UnicodeEncodeError):
+        pytest.skip("file system rejects these names")
+
+    selective_stage({record["path"] for record in get_changed_files()})
+
+    staged = subprocess.run(["git", "diff", "--cached", "--name-only", "-z"], capture_output=True).stdout
+    assert sorted(staged.split(b"\0")[:-1]) == sorted(os.fsencode(name) for name in names)
+
+
+@patch("pygitgo.commands.staging.get_status")
+def test_get_changed_files_submodule_label(mock_get_status):
+    mock_get_status.return_value = StatusSnapshot(entries=[StatusEntry("changed", ".", "M", "vendor/lib", submodule="SC.U")])
+
+    files = list(get_changed_files())
+
+    assert files[0]["label"] == "submodule: new commits, untracked content"
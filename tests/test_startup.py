@@ -0,0 +1,81 @@
+from pathlib import Path
+import subprocess
+import json
+import sys
+import os
+
+
+SRC_DIR = Path(__file__).parent.parent / "src"
+
+# Cold import budget for `gitgo log`, in milliseconds. Generous enough for slow
+# CI runners, tight enough to catch a heavy module sneaking back into startup.
+IMPORT_BUDGET_MS = 150
+
+HEAVY_MODULES = ["yaspin", "curses", "urllib.request", "zipfile", "pygitgo.auth.manager", "pygitgo.commands.push"]
+
+
+def _import_times(code):
+    env = {**os.environ, "PYTHONPATH": str(SRC_DIR)}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True, text=True, env=env, check=True,
+    )
+
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _self, cumulative, name = line[len("import time:"):].split("|")
+        if not cumulative.strip().isdigit():
+            continue
+        times[name.rstrip()] = int(cumulative)
+    return times
+
+
+def test_log_startup_skips_heavy_modules():
+    times = _import_times("import pygitgo.main as m; m.load_handler('log')")
+    loaded = {name.strip() for name in times}
+
+    for module in HEAVY_MODULES:
+        assert module not in loaded
+
+
+def test_log_startup_within_import_budget():
+    times = _import_times("import pygitgo.main as m; m.load_handler('log')")
+    top_level_us = sum(
+        cumulative for name, cumulative in times.items()
+        if name.startswith(" pygitgo")
+    )
+
+    assert top_level_us / 1000 < IMPORT_BUDGET_MS
+
+
+# Cold cost of fanning out the preflight queries, in milliseconds. The queries
+# themselves take a few; importing asyncio alone used to take about 45.
+GATHER_BUDGET_MS = 25
+
+
+def test_gather_commands_cold_start_is_cheap():
+    code = (
+        "import pygitgo.utils.executor as e, sys, time, json\n"
+        "before = set(sys.modules)\n"
+        "start = time.perf_counter()\n"
+        "e.gather_commands([[sys.executable, '-c', 'pass']])\n"
+        "elapsed = (time.perf_counter() - start) * 1000\n"
+        "print(json.dumps({'ms': elapsed, 'loaded': sorted(set(sys.modules) - before)}))\n"
+    )
+    env = {**os.environ, "PYTHONPATH": str(SRC_DIR)}
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env, check=True)
+    report = json.loads(result.stdout)
+
+    assert "asyncio" not in report["loaded"]
+    assert report["ms"] < GATHER_BUDGET_MS
+
+
+def test_push_startup_skips_curses():
+    # Only `push --select` opens the file picker.
+    times = _import_times("import pygitgo.main as m; m.load_handler('push')")
+    loaded = {name.strip() for name in times}
+
+    assert "curses" not in loaded
+    assert "pygitgo.commands.file_picker" not in loaded
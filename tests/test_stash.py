@@ -115,9 +115,9 @@ def test_git_stash_drop_failure(mocker):
 
 def test_git_stash_list_success(mocker):
     stash_list_output = "stash@{0}||2026-06-01 10:00:00||Auto-Save\nstash@{1}||2026-06-01 10:05:00||My-State"
-    fake_run = mocker.patch("pygitgo.commands.stash.run_command", return_value=stash_list_output)
-    result = git_stash_list()
-    assert result == stash_list_output
+    fake_run = mocker.patch("pygitgo.commands.stash.run_command_iter", return_value=iter(stash_list_output.splitlines()))
+    result = list(git_stash_list())
+    assert result == stash_list_output.splitlines()
     fake_run.assert_called_once_with(
         [
             "git", "stash", "list",
@@ -131,11 +131,11 @@ def test_git_stash_list_success(mocker):
 
 def test_git_stash_list_failure(mocker):
     fake_run = mocker.patch(
-        "pygitgo.commands.stash.run_command",
+        "pygitgo.commands.stash.run_command_iter",
         side_effect=GitCommandError(["git", "stash", "list"])
     )
-    result = git_stash_list()
-    assert result == ""
+    result = list(git_stash_list())
+    assert result == []
 
 
 def test_git_stash_clear_success(mocker):
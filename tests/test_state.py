@@ -27,7 +27,7 @@ def test_validate_state_id_out_scope(state_id, mocker):
     fake_error.assert_called_with("ID out of range. Range is 1 to 3.")
 
 def test_all_save_state_no_output(mocker):
-    mocker.patch("pygitgo.commands.state.git_stash_list", return_value="")
+    mocker.patch("pygitgo.commands.state.git_stash_list", return_value=iter([]))
     mocker.patch("pygitgo.commands.state.info")
     result = all_save_state()
     assert result == []
@@ -37,7 +37,7 @@ def test_all_save_state_with_output(mocker):
         "stash@{0}||2023-10-27 10:00:00||Test stash\n"
         "stash@{1}||2023-10-27 10:05:00||Another stash"
     )
-    mocker.patch("pygitgo.commands.state.git_stash_list", return_value=output)
+    mocker.patch("pygitgo.commands.state.git_stash_list", return_value=iter(output.splitlines()))
 
     result = all_save_state()
 
@@ -53,9 +53,38 @@ def test_all_save_state_with_output(mocker):
         "stash_index": 0
     }
 
+def test_all_save_state_in_worktree_shows_own_branch(mocker):
+    context = mocker.Mock(has_linked_worktrees=True, branch="feat")
+    mocker.patch("pygitgo.commands.state.get_repo_context", return_value=context)
+    output = (
+        "stash@{0}||2023-10-27 10:10:00||On feat: newest\n"
+        "stash@{1}||2023-10-27 10:05:00||On main: other worktree\n"
+        "stash@{2}||2023-10-27 10:00:00||WIP on feat: 1234 oldest"
+    )
+    mocker.patch("pygitgo.commands.state.git_stash_list", return_value=iter(output.splitlines()))
+
+    result = all_save_state()
+
+    assert [(state["id"], state["stash_index"]) for state in result] == [(1, 2), (2, 0)]
+
+def test_delete_state_all_in_worktree_drops_own_states(mocker):
+    mocker.patch("pygitgo.commands.state.confirm", return_value=True)
+    mocker.patch("pygitgo.commands.state.worktree_branch", return_value="feat")
+    mocker.patch("pygitgo.commands.state.all_save_state", return_value=[
+        {"id": 1, "stash_index": 2}, {"id": 2, "stash_index": 0},
+    ])
+    fake_clear = mocker.patch("pygitgo.commands.state.git_stash_clear")
+    fake_drop = mocker.patch("pygitgo.commands.state.git_stash_drop", return_value=True)
+    mocker.patch("pygitgo.commands.state.success")
+
+    delete_state("-a")
+
+    fake_clear.assert_not_called()
+    assert [call.kwargs["stash_id"] for call in fake_drop.call_args_list] == ["2", "0"]
+
 def test_all_save_state_malformed_line(mocker):
     output = "malformed_line_here\nstash@{1}||2023-10-27 10:05:00||Another stash"
-    mocker.patch("pygitgo.commands.state.git_stash_list", return_value=output)
+    mocker.patch("pygitgo.commands.state.git_stash_list", return_value=iter(output.splitlines()))
     fake_warning = mocker.patch("pygitgo.commands.state.warning")
 
     result = all_save_state()
@@ -107,7 +136,7 @@ def test_load_state_no_args(mocker):
     fake_success.assert_called_once_with("State 'msg2' restored.")
 
 def test_save_state_no_args(mocker):
-    mocker.patch("pygitgo.commands.state.run_command", return_value="M file")
+    mocker.patch("pygitgo.commands.state.has_changes", return_value=True)
     fake_push = mocker.patch(
         "pygitgo.commands.state.git_stash_push",
         return_value=True
@@ -120,7 +149,7 @@ def test_save_state_no_args(mocker):
     fake_success.assert_called_once_with("State 'Auto-Save' saved.")
 
 def test_save_state_with_name(mocker):
-    mocker.patch("pygitgo.commands.state.run_command", return_value="M file")
+    mocker.patch("pygitgo.commands.state.has_changes", return_value=True)
     fake_push = mocker.patch(
         "pygitgo.commands.state.git_stash_push",
         return_value=True
@@ -283,19 +312,19 @@ def test_load_state_keyboard_interrupt_cleanup_fails(mocker):
     fake_warning.assert_any_call("Could not clean up automatically. Run 'git status' to check, then 'git checkout -- .' if needed.")
 
 def test_save_state_local_changes_error(mocker):
-    mocker.patch("pygitgo.commands.state.run_command", side_effect=GitCommandError(["cmd"]))
+    mocker.patch("pygitgo.commands.state.has_changes", side_effect=GitCommandError(["cmd"]))
     fake_warning = mocker.patch("pygitgo.commands.state.warning")
     save_state()
     fake_warning.assert_called_once_with("Could not check for local changes - make sure you're in a valid git repository.")
 
 def test_save_state_no_changes(mocker):
-    mocker.patch("pygitgo.commands.state.run_command", return_value="")
+    mocker.patch("pygitgo.commands.state.has_changes", return_value=False)
     fake_info = mocker.patch("pygitgo.commands.state.info")
     save_state()
     fake_info.assert_called_once_with("No local changes to save.")
 
 def test_save_state_push_fails(mocker):
-    mocker.patch("pygitgo.commands.state.run_command", return_value="M test.py")
+    mocker.patch("pygitgo.commands.state.has_changes", return_value=True)
     mocker.patch("pygitgo.commands.state.git_stash_push", return_value=None)
     fake_error = mocker.patch("pygitgo.commands.state.error")
     save_state()
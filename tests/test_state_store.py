@@ -0,0 +1,107 @@
+from pygitgo.utils import state_store
+from datetime import timedelta
+import multiprocessing
+import json
+import os
+import pytest
+
+
+def test_missing_key_returns_default():
+    assert state_store.get("ns", "missing") is None
+    assert state_store.get("ns", "missing", "fallback") == "fallback"
+
+
+def test_set_and_get_roundtrip():
+    state_store.set("ns", "key", {"a": [1, 2]})
+
+    assert state_store.get("ns", "key") == {"a": [1, 2]}
+    assert state_store.items("ns") == {"key": {"a": [1, 2]}}
+
+
+def test_namespaces_are_separate():
+    state_store.set("one", "key", 1)
+    state_store.set("two", "key", 2)
+
+    assert state_store.get("one", "key") == 1
+    assert state_store.get("two", "key") == 2
+
+
+def test_expired_entries_are_hidden_and_pruned():
+    state_store.set("ns", "old", "value", ttl=timedelta(seconds=-1))
+    state_store.set("ns", "new", "value", ttl=timedelta(hours=1))
+
+    assert state_store.get("ns", "old") is None
+    assert state_store.items("ns") == {"new": "value"}
+
+    on_disk = json.loads((state_store.STATE_DIR / state_store.STATE_FILE_NAME).read_text())
+    assert "old" not in on_disk["ns"]
+
+
+def test_delete_keys_and_namespaces():
+    state_store.set_many("ns", {"a": 1, "b": 2})
+    state_store.set("other", "c", 3)
+
+    state_store.delete("ns", ["a"])
+    assert state_store.items("ns") == {"b": 2}
+
+    state_store.delete("ns")
+    assert state_store.items("ns") == {}
+    assert state_store.get("other", "c") == 3
+
+
+def test_write_is_atomic_and_leaves_no_temp_files():
+    state_store.set("ns", "key", "value")
+
+    names = os.listdir(state_store.STATE_DIR)
+    assert not [name for name in names if name.endswith(".tmp")]
+
+
+def test_sees_writes_from_other_processes():
+    state_store.set("ns", "key", "first")
+    assert state_store.get("ns", "key") == "first"
+
+    # Another process replaces the file behind our back.
+    path = state_store.STATE_DIR / state_store.STATE_FILE_NAME
+    replacement = path.with_name("replacement.json")
+    replacement.write_text(json.dumps({"ns": {"key": {"value": "second", "expires_at": None}}}))
+    os.replace(replacement, path)
+
+    assert state_store.get("ns", "key") == "second"
+
+
+def test_corrupt_file_reads_as_empty():
+    state_store.STATE_DIR.mkdir(parents=True, exist_ok=True)
+    (state_store.STATE_DIR / state_store.STATE_FILE_NAME).write_text("{not json")
+    state_store.clear_state_cache()
+
+    assert state_store.get("ns", "key") is None
+    state_store.set("ns", "key", "value")
+    assert state_store.get("ns", "key") == "value"
+
+
+def test_unwritable_store_is_ignored(mocker):
+    mocker.patch("pygitgo.utils.state_store._write", side_effect=PermissionError("read-only"))
+
+    assert state_store.set("ns", "key", "value") is False
+    assert state_store.get("ns", "key") is None
+
+
+def _increment(state_dir, count):
+    state_store.STATE_DIR = state_dir
+    for _ in range(count):
+        with state_store._transaction() as data:
+            entries = data.setdefault("ns", {})
+            current = entries.get("counter", {"value": 0})["value"]
+            entries["counter"] = {"value": current + 1, "expires_at": None}
+
+
+@pytest.mark.skipif(os.name == "nt", reason="relies on fork")
+def test_concurrent_writers_do_not_lose_updates():
+    context = multiprocessing.get_context("fork")
+    workers = [context.Process(target=_increment, args=(state_store.STATE_DIR, 25)) for _ in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert state_store.get("ns", "counter") == 100
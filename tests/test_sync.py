@@ -119,16 +119,14 @@ def test_sync_merge_conflict(mock_run_command, mock_get_branch, mock_ensure_insi
 @patch("pygitgo.commands.sync.git_commit", return_value=False)
 @patch("pygitgo.commands.sync.git_push")
 @patch("pygitgo.commands.sync.banner")
-def test_sync_no_new_changes_but_unpushed(mock_banner, mock_push, mock_commit, mock_run_command, mock_get_branch, mock_ensure_inside_git):
-    def side_effect(*args, **kwargs):
-        if args[0][1] == "log":
-            return "abcdef1 unpushed commit"
-        return ""
-    mock_run_command.side_effect = side_effect
+def test_sync_no_new_changes_but_unpushed(mock_banner, mock_push, mock_commit, mock_run_command, mock_get_branch, mock_ensure_inside_git, mocker):
+    mock_run_command.return_value = ""
+    fake_unpushed = mocker.patch("pygitgo.commands.sync.has_unpushed_commits", return_value=True)
 
     args = Namespace(message="msg")
     sync_operation(args)
 
+    fake_unpushed.assert_called_once_with("main", on_remote=True)
     mock_push.assert_called_with("main")
     mock_banner.assert_called_once()
 
@@ -137,12 +135,9 @@ def test_sync_no_new_changes_but_unpushed(mock_banner, mock_push, mock_commit, m
 @patch("pygitgo.commands.sync.run_command")
 @patch("pygitgo.commands.sync.git_commit", return_value=False)
 @patch("pygitgo.commands.sync.git_push")
-def test_sync_clean_tree(mock_push, mock_commit, mock_run_command, mock_get_branch, mock_ensure_inside_git):
-    def side_effect(*args, **kwargs):
-        if args[0][1] == "log":
-            return "   "  # Empty output meaning no unpushed commits
-        return ""
-    mock_run_command.side_effect = side_effect
+def test_sync_clean_tree(mock_push, mock_commit, mock_run_command, mock_get_branch, mock_ensure_inside_git, mocker):
+    mock_run_command.return_value = ""
+    mocker.patch("pygitgo.commands.sync.has_unpushed_commits", return_value=False)
 
     args = Namespace(message="msg")
     sync_operation(args)
@@ -156,12 +151,9 @@ def test_sync_clean_tree(mock_push, mock_commit, mock_run_command, mock_get_bran
 @patch("pygitgo.commands.sync.git_commit", return_value=False)
 @patch("pygitgo.commands.sync.git_push")
 @patch("pygitgo.commands.sync.banner")
-def test_sync_unpushed_check_fails(mock_banner, mock_push, mock_commit, mock_run_command, mock_get_branch, mock_ensure_inside_git):
-    def side_effect(*args, **kwargs):
-        if args[0][1] == "log":
-            raise GitCommandError(["git", "log"], stderr="fatal: bad revision")
-        return ""
-    mock_run_command.side_effect = side_effect
+def test_sync_unpushed_check_fails(mock_banner, mock_push, mock_commit, mock_run_command, mock_get_branch, mock_ensure_inside_git, mocker):
+    mock_run_command.return_value = ""
+    mocker.patch("pygitgo.commands.sync.has_unpushed_commits", side_effect=GitCommandError(["git", "rev-list"], stderr="fatal: bad revision"))
 
     args = Namespace(message="msg")
     sync_operation(args)
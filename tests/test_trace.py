@@ -0,0 +1,134 @@
+from pygitgo.utils.trace import start_trace, write_trace, span, run_traced, urlopen, is_tracing
+from pygitgo.utils.executor import run_command, run_command_iter
+from pygitgo.exceptions import GitCommandError
+import urllib.request
+import urllib.error
+import json
+import sys
+import pytest
+
+
+@pytest.fixture
+def trace_file(tmp_path):
+    path = tmp_path / "trace.json"
+    start_trace(str(path))
+    yield path
+    write_trace()
+
+
+def _events(path):
+    write_trace()
+    return json.loads(path.read_text(encoding="utf-8"))["traceEvents"]
+
+
+def test_span_is_a_no_op_without_trace():
+    assert not is_tracing()
+    with span("noop", "test") as span_args:
+        assert span_args is None
+
+
+def test_span_records_complete_event(trace_file):
+    with span("work", "test", step=1) as span_args:
+        span_args["result"] = "ok"
+
+    (event,) = _events(trace_file)
+    assert event["name"] == "work"
+    assert event["cat"] == "test"
+    assert event["ph"] == "X"
+    assert event["dur"] >= 0
+    assert event["args"] == {"step": 1, "result": "ok"}
+
+
+def test_span_records_error(trace_file):
+    with pytest.raises(ValueError):
+        with span("boom", "test"):
+            raise ValueError("nope")
+
+    (event,) = _events(trace_file)
+    assert event["args"]["error"] == "ValueError"
+
+
+def test_run_command_records_exit_code_and_bytes(trace_file):
+    run_command([sys.executable, "-c", "import sys; sys.stdout.write('héllo'); sys.stderr.write('ab')"])
+
+    (event,) = _events(trace_file)
+    assert event["cat"] == "subprocess"
+    assert event["args"]["argv"][0] == sys.executable
+    assert event["args"]["exit_code"] == 0
+    assert event["args"]["stdout_bytes"] == 6
+    assert event["args"]["stderr_bytes"] == 2
+
+
+@pytest.mark.parametrize("command, name", [
+    (["git", "-c", "gpg.format=ssh", "-c", "user.signingkey=~/.ssh/id.pub", "commit", "-m", "x"], "git commit"),
+    (["git", "-C", "/repo", "status"], "git status"),
+    (["ssh", "-T", "-o", "BatchMode=yes", "git@github.com"], "ssh git@github.com"),
+    (["git", "--version"], "git"),
+])
+def test_span_name_skips_option_values(command, name):
+    from pygitgo.utils.trace import _command_name
+    assert _command_name(command) == name
+
+
+def test_run_command_failure_is_traced(trace_file):
+    with pytest.raises(GitCommandError):
+        run_command([sys.executable, "-c", "import sys; sys.exit(4)"])
+
+    (event,) = _events(trace_file)
+    assert event["args"]["exit_code"] == 4
+
+
+def test_run_command_iter_is_traced(trace_file):
+    records = run_command_iter([sys.executable, "-c", "import sys; sys.stdout.buffer.write(b'a\\nb\\n')"])
+    assert list(records) == ["a", "b"]
+
+    (event,) = _events(trace_file)
+    assert event["args"]["exit_code"] == 0
+    assert event["args"]["stdout_bytes"] == 4
+
+
+def test_run_traced_marks_timeouts(trace_file):
+    import subprocess
+    with pytest.raises(subprocess.TimeoutExpired):
+        run_traced([sys.executable, "-c", "import time; time.sleep(5)"], timeout=0.1)
+
+    (event,) = _events(trace_file)
+    assert event["args"]["timed_out"] is True
+
+
+def test_urlopen_records_status_and_bytes(trace_file, mocker):
+    response = mocker.MagicMock(status=200)
+    response.read.return_value = b"{}"
+    mocker.patch("urllib.request.urlopen").return_value.__enter__.return_value = response
+
+    request = urllib.request.Request("https://api.github.com/user/repos", method="POST")
+    with urlopen(request, timeout=5) as resp:
+        assert resp.read() == b"{}"
+
+    (event,) = _events(trace_file)
+    assert event["name"] == "POST api.github.com"
+    assert event["cat"] == "http"
+    assert event["args"]["status"] == 200
+    assert event["args"]["response_bytes"] == 2
+
+
+def test_urlopen_records_http_errors(trace_file, mocker):
+    mocker.patch("urllib.request.urlopen", side_effect=urllib.error.HTTPError("url", 404, "Not Found", {}, None))
+
+    with pytest.raises(urllib.error.HTTPError):
+        with urlopen("https://example.com/missing", timeout=5):
+            pass
+
+    (event,) = _events(trace_file)
+    assert event["args"]["status"] == 404
+    assert event["args"]["error"] == "HTTPError"
+
+
+def test_write_trace_reports_unwritable_path(tmp_path, mocker):
+    fake_warning = mocker.patch("pygitgo.utils.cli_io.warning")
+    start_trace(str(tmp_path / "missing" / "trace.json"))
+
+    write_trace()
+
+    fake_warning.assert_called_once()
+    assert not is_tracing()
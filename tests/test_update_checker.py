@@ -1,63 +1,34 @@
 from pygitgo.utils.update_checker import (
-    read_cache, write_cache, should_check, get_latest_version,
-    parse_version, check_for_updates, check_for_updates_background
+    should_check, get_latest_version, parse_version,
+    check_for_updates, get_update_notice, refresh_cache,
+    STATE_NAMESPACE, CHECK_INTERVAL, WORKER_FLAG,
 )
-from datetime import datetime, timedelta
+from pygitgo.utils import state_store
+from datetime import timedelta
 from unittest.mock import MagicMock
 import json
 
 
-def test_read_cache_empty(tmp_path, mocker):
-    mocker.patch("pygitgo.utils.update_checker.CACHE_FILE", tmp_path / "missing.json")
-    assert read_cache() == {}
+def _checked(ttl=CHECK_INTERVAL):
+    state_store.delete(STATE_NAMESPACE)
+    state_store.set(STATE_NAMESPACE, "checked_at", "2026-01-01T00:00:00", ttl=ttl)
 
 
-def test_read_cache_valid(tmp_path, mocker):
-    cache_file = tmp_path / "update_check.json"
-    cache_file.write_text(json.dumps({"last_check": "2026-01-01T00:00:00"}))
-    mocker.patch("pygitgo.utils.update_checker.CACHE_FILE", cache_file)
-    result = read_cache()
-    assert result["last_check"] == "2026-01-01T00:00:00"
-
-
-def test_read_cache_corrupted(tmp_path, mocker):
-    cache_file = tmp_path / "update_check.json"
-    cache_file.write_text("not json")
-    mocker.patch("pygitgo.utils.update_checker.CACHE_FILE", cache_file)
-    assert read_cache() == {}
-
-
-def test_write_cache(tmp_path, mocker):
-    cache_file = tmp_path / "update_check.json"
-    mocker.patch("pygitgo.utils.update_checker.CACHE_DIR", tmp_path)
-    mocker.patch("pygitgo.utils.update_checker.CACHE_FILE", cache_file)
-    write_cache({"last_check": "2026-01-01T00:00:00"})
-    result = json.loads(cache_file.read_text())
-    assert result["last_check"] == "2026-01-01T00:00:00"
-
-
-def test_should_check_no_cache(mocker):
-    mocker.patch("pygitgo.utils.update_checker.read_cache", return_value={})
+def test_should_check_no_cache():
+    state_store.delete(STATE_NAMESPACE)
     assert should_check() is True
 
 
-def test_should_check_expired(mocker):
-    old_date = (datetime.now() - timedelta(days=8)).isoformat()
-    mocker.patch("pygitgo.utils.update_checker.read_cache", return_value={"last_check": old_date})
+def test_should_check_expired():
+    _checked(ttl=timedelta(seconds=-1))
     assert should_check() is True
 
 
-def test_should_check_still_valid(mocker):
-    recent_date = (datetime.now() - timedelta(days=1)).isoformat()
-    mocker.patch("pygitgo.utils.update_checker.read_cache", return_value={"last_check": recent_date})
+def test_should_check_still_valid():
+    _checked()
     assert should_check() is False
 
 
-def test_should_check_invalid_date(mocker):
-    mocker.patch("pygitgo.utils.update_checker.read_cache", return_value={"last_check": "not-a-date"})
-    assert should_check() is True
-
-
 def test_parse_version_standard():
     assert parse_version("1.5.0") == [1, 5, 0]
 
@@ -77,37 +48,75 @@ def test_get_latest_version_success(mocker):
     fake_response.read.return_value = json.dumps({"info": {"version": "1.6.0"}}).encode("utf-8")
     fake_response.__enter__ = lambda s: s
     fake_response.__exit__ = MagicMock(return_value=False)
-    mocker.patch("pygitgo.utils.update_checker.urllib.request.urlopen", return_value=fake_response)
+    mocker.patch("urllib.request.urlopen", return_value=fake_response)
     assert get_latest_version() == "1.6.0"
 
 
 def test_get_latest_version_network_failure(mocker):
-    mocker.patch("pygitgo.utils.update_checker.urllib.request.urlopen", side_effect=Exception("timeout"))
+    mocker.patch("urllib.request.urlopen", side_effect=Exception("timeout"))
     assert get_latest_version() is None
 
 
-def test_check_for_updates_skips_when_cached(mocker):
-    mocker.patch("pygitgo.utils.update_checker.should_check", return_value=False)
+def _cache_with(**values):
+    _checked()
+    state_store.set_many(STATE_NAMESPACE, values)
+
+
+def test_check_for_updates_never_fetches(mocker):
+    _checked()
+    fake_get = mocker.patch("pygitgo.utils.update_checker.get_latest_version")
+    fake_spawn = mocker.patch("pygitgo.utils.executor.spawn_detached")
+    check_for_updates("1.5.0")
+    fake_get.assert_not_called()
+    fake_spawn.assert_not_called()
+
+
+def test_stale_cache_starts_background_worker(mocker):
+    _checked(ttl=timedelta(seconds=-1))
     fake_get = mocker.patch("pygitgo.utils.update_checker.get_latest_version")
+    fake_spawn = mocker.patch("pygitgo.utils.executor.spawn_detached")
+
+    check_for_updates("1.5.0")
     check_for_updates("1.5.0")
+
     fake_get.assert_not_called()
+    fake_spawn.assert_called_once()
+    assert fake_spawn.call_args[0][0][1:] == ["-m", "pygitgo.utils.update_checker"]
+    assert not should_check()
+
+
+def test_frozen_build_runs_itself_as_worker(mocker, monkeypatch):
+    monkeypatch.setattr("sys.frozen", True, raising=False)
+    monkeypatch.setattr("sys.executable", "C:\\Program Files\\GitGo\\gitgo.exe")
+    _checked(ttl=timedelta(seconds=-1))
+    fake_spawn = mocker.patch("pygitgo.utils.executor.spawn_detached")
+
+    check_for_updates("1.5.0")
+
+    fake_spawn.assert_called_once_with(["C:\\Program Files\\GitGo\\gitgo.exe", WORKER_FLAG])
+
+
+def test_main_worker_flag_refreshes_cache(mocker, monkeypatch):
+    from pygitgo.main import main
+    monkeypatch.setattr("sys.argv", ["gitgo", WORKER_FLAG])
+    fake_refresh = mocker.patch("pygitgo.main.refresh_cache")
+    fake_forward = mocker.patch("pygitgo.utils.daemon.forward")
+
+    main()
+
+    fake_refresh.assert_called_once_with()
+    fake_forward.assert_not_called()
 
 
 def test_check_for_updates_no_update_available(mocker):
-    mocker.patch("pygitgo.utils.update_checker.should_check", return_value=True)
-    mocker.patch("pygitgo.utils.update_checker.read_cache", return_value={})
-    mocker.patch("pygitgo.utils.update_checker.write_cache")
-    mocker.patch("pygitgo.utils.update_checker.get_latest_version", return_value="1.5.0")
+    _cache_with(latest_version="1.5.0")
     fake_warning = mocker.patch("pygitgo.utils.update_checker.warning")
     check_for_updates("1.5.0")
     fake_warning.assert_not_called()
 
 
 def test_check_for_updates_newer_version_available(mocker):
-    mocker.patch("pygitgo.utils.update_checker.should_check", return_value=True)
-    mocker.patch("pygitgo.utils.update_checker.read_cache", return_value={})
-    mocker.patch("pygitgo.utils.update_checker.write_cache")
-    mocker.patch("pygitgo.utils.update_checker.get_latest_version", return_value="2.0.0")
+    _cache_with(latest_version="2.0.0")
     fake_warning = mocker.patch("pygitgo.utils.update_checker.warning")
     fake_info = mocker.patch("pygitgo.utils.update_checker.info")
     check_for_updates("1.5.0")
@@ -115,28 +124,63 @@ def test_check_for_updates_newer_version_available(mocker):
     fake_info.assert_called_with("Run: pip install --upgrade pygitgo")
 
 
+def test_newer_version_is_announced_once_per_interval():
+    _cache_with(latest_version="2.0.0")
+    assert get_update_notice("1.5.0") == "GitGo update available: 1.5.0 -> 2.0.0"
+    assert get_update_notice("1.5.0") is None
+
+    state_store.set(STATE_NAMESPACE, "notified_version", "2.0.0", ttl=timedelta(seconds=-1))
+    assert get_update_notice("1.5.0") is not None
+
+
 def test_check_for_updates_older_version_on_pypi(mocker):
-    mocker.patch("pygitgo.utils.update_checker.should_check", return_value=True)
-    mocker.patch("pygitgo.utils.update_checker.read_cache", return_value={})
-    mocker.patch("pygitgo.utils.update_checker.write_cache")
-    mocker.patch("pygitgo.utils.update_checker.get_latest_version", return_value="1.4.0")
+    _cache_with(latest_version="1.4.0")
     fake_warning = mocker.patch("pygitgo.utils.update_checker.warning")
     check_for_updates("1.5.0")
     fake_warning.assert_not_called()
 
 
-def test_check_for_updates_pypi_returns_none(mocker):
-    mocker.patch("pygitgo.utils.update_checker.should_check", return_value=True)
-    mocker.patch("pygitgo.utils.update_checker.read_cache", return_value={})
-    mocker.patch("pygitgo.utils.update_checker.write_cache")
-    mocker.patch("pygitgo.utils.update_checker.get_latest_version", return_value=None)
-    fake_warning = mocker.patch("pygitgo.utils.update_checker.warning")
-    check_for_updates("1.5.0")
-    fake_warning.assert_not_called()
+def test_check_for_updates_dev_version():
+    _cache_with(latest_version="2.0.0")
+    assert get_update_notice("dev") is None
+
+
+def test_refresh_cache_stores_version_and_validators(mocker):
+    state_store.delete(STATE_NAMESPACE)
+    fake_response = MagicMock()
+    fake_response.read.return_value = json.dumps({"info": {"version": "1.6.0"}}).encode("utf-8")
+    fake_response.headers = {"ETag": '"abc"', "Last-Modified": "Sat, 01 Aug 2026 00:00:00 GMT"}
+    fake_response.__enter__ = lambda s: s
+    fake_response.__exit__ = MagicMock(return_value=False)
+    mocker.patch("urllib.request.urlopen", return_value=fake_response)
+
+    refresh_cache()
+
+    cache = state_store.items(STATE_NAMESPACE)
+    assert cache["latest_version"] == "1.6.0"
+    assert cache["etag"] == '"abc"'
+    assert cache["last_modified"] == "Sat, 01 Aug 2026 00:00:00 GMT"
+    assert not should_check()
+
+
+def test_refresh_cache_revalidates_with_etag(mocker):
+    import urllib.error
+    _cache_with(latest_version="1.6.0", etag='"abc"', last_modified="Sat, 01 Aug 2026 00:00:00 GMT")
+    not_modified = urllib.error.HTTPError("https://pypi.org", 304, "Not Modified", {}, None)
+    fake_urlopen = mocker.patch("urllib.request.urlopen", side_effect=not_modified)
+
+    refresh_cache()
+
+    request = fake_urlopen.call_args[0][0]
+    assert request.get_header("If-none-match") == '"abc"'
+    assert request.get_header("If-modified-since") == "Sat, 01 Aug 2026 00:00:00 GMT"
+    assert state_store.get(STATE_NAMESPACE, "latest_version") == "1.6.0"
+
+
+def test_refresh_cache_keeps_version_on_failure(mocker):
+    _cache_with(latest_version="1.6.0")
+    mocker.patch("urllib.request.urlopen", side_effect=OSError("offline"))
 
+    refresh_cache()
 
-def test_check_for_updates_background_starts_thread(mocker):
-    fake_thread = MagicMock()
-    mocker.patch("pygitgo.utils.update_checker.threading.Thread", return_value=fake_thread)
-    check_for_updates_background("1.5.0")
-    fake_thread.start.assert_called_once()
+    assert state_store.get(STATE_NAMESPACE, "latest_version") == "1.6.0"
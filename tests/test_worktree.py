@@ -0,0 +1,199 @@
+from pygitgo.commands.worktree import (
+    list_worktrees, evict_idle_worktrees, worktree_jump, change_directory,
+    get_worktree_root, WORKTREE_NAMESPACE,
+)
+from pygitgo.utils.repo_context import RepoContext
+from pygitgo.exceptions import GitCommandError
+from pygitgo.utils import state_store
+import pytest
+
+
+PORCELAIN = (
+    "worktree {main}\nHEAD 1111\nbranch refs/heads/main\n\n"
+    "worktree {root}/feat\nHEAD 2222\nbranch refs/heads/feat\nlocked\n\n"
+    "worktree {root}/gone\nHEAD 3333\ndetached\nprunable gitdir file points to non-existent location\n"
+)
+
+
+@pytest.fixture
+def repo(mocker, tmp_path):
+    main = tmp_path / "project"
+    main.mkdir()
+    context = RepoContext(main / ".git", main / ".git", main, "main")
+    mocker.patch("pygitgo.commands.worktree.get_repo_context", return_value=context)
+    mocker.patch("pygitgo.commands.worktree.get_config", side_effect=lambda key, fallback: {
+        "worktree-root": str(tmp_path / "trees"),
+    }.get(key, fallback))
+    return context
+
+
+def _worktree(path, branch, locked=False):
+    return {"path": path, "branch": branch, "locked": locked, "prunable": False}
+
+
+def test_list_worktrees_parses_porcelain(mocker, tmp_path):
+    output = PORCELAIN.format(main=tmp_path / "project", root=tmp_path / "trees")
+    mocker.patch("pygitgo.commands.worktree.run_command", return_value=output)
+
+    worktrees = list_worktrees()
+
+    assert [wt["branch"] for wt in worktrees] == ["main", "feat", None]
+    assert worktrees[1]["locked"] and not worktrees[1]["prunable"]
+    assert worktrees[2]["prunable"]
+
+
+def test_worktree_root_is_per_repository(repo, tmp_path):
+    root = get_worktree_root(repo)
+    assert root.parent == tmp_path / "trees"
+    assert root.name.startswith("project-")
+
+    other = RepoContext(tmp_path / "b" / "project" / ".git", tmp_path / "b" / "project" / ".git", tmp_path, "main")
+    assert get_worktree_root(other) != root
+
+
+def test_jump_to_existing_worktree_only_changes_folder(mocker, repo, tmp_path):
+    feat = tmp_path / "elsewhere" / "feat"
+    mocker.patch("pygitgo.commands.worktree.list_worktrees", return_value=[
+        _worktree(repo.toplevel, "main"), _worktree(feat, "feat"),
+    ])
+    fake_run = mocker.patch("pygitgo.commands.worktree.run_command")
+    fake_cd = mocker.patch("pygitgo.commands.worktree.change_directory")
+
+    worktree_jump("feat")
+
+    fake_run.assert_not_called()
+    fake_cd.assert_called_once_with(feat)
+    assert set(state_store.items(WORKTREE_NAMESPACE)) == {str(repo.toplevel.resolve()), str(feat.resolve())}
+
+
+def test_jump_to_current_worktree_warns(mocker, repo):
+    mocker.patch("pygitgo.commands.worktree.list_worktrees", return_value=[_worktree(repo.toplevel, "main")])
+    fake_warning = mocker.patch("pygitgo.commands.worktree.warning")
+    fake_cd = mocker.patch("pygitgo.commands.worktree.change_directory")
+
+    worktree_jump("main")
+
+    fake_warning.assert_called_once_with("Already on branch 'main'.")
+    fake_cd.assert_not_called()
+
+
+def test_jump_adds_worktree_for_existing_branch(mocker, repo):
+    mocker.patch("pygitgo.commands.worktree.list_worktrees", return_value=[_worktree(repo.toplevel, "main")])
+    mocker.patch("pygitgo.commands.worktree.is_branch_exist", return_value=True)
+    fake_run = mocker.patch("pygitgo.commands.worktree.run_command")
+    fake_cd = mocker.patch("pygitgo.commands.worktree.change_directory")
+
+    worktree_jump("feature/login")
+
+    target = get_worktree_root(repo) / "feature" / "login"
+    fake_run.assert_called_once_with(
+        ["git", "worktree", "add", str(target), "feature/login"],
+        loading_msg="Checking out 'feature/login' in its own worktree...",
+        ok_text="Worktree for 'feature/login' ready.",
+    )
+    fake_cd.assert_called_once_with(target)
+
+
+def test_jump_creates_new_branch_after_confirm(mocker, repo):
+    mocker.patch("pygitgo.commands.worktree.list_worktrees", return_value=[_worktree(repo.toplevel, "main")])
+    mocker.patch("pygitgo.commands.worktree.is_branch_exist", return_value=False)
+    mocker.patch("pygitgo.commands.worktree.confirm", return_value=True)
+    fake_run = mocker.patch("pygitgo.commands.worktree.run_command")
+    mocker.patch("pygitgo.commands.worktree.change_directory")
+
+    worktree_jump("spike")
+
+    command = fake_run.call_args[0][0]
+    assert command[:5] == ["git", "worktree", "add", "-b", "spike"]
+
+
+def test_jump_canceled_creates_nothing(mocker, repo):
+    mocker.patch("pygitgo.commands.worktree.list_worktrees", return_value=[_worktree(repo.toplevel, "main")])
+    mocker.patch("pygitgo.commands.worktree.is_branch_exist", return_value=False)
+    mocker.patch("pygitgo.commands.worktree.confirm", return_value=False)
+    fake_run = mocker.patch("pygitgo.commands.worktree.run_command")
+    fake_cd = mocker.patch("pygitgo.commands.worktree.change_directory")
+
+    worktree_jump("spike")
+
+    fake_run.assert_not_called()
+    fake_cd.assert_not_called()
+
+
+def test_jump_prunes_deleted_worktrees_first(mocker, repo, tmp_path):
+    gone = dict(_worktree(tmp_path / "gone", "feat"), prunable=True)
+    mocker.patch("pygitgo.commands.worktree.list_worktrees", return_value=[_worktree(repo.toplevel, "main"), gone])
+    mocker.patch("pygitgo.commands.worktree.is_branch_exist", return_value=True)
+    fake_run = mocker.patch("pygitgo.commands.worktree.run_command")
+    fake_cd = mocker.patch("pygitgo.commands.worktree.change_directory")
+
+    worktree_jump("feat")
+
+    assert fake_run.call_args_list[0][0][0] == ["git", "worktree", "prune"]
+    assert fake_run.call_args_list[1][0][0][:3] == ["git", "worktree", "add"]
+    fake_cd.assert_called_once_with(get_worktree_root(repo) / "feat")
+
+
+def test_eviction_removes_least_recently_used(mocker, repo, tmp_path):
+    mocker.patch("pygitgo.commands.worktree.get_worktree_limit", return_value=2)
+    root = tmp_path / "trees"
+    old, older, current, target = (root / name for name in ("old", "older", "current", "target"))
+    state_store.set_many(WORKTREE_NAMESPACE, {str(old.resolve()): 20, str(older.resolve()): 10})
+    fake_run = mocker.patch("pygitgo.commands.worktree.run_command")
+
+    worktrees = [
+        _worktree(repo.toplevel, "main"),
+        _worktree(old, "old"), _worktree(older, "older"),
+        _worktree(current, "current"), _worktree(target, "target"),
+    ]
+    removed = evict_idle_worktrees(worktrees, root, keep=[current, target])
+
+    assert [wt["branch"] for wt in removed] == ["older", "old"]
+    assert fake_run.call_args_list[0][0][0] == ["git", "worktree", "remove", str(older)]
+    assert state_store.items(WORKTREE_NAMESPACE) == {}
+
+
+def test_eviction_keeps_dirty_and_locked_worktrees(mocker, repo, tmp_path):
+    mocker.patch("pygitgo.commands.worktree.get_worktree_limit", return_value=1)
+    root = tmp_path / "trees"
+    dirty, locked, clean, target = (root / name for name in ("dirty", "locked", "clean", "target"))
+    state_store.set_many(WORKTREE_NAMESPACE, {str(dirty.resolve()): 1, str(locked.resolve()): 2, str(clean.resolve()): 3})
+
+    def fake_remove(command):
+        if command[-1] == str(dirty):
+            raise GitCommandError(command, stderr="contains modified or untracked files, use --force to delete it")
+    fake_run = mocker.patch("pygitgo.commands.worktree.run_command", side_effect=fake_remove)
+
+    worktrees = [
+        _worktree(dirty, "dirty"), _worktree(locked, "locked", locked=True),
+        _worktree(clean, "clean"), _worktree(target, "target"),
+    ]
+    removed = evict_idle_worktrees(worktrees, root, keep=[target])
+
+    assert [wt["branch"] for wt in removed] == ["clean"]
+    assert fake_run.call_count == 2
+    assert set(state_store.items(WORKTREE_NAMESPACE)) == {str(dirty.resolve()), str(locked.resolve())}
+
+
+def test_eviction_under_limit_does_nothing(mocker, repo, tmp_path):
+    fake_run = mocker.patch("pygitgo.commands.worktree.run_command")
+    worktrees = [_worktree(repo.toplevel, "main"), _worktree(tmp_path / "trees" / "a", "a")]
+
+    assert evict_idle_worktrees(worktrees, tmp_path / "trees", keep=[]) == []
+    fake_run.assert_not_called()
+
+
+def test_change_directory_writes_cd_file(monkeypatch, tmp_path):
+    cd_file = tmp_path / "cd"
+    monkeypatch.setenv("GITGO_CD_FILE", str(cd_file))
+
+    assert change_directory(tmp_path / "feat")
+    assert cd_file.read_text(encoding="utf-8") == str(tmp_path / "feat")
+
+
+def test_change_directory_without_shell_function(mocker, monkeypatch, tmp_path):
+    monkeypatch.delenv("GITGO_CD_FILE", raising=False)
+    fake_info = mocker.patch("pygitgo.commands.worktree.info")
+
+    assert not change_directory(tmp_path / "feat")
+    fake_info.assert_any_call(f'Your branch is in:  cd "{tmp_path / "feat"}"', required=True)